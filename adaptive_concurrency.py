@@ -0,0 +1,144 @@
+"""
+상품 동시 처리 개수를 스스로 찾는 AIMD 제한기 (scrape_category의 고정 Semaphore 대체)
+
+MAX_CONCURRENT_ITEMS는 시작 값일 뿐이고, 처리가 건강하면(지연이 기준선 이내, 오류율 낮음)
+동시 처리 한도를 조금씩 올리고(덧셈 증가), DB 락 타임아웃/탐색 타임아웃/봇 차단 페이지가 보이면
+한도를 절반으로 줄입니다(곱셈 감소). 환경마다 DB/네트워크 여유가 달라도 처리량 한계 근처에서 동작합니다.
+
+    limiter = AdaptiveLimiter(MAX_CONCURRENT_ITEMS, name='CPU')
+    async with limiter.slot():
+        await process_item(...)
+    limiter.backoff('db_lock')     # 처리 중 감지한 과부하 신호
+"""
+import os
+import time
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+
+from circuit_breaker import BlockedResponseError
+
+# --- 설정 ---
+AIMD_MIN_CONCURRENCY = int(os.environ.get("AIMD_MIN_CONCURRENCY", "1"))
+AIMD_MAX_CONCURRENCY = int(os.environ.get("AIMD_MAX_CONCURRENCY", "8"))
+# 과부하 신호 시 한도에 곱하는 값
+AIMD_DECREASE_FACTOR = float(os.environ.get("AIMD_DECREASE_FACTOR", "0.5"))
+# 연달아 들어오는 같은 원인의 신호로 한도가 바닥까지 떨어지지 않도록, 감소 후 이 시간(초) 동안은 다시 줄이지 않음
+AIMD_DECREASE_COOLDOWN = float(os.environ.get("AIMD_DECREASE_COOLDOWN", "15"))
+# 최근 처리 시간이 기준선의 이 배수 이내여야 한도를 올림
+AIMD_LATENCY_TOLERANCE = float(os.environ.get("AIMD_LATENCY_TOLERANCE", "2.0"))
+# 최근 처리 중 오류 비율이 이보다 높으면 한도를 줄임
+AIMD_MAX_ERROR_RATE = float(os.environ.get("AIMD_MAX_ERROR_RATE", "0.2"))
+# 지연/오류율을 보는 최근 처리 수
+AIMD_WINDOW = 20
+# 기준선(처리 시간 지수 이동 평균) 반영 비율
+AIMD_BASELINE_ALPHA = 0.1
+
+# 오류 메시지 -> 과부하 원인
+_DB_LOCK_PATTERNS = ('lock wait timeout', '1205', 'deadlock', '1213')
+_BOT_WALL_PATTERNS = ('captcha', '자동입력 방지', '비정상적인 접근', 'access denied', 'too many requests',
+                      'cloudflare', 'are you a robot', '보안문자')
+
+
+def classify_error(error):
+    """예외/메시지 -> 'db_lock' | 'timeout' | 'bot_wall' | None"""
+    message = str(error).lower()
+    if isinstance(error, BlockedResponseError):
+        # 403/429/5xx 응답 (goto_checked, raise_for_blocking_status)
+        return 'bot_wall'
+    if any(pattern in message for pattern in _DB_LOCK_PATTERNS):
+        return 'db_lock'
+    if any(pattern in message for pattern in _BOT_WALL_PATTERNS):
+        return 'bot_wall'
+    if 'timeout' in type(error).__name__.lower() or 'timeout' in message:
+        return 'timeout'
+    return None
+
+
+def looks_like_bot_wall(page_text):
+    """페이지 본문이 봇 차단/캡차 화면으로 보이면 True"""
+    lowered = (page_text or '').lower()
+    return any(pattern in lowered for pattern in _BOT_WALL_PATTERNS)
+
+
+class AdaptiveLimiter:
+    """AIMD 방식의 비동기 동시 실행 제한기"""
+
+    def __init__(self, initial, minimum=AIMD_MIN_CONCURRENCY, maximum=AIMD_MAX_CONCURRENCY, name=''):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.name = name
+        self.in_flight = 0
+        self.baseline = None
+        self.outcomes = deque(maxlen=AIMD_WINDOW)   # True: 정상 완료
+        self.last_decrease = 0.0
+        self.peak_limit = self.limit
+        self.decreases = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def current(self):
+        """지금 허용하는 동시 처리 수"""
+        return max(self.minimum, int(self.limit))
+
+    @asynccontextmanager
+    async def slot(self):
+        """한도 안에서 실행 슬롯 하나를 빌림 (예외가 나면 오류로 기록)"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.current)
+            self.in_flight += 1
+        started = time.monotonic()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self._complete(time.monotonic() - started, ok)
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def _complete(self, latency, ok):
+        self.outcomes.append(ok)
+        if ok:
+            self.baseline = latency if self.baseline is None else \
+                (1 - AIMD_BASELINE_ALPHA) * self.baseline + AIMD_BASELINE_ALPHA * latency
+
+        errors = self.outcomes.count(False)
+        if len(self.outcomes) >= AIMD_WINDOW // 2 and errors / len(self.outcomes) > AIMD_MAX_ERROR_RATE:
+            self.backoff('error_rate')
+            return
+        # 한도를 다 쓰고 있을 때만 올림 (여유가 있는데 올리면 의미 없이 커짐)
+        healthy = ok and latency <= (self.baseline or latency) * AIMD_LATENCY_TOLERANCE
+        if healthy and self.in_flight >= self.current and self.limit < self.maximum:
+            previous = self.current
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.peak_limit = max(self.peak_limit, self.limit)
+            if self.current > previous:
+                print(f"     -> (동시 처리) {self.name} 한도 {previous} -> {self.current} (처리 {latency:.1f}s, 기준 {self.baseline:.1f}s)")
+
+    def backoff(self, reason):
+        """과부하 신호: 한도를 곱셈 감소 (쿨다운 중이면 무시)"""
+        now = time.monotonic()
+        if now - self.last_decrease < AIMD_DECREASE_COOLDOWN:
+            return
+        previous = self.current
+        self.limit = max(float(self.minimum), self.limit * AIMD_DECREASE_FACTOR)
+        self.last_decrease = now
+        self.decreases += 1
+        # 감소 직후의 오류 기록으로 다시 줄이지 않도록 창을 비움
+        self.outcomes.clear()
+        print(f"     -> (동시 처리) {self.name} 과부하 신호({reason}): 한도 {previous} -> {self.current}")
+
+    def report_error(self, error):
+        """처리 중 잡아서 삼킨 오류를 알림: 과부하 원인이면 한도를 줄이고, 아니면 오류율에만 반영"""
+        reason = classify_error(error)
+        if reason:
+            self.backoff(reason)
+        else:
+            self.outcomes.append(False)
+        return reason
+
+    def summary(self):
+        return f"동시 처리 한도: 현재 {self.current}, 최대 {int(self.peak_limit)}, 감소 {self.decreases}회"
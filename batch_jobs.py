@@ -0,0 +1,37 @@
+"""
+DB 일괄 처리 도구(reparse_specs.py, review_benchmarks.py)가 함께 쓰는 엔진/프로세스 풀 도우미
+
+두 도구 모두 저장된 행을 청크로 읽어 프로세스 풀에서 처리하고, 결과를 청크 순서대로 받아 한 트랜잭션씩 저장합니다.
+
+    engine = create_batch_engine()
+    with Pool(processes=workers) as pool:
+        for chunk_rows, results in ordered_chunk_results(pool, work_chunk, chunks):
+            저장
+"""
+import os
+
+from sqlalchemy import create_engine
+
+
+def create_batch_engine():
+    """크롤러와 같은 DB 환경 변수로 엔진 생성 (크롤러 모듈을 import하지 않음)"""
+    db_host = os.environ.get("DB_HOST", "localhost")
+    db_port = int(os.environ.get("DB_PORT", "3307"))
+    db_user = os.environ.get("DB_USER", "root")
+    db_password = os.environ.get("DB_PASSWORD", "1234")
+    db_name = os.environ.get("DB_NAME", "danawa")
+    db_url = f"mysql+pymysql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}?charset=utf8mb4"
+    return create_engine(db_url, pool_pre_ping=True, pool_recycle=3600, echo=False)
+
+
+def ordered_chunk_results(pool, func, chunks):
+    """청크를 풀의 func에 순서대로 넘기고 (청크 행 수, 결과)를 순서대로 돌려줍니다."""
+    sizes = []
+
+    def feed():
+        for rows in chunks:
+            sizes.append(len(rows))
+            yield rows
+
+    for index, results in enumerate(pool.imap(func, feed())):
+        yield sizes[index], results
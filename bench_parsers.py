@@ -0,0 +1,248 @@
+"""
+스펙 파서(PARSER_MAP)와 용량 추출기(extract_capacity_from_option) 회귀 검사 + 벤치마크
+
+parser_corpus/corpus.jsonl에 기록된 다나와 샘플(카테고리, 상품명, 스펙 문자열, 가격 옵션 텍스트)로
+1. 정답 비교: 파싱 결과가 parser_corpus/golden.jsonl과 같은지 (키 순서 포함) 확인
+   + parser_corpus/identity.jsonl의 상품명이 기대한 모델 키(model_identity.resolve_model)로 해석되는지 확인
+2. 처리량: 파서별 호출당 시간(µs)과 초당 처리 건수
+3. 메모리: 파서별 호출당 할당 피크(tracemalloc)와 호출 후 남은 블록 수
+를 측정하고, parser_corpus/baseline.json보다 허용 범위 이상 느려지거나 할당이 늘면 실패(종료 코드 1)합니다.
+
+사용법:
+    python bench_parsers.py                    # 정답 비교 + 벤치마크 + 기준선 비교
+    python bench_parsers.py --check-only       # 정답 비교만 (빠름)
+    python bench_parsers.py --update-golden    # 파서 동작을 의도적으로 바꾼 뒤 정답 갱신
+    python bench_parsers.py --save-baseline    # 현재 측정값을 기준선으로 저장 (측정 장비가 바뀌었을 때)
+"""
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+
+from spec_parsers import PARSER_MAP, extract_capacity_from_option
+from model_identity import resolve_model
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parser_corpus')
+CORPUS_PATH = os.path.join(CORPUS_DIR, 'corpus.jsonl')
+GOLDEN_PATH = os.path.join(CORPUS_DIR, 'golden.jsonl')
+BASELINE_PATH = os.path.join(CORPUS_DIR, 'baseline.json')
+IDENTITY_PATH = os.path.join(CORPUS_DIR, 'identity.jsonl')
+
+# 기준선 대비 허용 범위 (측정 잡음을 고려해 시간은 넉넉하게)
+PARSER_BENCH_TIME_TOLERANCE = float(os.environ.get("PARSER_BENCH_TIME_TOLERANCE", "0.5"))
+PARSER_BENCH_ALLOC_TOLERANCE = float(os.environ.get("PARSER_BENCH_ALLOC_TOLERANCE", "0.2"))
+# 한 번 측정에 최소로 쓰는 시간(초)과 반복 측정 횟수 (가장 빠른 값을 사용)
+PARSER_BENCH_MIN_SECONDS = 0.2
+PARSER_BENCH_REPEAT = 5
+
+CAPACITY_TARGET = 'extract_capacity_from_option'
+
+
+def load_corpus(path=CORPUS_PATH):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def parse_sample(sample):
+    """샘플 하나의 결과 (골든 파일 한 줄과 같은 형태)"""
+    parser_func = PARSER_MAP[sample['category']]
+    return {
+        'id': sample['id'],
+        # 키 순서까지 비교하도록 [키, 값] 목록으로 저장
+        'specs': [[key, value] for key, value in parser_func(sample['name'], sample['spec_string']).items()],
+        'capacity': extract_capacity_from_option(sample.get('option_text'), sample['category']),
+    }
+
+
+def check_golden(corpus):
+    """골든 파일과 다른 샘플 목록 [(id, 기대값, 실제값)]"""
+    with open(GOLDEN_PATH, encoding='utf-8') as f:
+        golden = {row['id']: row for row in map(json.loads, filter(str.strip, f))}
+
+    mismatches = []
+    for sample in corpus:
+        actual = parse_sample(sample)
+        expected = golden.get(sample['id'])
+        if expected != actual:
+            mismatches.append((sample['id'], expected, actual))
+    missing = set(golden) - {sample['id'] for sample in corpus}
+    for sample_id in sorted(missing):
+        mismatches.append((sample_id, golden[sample_id], None))
+    return mismatches
+
+
+def check_identities(path=IDENTITY_PATH):
+    """모델 키가 기대값과 다른 샘플 목록 [(id, 기대 키, 실제 키)]"""
+    mismatches = []
+    for sample in load_corpus(path):
+        identity = resolve_model(sample['name'], sample['category'])
+        actual = identity.key if identity else None
+        if actual != sample['key']:
+            mismatches.append((sample['id'], sample['key'], actual))
+    return mismatches
+
+
+def write_golden(corpus):
+    with open(GOLDEN_PATH, 'w', encoding='utf-8') as f:
+        for sample in corpus:
+            f.write(json.dumps(parse_sample(sample), ensure_ascii=False) + '\n')
+    print(f"정답 파일 갱신: {GOLDEN_PATH} ({len(corpus)}건)")
+
+
+def build_targets(corpus):
+    """측정 대상별 (함수, 인수 목록)"""
+    targets = {}
+    for category, parser_func in PARSER_MAP.items():
+        calls = [(sample['name'], sample['spec_string']) for sample in corpus if sample['category'] == category]
+        if calls:
+            targets[category] = (parser_func, calls)
+    targets[CAPACITY_TARGET] = (extract_capacity_from_option,
+                                [(sample.get('option_text'), sample['category']) for sample in corpus])
+    return targets
+
+
+def measure_time(func, calls):
+    """호출당 시간(µs): 최소 측정 시간을 채우도록 반복한 뒤 여러 번 중 가장 빠른 값"""
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            for args in calls:
+                func(*args)
+        elapsed = time.perf_counter() - started
+        if elapsed >= PARSER_BENCH_MIN_SECONDS:
+            break
+        loops *= 2
+
+    best = elapsed
+    for _ in range(PARSER_BENCH_REPEAT - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            for args in calls:
+                func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best / (loops * len(calls)) * 1e6
+
+
+def measure_allocations(func, calls):
+    """(호출당 할당 피크 바이트, 호출 후 남은 블록 수)"""
+    for args in calls:
+        func(*args)  # 정규식 캐시 등 첫 호출 비용 제외
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peaks = []
+        before = tracemalloc.take_snapshot()
+        for args in calls:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            result = func(*args)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+            del result
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, 'filename')
+                   if stat.traceback[0].filename.endswith('spec_parsers.py'))
+    return sum(peaks) // len(peaks), max(retained, 0)
+
+
+def run_benchmark(corpus):
+    results = {}
+    for name, (func, calls) in build_targets(corpus).items():
+        us_per_call = measure_time(func, calls)
+        peak_bytes, retained_blocks = measure_allocations(func, calls)
+        results[name] = {
+            'samples': len(calls),
+            'us_per_call': round(us_per_call, 3),
+            'calls_per_sec': round(1e6 / us_per_call),
+            'peak_bytes': peak_bytes,
+            'retained_blocks': retained_blocks,
+        }
+    return results
+
+
+def compare_baseline(results, baseline):
+    """기준선 대비 회귀 목록 [설명]"""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        time_limit = base['us_per_call'] * (1 + PARSER_BENCH_TIME_TOLERANCE)
+        if current['us_per_call'] > time_limit:
+            regressions.append(f"{name}: {base['us_per_call']:.1f}µs -> {current['us_per_call']:.1f}µs "
+                               f"(허용 {time_limit:.1f}µs)")
+        alloc_limit = base['peak_bytes'] * (1 + PARSER_BENCH_ALLOC_TOLERANCE)
+        if current['peak_bytes'] > alloc_limit:
+            regressions.append(f"{name}: 할당 피크 {base['peak_bytes']}B -> {current['peak_bytes']}B "
+                               f"(허용 {alloc_limit:.0f}B)")
+        if current['retained_blocks'] > base.get('retained_blocks', 0):
+            regressions.append(f"{name}: 호출 후 남은 블록 {base.get('retained_blocks', 0)} -> "
+                               f"{current['retained_blocks']} (누수 의심)")
+    return regressions
+
+
+def print_results(results, baseline):
+    print("\n" + "=" * 78)
+    print(f"{'대상':<30}{'샘플':>5}{'µs/건':>10}{'건/s':>11}{'할당피크(B)':>13}{'기준선 µs':>10}")
+    print("-" * 78)
+    for name, row in results.items():
+        base = baseline.get(name, {}).get('us_per_call')
+        print(f"{name:<30}{row['samples']:>5}{row['us_per_call']:>10.1f}{row['calls_per_sec']:>11,}"
+              f"{row['peak_bytes']:>13,}{(f'{base:.1f}' if base else '-'):>10}")
+    print("=" * 78)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스펙 파서 회귀 검사 + 벤치마크")
+    parser.add_argument('--check-only', action='store_true', help='정답 비교만 실행')
+    parser.add_argument('--update-golden', action='store_true', help='현재 파서 결과로 정답 파일 갱신')
+    parser.add_argument('--save-baseline', action='store_true', help='현재 측정값을 기준선으로 저장')
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    if args.update_golden:
+        write_golden(corpus)
+        return 0
+
+    mismatches = check_golden(corpus)
+    print(f"정답 비교: {len(corpus)}건 중 {len(mismatches)}건 불일치")
+    identity_mismatches = check_identities()
+    print(f"모델 키 비교: {len(load_corpus(IDENTITY_PATH))}건 중 {len(identity_mismatches)}건 불일치")
+    mismatches += identity_mismatches
+    for sample_id, expected, actual in mismatches[:10]:
+        print(f"  - {sample_id}\n      기대: {expected}\n      실제: {actual}")
+    if mismatches or args.check_only:
+        return 1 if mismatches else 0
+
+    results = run_benchmark(corpus)
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"기준선 저장: {BASELINE_PATH}")
+        return 0
+
+    regressions = compare_baseline(results, baseline)
+    if regressions:
+        print("❌ 성능 회귀:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print("✅ 회귀 없음" if baseline else "(기준선 없음: --save-baseline으로 저장하세요)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+벤치마크 데이터 신선도 정책 (소스/테스트별 TTL + 실행당 갱신 한도 + 표본이 적은 모델 우선)
+
+예전에는 점수가 한 번 저장되면 SELECT EXISTS로 영원히 건너뛰었습니다.
+이제 실행 시작 시 benchmark_results.created_at을 정책별로 한 번 집계해 갱신 계획을 세우고,
+스크래퍼는 부품/모델마다 계획만 조회합니다. (같은 행을 다시 저장하면 created_at이 갱신됨)
+
+    load_plan(engine)                                  # 크롤링 시작 시 1회
+    status = collect_status(conn, 'cinebench_r23', part_id)
+    if status not in COLLECT_STATUSES: 건너뜀
+
+상태:
+    missing  - 저장된 값이 없음 (항상 수집)
+    stale    - TTL이 지났고 이번 실행의 갱신 대상에 들어감 (수집)
+    fresh    - TTL 이내 (건너뜀)
+    deferred - TTL이 지났지만 이번 실행의 갱신 한도를 넘음 (다음 실행에서 갱신)
+"""
+import os
+from collections import namedtuple, Counter
+
+from sqlalchemy import text
+
+# 같은 모델의 표본(모든 소스의 같은 테스트 행 수)이 이보다 적으면 TTL을 줄이고 먼저 갱신
+BENCHMARK_FEW_SAMPLES = int(os.environ.get("BENCHMARK_FEW_SAMPLES", "3"))
+BENCHMARK_FEW_SAMPLES_TTL_RATIO = float(os.environ.get("BENCHMARK_FEW_SAMPLES_TTL_RATIO", "0.5"))
+# 모든 정책의 TTL에 곱하는 값 (예: 0이면 전부 갱신 대상, 2면 두 배로 오래 유지)
+BENCHMARK_TTL_SCALE = float(os.environ.get("BENCHMARK_TTL_SCALE", "1"))
+
+# key_column: 신선도를 판단하는 단위 (part_id: 부품별 저장, cpu_model: 모델 하나의 값을 공유)
+# scenario가 None이면 시나리오와 무관 (Geekbench는 Single/Multi를 한 번에 수집)
+FreshnessPolicy = namedtuple('FreshnessPolicy', [
+    'source', 'test_name', 'test_version', 'scenario', 'key_column', 'ttl_days', 'max_refresh_per_run',
+])
+
+BENCHMARK_POLICIES = {
+    'cinebench_r23': FreshnessPolicy('render4you', 'Cinebench', 'R23', 'Multi', 'part_id', 60, 30),
+    'geekbench_v6': FreshnessPolicy('geekbench', 'Geekbench', 'v6', None, 'part_id', 30, 30),
+    'blender_cpu': FreshnessPolicy('blender_opendata', 'Blender', '4.5.0', 'Median', 'part_id', 60, 30),
+    'blender_gpu': FreshnessPolicy('blender_opendata', 'Blender', '4.5.0', 'Median GPU', 'cpu_model', 60, 30),
+    '3dmark_fire_strike': FreshnessPolicy('3dmark', 'Fire Strike', '', 'GPU', 'part_id', 30, 20),
+    '3dmark_time_spy': FreshnessPolicy('3dmark', 'Time Spy', '', 'GPU', 'part_id', 30, 20),
+    '3dmark_port_royal': FreshnessPolicy('3dmark', 'Port Royal', '', 'GPU', 'part_id', 30, 20),
+}
+
+COLLECT_STATUSES = ('missing', 'stale')
+STATUS_LABELS = {
+    'fresh': '최신 데이터가 있습니다 (TTL 이내)',
+    'deferred': '갱신 대기 중입니다 (이번 실행의 갱신 한도 초과)',
+}
+
+
+def _policy_filter(policy):
+    """정책에 해당하는 행 조건과 파라미터"""
+    conditions = "source = :source AND test_name = :test_name AND test_version = :test_version"
+    params = {"source": policy.source, "test_name": policy.test_name, "test_version": policy.test_version}
+    if policy.scenario is not None:
+        conditions += " AND scenario = :scenario"
+        params["scenario"] = policy.scenario
+    return conditions, params
+
+
+def effective_ttl_seconds(policy, samples):
+    """표본이 적은 모델은 TTL을 줄여 더 자주 갱신"""
+    ttl = policy.ttl_days * 86400 * BENCHMARK_TTL_SCALE
+    if samples < BENCHMARK_FEW_SAMPLES:
+        ttl *= BENCHMARK_FEW_SAMPLES_TTL_RATIO
+    return ttl
+
+
+def plan_policy(policy, rows, model_samples):
+    """
+    정책 하나의 갱신 계획
+
+    Args:
+        rows: [(키, 마지막 저장 후 경과 초, 행 수, 모델명)]
+        model_samples: 모델명 -> 같은 테스트의 전체 행 수 (모든 소스)
+    Returns:
+        {키: 'fresh' | 'stale' | 'deferred'} (목록에 없는 키는 missing)
+    """
+    statuses = {}
+    stale = []
+    for key, age_seconds, count, model in rows:
+        samples = model_samples.get(model, count) if model else count
+        if age_seconds is not None and age_seconds < effective_ttl_seconds(policy, samples):
+            statuses[key] = 'fresh'
+        else:
+            # 표본이 적은 모델, 오래된 값 순서로 갱신
+            stale.append((samples, -(age_seconds or 0), key))
+    stale.sort(key=lambda item: item[:2])
+    for rank, (_, _, key) in enumerate(stale):
+        statuses[key] = 'stale' if rank < policy.max_refresh_per_run else 'deferred'
+    return statuses
+
+
+class RefreshPlan:
+    """실행 하나의 정책별 갱신 계획"""
+
+    def __init__(self, statuses):
+        self.statuses = statuses  # 정책 이름 -> {키: 상태}
+
+    @classmethod
+    def load(cls, engine, policies=None):
+        policies = policies or BENCHMARK_POLICIES
+        statuses = {}
+        model_samples = {}
+        with engine.connect() as conn:
+            for name, policy in policies.items():
+                if policy.test_name not in model_samples:
+                    model_samples[policy.test_name] = dict(conn.execute(text("""
+                        SELECT cpu_model, COUNT(*) FROM benchmark_results
+                        WHERE test_name = :test_name AND cpu_model IS NOT NULL
+                        GROUP BY cpu_model
+                    """), {"test_name": policy.test_name}).fetchall())
+                conditions, params = _policy_filter(policy)
+                rows = conn.execute(text(f"""
+                    SELECT {policy.key_column},
+                           TIMESTAMPDIFF(SECOND, MAX(created_at), CURRENT_TIMESTAMP),
+                           COUNT(*), MAX(cpu_model)
+                    FROM benchmark_results
+                    WHERE {conditions}
+                    GROUP BY {policy.key_column}
+                """), params).fetchall()
+                statuses[name] = plan_policy(policy, rows, model_samples[policy.test_name])
+        return cls(statuses)
+
+    def status(self, name, key):
+        policy_statuses = self.statuses.setdefault(name, {})
+        status = policy_statuses.get(key, 'missing')
+        if status in COLLECT_STATUSES:
+            # 같은 실행에서 같은 키(같은 모델의 다른 부품 등)를 다시 수집하지 않음
+            policy_statuses[key] = 'fresh'
+        return status
+
+    def summary(self):
+        """정책 이름 -> 상태별 개수"""
+        return {name: Counter(statuses.values()) for name, statuses in self.statuses.items()}
+
+
+_PLAN = None
+
+
+def load_plan(engine):
+    """크롤링 시작 시 갱신 계획을 세우고 정책별 요약을 출력합니다."""
+    global _PLAN
+    _PLAN = RefreshPlan.load(engine)
+    print("--- 벤치마크 갱신 계획 (정책 / 최신 / 갱신 / 대기) ---")
+    for name, counts in _PLAN.summary().items():
+        policy = BENCHMARK_POLICIES[name]
+        print(f"   {name:<20} TTL {policy.ttl_days}일, 최대 {policy.max_refresh_per_run}건: "
+              f"{counts['fresh']} / {counts['stale']} / {counts['deferred']}")
+    return _PLAN
+
+
+def collect_status(conn, name, key):
+    """
+    부품/모델 하나를 수집할지 판단합니다. ('missing'/'stale'이면 수집)
+
+    계획이 없으면(load_plan 없이 스크래퍼만 호출한 경우) 해당 키만 조회해 TTL로 판단합니다. (갱신 한도 없음)
+    """
+    if _PLAN is not None:
+        return _PLAN.status(name, key)
+
+    policy = BENCHMARK_POLICIES[name]
+    conditions, params = _policy_filter(policy)
+    row = conn.execute(text(f"""
+        SELECT TIMESTAMPDIFF(SECOND, MAX(created_at), CURRENT_TIMESTAMP), COUNT(*)
+        FROM benchmark_results
+        WHERE {conditions} AND {policy.key_column} = :key
+    """), {**params, "key": key}).fetchone()
+    if not row or not row[1]:
+        return 'missing'
+    return 'fresh' if row[0] is not None and row[0] < effective_ttl_seconds(policy, row[1]) else 'stale'
@@ -0,0 +1,153 @@
+"""
+벤치마크 순위표 행(장치 이름) <-> 부품 모델 매칭기
+
+소스(render4you, Blender Open Data, 3DMark 등)마다 장치 이름 목록을 한 번만 읽어
+모델 번호 기준의 역색인을 만들고, 부품 하나를 찾을 때는 같은 번호를 가진 후보만
+점수를 매깁니다. 행 전체를 부분 문자열로 훑지 않으므로 목록이 커져도 비용이 거의 같고,
+접미사 규칙으로 "5060" / "5060 Ti" 같은 오매칭을 막습니다.
+
+    index = DeviceIndex.build('GPU', [(name, score) for name, score in rows])
+    match = index.match('RTX 5060')   # -> DeviceMatch(name='NVIDIA GeForce RTX 5060', payload=..., score=...)
+
+접미사 규칙:
+    - GPU: Ti / SUPER / Ti SUPER / XT / XTX / GRE 는 정확히 같아야 함 (5060 != 5060 Ti, 7900 XT != 7900 XTX)
+    - CPU: X3D / X / G / XT 등은 정확히 같아야 함 (7800X3D != 7800X)
+           F만 다른 경우(14900K <-> 14900KF, 12400 <-> 12400F)는 같은 다이이므로 낮은 점수로 허용
+    - 제조사/제품군이 양쪽 다 있는데 다르면 제외
+    - 노트북/모바일/Max-Q 행은 찾는 이름에도 같은 표시가 있을 때만 허용 (RTX 4060 != RTX 4060 Laptop GPU)
+"""
+import os
+import re
+import time
+from collections import namedtuple
+
+from model_identity import ModelIdentity, resolve_cpu, resolve_gpu
+
+# 소스별 색인 재사용 시간(초): 크롤링 한 번 동안은 같은 순위표를 다시 받지 않음
+BENCHMARK_INDEX_TTL = float(os.environ.get("BENCHMARK_INDEX_TTL", "3600"))
+
+DeviceMatch = namedtuple('DeviceMatch', ['name', 'payload', 'score'])
+
+_TOKEN_PATTERN = re.compile(r'[A-Z0-9]+')
+_NUMBER_PATTERN = re.compile(r'(?<!\d)(\d{3,5})(?!\d)')
+_RESOLVERS = {'CPU': resolve_cpu, 'GPU': resolve_gpu}
+
+# 데스크탑 부품과 다른 제품인 행의 표시 (찾는 이름에 없으면 제외)
+_VARIANT_TOKENS = {'LAPTOP', 'MOBILE', 'NOTEBOOK', 'MAX', 'EMBEDDED'}
+
+SCORE_EXACT = 100
+PENALTY_F_VARIANT = 30      # 14900K <-> 14900KF
+PENALTY_UNKNOWN_FAMILY = 5  # 한쪽에만 제품군 정보가 있음
+PENALTY_PER_TOKEN = 1       # 같은 조건이면 군더더기 단어가 적은 행을 우선
+
+
+def _suffix_penalty(kind, wanted, found):
+    """접미사 차이에 대한 감점 (허용하지 않으면 None)"""
+    if wanted == found:
+        return 0
+    if kind == 'CPU' and wanted.rstrip('F') == found.rstrip('F'):
+        return PENALTY_F_VARIANT
+    return None
+
+
+class DeviceIndex:
+    """소스 하나의 장치 이름 목록에 대한 모델 번호 역색인"""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.resolve = _RESOLVERS[kind]
+        self.entries = []   # (이름, payload, ModelIdentity 또는 None, 토큰 집합)
+        self.by_number = {}  # 모델 번호 -> 항목 위치 목록
+
+    @classmethod
+    def build(cls, kind, items):
+        """items: (장치 이름, payload) 반복자"""
+        index = cls(kind)
+        for name, payload in items:
+            index.add(name, payload)
+        return index
+
+    def add(self, name, payload=None):
+        name = (name or '').strip()
+        if not name:
+            return
+        upper = name.upper()
+        identity = self.resolve(name)
+        position = len(self.entries)
+        self.entries.append((name, payload, identity, frozenset(_TOKEN_PATTERN.findall(upper))))
+        numbers = {identity.number} if identity else set(_NUMBER_PATTERN.findall(upper))
+        for number in numbers:
+            self.by_number.setdefault(number, []).append(position)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def candidates(self, query):
+        """(찾는 모델의 ModelIdentity 또는 None, 모델 번호가 같은 항목 위치 목록)"""
+        if isinstance(query, ModelIdentity):
+            return query, self.by_number.get(query.number, [])
+        identity = self.resolve(query) if query else None
+        if identity:
+            return identity, self.by_number.get(identity.number, [])
+        number = _NUMBER_PATTERN.search((query or '').upper())
+        return None, self.by_number.get(number.group(1), []) if number else []
+
+    def score(self, wanted, entry, query_flags=frozenset()):
+        """후보 하나의 점수 (규칙상 다른 모델이면 None). query_flags: 찾는 이름에 있는 노트북/모바일 표시"""
+        _, _, found, tokens = entry
+        if (tokens & _VARIANT_TOKENS) - query_flags:
+            # 데스크탑 "RTX 4060"이 "RTX 4060 Laptop GPU" 점수를 받지 않도록 (접미사 불일치와 같이 제외)
+            return None
+        penalty = 0
+        if wanted is None or found is None:
+            # 모델을 해석하지 못한 쪽이 있으면 접미사가 없는 행만 허용 ("GPU 5060" -> "RTX 5060")
+            if found is not None and found.suffix:
+                return None
+            return SCORE_EXACT - PENALTY_UNKNOWN_FAMILY * 2 - penalty - PENALTY_PER_TOKEN * len(tokens)
+
+        suffix_penalty = _suffix_penalty(self.kind, wanted.suffix, found.suffix)
+        if suffix_penalty is None:
+            return None
+        if wanted.vendor and found.vendor and wanted.vendor != found.vendor:
+            return None
+        if wanted.family and found.family and wanted.family != found.family:
+            return None
+        if not (wanted.family and found.family):
+            penalty += PENALTY_UNKNOWN_FAMILY
+        return SCORE_EXACT - suffix_penalty - penalty - PENALTY_PER_TOKEN * len(tokens)
+
+    def match(self, query):
+        """가장 잘 맞는 행 (DeviceMatch) 또는 None. query: 이름 문자열 또는 ModelIdentity"""
+        wanted, positions = self.candidates(query)
+        # ModelIdentity로 찾는 경우는 다나와 상품(데스크탑 부품)이므로 표시 없음
+        query_flags = frozenset() if isinstance(query, ModelIdentity) else \
+            frozenset(_TOKEN_PATTERN.findall((query or '').upper())) & _VARIANT_TOKENS
+        best = None
+        for position in positions:
+            entry = self.entries[position]
+            score = self.score(wanted, entry, query_flags)
+            if score is not None and (best is None or score > best.score):
+                best = DeviceMatch(entry[0], entry[1], score)
+        return best
+
+
+_SOURCE_INDEXES = {}
+
+
+def get_source_index(source_key, kind, loader, ttl=BENCHMARK_INDEX_TTL):
+    """
+    소스별 색인을 한 번 만들어 재사용합니다.
+
+    Args:
+        source_key: 소스/조회 조건을 구분하는 해시 가능한 키
+        loader: (장치 이름, payload) 목록을 돌려주는 함수. None을 돌려주면 (조회 실패) 캐시하지 않음
+    """
+    cached = _SOURCE_INDEXES.get(source_key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    items = loader()
+    if items is None:
+        return None
+    index = DeviceIndex.build(kind, items)
+    _SOURCE_INDEXES[source_key] = (time.monotonic(), index)
+    return index
@@ -0,0 +1,328 @@
+"""
+크롤러 목록 페이지 루프(crawler.scrape_category) 오프라인 점검
+
+브라우저/네트워크/MySQL 없이 작은 다나와 목록 HTML을 가짜 Playwright 페이지로 열고,
+가짜 DB 엔진에 실행된 SQL을 기록해 scrape_category의 페이지 루프를 처음부터 끝까지 실행합니다.
+1. 전체 수집 (CPU, 그래픽카드): 마감 예산(--deadline)을 켠 채 목록 -> 상품 저장 -> 벤치마크/리뷰 단계까지 진행
+   (벤치마크/리뷰 사이트는 차단기를 미리 열어 두어 실제 요청 없이 재시도 대기열로 들어가는지 확인)
+2. 가격만 갱신 (--prices-only): 알려진 상품의 가격 변경이 UPDATE 한 번으로 저장되는지 확인 (INSERT 없음)
+3. 목록 페이지 이동 실패: 실패한 페이지 번호를 돌려주는지 확인
+4. 목록 페이지 차단 응답(429): 예외 없는 goto도 실패한 페이지로 처리하는지 확인
+기대와 다르거나 루프 안에서 예외가 나면 실패(종료 코드 1)합니다.
+
+사용법:
+    python check_crawl_loop.py              # 점검 실행 (크롤러 로그는 실패할 때만 출력)
+    python check_crawl_loop.py --verbose    # 크롤러 로그도 함께 출력
+"""
+import io
+import os
+import sys
+import asyncio
+import argparse
+import contextlib
+
+# crawler를 불러올 때 MySQL 스키마 확인을 건너뜀 (엔진은 만들지만 연결하지 않음)
+os.environ.setdefault('CRAWLER_SKIP_SCHEMA', '1')
+# 미룬 벤치마크/리뷰 작업을 카테고리 끝에서 쿨다운을 기다려 재시도하지 않음 (실제 사이트로 요청하지 않도록)
+os.environ.setdefault('CIRCUIT_REQUEUE_MAX_WAIT', '0')
+
+from bs4 import BeautifulSoup
+from sqlalchemy import text
+
+import crawler
+import crawl_deadline
+from circuit_breaker import CIRCUITS, CIRCUIT_FAILURE_THRESHOLD
+
+LIST_PAGE = """
+<ul class="product_list">
+  <li class="prod_item" id="productItem{pcode}">
+    <div class="thumb_image"><img class="lazyload" data-src="//img.danawa.com/prod_img/{pcode}.jpg"></div>
+    <p class="prod_name"><a href="https://prod.danawa.com/info/?pcode={pcode}">{name}</a></p>
+    <div class="spec_list">{spec}</div>
+    <div class="prod_sub_meta">
+      <div class="meta_item">상품의견 <span class="dd"><strong>1,234</strong></span></div>
+      <div class="meta_item">상품리뷰 <span class="text__score">4.8</span></div>
+    </div>
+    <p class="price_sect"><a href="#"><strong>{price}</strong>원</a></p>
+  </li>
+</ul>
+"""
+EMPTY_PAGE = '<ul class="product_list"></ul>'
+# 카테고리 -> 목록 1페이지의 상품 (2페이지는 비어 있어 루프가 멈춤)
+ITEMS = {
+    'CPU': dict(pcode=1001, name='AMD 라이젠5-6세대 7500F (라파엘) (멀티팩(정품))',
+                spec='데스크탑 / AMD(소켓AM5) / 6코어 / 12스레드 / 기본 클럭: 3.7GHz / 최대 클럭: 5.0GHz'),
+    '그래픽카드': dict(pcode=1002, name='MSI 지포스 RTX 5060 벤투스 2X OC D7 8GB',
+                     spec='PCIe5.0 / GDDR7 / 8GB / 부스트클럭: 2497MHz / 스트림 프로세서: 3840개'),
+}
+BENCHMARK_SOURCES = ('render4you.com', 'geekbench.com', 'opendata.blender.org', '3dmark.com', 'quasarzone.com')
+
+
+class FakeLocator:
+    """BeautifulSoup 위에서 동작하는 Playwright Locator 흉내 (지연 평가, 요소가 없으면 예외)"""
+
+    def __init__(self, resolve):
+        self._resolve = resolve
+
+    def locator(self, selector):
+        def resolve():
+            found = []
+            for element in self._resolve():
+                found.extend(match for match in element.select(selector) if match not in found)
+            return found
+        return FakeLocator(resolve)
+
+    def nth(self, index):
+        return FakeLocator(lambda: self._resolve()[index:index + 1])
+
+    @property
+    def first(self):
+        return self.nth(0)
+
+    def _one(self):
+        elements = self._resolve()
+        if not elements:
+            raise TimeoutError("요소 없음")
+        return elements[0]
+
+    async def count(self):
+        return len(self._resolve())
+
+    async def wait_for(self, timeout=None):
+        self._one()
+
+    async def inner_text(self, timeout=None):
+        return self._one().get_text(' ', strip=True)
+
+    async def get_attribute(self, name, timeout=None):
+        return self._one().get(name)
+
+    async def evaluate(self, script):
+        raise NotImplementedError("가짜 페이지는 JavaScript를 실행하지 않음")
+
+
+class FakeMouse:
+    async def wheel(self, delta_x, delta_y):
+        pass
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+
+class FakePage:
+    """목록 페이지 번호 -> HTML (goto 때 바뀜), 이동한 URL 기록"""
+
+    def __init__(self, pages, fail_goto=False, status=200):
+        self.pages = pages
+        self.fail_goto = fail_goto
+        self.status = status
+        self.visited = []
+        self.soup = BeautifulSoup('', 'html.parser')
+        self.mouse = FakeMouse()
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        self.visited.append(url)
+        if self.fail_goto:
+            raise TimeoutError(f"페이지 이동 실패: {url}")
+        page_num = int(url.rsplit('page=', 1)[1])
+        self.soup = BeautifulSoup(self.pages.get(page_num, EMPTY_PAGE), 'html.parser')
+        return FakeResponse(self.status)
+
+    async def wait_for_selector(self, selector, timeout=None):
+        if not self.soup.select(selector):
+            raise TimeoutError(f"선택자 없음: {selector}")
+
+    async def wait_for_timeout(self, milliseconds):
+        pass
+
+    async def wait_for_load_state(self, state=None, timeout=None):
+        pass
+
+    async def inner_text(self, selector, timeout=None):
+        return self.soup.get_text(' ', strip=True)
+
+    def locator(self, selector):
+        return FakeLocator(lambda: [self.soup]).locator(selector)
+
+
+class FakeResult:
+    def __init__(self, rows=None, lastrowid=None):
+        self.rows = rows or []
+        self.lastrowid = lastrowid
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def scalar_one_or_none(self):
+        return 1
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def begin(self):
+        return self
+
+    def execute(self, statement, params=None):
+        sql = ' '.join(str(statement).split())
+        self.engine.statements.append(sql)
+        if sql.startswith('SELECT link, id, price FROM parts'):
+            return FakeResult(list(self.engine.known_prices))
+        if sql.startswith('INSERT INTO parts'):
+            self.engine.next_id += 1
+            return FakeResult(lastrowid=self.engine.next_id)
+        return FakeResult()
+
+
+class FakeEngine:
+    """실행된 SQL만 기록하는 엔진 (신규 상품은 INSERT마다 새 id, --prices-only의 저장된 가격은 known_prices)"""
+
+    def __init__(self, known_prices=()):
+        self.known_prices = known_prices
+        self.statements = []
+        self.next_id = 100
+
+    def connect(self):
+        return FakeConnection(self)
+
+    def begin(self):
+        return FakeConnection(self)
+
+    def count(self, prefix):
+        return sum(1 for sql in self.statements if sql.startswith(prefix))
+
+
+SQL_PARTS = text("INSERT INTO parts (name, category, price, link) VALUES (:name, :category, :price, :link)")
+SQL_SPECS = text("INSERT INTO part_spec (part_id, specs) VALUES (:part_id, :specs)")
+SQL_REVIEW = text("INSERT INTO community_reviews (part_id, source, raw_text) VALUES (:part_id, :source, :raw_text)")
+SQL_CHECK_REVIEW = text("SELECT 1 FROM community_reviews WHERE part_id = :part_id LIMIT 1")
+
+
+async def run_category(page, engine, category_name, **options):
+    return await crawler.scrape_category(None, page, engine, category_name, crawler.CATEGORIES[category_name],
+                                         sql_parts=SQL_PARTS, sql_specs=SQL_SPECS, sql_review=SQL_REVIEW,
+                                         sql_check_review=SQL_CHECK_REVIEW, **options)
+
+
+def list_pages(category_name, price):
+    return {1: LIST_PAGE.format(price=price, **ITEMS[category_name])}
+
+
+async def check_full_crawl():
+    """마감 예산을 켠 전체 수집: 모든 페이지를 열고 상품을 저장한 뒤 벤치마크/리뷰 단계가 차단기 대기열로 가는지"""
+    problems = []
+    for source in BENCHMARK_SOURCES:
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+            CIRCUITS.record_failure(source)
+    skipped_before = {source: CIRCUITS.circuits[source].skipped for source in BENCHMARK_SOURCES}
+    crawl_deadline.begin(3600, total_pages=crawler.CRAWL_PAGES * 2)
+
+    engine = FakeEngine()
+    for category_name in ('CPU', '그래픽카드'):
+        page = FakePage(list_pages(category_name, '189,000'))
+        failed = await run_category(page, engine, category_name, collect_reviews=True, collect_benchmarks=True)
+        if failed:
+            problems.append(f"{category_name}: 실패한 페이지 {failed}")
+        if len(page.visited) != 2:
+            problems.append(f"{category_name}: 목록 페이지 {len(page.visited)}개 이동 (기대 2개: 상품 페이지 + 빈 페이지에서 중단)")
+
+    if engine.count('INSERT INTO parts') != 2:
+        problems.append(f"parts 저장 {engine.count('INSERT INTO parts')}건 (기대 2건: 카테고리마다 상품 1개)")
+    skipped = {source: CIRCUITS.circuits[source].skipped - skipped_before[source] for source in BENCHMARK_SOURCES}
+    expected = {
+        'render4you.com': 1, 'geekbench.com': 1,
+        'opendata.blender.org': 2,                        # CPU Blender + GPU Blender
+        '3dmark.com': len(crawler.THREEDMARK_TESTS),      # 기본 테스트 + 추가 테스트 (마감 예산 통과)
+        'quasarzone.com': 2,                              # 리뷰는 모든 상품
+    }
+    if skipped != expected:
+        problems.append(f"차단기로 미룬 작업 {skipped} (기대 {expected})")
+    crawl_deadline.begin(None, 0)
+    return problems
+
+
+async def check_prices_only():
+    """--prices-only: 알려진 상품 하나의 가격 변경만 UPDATE 한 번으로 저장"""
+    problems = []
+    crawl_deadline.begin(3600, total_pages=crawler.CRAWL_PAGES, prices_only=True)
+    known_link = f"https://prod.danawa.com/info/?pcode={ITEMS['CPU']['pcode']}"
+    engine = FakeEngine(known_prices=[(known_link, 7, 199000)])
+    page = FakePage(list_pages('CPU', '189,000'))
+    failed = await run_category(page, engine, 'CPU', collect_reviews=False, collect_benchmarks=False, prices_only=True)
+    if failed:
+        problems.append(f"실패한 페이지 {failed}")
+    if engine.count('UPDATE parts SET price') != 1:
+        problems.append(f"가격 UPDATE {engine.count('UPDATE parts SET price')}건 (기대 1건)")
+    if engine.count('INSERT INTO parts') != 0:
+        problems.append("가격만 갱신인데 parts INSERT 실행")
+    crawl_deadline.begin(None, 0)
+    return problems
+
+
+async def check_failed_goto():
+    """목록 페이지를 열지 못하면 그 페이지 번호를 돌려줌 (분산 작업자는 다시 대기열로)"""
+    page = FakePage({}, fail_goto=True)
+    failed = await run_category(page, FakeEngine(), 'CPU', collect_reviews=False, collect_benchmarks=False)
+    expected = list(range(1, crawler.CRAWL_PAGES + 1))
+    return [] if failed == expected else [f"실패한 페이지 {failed} (기대 {expected})"]
+
+
+async def check_blocked_status():
+    """goto가 429로 응답하면 상품을 읽지 않고 실패한 페이지로 돌려줌 (goto_checked)"""
+    engine = FakeEngine()
+    page = FakePage(list_pages('CPU', '189,000'), status=429)
+    failed = await run_category(page, engine, 'CPU', collect_reviews=False, collect_benchmarks=False)
+    expected = list(range(1, crawler.CRAWL_PAGES + 1))
+    problems = [] if failed == expected else [f"실패한 페이지 {failed} (기대 {expected})"]
+    if engine.count('INSERT INTO parts'):
+        problems.append("차단 응답 페이지의 상품을 저장함")
+    return problems
+
+
+CHECKS = (
+    ('전체 수집 (마감 예산)', check_full_crawl),
+    ('가격만 갱신', check_prices_only),
+    ('목록 페이지 이동 실패', check_failed_goto),
+    ('목록 페이지 차단 응답 (429)', check_blocked_status),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="scrape_category 페이지 루프 오프라인 점검")
+    parser.add_argument('--verbose', action='store_true', help='크롤러 로그도 출력')
+    args = parser.parse_args()
+
+    failures = 0
+    for name, check in CHECKS:
+        log = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(sys.stdout if args.verbose else log):
+                problems = asyncio.run(check())
+        except Exception as e:
+            problems = [f"예외 {type(e).__name__}: {e}"]
+        if problems:
+            failures += 1
+            print(f"❌ {name}")
+            for problem in problems:
+                print(f"  - {problem}")
+            if not args.verbose:
+                print(log.getvalue()[-4000:])
+        else:
+            print(f"✅ {name}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+외부 벤치마크/리뷰 사이트별 차단기 (circuit breaker)
+
+3DMark나 퀘이사존이 느려지거나 요청을 막으면, 남은 모든 부품이 매번 긴 타임아웃(탐색 90초, 대기 10초, 재시도 3회)을
+그대로 치르게 됩니다. 사이트(호스트)마다 차단기를 두어
+    closed    - 정상. 최근 CIRCUIT_FAILURE_WINDOW초 안에 성공 없이 CIRCUIT_FAILURE_THRESHOLD번 연속 실패하면 open
+    open      - CIRCUIT_COOLDOWN초 동안 이 사이트로 가는 요청/작업을 바로 건너뜀 (작업은 재시도 대기열로)
+    half_open - 쿨다운이 지나면 작업 하나만 시험 삼아 보내고, 성공하면 closed, 실패하면 다시 open
+으로 동작합니다. 실패/성공은 host_scheduler의 요청 단위(페이지 이동, requests 호출)로 기록됩니다.
+requests는 403/429/5xx에도 예외를 내지 않으므로, 응답을 받은 뒤 polite_sync 블록 안에서
+raise_for_blocking_status로 차단/과부하 응답을 실패로 바꿉니다.
+
+    if CIRCUITS.allow('3dmark.com'):
+        try:
+            await scrape(...)
+        finally:
+            CIRCUITS.release('3dmark.com')
+    else:
+        CIRCUITS.defer('3dmark.com', label, scrape)   # 카테고리 끝에서 다시 시도
+"""
+import os
+import time
+from collections import deque
+
+# --- 설정 ---
+CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("CIRCUIT_FAILURE_THRESHOLD", "3"))
+CIRCUIT_FAILURE_WINDOW = float(os.environ.get("CIRCUIT_FAILURE_WINDOW", "300"))
+CIRCUIT_COOLDOWN = float(os.environ.get("CIRCUIT_COOLDOWN", "120"))
+# 재시도 대기열을 처리할 때 쿨다운이 이보다 많이 남았으면 기다리지 않고 다음 실행으로 넘김 (초)
+CIRCUIT_REQUEUE_MAX_WAIT = float(os.environ.get("CIRCUIT_REQUEUE_MAX_WAIT", "180"))
+
+# 차단기를 적용하는 호스트 (다나와는 크롤링 본체라 제외)
+CIRCUIT_SOURCES = ('quasarzone.com', 'geekbench.com', '3dmark.com', 'render4you.com', 'opendata.blender.org')
+
+
+# 차단(403), 요청 한도 초과(429), 서버 과부하(5xx) 응답은 요청 실패로 기록
+BLOCKING_STATUS_CODES = (403, 429)
+
+
+class CircuitOpenError(Exception):
+    """차단기가 열린 사이트로 요청하려고 할 때 (쿨다운 중)"""
+
+
+class BlockedResponseError(Exception):
+    """사이트가 차단/과부하 상태 코드로 응답함"""
+
+
+def raise_for_blocking_status(status_code, url=''):
+    """403/429/5xx 응답이면 BlockedResponseError (polite_sync 블록 안에서 호출해 차단기에 실패로 기록)"""
+    if status_code in BLOCKING_STATUS_CODES or (status_code or 0) >= 500:
+        raise BlockedResponseError(f"HTTP {status_code} {url}".strip())
+
+
+class _Circuit:
+    def __init__(self, source):
+        self.source = source
+        self.state = 'closed'
+        self.failures = deque()     # 연속 실패 시각 (성공하면 비움)
+        self.opened_at = 0.0
+        self.probing = False        # half_open에서 시험 작업이 진행 중인지
+        self.deferred = []          # (작업 이름, 작업 함수)
+        self.trips = 0
+        self.skipped = 0
+
+    def remaining_cooldown(self, now=None):
+        if self.state != 'open':
+            return 0.0
+        return max(0.0, self.opened_at + CIRCUIT_COOLDOWN - (now or time.monotonic()))
+
+    def refresh(self, now):
+        """쿨다운이 끝난 open -> half_open"""
+        if self.state == 'open' and self.remaining_cooldown(now) == 0:
+            self.state = 'half_open'
+            self.probing = False
+            print(f"        -> (차단기) {self.source} 쿨다운 종료: 시험 요청으로 복구 확인")
+
+
+class CircuitRegistry:
+    def __init__(self, sources=CIRCUIT_SOURCES):
+        self.circuits = {source: _Circuit(source) for source in sources}
+
+    def _get(self, source):
+        circuit = self.circuits.get(source)
+        if circuit is not None:
+            circuit.refresh(time.monotonic())
+        return circuit
+
+    def state(self, source):
+        circuit = self._get(source)
+        return circuit.state if circuit else 'closed'
+
+    def allow(self, source):
+        """이 사이트로 새 작업을 시작해도 되는지 (half_open이면 시험 작업 하나만 허용)"""
+        circuit = self._get(source)
+        if circuit is None or circuit.state == 'closed':
+            return True
+        if circuit.state == 'half_open' and not circuit.probing:
+            circuit.probing = True
+            return True
+        circuit.skipped += 1
+        return False
+
+    def release(self, source):
+        """작업 종료: 시험 작업이 요청 없이 끝났으면 다음 작업이 다시 시험할 수 있게 함"""
+        circuit = self.circuits.get(source)
+        if circuit is not None and circuit.state == 'half_open':
+            circuit.probing = False
+
+    def check(self, source):
+        """요청 직전 검사: 쿨다운 중이면 CircuitOpenError (진행 중이던 작업의 남은 요청도 바로 끝냄)"""
+        circuit = self._get(source)
+        if circuit is not None and circuit.state == 'open':
+            circuit.skipped += 1
+            raise CircuitOpenError(f"{source} 차단기 열림 (쿨다운 {circuit.remaining_cooldown():.0f}초 남음)")
+
+    def record_success(self, source):
+        circuit = self.circuits.get(source)
+        if circuit is None:
+            return
+        circuit.failures.clear()
+        if circuit.state != 'closed':
+            circuit.state = 'closed'
+            circuit.probing = False
+            print(f"        -> (차단기) {source} 복구 확인: 다시 정상 수집")
+
+    def record_failure(self, source, error=None):
+        circuit = self.circuits.get(source)
+        if circuit is None:
+            return
+        now = time.monotonic()
+        if circuit.state == 'half_open':
+            self._trip(circuit, now, '시험 요청 실패')
+            return
+        if circuit.state == 'open':
+            return
+        circuit.failures.append(now)
+        while circuit.failures and now - circuit.failures[0] > CIRCUIT_FAILURE_WINDOW:
+            circuit.failures.popleft()
+        if len(circuit.failures) >= CIRCUIT_FAILURE_THRESHOLD:
+            reason = f"{len(circuit.failures)}회 연속 실패"
+            if error is not None:
+                reason += f", 마지막 오류 {type(error).__name__}"
+            self._trip(circuit, now, reason)
+
+    def _trip(self, circuit, now, reason):
+        circuit.state = 'open'
+        circuit.opened_at = now
+        circuit.probing = False
+        circuit.failures.clear()
+        circuit.trips += 1
+        print(f"        -> (차단기) {circuit.source} 열림 ({reason}): {CIRCUIT_COOLDOWN:.0f}초 동안 건너뜀")
+
+    def defer(self, source, label, work):
+        """건너뛴 작업을 재시도 대기열에 넣음 (work: 새 DB 커넥션을 받아 실행하는 함수)"""
+        self.circuits[source].deferred.append((label, work))
+
+    def take_deferred(self):
+        """[(사이트, 남은 쿨다운 초, [(작업 이름, 작업 함수)])] - 대기열을 비움"""
+        now = time.monotonic()
+        batches = []
+        for circuit in self.circuits.values():
+            if circuit.deferred:
+                batches.append((circuit.source, circuit.remaining_cooldown(now), circuit.deferred))
+                circuit.deferred = []
+        return batches
+
+    def summary(self):
+        """차단기가 한 번이라도 열린 사이트의 (상태, 열린 횟수, 건너뛴 작업/요청 수)"""
+        return {source: (circuit.state, circuit.trips, circuit.skipped)
+                for source, circuit in self.circuits.items() if circuit.trips}
+
+
+CIRCUITS = CircuitRegistry()
+
+
+def print_circuit_summary():
+    stats = CIRCUITS.summary()
+    if not stats:
+        return
+    print("--- 차단기 (사이트 / 상태 / 열린 횟수 / 건너뜀) ---")
+    for source, (state, trips, skipped) in sorted(stats.items()):
+        print(f"   {source:<24} {state} / {trips}회 / {skipped}건")
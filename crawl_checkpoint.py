@@ -0,0 +1,218 @@
+"""
+크롤링 진행 상황 체크포인트 (중단/선점 후 --resume으로 이어서 실행)
+
+Cloud Run 작업이 중간에 종료되어도 다음 실행이 CPU 1페이지부터 다시 시작하지 않도록,
+작업이 커밋될 때마다 진행 상황(크롤링 프런티어)을 DB에 기록합니다.
+    category - 모든 페이지를 처리한 카테고리
+    page     - 모든 상품을 처리한 목록 페이지 ("카테고리:페이지")
+    item     - 모든 용량/단계를 처리한 상품 (목록의 상품 링크)
+    stage    - 부품(용량별 상품 링크)별로 끝난 수집 단계 ("링크|benchmarks", "링크|reviews")
+
+SIGTERM/SIGINT를 받으면 새 상품/페이지/카테고리를 시작하지 않고, 진행 중인 상품의 DB 저장까지만 마친 뒤
+(벤치마크/리뷰 등 부가 수집은 건너뜀) 실행을 'interrupted'로 기록하고 끝냅니다.
+중단 없이 끝났어도 끝내지 못한 페이지(실패한 상품, 건너뛴 부가 수집)가 있으면 완료로 기록하지 않고 'interrupted'로 남겨
+--resume이 그 페이지를 다시 엽니다.
+
+    python crawler.py --benchmarks            # 새 실행 (이전 미완료 실행은 abandoned 처리)
+    python crawler.py --resume                # 마지막 미완료 실행을 같은 옵션으로 이어서 실행
+
+    begin_run(engine, options, resume=True)
+    if is_done('page', 'CPU:2'): 건너뜀
+    mark('page', 'CPU:2')
+    mark_incomplete('page', 'CPU:3')          # 이번 실행에서는 완료로 기록하지 않음 (실행은 interrupted)
+"""
+import json
+import signal
+import asyncio
+import hashlib
+
+from sqlalchemy import text
+
+# 이어서 실행할 수 있는 실행 상태 (running: 강제 종료/크래시, interrupted: SIGTERM으로 정상 중단)
+RESUMABLE_STATUSES = ('running', 'interrupted')
+_RESUMABLE_SQL = "('" + "', '".join(RESUMABLE_STATUSES) + "')"
+
+
+def ensure_tables(engine):
+    """체크포인트 테이블이 없으면 생성합니다."""
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS crawl_runs (
+                run_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                options TEXT NOT NULL COMMENT '실행 옵션 JSON (--resume 시 그대로 사용)',
+                status VARCHAR(16) NOT NULL DEFAULT 'running' COMMENT 'running | interrupted | done | abandoned',
+                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                KEY idx_crawl_runs_status (status, run_id)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """))
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS crawl_progress (
+                run_id BIGINT NOT NULL,
+                kind VARCHAR(16) NOT NULL COMMENT 'category | page | item | stage',
+                key_hash CHAR(40) NOT NULL COMMENT 'progress_key의 SHA-1 (긴 URL 키 인덱스용)',
+                progress_key VARCHAR(1024) NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (run_id, kind, key_hash)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """))
+
+
+def _hash(key):
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def find_resumable(engine):
+    """마지막 미완료 실행 -> (run_id, 옵션 dict) 또는 None"""
+    ensure_tables(engine)
+    with engine.connect() as conn:
+        row = conn.execute(text(f"""
+            SELECT run_id, options FROM crawl_runs
+            WHERE status IN {_RESUMABLE_SQL} ORDER BY run_id DESC LIMIT 1
+        """)).fetchone()
+    if not row:
+        return None
+    return row[0], json.loads(row[1])
+
+
+class CrawlCheckpoint:
+    """실행 하나의 진행 상황 (시작 시 DB에서 한 번 읽고, 이후에는 기록만 함)"""
+
+    def __init__(self, engine, run_id, done):
+        self.engine = engine
+        self.run_id = run_id
+        self.done = done  # kind -> {progress_key}
+
+    @classmethod
+    def begin(cls, engine, options, resume=False):
+        ensure_tables(engine)
+        resumable = find_resumable(engine) if resume else None
+        if resumable:
+            run_id = resumable[0]
+            with engine.begin() as conn:
+                conn.execute(text("UPDATE crawl_runs SET status = 'running' WHERE run_id = :run_id"),
+                             {"run_id": run_id})
+                rows = conn.execute(text("SELECT kind, progress_key FROM crawl_progress WHERE run_id = :run_id"),
+                                    {"run_id": run_id}).fetchall()
+            done = {}
+            for kind, key in rows:
+                done.setdefault(kind, set()).add(key)
+            print(f"--- (재개) 실행 #{run_id} 이어서 진행: 카테고리 {len(done.get('category', ()))}개, "
+                  f"페이지 {len(done.get('page', ()))}개, 상품 {len(done.get('item', ()))}개 완료됨 ---")
+            return cls(engine, run_id, done)
+
+        if resume:
+            print("--- (재개) 이어서 실행할 미완료 실행이 없어 새로 시작합니다. ---")
+        with engine.begin() as conn:
+            # 이어서 실행하지 않기로 한 이전 미완료 실행은 정리
+            stale_ids = [row[0] for row in conn.execute(text(
+                f"SELECT run_id FROM crawl_runs WHERE status IN {_RESUMABLE_SQL}")).fetchall()]
+            if stale_ids:
+                conn.execute(text(f"UPDATE crawl_runs SET status = 'abandoned' WHERE status IN {_RESUMABLE_SQL}"))
+                for stale_id in stale_ids:
+                    conn.execute(text("DELETE FROM crawl_progress WHERE run_id = :run_id"), {"run_id": stale_id})
+            result = conn.execute(text("INSERT INTO crawl_runs (options) VALUES (:options)"),
+                                  {"options": json.dumps(options, ensure_ascii=False)})
+            run_id = result.lastrowid
+        print(f"--- 크롤링 실행 #{run_id} 시작 (중단되면 --resume으로 이어서 실행) ---")
+        return cls(engine, run_id, {})
+
+    def is_done(self, kind, key):
+        return key in self.done.get(kind, ())
+
+    def mark(self, kind, key):
+        """진행 상황 기록 (해당 작업의 트랜잭션이 커밋된 뒤 호출)"""
+        if self.is_done(kind, key):
+            return
+        with self.engine.begin() as conn:
+            conn.execute(text("""
+                INSERT IGNORE INTO crawl_progress (run_id, kind, key_hash, progress_key)
+                VALUES (:run_id, :kind, :key_hash, :progress_key)
+            """), {"run_id": self.run_id, "kind": kind, "key_hash": _hash(key), "progress_key": key[:1024]})
+        self.done.setdefault(kind, set()).add(key)
+
+    def finish(self, status):
+        """실행 종료 기록 (done이면 진행 상황 행은 더 필요 없으므로 삭제)"""
+        with self.engine.begin() as conn:
+            conn.execute(text("UPDATE crawl_runs SET status = :status WHERE run_id = :run_id"),
+                         {"status": status, "run_id": self.run_id})
+            if status == 'done':
+                conn.execute(text("DELETE FROM crawl_progress WHERE run_id = :run_id"), {"run_id": self.run_id})
+
+
+_ACTIVE = None
+_STOP_REQUESTED = False
+# 이번 실행에서 끝내지 못한 작업 (kind, key) - 완료로 기록하지 않고, 실행을 재개 가능하게 남김
+_INCOMPLETE = set()
+
+
+def begin_run(engine, options, resume=False):
+    """크롤링 시작 시 1회: 새 실행을 만들거나 마지막 미완료 실행을 이어받습니다."""
+    global _ACTIVE
+    _INCOMPLETE.clear()
+    _ACTIVE = CrawlCheckpoint.begin(engine, options, resume=resume)
+    return _ACTIVE
+
+
+def finish_run():
+    """크롤링 종료 시 1회: 중단 요청이 있었거나 끝내지 못한 작업이 있으면 interrupted, 아니면 done으로 기록"""
+    global _ACTIVE
+    if _ACTIVE is None:
+        return
+    status = 'interrupted' if _STOP_REQUESTED or _INCOMPLETE else 'done'
+    _ACTIVE.finish(status)
+    if _STOP_REQUESTED:
+        print(f"--- 실행 #{_ACTIVE.run_id} 중단 기록 완료: python crawler.py --resume 으로 이어서 실행 ---")
+    elif _INCOMPLETE:
+        pages = sum(1 for kind, _ in _INCOMPLETE if kind == 'page')
+        print(f"--- 실행 #{_ACTIVE.run_id}: 끝내지 못한 목록 페이지 {pages}개 (실패한 상품/건너뛴 부가 수집) - "
+              f"python crawler.py --resume 으로 이어서 수집 ---")
+    _ACTIVE = None
+
+
+def is_done(kind, key):
+    """체크포인트 없이(스크래퍼 단독 호출 등) 실행 중이면 항상 False"""
+    return _ACTIVE is not None and _ACTIVE.is_done(kind, key)
+
+
+def mark(kind, key):
+    """완료 기록 (이번 실행에서 끝내지 못한 것으로 기록된 작업은 무시)"""
+    if _ACTIVE is not None and (kind, key) not in _INCOMPLETE:
+        _ACTIVE.mark(kind, key)
+
+
+def mark_incomplete(kind, key):
+    """끝내지 못한 작업 기록: 이번 실행에서는 완료로 기록하지 않고, 실행은 interrupted로 끝남"""
+    if _ACTIVE is not None:
+        _INCOMPLETE.add((kind, key))
+
+
+def has_incomplete():
+    return bool(_INCOMPLETE)
+
+
+def stop_requested():
+    return _STOP_REQUESTED
+
+
+def request_stop(signum=None, frame=None):
+    global _STOP_REQUESTED
+    if _STOP_REQUESTED:
+        return
+    _STOP_REQUESTED = True
+    name = signal.Signals(signum).name if signum else '중단'
+    print(f"\n--- ({name}) 중단 요청: 진행 중인 상품 저장만 마치고 종료합니다. (새 작업 시작 안 함) ---")
+
+
+def install_stop_handlers():
+    """SIGTERM/SIGINT -> 중단 요청 (이벤트 루프 안에서 호출, 두 번째 신호는 기본 동작으로 즉시 종료)"""
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        def handler(signum=signum):
+            loop.remove_signal_handler(signum)
+            request_stop(signum)
+        try:
+            loop.add_signal_handler(signum, handler)
+        except (NotImplementedError, RuntimeError):
+            # Windows 이벤트 루프는 add_signal_handler 미지원
+            signal.signal(signum, request_stop)
@@ -0,0 +1,213 @@
+"""
+상주(daemon) 크롤러: 브라우저/DB 풀을 띄워 둔 채 카테고리별 갱신 작업을 주기마다 실행
+
+매번 새로 실행하면 import, 엔진 생성, DDL/ALTER, Chromium 시작, 퀘이사존 세션 획득을 실행마다 다시 치릅니다.
+상주 모드는 이 시작 비용을 한 번만 치르고, (카테고리, 작업 종류)마다 정해진 주기가 지난 작업만 실행합니다.
+    prices     - 다나와 목록 가격 (DAEMON_PRICES_ONLY=1: 알려진 상품 가격만)  기본 1시간마다
+    reviews    - 다나와 목록 + 퀘이사존 리뷰                 기본 1일마다
+    benchmarks - 다나와 목록 + 벤치마크 (TTL이 지난 값만)    기본 7일마다
+같은 카테고리에서 여러 작업이 함께 밀려 있으면 목록을 한 번만 돌면서 같이 처리하고, 다나와 목록은 항상 저장되므로
+리뷰/벤치마크 작업을 실행하면 prices 작업도 실행한 것으로 칩니다.
+
+주기 설정 (DAEMON_JOBS, 단위 s/m/h/d, 0이면 끔, "카테고리:종류"로 카테고리별 덮어쓰기):
+    DAEMON_JOBS="prices=1h,reviews=1d,benchmarks=7d,그래픽카드:prices=30m,HDD:reviews=0"
+
+진행 상황은 로컬 상태 엔드포인트(DAEMON_STATUS_HOST:DAEMON_STATUS_PORT, 기본 127.0.0.1:8787)에서 JSON으로 확인합니다.
+
+    python crawler.py --daemon                     # 상주 실행 (SIGTERM/Ctrl+C: 진행 중인 작업을 마치고 종료)
+    python crawler.py --daemon --summarize         # 리뷰 작업에서 즉시 AI 요약
+    curl http://127.0.0.1:8787/status
+"""
+import os
+import re
+import json
+import time
+import argparse
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from host_scheduler import HOST_SCHEDULER
+from circuit_breaker import CIRCUITS
+
+# 작업 종류 (앞에 있을수록 싼 작업, 뒤의 작업은 prices를 포함)
+JOB_KINDS = ('prices', 'reviews', 'benchmarks')
+DAEMON_JOBS = os.environ.get("DAEMON_JOBS", "prices=1h,reviews=1d,benchmarks=7d")
+# 동시에 실행할 카테고리 작업 수 (브라우저 하나에 목록 페이지를 이 수만큼 띄워 둠)
+DAEMON_PAGES = int(os.environ.get("DAEMON_PAGES", "2"))
+# 브라우저를 이 수만큼 작업을 실행한 뒤 (진행 중인 작업이 끝나면) 다시 시작 (메모리 해제)
+DAEMON_RECYCLE_JOBS = int(os.environ.get("DAEMON_RECYCLE_JOBS", "30"))
+# 실패한 작업은 주기 대신 이 시간 뒤에 다시 시도 (초)
+DAEMON_RETRY_SECONDS = float(os.environ.get("DAEMON_RETRY_SECONDS", "600"))
+# prices 작업을 가격만 갱신하는 빠른 경로(--prices-only)로 실행
+# (신규 상품/스펙은 reviews/benchmarks 작업에서 저장, 0이면 prices 작업도 목록 전체를 저장)
+DAEMON_PRICES_ONLY = os.environ.get("DAEMON_PRICES_ONLY", "1") == "1"
+DAEMON_STATUS_HOST = os.environ.get("DAEMON_STATUS_HOST", "127.0.0.1")
+DAEMON_STATUS_PORT = int(os.environ.get("DAEMON_STATUS_PORT", "8787"))
+
+_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_interval(value):
+    """'90', '30m', '1h', '7d' -> 초"""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*', value.lower())
+    if not match:
+        raise ValueError(f"주기 형식 오류: {value!r} (예: 30m, 1h, 7d)")
+    return float(match.group(1)) * _UNITS[match.group(2)]
+
+
+def load_job_intervals(categories, spec=DAEMON_JOBS):
+    """DAEMON_JOBS -> {(카테고리, 종류): 주기 초} (주기가 0인 작업은 제외)"""
+    defaults, overrides = {}, {}
+    for entry in filter(None, (part.strip() for part in spec.split(','))):
+        key, _, value = entry.partition('=')
+        category, _, kind = key.strip().rpartition(':')
+        if kind not in JOB_KINDS:
+            raise ValueError(f"알 수 없는 작업 종류: {kind!r} (가능: {', '.join(JOB_KINDS)})")
+        if category and category not in categories:
+            raise ValueError(f"알 수 없는 카테고리: {category!r}")
+        (overrides.setdefault(category, {}) if category else defaults)[kind] = parse_interval(value)
+    intervals = {}
+    for category in categories:
+        for kind, seconds in {**defaults, **overrides.get(category, {})}.items():
+            if seconds > 0:
+                intervals[(category, kind)] = seconds
+    return intervals
+
+
+class JobSchedule:
+    """(카테고리, 종류)별 마지막 실행 시각과 다음 실행 시각 (시작 직후에는 모든 작업이 밀린 상태)"""
+
+    def __init__(self, intervals):
+        self.intervals = intervals
+        self.next_due = {key: 0.0 for key in intervals}
+        self.history = {key: {"runs": 0, "failures": 0, "last_started": None, "last_duration": None,
+                              "last_error": None} for key in intervals}
+
+    def due(self, now, busy=()):
+        """지금 실행할 작업 -> [(카테고리, [종류])] (가장 오래 밀린 카테고리부터, busy 카테고리 제외)"""
+        by_category = {}
+        for (category, kind), due_at in self.next_due.items():
+            if due_at <= now and category not in busy:
+                overdue = by_category.setdefault(category, [0.0, []])
+                overdue[0] = max(overdue[0], now - due_at)
+                overdue[1].append(kind)
+        ordered = sorted(by_category.items(), key=lambda item: -item[1][0])
+        return [(category, sorted(kinds, key=JOB_KINDS.index)) for category, (_, kinds) in ordered]
+
+    def covered(self, category, kinds):
+        """이번 실행으로 같이 갱신되는 작업 (리뷰/벤치마크 실행은 목록 가격도 저장)"""
+        covered = set(kinds)
+        if (category, 'prices') in self.intervals:
+            covered.add('prices')
+        return sorted(covered, key=JOB_KINDS.index)
+
+    def record(self, category, kinds, started, finished, error=None):
+        for kind in self.covered(category, kinds):
+            key = (category, kind)
+            history = self.history[key]
+            history["runs"] += 1
+            history["last_started"] = started
+            history["last_duration"] = round(finished - started, 1)
+            history["last_error"] = str(error)[:300] if error else None
+            if error:
+                history["failures"] += 1
+                self.next_due[key] = finished + min(DAEMON_RETRY_SECONDS, self.intervals[key])
+            else:
+                self.next_due[key] = started + self.intervals[key]
+
+    def seconds_until_next(self, now):
+        return max(0.0, min(self.next_due.values(), default=now) - now)
+
+
+def _clock(timestamp):
+    return datetime.fromtimestamp(timestamp).isoformat(timespec='seconds') if timestamp else None
+
+
+class DaemonStatus:
+    """상태 엔드포인트가 읽는 상주 크롤러 상태 (이벤트 루프와 HTTP 스레드가 공유)"""
+
+    def __init__(self, schedule):
+        self.schedule = schedule
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.browser_launches = 0
+        self.jobs_run = 0
+        self.running = {}      # 카테고리 -> (종류 목록, 시작 시각)
+        self.state = 'starting'
+
+    def update(self, **fields):
+        with self.lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+
+    def job_started(self, category, kinds):
+        with self.lock:
+            self.running[category] = (kinds, time.time())
+
+    def job_finished(self, category):
+        with self.lock:
+            self.running.pop(category, None)
+            self.jobs_run += 1
+
+    def snapshot(self):
+        # 단조 시계(next_due) -> 벽시계 변환
+        offset = time.time() - time.monotonic()
+        with self.lock:
+            return {
+                "state": self.state,
+                "started_at": _clock(self.started_at),
+                "uptime_seconds": round(time.time() - self.started_at),
+                "browser_launches": self.browser_launches,
+                "jobs_run": self.jobs_run,
+                "running": {category: {"kinds": kinds, "started_at": _clock(started)}
+                            for category, (kinds, started) in self.running.items()},
+                "jobs": [{
+                    "category": category, "kind": kind,
+                    "interval_seconds": self.schedule.intervals[(category, kind)],
+                    "next_due": _clock(max(self.schedule.next_due[(category, kind)] + offset, self.started_at)),
+                    **{name: (_clock(value + offset) if name == "last_started" and value else value)
+                       for name, value in history.items()},
+                } for (category, kind), history in self.schedule.history.items()],
+                "hosts": {host: {"requests": requests, "waited_seconds": round(waited, 1)}
+                          for host, (requests, waited) in HOST_SCHEDULER.summary().items()},
+                "circuits": {source: {"state": state, "trips": trips, "skipped": skipped}
+                             for source, (state, trips, skipped) in CIRCUITS.summary().items()},
+            }
+
+
+def start_status_server(status, host=DAEMON_STATUS_HOST, port=DAEMON_STATUS_PORT):
+    """GET /status (JSON), GET /healthz 를 처리하는 HTTP 서버를 백그라운드 스레드로 시작"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] in ('/', '/status'):
+                body = json.dumps(status.snapshot(), ensure_ascii=False, indent=2).encode('utf-8')
+                content_type = 'application/json; charset=utf-8'
+            elif self.path == '/healthz':
+                body, content_type = b'ok', 'text/plain'
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 크롤러 로그에 요청 로그를 섞지 않음
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name='daemon-status', daemon=True).start()
+    print(f"--- 상태 엔드포인트: http://{host}:{port}/status ---")
+    return server
+
+
+def parse_daemon_args(argv):
+    parser = argparse.ArgumentParser(description="상주 크롤러")
+    parser.add_argument('--daemon', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--summarize', action='store_true', help='리뷰 작업에서 수집한 리뷰를 바로 AI 요약')
+    parser.add_argument('--port', type=int, default=DAEMON_STATUS_PORT, help='상태 엔드포인트 포트')
+    parser.add_argument('--jobs', default=DAEMON_JOBS, help='작업 주기 (DAEMON_JOBS와 같은 형식)')
+    return parser.parse_known_args(argv)[0]
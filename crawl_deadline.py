@@ -0,0 +1,196 @@
+"""
+마감 시간(--deadline) 안에 끝내는 크롤링 예산
+
+대화형 메뉴의 "5-10분"~"30-45분"은 예상일 뿐이라, 느린 실행은 Cloud Run 작업 제한 시간을 넘겨 진행 중인 작업을 잃었습니다.
+--deadline을 주면 실행 중 측정한 단계별 속도로 남은 작업 시간을 추정하고, 마감이 가까워지면 우선순위가 낮은
+부가 수집부터 건너뜁니다. 다나와 목록/가격 저장(core)은 건너뛰지 않습니다.
+    core          - 목록 페이지 열기 + 상품 저장 (항상 실행)
+    benchmarks    - CPU 벤치마크, GPU Blender, 3DMark 기본 테스트(DEADLINE_PRIMARY_3DMARK)     우선순위 2
+    3dmark_extra  - 나머지 3DMark 테스트                                                      우선순위 1
+    reviews       - 퀘이사존 리뷰                                                             우선순위 1
+남은 시간 - 여유분(DEADLINE_RESERVE_SECONDS) 안에 (남은 core + 켜 둔 단계의 남은 예상 시간) x DEADLINE_SAFETY가
+들어가지 않으면 우선순위가 낮은 단계부터 끕니다. (남은 core만으로도 넘치면 부가 수집은 모두 끔)
+다음 목록 페이지 하나의 core조차 들어가지 않으면 새 페이지를 시작하지 않고 중단 요청(crawl_checkpoint)으로
+진행 중인 저장만 마친 뒤 끝내므로, --resume으로 남은 페이지를 이어서 실행할 수 있습니다.
+부가 수집을 건너뛴 상품이 있는 페이지는 완료로 기록하지 않고, 실행도 'interrupted'로 남겨 --resume에서 다시 수집합니다.
+
+    python crawler.py --benchmarks --reviews --deadline 40m
+
+    begin(deadline_seconds, total_pages)        # 크롤링 시작 시 1회 (--prices-only: prices_only=True)
+    if allow('reviews'): 수집
+    record_stage('reviews', seconds); record_item(seconds); record_page(seconds, items)
+"""
+import os
+import time
+
+import crawl_checkpoint
+
+# 추정 시간에 곱하는 안전 계수
+DEADLINE_SAFETY = float(os.environ.get("DEADLINE_SAFETY", "1.3"))
+# 마감 전에 남겨 둘 시간 (브라우저 종료, 리뷰 요약 대기열 정리 등, 초)
+DEADLINE_RESERVE_SECONDS = float(os.environ.get("DEADLINE_RESERVE_SECONDS", "90"))
+# 마감이 가까워져도 남겨 두는 3DMark 테스트
+DEADLINE_PRIMARY_3DMARK = os.environ.get("DEADLINE_PRIMARY_3DMARK", "Time Spy")
+# 측정 전 추정값 (초) - 첫 몇 개를 측정하면 지수 이동 평균으로 바뀜
+DEFAULT_RATES = {'page': 15.0, 'item': 3.0, 'benchmarks': 60.0, '3dmark_extra': 30.0, 'reviews': 20.0}
+# --prices-only: 스크롤/이미지 대기 없이 목록을 열고, 상품마다 링크/가격만 읽음
+PRICES_ONLY_RATES = {'page': 5.0, 'item': 0.3}
+EWMA_ALPHA = 0.3
+# 이만큼 상품을 측정하기 전에는 부가 수집을 끄지 않음 (측정 전 추정값은 비관적)
+DEADLINE_WARMUP_ITEMS = int(os.environ.get("DEADLINE_WARMUP_ITEMS", "10"))
+
+# 단계 -> 우선순위 (낮을수록 먼저 끔)
+STAGE_PRIORITY = {'benchmarks': 2, '3dmark_extra': 1, 'reviews': 1}
+# 측정 전에 상품 하나당 단계 실행 횟수 추정 (3DMark 기본 외 테스트는 2개)
+STAGE_RUNS_PER_ITEM = {'benchmarks': 1, '3dmark_extra': 2, 'reviews': 1}
+
+
+def parse_duration(value):
+    """'2400', '40m', '1h' -> 초"""
+    value = value.strip().lower()
+    units = {'s': 1, 'm': 60, 'h': 3600}
+    if value and value[-1] in units:
+        return float(value[:-1]) * units[value[-1]]
+    return float(value)
+
+
+class CrawlBudget:
+    def __init__(self, deadline_seconds, total_pages, prices_only=False):
+        self.started = time.monotonic()
+        self.deadline = self.started + deadline_seconds
+        self.window = deadline_seconds
+        self.remaining_pages = total_pages
+        self.rates = dict(DEFAULT_RATES, **(PRICES_ONLY_RATES if prices_only else {}))
+        self.items_per_page = None
+        self.stage_seen = {stage: 0 for stage in STAGE_PRIORITY}
+        self.items_seen = 0
+        self.enabled = set(STAGE_PRIORITY)
+        self.shed = {}               # 단계 -> 건너뛴 횟수
+        self.stopped = False
+
+    def _update(self, name, seconds):
+        self.rates[name] += EWMA_ALPHA * (seconds - self.rates[name])
+
+    def record_page(self, seconds, items):
+        """목록 페이지 하나를 여는 데 걸린 시간 (상품 처리 제외)과 상품 수"""
+        self.remaining_pages = max(0, self.remaining_pages - 1)
+        self._update('page', seconds)
+        self.items_per_page = items if self.items_per_page is None else \
+            self.items_per_page + EWMA_ALPHA * (items - self.items_per_page)
+
+    def record_item(self, seconds):
+        """상품 하나의 core 시간 (부가 수집 제외)"""
+        self.items_seen += 1
+        self._update('item', seconds)
+
+    def record_stage(self, stage, seconds):
+        self.stage_seen[stage] += 1
+        self._update(stage, seconds)
+
+    def page_core(self, concurrency):
+        """목록 페이지 하나의 core 예상 시간"""
+        return self.rates['page'] + (self.items_per_page or 40) * self.rates['item'] / max(concurrency, 1)
+
+    def remaining_core(self, concurrency):
+        return self.remaining_pages * self.page_core(concurrency)
+
+    def remaining_stage(self, stage, concurrency):
+        items = self.remaining_pages * (self.items_per_page or 40)
+        # 상품 하나당 실행 횟수 (카테고리마다 다르므로 측정값 사용, 처음에는 모든 상품이 실행한다고 봄)
+        runs = self.stage_seen[stage] / self.items_seen if self.items_seen else STAGE_RUNS_PER_ITEM[stage]
+        return items * runs * self.rates[stage] / max(concurrency, 1)
+
+    def time_left(self):
+        return self.deadline - time.monotonic() - DEADLINE_RESERVE_SECONDS
+
+    def replan(self, concurrency):
+        """켜 둘 단계를 다시 정함 (우선순위가 낮은 단계부터 끔, 추정이 나아지면 다시 켬)"""
+        if self.stopped or self.items_seen < DEADLINE_WARMUP_ITEMS:
+            return
+        left = self.time_left()
+        costs = {stage: self.remaining_stage(stage, concurrency) * DEADLINE_SAFETY for stage in STAGE_PRIORITY}
+        needed = self.remaining_core(concurrency) * DEADLINE_SAFETY + sum(costs.values())
+        enabled = set(STAGE_PRIORITY)
+        for stage in sorted(STAGE_PRIORITY, key=lambda name: (STAGE_PRIORITY[name], name)):
+            if needed <= left:
+                break
+            needed -= costs[stage]
+            enabled.discard(stage)
+        if enabled != self.enabled:
+            changes = [f"'{stage}' 끔" for stage in sorted(self.enabled - enabled)] + \
+                      [f"'{stage}' 다시 켬" for stage in sorted(enabled - self.enabled)]
+            print(f"\n--- (마감) 남은 {left:.0f}초, 예상 {needed:.0f}초: {', '.join(changes)} ---")
+            self.enabled = enabled
+
+    def allow_page(self, concurrency):
+        """다음 목록 페이지의 core가 마감 안에 들어가는지 (아니면 재개 가능하게 중단 요청)"""
+        if self.stopped:
+            return False
+        left, needed = self.time_left(), self.page_core(concurrency) * DEADLINE_SAFETY
+        if left >= needed:
+            return True
+        self.stopped = True
+        self.enabled.clear()
+        print(f"\n--- (마감) 남은 {max(left, 0):.0f}초 < 목록 페이지 하나 예상 {needed:.0f}초: "
+              f"남은 페이지 {self.remaining_pages}개는 --resume으로 이어서 실행 ---")
+        crawl_checkpoint.request_stop()
+        return False
+
+    def allow(self, stage, concurrency):
+        self.replan(concurrency)
+        if stage in self.enabled:
+            return True
+        self.shed[stage] = self.shed.get(stage, 0) + 1
+        return False
+
+    def summary(self):
+        used = time.monotonic() - self.started
+        shed = ', '.join(f"{stage} {count}건" for stage, count in self.shed.items()) or '없음'
+        return f"마감 예산: {used:.0f}s / {self.window:.0f}s 사용, 건너뛴 부가 수집: {shed}"
+
+
+_BUDGET = None
+
+
+def begin(deadline_seconds, total_pages, prices_only=False):
+    """크롤링 시작 시 1회 (deadline_seconds가 없으면 예산 없이 실행, prices_only면 가격만 읽는 속도로 시작)"""
+    global _BUDGET
+    _BUDGET = CrawlBudget(deadline_seconds, total_pages, prices_only) if deadline_seconds else None
+    if _BUDGET:
+        print(f"--- 마감 {deadline_seconds / 60:.0f}분 안에 실행 (목록 페이지 {total_pages}개, 여유 {DEADLINE_RESERVE_SECONDS:.0f}초) ---")
+    return _BUDGET
+
+
+def allow(stage, concurrency=1):
+    """부가 수집 단계를 시작해도 되는지 (마감이 없으면 항상 True)"""
+    return _BUDGET is None or _BUDGET.allow(stage, concurrency)
+
+
+def allow_page(concurrency=1):
+    """새 목록 페이지를 시작해도 되는지 (core도 마감 안에 들어가지 않으면 False)"""
+    return _BUDGET is None or _BUDGET.allow_page(concurrency)
+
+
+def record_page(seconds, items):
+    if _BUDGET is not None:
+        _BUDGET.record_page(seconds, items)
+
+
+def record_item(seconds):
+    if _BUDGET is not None:
+        _BUDGET.record_item(seconds)
+
+
+def record_stage(stage, seconds):
+    if _BUDGET is not None:
+        _BUDGET.record_stage(stage, seconds)
+
+
+def shed_any():
+    """이번 실행에서 마감 때문에 건너뛴 부가 수집이 있는지"""
+    return _BUDGET is not None and bool(_BUDGET.shed)
+
+
+def print_deadline_summary():
+    if _BUDGET is not None:
+        print(f"--- {_BUDGET.summary()} ---")
@@ -3,6 +3,7 @@ import asyncio
 from playwright.async_api import async_playwright, Playwright
 from bs4 import BeautifulSoup
 from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
 import json
 import time
 from playwright_stealth import stealth_sync
@@ -12,6 +13,22 @@ import statistics
 import sys
 import pymysql
 import os
+import summarize_reviews
+# 카테고리별 상세 스펙 파서 (규칙 테이블 → 컴파일된 파서, spec_parsers.py 참고)
+from spec_parsers import PARSER_MAP, add_capacity_specs, extract_capacity_from_option
+from model_identity import resolve_cpu, resolve_model, normalize_gpu_model
+from benchmark_matcher import DeviceIndex, get_source_index
+import benchmark_freshness
+from adaptive_concurrency import AdaptiveLimiter, looks_like_bot_wall
+from host_scheduler import polite, polite_sync, print_host_summary
+from circuit_breaker import CIRCUITS, CIRCUIT_REQUEUE_MAX_WAIT, CircuitOpenError, BlockedResponseError, print_circuit_summary, raise_for_blocking_status
+from functools import partial
+from timeout_policy import timed, timed_sync, print_timeout_summary
+import crawl_checkpoint
+import work_queue
+import crawl_daemon
+import refresh_tiers
+import crawl_deadline
 
 
 # --- 1. 기본 설정 ---
@@ -23,24 +40,20 @@ CRAWL_PAGES = 2
 # 브라우저 창을 띄울지 여부 (True: 숨김, False: 보임 - 디버깅 및 안정성에 유리)
 HEADLESS_MODE = True
 
-# 각 동작 사이의 지연 시간 (ms). 봇 탐지를 피하고 안정성을 높임 (50~100 추천)
-SLOW_MOTION = 20
+# 요청 간격은 모든 동작에 고정 지연(slow_mo)을 넣는 대신 호스트별 스케줄러(host_scheduler.py)가 조절
+# - 호스트마다 초당 요청 수/동시 요청 수를 따로 적용, 전체 속도는 환경 변수 HOST_RATE_SCALE로 조절
 
 # ===== [속도 최적화 설정] =====
-# 동시 처리할 상품 개수 (기본: 2, 권장 범위: 1~5)
-# - 벤치마크/리뷰 수집 시 2개 권장 (안정성 우선)
-# - 기본 정보만 수집 시 3~5개 가능
-# - 값이 클수록 빠르지만 DB 연결/락 타임아웃 발생 가능
+# 동시 처리할 상품 개수의 시작 값 (기본: 2)
+# - 실행 중에는 AIMD 제한기(adaptive_concurrency.py)가 처리 시간/오류를 보고
+#   AIMD_MIN_CONCURRENCY~AIMD_MAX_CONCURRENCY(기본 1~8) 사이에서 자동으로 조절
 # - 환경 변수 MAX_CONCURRENT_ITEMS로 오버라이드 가능
 MAX_CONCURRENT_ITEMS = int(os.getenv('MAX_CONCURRENT_ITEMS', '2'))
 
-# 페이지 로딩 최대 대기 시간 (ms, 기본: 30000 = 30초)
-# - 빠른 크롤링을 원하면 15000~20000으로 줄이기
-PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', '30000'))
-
-# 개별 요소 대기 시간 (ms, 기본: 5000 = 5초)
-# - 빠른 크롤링을 원하면 2000~3000으로 줄이기
-ELEMENT_TIMEOUT = int(os.getenv('ELEMENT_TIMEOUT', '5000'))
+# 페이지 이동/요소 대기 타임아웃은 호스트/동작별로 학습 (timeout_policy.py)
+# - 최근 소요 시간 p95 x TIMEOUT_P95_MULTIPLE(기본 3)을 사용, 표본이 모이기 전에는 호출부 기본값 사용
+# - PAGE_LOAD_TIMEOUT(기본 30000ms): 학습된 페이지 이동 타임아웃의 상한 (호출부 기본값이 더 크면 그 값)
+# - ELEMENT_TIMEOUT(기본 5000ms): 학습된 요소 대기/읽기 타임아웃의 상한 (호출부 기본값이 더 크면 그 값)
 
 # --- 2. DB 설정 (로컬 모드) ---
 # 환경 변수에서 읽거나, 기본값 사용 (docker-compose.yml 참고)
@@ -63,34 +76,13 @@ CATEGORIES = {
          '파워': 'power'
 }
 
-# --- 5. SQLAlchemy 엔진 생성 (로컬 MySQL) ---
-try:
-    # [검증] DB 설정 확인
-    if not all([DB_HOST, DB_USER, DB_PASSWORD, DB_NAME]):
-        raise ValueError("DB_HOST, DB_USER, DB_PASSWORD, DB_NAME을 설정해야 합니다.")
-
-    # MySQL 연결 문자열 생성 (UTF-8 설정 강화)
-    db_url = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
-    
-    # SQLAlchemy 엔진 생성
-    engine = create_engine(
-        db_url,
-        pool_pre_ping=True,     # 연결 상태 확인 (중요: 끊긴 연결 감지)
-        pool_recycle=1800,      # 30분마다 연결 재생성 (MySQL wait_timeout보다 짧게)
-        pool_size=15,           # 연결 풀 크기 증가 (동시 처리 개수보다 크게)
-        max_overflow=30,        # 추가 연결 허용 증가
-        pool_timeout=60,        # 연결 풀 타임아웃 증가 (60초)
-        echo=False,             # SQL 로그 출력 여부
-        connect_args={
-            'charset': 'utf8mb4',
-            'init_command': "SET NAMES utf8mb4 COLLATE utf8mb4_unicode_ci",
-            'connect_timeout': 30,     # 연결 타임아웃 증가 (30초)
-            'read_timeout': 120,       # 읽기 타임아웃 증가 (120초)
-            'write_timeout': 120,      # 쓰기 타임아웃 증가 (120초)
-            'autocommit': False,       # 명시적 트랜잭션 사용
-        }
-    )
+# --tiered 실행에서 전체 카테고리에 걸쳐 열 목록 페이지 수 (기본: 지금과 같은 카테고리 수 x CRAWL_PAGES)
+# - 인기/가격 변동이 잦은 부품이 있는 페이지부터 채움 (refresh_tiers.py)
+REFRESH_PAGE_BUDGET = int(os.getenv('REFRESH_PAGE_BUDGET', '0')) or len(CATEGORIES) * CRAWL_PAGES
 
+# --- 5. SQLAlchemy 엔진 생성 (로컬 MySQL) ---
+def ensure_schema(engine):
+    """벤치마크/스펙/호환성 테이블이 없으면 생성 (크롤러를 불러올 때 한 번)"""
     with engine.connect() as conn:
         print(f"로컬 MySQL DB 연결 성공 ({DB_HOST}:{DB_PORT}/{DB_NAME})")
         # 벤치마크 결과 테이블이 없으면 생성
@@ -176,6 +168,38 @@ try:
         except:
             pass
         
+        # 요약 상태: 크롤러가 'pending'으로 저장하고 요약기(summarize_reviews.py)가 'done'/'failed'로 변경
+        try:
+            alter_review5 = text("ALTER TABLE community_reviews ADD COLUMN summary_status VARCHAR(16) NOT NULL DEFAULT 'pending' COMMENT 'AI 요약 상태 (pending, done, failed)'")
+            conn.execute(alter_review5)
+            # 컬럼을 처음 추가한 경우에만 기존 요약본 상태를 채움
+            conn.execute(text("UPDATE community_reviews SET summary_status = 'done' WHERE ai_summary IS NOT NULL"))
+        except:
+            pass
+        
+        try:
+            alter_review6 = text("ALTER TABLE community_reviews ADD KEY idx_review_summary_status (summary_status, id)")
+            conn.execute(alter_review6)
+        except:
+            pass
+        
+        # === 스펙 원본 보관 테이블 (재크롤링 없이 재파싱: --reparse) ===
+        create_spec_raw_sql = text("""
+        CREATE TABLE IF NOT EXISTS part_spec_raw (
+            part_id BIGINT PRIMARY KEY,
+            category VARCHAR(32) NOT NULL,
+            name VARCHAR(512) NOT NULL COMMENT '용량 표기 전 원본 상품명',
+            spec_string TEXT NOT NULL,
+            capacity VARCHAR(64) NULL COMMENT '가격 옵션 용량 (RAM/SSD/HDD)',
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+            KEY idx_spec_raw_category (category)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        """)
+        conn.execute(create_spec_raw_sql)
+
+        # === 가격 확인 이력 (인기도/변동성 갱신 등급: --tiered) ===
+        refresh_tiers.ensure_tables(engine)
+        
         # === 호환성 규칙 테이블 생성 ===
         print("\n=== AI 견적 추천 시스템 테이블 초기화 ===")
         create_compatibility_rules_sql = text("""
@@ -226,7 +250,39 @@ try:
         """)
         conn.execute(create_usage_weights_sql)
         print("  -> usage_weights 테이블 생성/확인 완료")
-        
+
+
+try:
+    # [검증] DB 설정 확인
+    if not all([DB_HOST, DB_USER, DB_PASSWORD, DB_NAME]):
+        raise ValueError("DB_HOST, DB_USER, DB_PASSWORD, DB_NAME을 설정해야 합니다.")
+
+    # MySQL 연결 문자열 생성 (UTF-8 설정 강화)
+    db_url = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
+    
+    # SQLAlchemy 엔진 생성
+    engine = create_engine(
+        db_url,
+        pool_pre_ping=True,     # 연결 상태 확인 (중요: 끊긴 연결 감지)
+        pool_recycle=1800,      # 30분마다 연결 재생성 (MySQL wait_timeout보다 짧게)
+        pool_size=15,           # 연결 풀 크기 증가 (동시 처리 개수보다 크게)
+        max_overflow=30,        # 추가 연결 허용 증가
+        pool_timeout=60,        # 연결 풀 타임아웃 증가 (60초)
+        echo=False,             # SQL 로그 출력 여부
+        connect_args={
+            'charset': 'utf8mb4',
+            'init_command': "SET NAMES utf8mb4 COLLATE utf8mb4_unicode_ci",
+            'connect_timeout': 30,     # 연결 타임아웃 증가 (30초)
+            'read_timeout': 120,       # 읽기 타임아웃 증가 (120초)
+            'write_timeout': 120,      # 쓰기 타임아웃 증가 (120초)
+            'autocommit': False,       # 명시적 트랜잭션 사용
+        }
+    )
+
+    # CRAWLER_SKIP_SCHEMA=1: DB에 연결하지 않고 함수만 불러 씀 (check_crawl_loop.py 같은 오프라인 점검)
+    if os.getenv('CRAWLER_SKIP_SCHEMA', '0') != '1':
+        ensure_schema(engine)
+
 except Exception as e:
     print(f"DB 연결 실패: {e}")
     # (디버깅을 위해 오류 상세 출력)
@@ -363,964 +419,16 @@ def initialize_usage_weights(engine):
             print(f"  -> 용도별 가중치 {len(weights)}개 삽입 완료")
 
 
-def parse_cpu_specs(name, spec_string):
-    """[수정] P+E코어, 클럭, 캐시, 벤치마크 등 상세 스펙을 지원하는 CPU 파서"""
-    specs = {}
-    
-    # 1. 기본 텍스트 준비
-    full_text = name + " / " + spec_string
-    spec_parts = [part.strip() for part in spec_string.split('/')]
-
-    # 2. 제조사 확정 (기존 로직)
-    if '인텔' in full_text or '코어i' in full_text or '울트라' in full_text:
-        specs['manufacturer'] = '인텔'
-    elif 'AMD' in full_text or '라이젠' in full_text:
-        specs['manufacturer'] = 'AMD'
-
-    # 3. 루프를 돌며 "Key: Value" 및 단순 키워드 스펙 파싱
-    for part in spec_parts:
-        # "스펙명: 값" 형식에서 '값' 부분만 추출 (없으면 원본)
-        value = part.split(':', 1)[-1].strip()
-
-        if '메모리 규격:' in part:
-            specs['memory_spec'] = value
-        elif '기본 클럭:' in part:
-            specs['base_clock'] = value
-        elif '최대 클럭:' in part:
-            specs['max_clock'] = value
-        elif 'L2 캐시:' in part:
-            specs['l2_cache'] = value
-        elif 'L3 캐시:' in part:
-            specs['l3_cache'] = value
-        elif 'PBP-MTP:' in part: # 인텔 전력
-            specs['power_consumption'] = value
-        elif 'TDP:' in part: # AMD 전력
-            specs['power_consumption'] = value
-        elif '기술 지원:' in part:
-            specs['tech_support'] = value
-        elif '쿨러:' in part:
-            specs['cooler_included'] = value
-        elif '시네벤치R23(싱글):' in part:
-            specs['cinebench_r23_single'] = value
-        elif '시네벤치R23(멀티):' in part:
-            specs['cinebench_r23_multi'] = value
-        elif '출시가:' in part:
-            specs['launch_price'] = value
-        elif 'nm' in part and 'process_node' not in specs: # 예: TSMC 3nm
-            specs['process_node'] = part
-        elif 'PCIe' in part and 'pcie_version' not in specs: # 예: PCIe5.0, 4.0
-            specs['pcie_version'] = part
-        elif 'MHz' in part and 'memory_clock_default' not in specs: # 예: 6400MHz
-            specs['memory_clock_default'] = part
-        elif '그래픽' in part and '내장그래픽' not in part and 'graphics_model' not in specs: # 예: 인텔 그래픽스(Xe LPG)
-            specs['graphics_model'] = part
-
-    # 4. 정규 표현식으로 복잡/중복 스펙 보완 (기존 로직 + 개선)
-    
-    # 코어 (기존 로직)
-    if 'cores' not in specs:
-        core_match = re.search(r'([PE\d\+]+코어)', full_text)
-        if core_match:
-            specs['cores'] = core_match.group(1)
-
-    # 스레드 (기존 로직)
-    if 'threads' not in specs:
-        thread_match = re.search(r'([\d\+]+)\s*스레드', full_text)
-        if thread_match:
-            specs['threads'] = thread_match.group(1).replace(' ', '') + '스레드'
-
-    # 소켓 (개선된 로직: 괄호 안의 소켓도 인식)
-    # 예: 인텔(소켓1851), AMD(소켓AM5), 소켓1700
-    if 'socket' not in specs:
-        socket_match = re.search(r'(소켓[\w\d\+]+)', full_text) # \w+ for AM5
-        if socket_match:
-            specs['socket'] = socket_match.group(1)
-    
-    # 코드네임 (기존 로직)
-    if 'codename' not in specs:
-        codename_match = re.search(r'\(([^)]*(?:레이크|릿지|리프레시|라파엘|버미어|피카소|세잔|시마다 픽|피닉스|Zen\d+)[^)]*)\)', full_text)
-        if codename_match:
-            specs['codename'] = codename_match.group(1)
-    
-    # CPU 시리즈 (기존 로직)
-    if 'cpu_series' not in specs:
-        # '세대' 또는 '(Zen5)' 같은 코드네임도 시리즈로 간주
-        series_match = re.search(r'(\d+세대|\(Zen\d+\))', full_text)
-        if series_match:
-            specs['cpu_series'] = series_match.group(1)
-        elif 'codename' in specs: # 코드네임을 시리즈로 활용
-            specs['cpu_series'] = specs['codename']
-
-    # CPU 종류 (기존 로직)
-    if 'cpu_class' not in specs:
-        class_match = re.search(r'(코어\s?(?:울트라|i)\d+|라이젠\s?\d)', name, re.I)
-        if class_match:
-            specs['cpu_class'] = class_match.group(1).replace(' ', '')
-
-    # 내장그래픽 (기존 로직 + 보완)
-    if 'integrated_graphics' not in specs:
-        if '내장그래픽' in full_text:
-            if '미탑재' in full_text:
-                specs['integrated_graphics'] = '미탑재'
-            elif '탑재' in full_text:
-                specs['integrated_graphics'] = '탑재'
-        elif 'graphics_model' in specs: # 그래픽 모델이 있으면 '탑재'로 간주
-             specs['integrated_graphics'] = '탑재'
-            
-    return specs
-
-def parse_cooler_specs(name, spec_string):
-    """쿨러 파싱 로직 개선 (CPU 쿨러 / 시스템 쿨러 / 상세스펙 최종본)"""
-    specs = {}
-    if name: specs['manufacturer'] = name.split()[0]
-    
-    spec_parts = [part.strip() for part in spec_string.split('/')]
-    full_text = name + " / " + spec_string
-
-    # 1. product_type을 명시적으로 탐색 (기존 로직)
-    if 'CPU 쿨러' in spec_parts:
-        specs['product_type'] = 'CPU 쿨러'
-    elif any(s in spec_parts for s in ['시스템 쿨러', '시스템 팬']):
-        specs['product_type'] = '시스템 쿨러'
-    else:
-        # spec_parts에 명시적 타입이 없는 경우, 이름(name)이나 전체 텍스트에서 추론
-        if 'CPU 쿨러' in full_text:
-            specs['product_type'] = 'CPU 쿨러'
-        elif '시스템 쿨러' in full_text or '시스템 팬' in full_text:
-            if '시스템 팬 커넥터' not in full_text:
-                 specs['product_type'] = '시스템 쿨러'
-        else:
-            # 최후의 수단: 스펙 내용으로 추론 (CPU 쿨러 스펙이 보이면 CPU 쿨러로)
-            if any(s in spec_string for s in ['공랭', '수랭', '타워형', '쿨러 높이', '라디에이터']):
-                 specs['product_type'] = 'CPU 쿨러'
-            elif ' fan' in name.lower() or ' 팬' in name:
-                specs['product_type'] = '시스템 쿨러'
-            else:
-                specs['product_type'] = '기타 쿨러' # M.2 쿨러 등
-
-    # 2. 루프를 돌며 세부 스펙을 파싱합니다.
-    for part in spec_parts:
-        # "스펙명: 값" 형식에서 '값' 부분만 추출 (없으면 원본)
-        value = part.split(':', 1)[-1].strip()
-
-        # --- [A] 공통 스펙 (CPU 쿨러 & 시스템 쿨러) ---
-        if '팬 크기:' in part:
-            fan_size_match = re.search(r'(\d+mm)', part) 
-            if fan_size_match: specs['fan_size'] = fan_size_match.group(1) # "120mm"
-        
-        elif '팬 커넥터' in part or ('핀' in part and not value.startswith('12V') and '16핀' not in part): # "4핀", "3핀"
-            specs['fan_connector'] = value 
-        
-        elif 'RPM' in part:
-            specs['max_fan_speed'] = value # "1550 RPM" or "3000 RPM"
-        elif 'CFM' in part:
-            specs['max_airflow'] = value # "66.17 CFM" or "77 CFM"
-        elif 'mmH2O' in part:
-            specs['static_pressure'] = value # "1.53mmH₂O" or "6.9mmH₂O"
-        elif 'dBA' in part:
-            specs['max_fan_noise'] = value # "25.6dBA"
-        
-        elif 'A/S기간' in part or 'A/S 기간' in part:
-            specs['warranty_period'] = value # "6년" or "3년"
-        
-        elif '무게:' in part:
-            specs['weight'] = value # "185g" or "850g"
-
-        elif re.search(r'^\d+T$', part): # "25T"
-            specs['fan_thickness'] = part 
-
-        elif '베어링:' in part:
-            specs['fan_bearing'] = value # "FDB(유체)" or "S-FDB(유체)"
-
-        elif 'PWM 지원' in part:
-            specs['pwm_support'] = 'Y'
-            
-        elif 'LED' in part: 
-            specs['led_type'] = value # "non-LED"
-            
-        # --- [B] 시스템 쿨러 전용 스펙 ---
-        if specs.get('product_type') == '시스템 쿨러':
-            if '작동전압:' in part:
-                specs['operating_voltage'] = value # "팬 12V"
-            
-            elif '데이지체인' in part:
-                specs['daisy_chain'] = 'Y'
-            
-            elif '제로팬' in part or '0-dB' in part:
-                specs['zero_fan'] = 'Y'
-            
-            elif re.search(r'^\d+개$', part): # "3개", "5개"
-                specs['fan_count'] = part
-
-        # --- [C] CPU 쿨러 전용 스펙 ---
-        if specs.get('product_type') == 'CPU 쿨러':
-            if '공랭' in part: specs['cooling_method'] = '공랭'
-            elif '수랭' in part: specs['cooling_method'] = '수랭'
-            
-            # 공랭 폼팩터
-            elif '듀얼타워형' in part: specs['air_cooling_form'] = '듀얼타워형'
-            elif '싱글타워형' in part: specs['air_cooling_form'] = '싱글타워형'
-            elif '슬림형' in part: specs['air_cooling_form'] = '슬림형'
-            elif '일반형' in part: specs['air_cooling_form'] = '일반형'
-            elif '서버용' in part: specs['air_cooling_form'] = '서버용'
-            
-            # 라디에이터
-            elif ('라디에이터' in part or '열' in part):
-                radiator_match = re.search(r'(1열|2열|3열|4열)', part)
-                if radiator_match: specs['radiator_length'] = radiator_match.group(1)
-            
-            # TDP
-            elif 'TDP' in part and ('W' in part or 'w' in part):
-                specs['tdp'] = value # "260W"
-            
-            # Sockets
-            elif '인텔 소켓:' in part:
-                specs['intel_socket'] = value
-            elif 'AMD 소켓:' in part:
-                specs['amd_socket'] = value
-
-            # Dimensions
-            elif '가로:' in part:
-                specs['width'] = value
-            elif '세로:' in part:
-                specs['depth'] = value
-            elif '높이:' in part and '쿨러 높이' not in part: 
-                specs['height'] = value
-            elif '쿨러 높이:' in part:
-                specs['cooler_height'] = value # "155mm"
-                
-            # Fan Count (CPU specific)
-            elif re.search(r'팬 개수: \d+개', part):
-                specs['fan_count'] = value # "2개"
-
-    # 3. 후처리 (기존 로직)
-    if specs.get('product_type') == '시스템 쿨러' and 'fan_count' not in specs:
-        count_match = re.search(r'(\d)(?:IN1|PACK)', name, re.I)
-        if count_match:
-            specs['fan_count'] = f"{count_match.group(1)}개"
-            
-    if specs.get('cooling_method') != '수랭' and 'radiator_length' in specs:
-        del specs['radiator_length']
-            
-    return specs
-
-def parse_motherboard_specs(name, spec_string):
-    """메인보드 파싱 로직 개선 (사용자 요청 스펙 모두 반영)"""
-    specs = {}
-    if name: specs['manufacturer'] = name.split()[0]
-
-    # '/'로 나뉜 기본 스펙 리스트
-    spec_parts = [part.strip() for part in spec_string.split('/')]
-    
-    # 원본 스펙 문자열 (복잡한 파싱용)
-    full_text = " / ".join(spec_parts)
-
-    # --- 1. 기본 스펙 (루프 파싱) ---
-    for part in spec_parts:
-        part_no_keyword = part.replace('CPU 소켓:','').strip()
-        
-        if '소켓' in part and 'CPU 소켓' in part: 
-            specs['socket'] = part_no_keyword
-            specs['cpu_socket'] = part_no_keyword  # 호환성을 위해 cpu_socket에도 저장
-        elif re.search(r'^[A-Z]\d{3}[A-Z]*$', part): 
-            specs['chipset'] = part
-        elif 'ATX' in part or 'ITX' in part: 
-            specs['form_factor'] = part
-            specs['board_form_factor'] = part  # 호환성을 위해 board_form_factor에도 저장
-        elif 'DDR' in part: 
-            specs['memory_spec'] = part
-            # DDR4, DDR5 등 메모리 타입 추출하여 memory_type에도 저장
-            if 'DDR5' in part:
-                specs['memory_type'] = 'DDR5'
-            elif 'DDR4' in part:
-                specs['memory_type'] = 'DDR4'
-            elif 'DDR3' in part:
-                specs['memory_type'] = 'DDR3'
-        elif 'VGA 연결' in part or 'PCIe' in part and 'vga_connection' not in specs: 
-            specs['vga_connection'] = part
-            # VGA 인터페이스 정보도 별도로 저장 (호환성 체크용)
-            if 'VGA 연결' in part:
-                specs['vga_interface'] = part
-        elif '메모리 슬롯' in part: 
-            specs['memory_slots'] = part
-        elif 'M.2:' in part: 
-            specs['m2_slots'] = part.split(':')[-1].strip()
-        elif 'SATA3:' in part:
-            specs['sata3_ports'] = part.split(':')[-1].strip()
-        elif 'ch(' in part or '.1ch' in part:
-            specs['audio_channels'] = part
-        elif '무선랜' in part or 'Wi-Fi' in part: 
-            specs['wireless_lan'] = 'Y' # 존재 여부
-        elif '블루투스' in part:
-            specs['bluetooth'] = 'Y' # 존재 여부
-        elif 'MHz' in part and 'memory_clock' not in specs:
-            # 메모리 클럭 추출 (예: "8000MHz", "6000MHz(PC5-48000)")
-            specs['memory_clock'] = part
-
-    # --- 2. 정규식을 이용한 상세 스펙 추출 (전체 텍스트 기반) ---
-    
-    # 전원부
-    if (m := re.search(r'전원부:\s*([\d\+\s]+페이즈)', full_text)):
-        specs['power_phases'] = m.group(1)
-        specs['power_phase'] = m.group(1)  # 호환성을 위해 power_phase에도 저장
-        
-    # 메모리
-    if (m := re.search(r'(\d+)MHz\s*\((PC\d-[\d]+)\)', full_text)):
-        specs['memory_clock'] = m.group(1) + 'MHz'
-    elif 'memory_clock' in specs and 'MHz' not in specs['memory_clock']:
-        # 이미 memory_clock이 설정되었지만 MHz가 없는 경우 (예: "8000")
-        pass  # 유지
-    if (m := re.search(r'메모리 용량:\s*(최대 [\d,]+GB)', full_text)):
-        specs['memory_capacity_max'] = m.group(1)
-        specs['max_memory_capacity'] = m.group(1)  # 호환성을 위해 max_memory_capacity에도 저장
-    if 'XMP' in full_text: 
-        specs['memory_profile_xmp'] = 'Y'
-        specs['xmp'] = 'Y'
-    if 'EXPO' in full_text: 
-        specs['memory_profile_expo'] = 'Y'
-        specs['expo'] = 'Y'
-
-    # 확장슬롯
-    if (m := re.search(r'PCIe버전:\s*([\w\d\.,\s]+)', full_text)):
-        specs['pcie_versions'] = m.group(1).strip().rstrip(',')
-    if (m := re.search(r'PCIex16:\s*(\d+개)', full_text)):
-        specs['pciex16_slots'] = m.group(1)
-    if (m := re.search(r'PCIex1:\s*([\d+]+개)', full_text)):
-        specs['pciex1_slots'] = m.group(1)
-
-    # 저장장치
-    if (m := re.search(r'M.2 연결:\s*([\w\d\.,\s]+)', full_text)):
-        specs['m2_interface'] = m.group(1).strip().rstrip(',')
-
-    # 후면단자 (항목별 존재 여부 및 개수)
-    if (m := re.search(r'후면단자:\s*([^\/]+(?:\s*\/[^\/]+)*)', full_text)):
-        rear_io_text = m.group(1)
-        if 'HDMI' in rear_io_text: specs['rear_io_hdmi'] = 'Y'
-        if 'DP' in rear_io_text: specs['rear_io_dp'] = 'Y'
-        if 'USB 3' in rear_io_text: specs['rear_io_usb3'] = 'Y'
-        if 'USB 2.0' in rear_io_text: specs['rear_io_usb2'] = 'Y'
-        if 'RJ-45' in rear_io_text: specs['rear_io_rj45'] = 'Y'
-        if '오디오잭' in rear_io_text: specs['rear_io_audio'] = 'Y'
-        if 'PS/2' in rear_io_text: specs['rear_io_ps2'] = 'Y'
-        if 'BIOS플래시백' in rear_io_text: specs['rear_io_bios_flashback'] = 'Y'
-            
-    if (m := re.search(r'USB A타입:\s*(\d+개)', full_text)):
-        specs['rear_io_usb_a'] = m.group(1)
-    if (m := re.search(r'USB C타입:\s*(\d+개)', full_text)):
-        specs['rear_io_usb_c'] = m.group(1)
-
-    # 랜/오디오
-    if (m := re.search(r'유선랜 칩셋:\s*([\w\s]+)', full_text)):
-        specs['lan_chipset'] = m.group(1).strip()
-    if (m := re.search(r'([\d\.]+)Gbps', full_text)):
-        specs['lan_speed'] = m.group(1) + 'Gbps'
-    if (m := re.search(r'RJ-45:\s*(\d+개)', full_text)):
-        specs['rj45_ports'] = m.group(1)
-    if (m := re.search(r'오디오 칩셋:\s*([\w\s]+)', full_text)):
-        specs['audio_chipset'] = m.group(1).strip()
-
-    # 내부 I/O
-    if 'USB3.0 헤더' in full_text: specs['internal_io_usb3'] = 'Y'
-    if 'USB2.0 헤더' in full_text: specs['internal_io_usb2'] = 'Y'
-    if 'USB3.0 Type C 헤더' in full_text: specs['internal_io_usb_c'] = 'Y'
-    if 'RGB 12V 4핀 헤더' in full_text: specs['internal_io_rgb_12v'] = 'Y'
-    if 'ARGB 5V 3핀 헤더' in full_text: specs['internal_io_argb_5v'] = 'Y'
-    if (m := re.search(r'시스템팬 4핀:\s*(\d+개)', full_text)):
-        specs['internal_io_sys_fan'] = m.group(1)
-    if 'TPM 헤더' in full_text: specs['internal_io_tpm'] = 'Y'
-    if '프론트오디오AAFP 헤더' in full_text: specs['internal_io_audio'] = 'Y'
-
-    # 특징
-    if '전원부 방열판' in full_text: specs['feature_vr_heatsink'] = 'Y'
-    if 'M.2 히트싱크' in full_text: specs['feature_m2_heatsink'] = 'Y'
-    if 'UEFI' in full_text: specs['feature_uefi'] = 'Y'
-    if (m := re.search(r'(\d{2}년 \d{1,2}월부로.*)', full_text)):
-        specs['product_note'] = m.group(1)
-
-    # --- 3. 소켓 및 메모리 타입 추론 (정보가 없는 경우 칩셋이나 제품명에서 추론) ---
-    chipset = specs.get('chipset', '')
-    product_name_upper = name.upper() if name else ''
-    
-    # 3-1. 소켓 추론
-    if 'socket' not in specs or not specs['socket']:
-        # AMD 소켓 추론 (칩셋 기반)
-        if chipset:
-            if any(chip in chipset for chip in ['B850', 'X870', 'A620', 'B650', 'X670']):
-                specs['socket'] = 'AM5'
-                specs['cpu_socket'] = 'AM5'
-            elif any(chip in chipset for chip in ['B550', 'X570', 'A520']):
-                specs['socket'] = 'AM4'
-                specs['cpu_socket'] = 'AM4'
-            # Intel 소켓 추론 (칩셋 기반)
-            elif any(chip in chipset for chip in ['Z890', 'B860', 'H810']):
-                specs['socket'] = 'LGA1851'
-                specs['cpu_socket'] = 'LGA1851'
-            elif any(chip in chipset for chip in ['Z790', 'B760', 'H770', 'B660']):
-                specs['socket'] = 'LGA1700'
-                specs['cpu_socket'] = 'LGA1700'
-            elif any(chip in chipset for chip in ['Z690', 'H670']):
-                specs['socket'] = 'LGA1700'
-                specs['cpu_socket'] = 'LGA1700'
-        
-        # 칩셋에서 찾지 못한 경우 제품명에서 추론
-        if ('socket' not in specs or not specs['socket']) and product_name_upper:
-            # AMD 제품명 기반 추론
-            if any(chip in product_name_upper for chip in ['B850', 'X870', 'B650', 'X670', 'A620']):
-                specs['socket'] = 'AM5'
-                specs['cpu_socket'] = 'AM5'
-            elif any(chip in product_name_upper for chip in ['B550', 'X570', 'A520']):
-                specs['socket'] = 'AM4'
-                specs['cpu_socket'] = 'AM4'
-            # Intel 제품명 기반 추론
-            elif any(chip in product_name_upper for chip in ['Z890', 'B860', 'H810']):
-                specs['socket'] = 'LGA1851'
-                specs['cpu_socket'] = 'LGA1851'
-            elif any(chip in product_name_upper for chip in ['Z790', 'B760', 'H770']):
-                specs['socket'] = 'LGA1700'
-                specs['cpu_socket'] = 'LGA1700'
-            elif any(chip in product_name_upper for chip in ['Z690', 'B660', 'H670']):
-                specs['socket'] = 'LGA1700'
-                specs['cpu_socket'] = 'LGA1700'
-    
-    # 3-2. 메모리 타입 추론 (메모리 타입 정보가 없는 경우)
-    if 'memory_type' not in specs or not specs['memory_type']:
-        # 칩셋 기반 메모리 타입 추론 (최신 칩셋들은 DDR5 전용)
-        if chipset:
-            # AM5 칩셋은 DDR5 전용
-            if any(chip in chipset for chip in ['B850', 'X870', 'B650', 'X670', 'A620']):
-                specs['memory_type'] = 'DDR5'
-            # AM4 칩셋은 DDR4 전용
-            elif any(chip in chipset for chip in ['B550', 'X570', 'A520', 'B450', 'X470']):
-                specs['memory_type'] = 'DDR4'
-            # 최신 Intel 칩셋 (13세대 이후)는 주로 DDR5 (일부 DDR4 지원)
-            elif any(chip in chipset for chip in ['Z890', 'B860', 'H810']):
-                specs['memory_type'] = 'DDR5'
-            # 12-13세대 Intel 칩셋은 DDR4/DDR5 혼용 (정확한 판단 어려움)
-            # Z790, B760 등은 제품에 따라 DDR4 또는 DDR5 지원
-            # 이 경우 memory_clock으로 추론 시도
-            elif any(chip in chipset for chip in ['Z790', 'B760', 'H770']):
-                memory_clock_str = str(specs.get('memory_clock', ''))
-                if memory_clock_str:
-                    clock_num = int(''.join(filter(str.isdigit, memory_clock_str))) if any(c.isdigit() for c in memory_clock_str) else 0
-                    # DDR5는 일반적으로 4800MHz 이상
-                    if clock_num >= 4800:
-                        specs['memory_type'] = 'DDR5'
-                    # DDR4는 일반적으로 2133~3200MHz
-                    elif 2000 <= clock_num < 4800:
-                        specs['memory_type'] = 'DDR4'
-        
-        # 칩셋에서 찾지 못한 경우 제품명에서 추론
-        if ('memory_type' not in specs or not specs['memory_type']) and product_name_upper:
-            # AM5 제품명은 DDR5 전용
-            if any(chip in product_name_upper for chip in ['B850', 'X870', 'B650', 'X670', 'A620']):
-                specs['memory_type'] = 'DDR5'
-            # AM4 제품명은 DDR4 전용
-            elif any(chip in product_name_upper for chip in ['B550', 'X570', 'A520', 'B450']):
-                specs['memory_type'] = 'DDR4'
-            # Intel 최신 칩셋
-            elif any(chip in product_name_upper for chip in ['Z890', 'B860', 'H810']):
-                specs['memory_type'] = 'DDR5'
-
-    return specs
-
-def parse_ram_specs(name, spec_string):
-    """RAM 파싱 로직 개선 (사용자 요청 스펙 모두 반영)"""
-    specs = {}
-    if name: specs['manufacturer'] = name.split()[0]
-    
-    spec_parts = [part.strip() for part in spec_string.split('/')]
-    full_text = " / ".join(spec_parts) # LED 시스템 등 '/'로 분리 안되는 스펙 검사용
-
-    for part in spec_parts:
-        # --- 1. 기본 스펙 ---
-        if '데스크탑용' in part or '노트북용' in part: 
-            specs['device_type'] = part
-        elif re.match(r'^DDR\d+$', part): 
-            specs['product_class'] = part
-        elif re.search(r'^\d+GB$|^\d+TB$', part) and 'capacity' not in specs: 
-            specs['capacity'] = part
-        
-        # --- 2. 상세 스펙 (사용자 요청 기준) ---
-        
-        # 클럭
-        elif (m := re.search(r'(\d+MHz)\s*\((PC\d-[\d]+)\)', part)):
-            specs['clock_speed'] = m.group(1)
-            specs['pc_clock_speed'] = m.group(2)
-        elif 'MHz' in part and 'clock_speed' not in specs:
-            specs['clock_speed'] = part
-        
-        # 램타이밍
-        elif '램타이밍:' in part:
-            specs['ram_timing'] = part.split(':')[-1].strip()
-        
-        # 전압
-        elif (m := re.search(r'([\d\.]+)V$', part)):
-            specs['voltage'] = m.group(1) + 'V'
-            
-        # 램개수
-        elif '램개수:' in part:
-            specs['ram_count'] = part.split(':')[-1].strip()
-        
-        # LED
-        elif 'LED 라이트' in part:
-            specs['led_light'] = 'Y'
-        elif 'LED색상:' in part:
-            specs['led_color'] = part.split(':')[-1].strip()
-
-        # 프로파일
-        elif 'XMP' in part: # XMP3.0, XMP 등
-            specs['memory_profile_xmp'] = 'Y'
-        elif 'EXPO' in part:
-            specs['memory_profile_expo'] = 'Y'
-        
-        # 기타
-        elif '온다이ECC' in part:
-            specs['on_die_ecc'] = 'Y'
-        
-        # 방열판
-        elif '히트싱크:' in part:
-            specs['heatsink_presence'] = part.split(':')[-1].strip()
-        elif '방열판 색상:' in part:
-            specs['heatsink_color'] = part.split(':')[-1].strip()
-        elif '방열판' in part and 'heatsink_presence' not in specs: # '방열판'만 있는 경우
-            specs['heatsink_presence'] = 'Y'
-            
-        # 높이
-        elif '높이:' in part:
-            specs['height'] = part.split(':')[-1].strip()
-            
-        # 모듈제조사
-        elif '모듈제조사:' in part:
-            specs['module_manufacturer'] = part.split(':')[-1].strip()
-
-    # --- 3. 전체 텍스트 기반 스펙 (LED 시스템) ---
-    if (m := re.search(r'LED 시스템:\s*([^\/]+)', full_text)):
-        specs['led_system'] = m.group(1).strip()
-
-    return specs
-
-def parse_vga_specs(name, spec_string):
-    """그래픽카드 파싱 로직 개선 (사용자 요청 스펙 모두 반영)"""
-    specs = {}
-    if name: specs['manufacturer'] = name.split()[0]
-    
-    spec_parts = [part.strip() for part in spec_string.split('/')]
-    full_text = " / ".join(spec_parts) # '/'로 분리 안되는 스펙 검사용
-
-    # --- 1. 기본 스펙 (루프 파싱) ---
-    for part in spec_parts:
-        if 'RTX' in part or 'GTX' in part: 
-            specs['nvidia_chipset'] = part
-        elif 'RX' in part: 
-            specs['amd_chipset'] = part
-        elif 'Arc' in part: 
-            specs['intel_chipset'] = part
-        elif 'PCIe' in part and 'gpu_interface' not in specs: 
-            specs['gpu_interface'] = part
-        elif 'GDDR' in part and 'gpu_memory_type' not in specs:
-            specs['gpu_memory_type'] = part # 예: GDDR7
-        elif 'GB' in part and 'TB' not in part and 'gpu_memory_capacity' not in specs:
-             # '용량'이 다른 스펙(예: HDD)과 겹칠 수 있으므로 GPU 파서 내에서만 사용
-            specs['gpu_memory_capacity'] = part # 예: 12GB
-        elif '팬 개수' in part or ('팬' in part and len(part) < 4):
-            specs['fan_count'] = part # 3팬, 2팬 등
-        
-    # --- 2. 정규식을 이용한 상세 스펙 추출 (전체 텍스트 기반) ---
-    
-    # 전력 및 크기
-    if (m := re.search(r'정격파워\s*([\w\d\s]+이상)', full_text)):
-        specs['recommended_psu'] = m.group(1)
-    if (m := re.search(r'전원 포트:\s*([^\/]+)', full_text)):
-        specs['power_connector'] = m.group(1).strip()
-    if (m := re.search(r'가로\(길이\):\s*([\d\.]+mm)', full_text)):
-        specs['gpu_length'] = m.group(1)
-    if (m := re.search(r'두께:\s*([\d\.]+mm)', full_text)):
-        specs['gpu_thickness'] = m.group(1)
-    if (m := re.search(r'사용전력:\s*([\w\d\s]+)', full_text)):
-        specs['power_consumption'] = m.group(1).strip()
-
-    # 클럭 및 프로세서
-    if (m := re.search(r'베이스클럭:\s*(\d+MHz)', full_text)):
-        specs['base_clock'] = m.group(1)
-    if (m := re.search(r'부스트클럭:\s*(\d+MHz)', full_text)):
-        specs['boost_clock'] = m.group(1)
-    if (m := re.search(r'OC클럭:\s*(\d+MHz)', full_text)):
-        specs['oc_clock'] = m.group(1)
-    if (m := re.search(r'스트림 프로세서:\s*([\d,]+)개', full_text)):
-        specs['stream_processors'] = m.group(1) + '개'
-
-    # 출력 및 지원
-    if (m := re.search(r'출력단자:\s*([^\/]+)', full_text)):
-        specs['output_ports'] = m.group(1).strip()
-    if '8K' in full_text: specs['support_8k'] = 'Y'
-    if 'HDR' in full_text: specs['support_hdr'] = 'Y'
-    if 'HDCP 2.3' in full_text: specs['support_hdcp'] = '2.3'
-    if (m := re.search(r'A/S\s*([\d년]+)', full_text)):
-        specs['warranty_period'] = m.group(1)
-
-    # 특징
-    if '제로팬' in full_text or '0-dB' in full_text:
-        specs['zero_fan'] = 'Y'
-    if '백플레이트' in full_text:
-        specs['has_backplate'] = 'Y'
-    if 'DrMOS' in full_text:
-        specs['feature_drmos'] = 'Y'
-    if 'LED 라이트' in full_text:
-        specs['led_light'] = 'Y'
-    if (m := re.search(r'MYSTIC LIGHT', full_text)): # LED 시스템은 예시가 하나라 하드코딩
-        specs['led_system'] = m.group(0)
-    if (m := re.search(r'구성품:\s*([^\/]+)', full_text)):
-        specs['accessories'] = m.group(1).strip()
-
-    return specs
-
-def parse_ssd_specs(name, spec_string):
-    """SSD 파싱 로직 개선 (사용자 요청 스펙 모두 반영)"""
-    specs = {}
-    if name: specs['manufacturer'] = name.split()[0]
-    
-    spec_parts = [part.strip() for part in spec_string.split('/')]
-    full_text = " / ".join(spec_parts) # '/'로 분리 안되는 스펙 검사용
-
-    # --- 1. 기본 스펙 (루프 파싱) ---
-    for part in spec_parts:
-        if 'M.2' in part or '2.5인치' in part or 'SATA' in part and 'form_factor' not in specs: 
-            specs['form_factor'] = part
-        elif 'PCIe' in part or 'SATA' in part and 'ssd_interface' not in specs: 
-            specs['ssd_interface'] = part
-        elif ('TLC' in part or 'QLC' in part or 'MLC' in part) and 'memory_type' not in specs: 
-            specs['memory_type'] = part
-        elif 'DRAM 탑재' in part or 'DRAM 미탑재' in part: 
-            specs['ram_mounted'] = part
-        elif 'DDR' in part and 'GB' in part:
-            specs['ram_spec'] = part
-        elif '컨트롤러:' in part:
-            specs['controller'] = part.split(':')[-1].strip()
-        
-        # 성능
-        elif '순차읽기:' in part:
-            specs['sequential_read'] = part.split(':')[-1].strip()
-        elif '순차쓰기:' in part:
-            specs['sequential_write'] = part.split(':')[-1].strip()
-        elif '읽기IOPS:' in part:
-            specs['read_iops'] = part.split(':')[-1].strip()
-        elif '쓰기IOPS:' in part:
-            specs['write_iops'] = part.split(':')[-1].strip()
-
-        # 지원기능
-        elif 'TRIM' in part: specs['support_trim'] = 'Y'
-        elif 'GC' in part: specs['support_gc'] = 'Y'
-        elif 'SLC캐싱' in part: specs['support_slc_caching'] = 'Y'
-        elif 'S.M.A.R.T' in part: specs['support_smart'] = 'Y'
-        elif 'DEVSLP' in part: specs['support_devslp'] = 'Y'
-        elif 'AES 암호화' in part: specs['support_aes'] = 'Y'
-        elif '전용 S/W' in part: specs['support_sw'] = 'Y'
-        
-        # 환경특성
-        elif 'MTBF:' in part:
-            specs['mtbf'] = part.split(':')[-1].strip()
-        elif 'TBW:' in part:
-            specs['tbw'] = part.split(':')[-1].strip()
-        elif 'PS5 호환' in part:
-            specs['ps5_compatible'] = 'Y'
-        elif 'A/S기간:' in part:
-            specs['warranty_period'] = part.split(':')[-1].strip()
-        elif '방열판' in part and 'heatsink_presence' not in specs:
-            specs['heatsink_presence'] = part # 방열판 미포함, 방열판 포함 등
-        elif '두께:' in part:
-            specs['ssd_thickness'] = part.split(':')[-1].strip()
-        elif (m := re.search(r'(\d+g)$', part)):
-            specs['ssd_weight'] = m.group(1)
-    
-    # --- 2. 루프로 잡기 힘든 스펙 (A/S 기간 등) ---
-    if 'warranty_period' not in specs:
-         if (m := re.search(r'A/S\s*([\w\d년\s,]+)', full_text)):
-            specs['warranty_period'] = m.group(1).strip()
-    if 'capacity' not in specs: # 'TB'/'GB'가 TBW와 겹칠 수 있으므로 마지막에 체크
-        for part in spec_parts:
-            # 'TB' 또는 'GB'를 포함하지만 'TBW'나 'DDR'(DRAM스펙)은 아닌 경우
-            if ('TB' in part or 'GB' in part) and 'TBW' not in part and 'DDR' not in part and 'capacity' not in specs:
-                specs['capacity'] = part
-                break
-
-    return specs
-
-def parse_hdd_specs(name, spec_string):
-    """HDD 파싱 로직 개선 (사용자 요청 스펙 모두 반영)"""
-    specs = {}
-    if name: specs['manufacturer'] = name.split()[0]
-    
-    spec_parts = [part.strip() for part in spec_string.split('/')]
-    full_text = " / ".join(spec_parts) # '/'로 분리 안되는 스펙 검사용
-
-    for part in spec_parts:
-        if 'HDD (' in part: # HDD (NAS용)
-            specs['product_class'] = part
-        elif 'cm' in part or '인치' in part: # 8.9cm(3.5인치)
-            specs['form_factor'] = part
-        elif ('TB' in part or 'GB' in part) and 'disk_capacity' not in specs: 
-            specs['disk_capacity'] = part
-        elif 'SATA' in part: # SATA3 (6Gb/s)
-            specs['hdd_interface'] = part
-        elif 'RPM' in part: # 7,200RPM
-            specs['rotation_speed'] = part
-        elif '메모리' in part or '버퍼' in part: # 메모리 512MB
-            specs['buffer_capacity'] = part
-        elif 'MB/s' in part: # 275MB/s
-            specs['transfer_rate'] = part
-        elif '기록방식:' in part:
-            specs['recording_method'] = part.split(':')[-1].strip()
-        elif '두께:' in part:
-            specs['hdd_thickness'] = part.split(':')[-1].strip()
-        elif '헬륨충전' in part:
-            specs['helium_filled'] = 'Y'
-        elif 'RV센서' in part:
-            specs['rv_sensor'] = 'Y'
-        elif '사용보증:' in part:
-            specs['mtbf'] = part.split(':')[-1].strip()
-        elif '소음' in part and 'dB' in part: # 소음(유휴/탐색): 28/32dB
-            specs['noise_level'] = part.split(':')[-1].strip()
-        elif 'A/S 정보:' in part:
-            specs['hdd_warranty'] = part.split(':')[-1].strip()
-    
-    # A/S 정보가 루프에서 안 잡혔을 경우
-    if 'hdd_warranty' not in specs:
-         if (m := re.search(r'A/S 정보:\s*([^\/]+)', full_text)):
-            specs['hdd_warranty'] = m.group(1).strip()
-
-    return specs
-
-def parse_case_specs(name, spec_string):
-    """케이스 파싱 로직 개선 (사용자 요청 스펙 모두 반영)"""
-    specs = {}
-    if name: specs['manufacturer'] = name.split()[0]
-    
-    spec_parts = [part.strip() for part in spec_string.split('/')]
-    full_text = " / ".join(spec_parts) # '/'로 분리 안되는 스펙 검사용
-
-    # --- 1. 기본 스펙 (루프 파싱) ---
-    for part in spec_parts:
-        if '케이스' in part and '(' not in part and 'product_class' not in specs: # 'PC케이스' or 'M-ATX 케이스'
-            specs['product_class'] = part
-        elif '지원보드규격:' in part:
-            specs['supported_board'] = part.split(':')[-1].strip()
-        elif 'VGA' in part and ('mm' in part or '길이' in part) and 'vga_length' not in specs:
-            specs['vga_length'] = part.split(':')[-1].strip()
-        elif 'CPU' in part and ('mm' in part or '높이' in part) and 'cpu_cooler_height_limit' not in specs:
-            specs['cpu_cooler_height_limit'] = part.split(':')[-1].strip()
-        elif '타워' in part: # 미니타워, 빅타워 등
-            specs['case_size'] = part
-        elif '파워미포함' in part or '파워포함' in part:
-            specs['psu_included'] = part
-        elif '측면:' in part: # 측면 패널 타입: (Fallback)
-            specs['panel_side'] = part.split(':')[-1].strip()
-        elif '파워 장착 길이:' in part:
-            specs['psu_length'] = part.split(':')[-1].strip()
-        elif '파워 위치:' in part:
-            specs['psu_location'] = part.split(':')[-1].strip()
-        elif 'LED 색상:' in part:
-            specs['led_color'] = part.split(':')[-1].strip()
-
-    # --- 2. 정규식을 이용한 상세 스펙 추출 (전체 텍스트 기반) ---
-    
-    # 패널
-    if (m := re.search(r'전면 패널 타입:\s*([^\/]+)', full_text)):
-        specs['panel_front'] = m.group(1).strip()
-    if (m := re.search(r'측면 패널 타입:\s*([^\/]+)', full_text)):
-        specs['panel_side'] = m.group(1).strip() # 루프 파싱 덮어쓰기 (더 정확)
-
-    # 쿨러/튜닝
-    if (m := re.search(r'쿨링팬:\s*(총[\d]+개)', full_text)):
-        specs['cooling_fan_total'] = m.group(1)
-    if (m := re.search(r'LED팬:\s*([\d]+개)', full_text)):
-        specs['cooling_fan_led'] = m.group(1)
-    if (m := re.search(r'후면:\s*([^\/]+)', full_text)):
-        specs['cooling_fan_rear'] = m.group(1).strip()
-
-    # 크기
-    if (m := re.search(r'너비\(W\):\s*([\d\.]+mm)', full_text)):
-        specs['case_width'] = m.group(1)
-    if (m := re.search(r'깊이\(D\):\s*([\d\.]+mm)', full_text)):
-        specs['case_depth'] = m.group(1)
-    if (m := re.search(r'높이\(H\):\s*([\d\.]+mm)', full_text)):
-        specs['case_height'] = m.group(1)
-
-    return specs
-
-def extract_capacity_from_option(option_text, category_name):
-    """
-    가격 옵션 텍스트에서 용량 정보 추출
-    
-    Args:
-        option_text: 가격 옵션 텍스트 (예: "4TB 629,940원", "32GB(16Gx2) 807,970원", "1위 2TB 329,390원")
-        category_name: 카테고리 이름 ('RAM', 'SSD', 'HDD')
-    
-    Returns:
-        용량 문자열 (예: "4TB", "32GB (16GB x2)", "2TB") 또는 None
-    """
-    if not option_text:
-        return None
-    
-    # RAM의 경우: "32GB(16Gx2)", "48GB(24Gx2)", "16GB x2", "32GB (16GB x2)", "J 패키지" 등
-    if category_name == 'RAM':
-        # 패턴 1: "32GB(16Gx2)" 또는 "48GB(24Gx2)" - 괄호 안에 축약형
-        pattern1 = re.search(r'(\d+GB)\((\d+)Gx(\d+)\)', option_text, re.IGNORECASE)
-        if pattern1:
-            total_capacity = pattern1.group(1)  # 예: "32GB"
-            single_capacity_num = int(pattern1.group(2))  # 예: 16
-            count = int(pattern1.group(3))  # 예: 2
-            single_capacity = f"{single_capacity_num}GB"
-            return f"{total_capacity} ({single_capacity} x{count})"
-        
-        # 패턴 2: "32GB(16GBx2)" - 괄호 안에 GB 포함
-        pattern2 = re.search(r'(\d+GB)\((\d+GB)x(\d+)\)', option_text, re.IGNORECASE)
-        if pattern2:
-            total_capacity = pattern2.group(1)  # 예: "32GB"
-            single_capacity = pattern2.group(2)  # 예: "16GB"
-            count = int(pattern2.group(3))  # 예: 2
-            return f"{total_capacity} ({single_capacity} x{count})"
-        
-        # 패턴 3: "16GB x2" 또는 "16GB x 2" - 공백 포함
-        pattern3 = re.search(r'(\d+GB)\s*x\s*(\d+)', option_text, re.IGNORECASE)
-        if pattern3:
-            single_capacity = pattern3.group(1)  # 예: "16GB"
-            count = int(pattern3.group(2))  # 예: 2
-            # 총 용량 계산
-            single_capacity_num = int(single_capacity.replace('GB', ''))
-            total_capacity_num = single_capacity_num * count
-            return f"{total_capacity_num}GB ({single_capacity} x{count})"
-        
-        # 패턴 4: "32GB (16GB x2)" - 괄호와 공백 포함
-        pattern4 = re.search(r'(\d+GB)\s*\((\d+GB)\s*x\s*(\d+)\)', option_text, re.IGNORECASE)
-        if pattern4:
-            total_capacity = pattern4.group(1)  # 예: "32GB"
-            single_capacity = pattern4.group(2)  # 예: "16GB"
-            count = int(pattern4.group(3))  # 예: 2
-            return f"{total_capacity} ({single_capacity} x{count})"
-        
-        # 패턴 5: "J 패키지" 또는 "K 패키지" 등 - 패키지 정보만 있는 경우
-        # 이 경우 용량 정보는 상품명에서 추출해야 하므로, 패키지 정보만 반환
-        package_match = re.search(r'([JK])\s*패키지', option_text, re.IGNORECASE)
-        if package_match:
-            # J 패키지 = 2개, K 패키지 = 4개 (일반적인 규칙)
-            package_type = package_match.group(1).upper()
-            package_count = 2 if package_type == 'J' else 4 if package_type == 'K' else 2
-            # 용량 정보가 함께 있는지 확인
-            capacity_match = re.search(r'(\d+GB)', option_text, re.IGNORECASE)
-            if capacity_match:
-                total_capacity = capacity_match.group(1)
-                # 단일 용량 추정 (총 용량 / 패키지 개수)
-                total_capacity_num = int(total_capacity.replace('GB', ''))
-                single_capacity_num = total_capacity_num // package_count
-                single_capacity = f"{single_capacity_num}GB"
-                return f"{total_capacity} ({single_capacity} x{package_count})"
-            else:
-                # 용량 정보가 없으면 패키지 정보만 반환
-                return f"{package_type} 패키지"
-        
-        # 패턴 6: 단순 용량 패턴 (예: "32GB") - 패키지 정보 없음
-        capacity_match = re.search(r'(\d+GB)', option_text, re.IGNORECASE)
-        if capacity_match:
-            return capacity_match.group(1)
-    
-    # SSD, HDD의 경우: "4TB", "2TB", "1TB", "512GB" 등
-    # 또는 "8TB 135원/1GB 1,079,080원" 같은 형식
-    elif category_name in ['SSD', 'HDD']:
-        # TB 우선 검색 (숫자 + TB 패턴, 앞뒤 공백이나 다른 문자 허용)
-        tb_match = re.search(r'(\d+(?:\.\d+)?)\s*TB', option_text, re.IGNORECASE)
-        if tb_match:
-            return f"{tb_match.group(1)}TB"
-        
-        # GB 검색 (숫자 + GB 패턴)
-        gb_match = re.search(r'(\d+(?:\.\d+)?)\s*GB', option_text, re.IGNORECASE)
-        if gb_match:
-            return f"{gb_match.group(1)}GB"
-    
-    return None
-
-def parse_power_specs(name, spec_string):
-    """파워 파싱 로직 개선 (사용자 요청 스펙 모두 반영)"""
-    specs = {}
-    if name: specs['manufacturer'] = name.split()[0]
-    
-    spec_parts = [part.strip() for part in spec_string.split('/')]
-    full_text = " / ".join(spec_parts) # '/'로 분리 안되는 스펙 검사용
-
-    for part in spec_parts:
-        if '파워' in part and 'ATX' in part and 'product_class' not in specs: 
-            specs['product_class'] = part # ATX 파워
-        elif 'W' in part and 'rated_output' not in specs: 
-            specs['rated_output'] = part # 850W
-        elif '80 PLUS' in part: 
-            specs['eighty_plus_cert'] = part # 80 PLUS 브론즈
-        elif '케이블연결:' in part:
-            specs['cable_connection'] = part.split(':')[-1].strip()
-        elif 'ETA인증:' in part:
-            specs['eta_cert'] = part.split(':')[-1].strip()
-        elif 'LAMBDA인증:' in part:
-            specs['lambda_cert'] = part.split(':')[-1].strip()
-        elif '+12V' in part and '레일' in part:
-            specs['plus_12v_rail'] = part # +12V 싱글레일
-        elif '+12V 가용률:' in part:
-            specs['plus_12v_availability'] = part.split(':')[-1].strip()
-        elif 'PFC' in part: # 액티브PFC
-            specs['pfc_circuit'] = part
-        elif 'PF(역률):' in part:
-            specs['pf_rate'] = part.split(':')[-1].strip()
-        elif 'mm 팬' in part: # 120mm 팬
-            specs['fan_size'] = part
-        elif '깊이:' in part:
-            specs['psu_depth'] = part.split(':')[-1].strip()
-        elif '무상' in part or 'A/S' in part and 'warranty_period' not in specs:
-            specs['warranty_period'] = part # 무상 7년
-            
-        # 커넥터
-        elif '메인전원:' in part:
-            specs['main_connector'] = part.split(':')[-1].strip()
-        elif '보조전원:' in part:
-            specs['aux_connector'] = part.split(':')[-1].strip()
-        elif 'PCIe 16핀' in part:
-            specs['pcie_16pin'] = part.split(':')[-1].strip()
-        elif 'PCIe 8핀' in part:
-            specs['pcie_8pin'] = part.split(':')[-1].strip()
-        elif 'SATA:' in part:
-            specs['sata_connectors'] = part.split(':')[-1].strip()
-        elif 'IDE 4핀:' in part:
-            specs['ide_4pin_connectors'] = part.split(':')[-1].strip()
-            
-        # 부가기능
-        elif '대기전력 1W 미만' in part:
-            specs['feature_standby_power'] = 'Y'
-        elif '플랫케이블' in part:
-            specs['feature_flat_cable'] = 'Y'
-            
-    # 변경사항 (전체 텍스트에서 검색)
-    if (m := re.search(r'(\d{2}년 \d{1,2}월.*)', full_text)):
-        specs['product_note'] = m.group(1)
-
-    return specs
-
-PARSER_MAP = {
-    'CPU': parse_cpu_specs,
-    '쿨러': parse_cooler_specs,
-    '메인보드': parse_motherboard_specs,
-    'RAM': parse_ram_specs,
-    '그래픽카드': parse_vga_specs,
-    'SSD': parse_ssd_specs,
-    'HDD': parse_hdd_specs,
-    '케이스': parse_case_specs,
-    '파워': parse_power_specs,
-}
-
 def scrape_cinebench_r23(page, keyword):
     """ (신규) render4you.com에서 Cinebench R23 '멀티코어' 점수만 스크랩합니다. """
     print(f"        -> (1/4) Cinebench R23 검색 (키워드: {keyword})")
     try:
         url = "https://www.render4you.com/cinebench-benchmark-database"
-        page.goto(url, wait_until='domcontentloaded', timeout=15000)
+        with polite_sync(url):
+            timed_sync(url, 'goto', 15000, lambda t: page.goto(url, wait_until='domcontentloaded', timeout=t))
         
         try:
-            page.wait_for_selector('table#benchmark-table', timeout=10000)
+            timed_sync('render4you.com', 'wait', 10000, lambda t: page.wait_for_selector('table#benchmark-table', timeout=t))
         except Exception:
             print("        -> (경고) Cinebench R23 테이블을 시간 초과로 찾지 못했습니다.")
             return None
@@ -1368,10 +476,11 @@ def scrape_cinebench_r23(page, keyword):
 def _scrape_geekbench_page(page, url, keyword):
     """ (신규) Geekbench 헬퍼 함수. 특정 URL에서 keyword의 점수를 1개 찾습니다. """
     try:
-        page.goto(url, wait_until='domcontentloaded', timeout=15000)
+        with polite_sync(url):
+            timed_sync(url, 'goto', 15000, lambda t: page.goto(url, wait_until='domcontentloaded', timeout=t))
         
         try:
-            page.wait_for_selector('table.list tbody tr', timeout=10000)
+            timed_sync('geekbench.com', 'wait', 10000, lambda t: page.wait_for_selector('table.list tbody tr', timeout=t))
         except Exception:
             print(f"        -> (경고) Geekbench 테이블을 시간 초과로 찾지 못했습니다. ({url})")
             return None
@@ -1435,11 +544,12 @@ def scrape_blender(page, keyword):
     print(f"        -> (3/4) Blender 검색 (키워드: {keyword})")
     try:
         url = "https://opendata.blender.org/benchmarks/query/?compute_type=CPU"
-        page.goto(url, wait_until='domcontentloaded', timeout=15000)
+        with polite_sync(url):
+            timed_sync(url, 'goto', 15000, lambda t: page.goto(url, wait_until='domcontentloaded', timeout=t))
         
         search_box_selector = 'input[type="search"]'
         try:
-            page.wait_for_selector(search_box_selector, timeout=10000)
+            timed_sync('opendata.blender.org', 'wait', 10000, lambda t: page.wait_for_selector(search_box_selector, timeout=t))
         except Exception:
              print(f"        -> (경고) Blender 검색창을 시간 초과로 찾지 못했습니다.")
              return None
@@ -1473,58 +583,82 @@ def scrape_blender(page, keyword):
         print(f"        -> (경고) Blender 스크래핑 실패: {e}")
         return None
 
-def extract_benchmark_scores(raw_text):
+# --- (신규) CPU 벤치마크 수집 함수들 ---
+def _cinebench_row_names(rows):
+    """render4you 테이블 행 -> (제조사 + 모델명, 행) 목록"""
+    for row in rows:
+        cells = row.select('td')
+        if len(cells) < 2:
+            continue
+        # 0: 제조사, 1: 모델명 (모델명이 비어 있으면 행 전체 텍스트)
+        model_text = cells[1].get_text(strip=True) or row.get_text(strip=True)
+        yield f"{cells[0].get_text(strip=True)} {model_text}", row
+
+
+def _load_blender_median_rows(url, params, timeout, label=''):
     """
-    리뷰 본문 텍스트에서 대표적인 벤치마크 점수(정수)를 단순 정규식으로 추출합니다.
-    - Cinebench R23/R24: Multi/Single
-    - CPU Profile: Max/1T/2T/4T/8T/16T
-    값이 다수일 경우 상위 몇 개만 반환합니다.
+    Blender Open Data DataTables 응답 -> [(장치 이름, Median Score)] (조회 실패 시 None)
+    DataTables 응답 구조: {columns: [...], rows: [[...], [...]]}
     """
-    results = []
+    with polite_sync(url):
+        response = requests.get(url, params=params, timeout=timeout)
+        raise_for_blocking_status(response.status_code, url)
+    if response.status_code != 200:
+        print(f"        -> (경고) {label}API 응답 오류: {response.status_code}")
+        return None
 
-    # 공통 숫자 파서
-    def to_int(num_str):
-        try:
-            return int(num_str.replace(',', '').strip())
-        except Exception:
-            return None
+    try:
+        data = response.json()
+    except:
+        print(f"        -> (경고) {label}JSON 파싱 실패")
+        return None
 
-    text = raw_text
-
-    # Cinebench R23/R24
-    for m in re.finditer(r"Cinebench\s*R(2[34])\s*(Multi|멀티|Single|싱글)?[^\n\r]*?([\d,]{3,})", text, re.I):
-        version = m.group(1)
-        scenario = m.group(2) or ''
-        value = to_int(m.group(3))
-        if value:
-            results.append({
-                "test_name": "Cinebench",
-                "test_version": f"R{version}",
-                "scenario": ("Multi" if scenario and scenario.lower().startswith('m') else ("Single" if scenario and scenario.lower().startswith('s') else "")),
-                "metric_name": "Score",
-                "value": value,
-                "unit": "pts"
-            })
+    if not isinstance(data, dict) or 'rows' not in data:
+        print(f"        -> (경고) {label}잘못된 응답 구조")
+        return None
 
-    # CPU Profile
-    for scenario_label in ["Max", "1T", "2T", "4T", "8T", "16T"]:
-        pattern = rf"CPU\s*Profile[^\n\r]*{scenario_label}[^\n\r]*([\d,]{3,})"
-        for m in re.finditer(pattern, text, re.I):
-            value = to_int(m.group(1))
-            if value:
-                results.append({
-                    "test_name": "CPU Profile",
-                    "test_version": "",
-                    "scenario": scenario_label,
-                    "metric_name": "Score",
-                    "value": value,
-                    "unit": "pts"
-                })
+    # columns에서 'Median Score', 'Device Name' 컬럼 인덱스 찾기
+    columns = data.get('columns', [])
+    median_idx = None
+    device_idx = None
+    for i, col in enumerate(columns):
+        display_name = col.get('display_name', '') if isinstance(col, dict) else str(col)
+        if 'Median Score' in display_name or 'median' in display_name.lower():
+            median_idx = i
+        if 'Device Name' in display_name or 'device_name' in display_name.lower():
+            device_idx = i
+
+    if median_idx is None or device_idx is None:
+        print(f"        -> (경고) {label}Median Score 컬럼을 찾지 못했습니다.")
+        return None
+
+    devices = []
+    for row in data.get('rows', []):
+        if not isinstance(row, list) or len(row) <= max(median_idx, device_idx):
+            continue
+        device_name = str(row[device_idx])
+        # HTML 태그 제거
+        if '<a' in device_name:
+            device_name = re.sub(r'<[^>]+>', '', device_name)
+        try:
+            score = float(row[median_idx])
+        except (TypeError, ValueError):
+            continue
+        if score > 0:
+            devices.append((device_name.strip(), score))
+    return devices
+
+async def goto_checked(page, url, action, default_ms, wait_until='load'):
+    """
+    호스트 스케줄러를 거쳐 Playwright 페이지 이동 (타임아웃은 timeout_policy가 학습)
+    goto는 403/429/5xx에도 예외를 내지 않으므로 polite 블록 안에서 상태 코드를 확인해 차단기에 실패로 기록
+    """
+    async with polite(url):
+        response = await timed(url, action, default_ms, lambda t: page.goto(url, wait_until=wait_until, timeout=t))
+        raise_for_blocking_status(response.status if response else None, url)
+    return response
 
-    # 너무 많은 결과면 상위 10개만 반환
-    return results[:10]
 
-# --- (신규) CPU 벤치마크 수집 함수들 ---
 async def scrape_cinebench_r23(browser, cpu_name, conn, part_id, category_name='CPU'):
     """
     render4you.com에서 Cinebench R23 점수 수집 (Multi/Single)
@@ -1536,32 +670,21 @@ async def scrape_cinebench_r23(browser, cpu_name, conn, part_id, category_name='
 
     try:
         # CPU 모델명 추출 (7500F, 7800X3D 등)
-        cpu_model_match = re.search(r'(\d{3,5}\w*(?:F|K|X|G|3D)*|\d{3}[K])', cpu_name, re.I)
-        cpu_model = cpu_model_match.group(1) if cpu_model_match else None
-        
-        # 중복 체크: 이미 데이터가 있으면 수집하지 않음
-        check_sql = text("""
-            SELECT EXISTS (
-                SELECT 1 FROM benchmark_results 
-                WHERE part_id = :part_id 
-                AND test_name = 'Cinebench' 
-                AND test_version = 'R23'
-                AND scenario = 'Multi'
-            )
-        """)
-        exists_result = conn.execute(check_sql, {"part_id": part_id})
-        if exists_result.scalar() == 1:
-            print(f"        -> (건너뜀) Cinebench R23 데이터가 이미 존재합니다.")
+        cpu_identity = resolve_cpu(cpu_name)
+        cpu_model = cpu_identity.model if cpu_identity else None
+        
+        # 신선도 체크: TTL 이내이거나 이번 실행의 갱신 한도를 넘으면 수집하지 않음
+        freshness = benchmark_freshness.collect_status(conn, 'cinebench_r23', part_id)
+        if freshness not in benchmark_freshness.COLLECT_STATUSES:
+            print(f"        -> (건너뜀) Cinebench R23 {benchmark_freshness.STATUS_LABELS[freshness]}")
             return
         # CPU 모델명 정규화 (7500F -> 7500, 7800X3D -> 7800)
         # 더 정확한 매칭을 위해 전체 모델명도 시도
-        model_match = re.search(r'(\d{3,5}\w*(?:F|K|X|G|3D)*)', cpu_name, re.I)
-        if not model_match:
+        if not cpu_identity:
             return
         
-        search_term_full = model_match.group(1)  # 전체 (예: 7500F)
-        search_term_num = re.search(r'(\d{3,5})', cpu_name, re.I)
-        search_term_num = search_term_num.group(1) if search_term_num else search_term_full[:4]
+        search_term_full = cpu_model  # 전체 (예: 7500F)
+        search_term_num = cpu_identity.number
         
         url = "https://www.render4you.com/cinebench-benchmark-database"
         print(f"      -> Cinebench R23 검색: {url} (필터: {search_term_full})")
@@ -1572,10 +695,13 @@ async def scrape_cinebench_r23(browser, cpu_name, conn, part_id, category_name='
         )
         # 타임아웃 증가 (15초 -> 45초)
         try:
-            await new_page.goto(url, wait_until='networkidle', timeout=45000)
+            await goto_checked(new_page, url, 'goto_idle', 45000, wait_until='networkidle')
+        except (BlockedResponseError, CircuitOpenError):
+            # 차단/과부하 응답이나 열린 차단기는 load로 다시 요청하지 않음
+            raise
         except Exception as e:
             print(f"        -> (경고) networkidle 실패, load로 재시도: {type(e).__name__}")
-            await new_page.goto(url, wait_until='load', timeout=30000)
+            await goto_checked(new_page, url, 'goto', 30000, wait_until='load')
         await new_page.wait_for_timeout(3000)  # 페이지 로딩 대기 증가
         
         # 검색 입력 필드 찾기 및 입력 (여러 시도)
@@ -1651,42 +777,14 @@ async def scrape_cinebench_r23(browser, cpu_name, conn, part_id, category_name='
         """)
         
         found = False
-        # 전체 테이블 스캔 (검색 필터 실패 시 대비) - 모든 행 확인
-        print(f"        -> (디버그) 총 {len(rows)}개 행 중 스캔 시작...")
-        for idx, row in enumerate(rows):  # 전체 행 확인
+        # 행마다 부분 문자열을 비교하지 않고, 장치 이름 색인에서 접미사 규칙으로 가장 맞는 행 하나를 고름
+        # (7800X3D와 7800X, 14900K와 14900KF 구분)
+        row_index = DeviceIndex.build('CPU', _cinebench_row_names(rows))
+        match = row_index.match(cpu_identity)
+        if match:
+            row = match.payload
             cells = row.select('td')
-            if len(cells) < 2:
-                continue
-            
-            # 모델명 셀 찾기 (두 번째 셀)
-            model_text = cells[1].get_text(strip=True) if len(cells) >= 2 else ''
-            if not model_text:
-                model_text = row.get_text(strip=True)
-            
-            # 검색어 매칭 (더 유연하게)
-            # "AMD  Ryzen 5 7500F" 형식에서 "7500F" 또는 "7500" 찾기
-            model_lower = model_text.lower()
-            
-            # 숫자 부분 추출해서 비교
-            model_num = re.search(r'\d{3,5}', model_text)
-            model_num = model_num.group() if model_num else ''
-            
-            matches = (
-                search_term_full.lower() in model_lower or
-                search_term_num.lower() in model_lower or
-                model_num == search_term_num or
-                ('ryzen' in model_lower and search_term_num in model_text) or
-                ('ryzen 5' in model_lower and search_term_num in model_text)
-            )
-            
-            if not matches:
-                # 전체 CPU 이름의 주요 단어로 확인
-                cpu_keywords = [w for w in cpu_name.split() if len(w) >= 3 and w.lower() not in ['amd', 'intel', '라이젠', '세대', '라파엘']]
-                if not any(kw.lower() in model_lower for kw in cpu_keywords):
-                    continue
-            
-            # 디버그: 매칭된 행 출력
-            print(f"        -> (디버그) 행 {idx+1} 매칭 성공: {model_text[:60]}")
+            print(f"        -> (디버그) 행 매칭 성공: {match.name[:60]} (점수 {match.score})")
             
             # R23 점수 찾기 (네 번째 셀, 인덱스 3)
             r23_score = None
@@ -1696,9 +794,7 @@ async def scrape_cinebench_r23(browser, cpu_name, conn, part_id, category_name='
                     r23_score = int(r23_text.replace(',', '').strip())
                 except:
                     pass
-                # 디버그
-                if idx < 5:
-                    print(f"        -> (디버그) R23 텍스트: {r23_text}, 파싱: {r23_score}")
+                print(f"        -> (디버그) R23 텍스트: {r23_text}, 파싱: {r23_score}")
             
             # R23 점수를 찾지 못했으면 전체 행에서 숫자 패턴 찾기
             if not r23_score or r23_score == 0:
@@ -1711,8 +807,7 @@ async def scrape_cinebench_r23(browser, cpu_name, conn, part_id, category_name='
                         nums = [int(n.replace(',', '')) for n in numbers if int(n.replace(',', '')) > 1000]
                         if nums:
                             r23_score = max(nums)
-                            if idx < 5:
-                                print(f"        -> (디버그) 행 텍스트에서 R23 점수 추출: {r23_score}")
+                            print(f"        -> (디버그) 행 텍스트에서 R23 점수 추출: {r23_score}")
                     except:
                         pass
             
@@ -1732,10 +827,12 @@ async def scrape_cinebench_r23(browser, cpu_name, conn, part_id, category_name='
                 })
                 found = True
                 print(f"        -> Cinebench R23 Multi: {r23_score}")
-                break
         
         if not found:
             print(f"        -> (정보) Cinebench R23 점수를 찾지 못했습니다. (검색어: {search_term_full})")
+    except CircuitOpenError:
+        # 작업 도중 차단기가 열림: _run_with_circuit이 재시도 대기열에 넣도록 전달
+        raise
     except Exception as e:
         print(f"        -> (경고) Cinebench R23 수집 중 오류: {type(e).__name__} - {str(e)[:100]}")
     finally:
@@ -1753,29 +850,20 @@ async def scrape_geekbench_v6(browser, cpu_name, conn, part_id):
         from datetime import datetime
         
         # CPU 모델명 정규화 (7800X3D -> 7800X3D 또는 7500F -> 7500F)
-        model_match = re.search(r'(\d{3,5}\w*(?:F|K|X|G|3D)*|\d{3}[K])', cpu_name, re.I)
-        if not model_match:
+        cpu_identity = resolve_cpu(cpu_name)
+        if not cpu_identity:
             return
         
-        search_term = model_match.group(1)
-        search_num = re.search(r'\d{3,5}', search_term)
-        search_num = search_num.group() if search_num else search_term
+        search_term = cpu_identity.model
+        search_num = cpu_identity.number
         
         # CPU 모델명 추출
         cpu_model = search_term
         
-        # 중복 체크: 이미 데이터가 있으면 수집하지 않음
-        check_sql = text("""
-            SELECT EXISTS (
-                SELECT 1 FROM benchmark_results 
-                WHERE part_id = :part_id 
-                AND test_name = 'Geekbench' 
-                AND test_version = 'v6'
-            )
-        """)
-        exists_result = conn.execute(check_sql, {"part_id": part_id})
-        if exists_result.scalar() == 1:
-            print(f"        -> (건너뜀) Geekbench v6 데이터가 이미 존재합니다.")
+        # 신선도 체크: TTL 이내이거나 이번 실행의 갱신 한도를 넘으면 수집하지 않음
+        freshness = benchmark_freshness.collect_status(conn, 'geekbench_v6', part_id)
+        if freshness not in benchmark_freshness.COLLECT_STATUSES:
+            print(f"        -> (건너뜀) Geekbench v6 {benchmark_freshness.STATUS_LABELS[freshness]}")
             return
         
         sql_bench = text("""
@@ -1801,10 +889,12 @@ async def scrape_geekbench_v6(browser, cpu_name, conn, part_id):
         )
         # 타임아웃 증가 (15초 -> 45초)
         try:
-            await new_page.goto(search_url, wait_until='networkidle', timeout=45000)
+            await goto_checked(new_page, search_url, 'goto_idle', 45000, wait_until='networkidle')
+        except (BlockedResponseError, CircuitOpenError):
+            raise
         except Exception as e:
             print(f"        -> (경고) networkidle 실패, load로 재시도: {type(e).__name__}")
-            await new_page.goto(search_url, wait_until='load', timeout=30000)
+            await goto_checked(new_page, search_url, 'goto', 30000, wait_until='load')
         await new_page.wait_for_timeout(3000)
         
         html = await new_page.content() # page. -> new_page.
@@ -1944,6 +1034,8 @@ async def scrape_geekbench_v6(browser, cpu_name, conn, part_id):
             })
             print(f"        -> Geekbench v6 Multi-core: {best_result['multi']}")
             
+    except CircuitOpenError:
+        raise
     except Exception as e:
         print(f"        -> (경고) Geekbench v6 수집 중 오류: {type(e).__name__} - {str(e)[:100]}")
     finally:
@@ -1958,26 +1050,17 @@ def scrape_blender_median(page, cpu_name, conn, part_id):
     """
     try:
         # CPU 모델명 정규화
-        model_match = re.search(r'(\d{3,5}\w*(?:F|K|X|G|3D)*|\d{3}[K])', cpu_name, re.I)
-        if not model_match:
+        cpu_identity = resolve_cpu(cpu_name)
+        if not cpu_identity:
             return
         
-        search_term = model_match.group(1)
+        search_term = cpu_identity.model
         cpu_model = search_term
         
-        # 중복 체크: 이미 데이터가 있으면 수집하지 않음
-        check_sql = text("""
-            SELECT EXISTS (
-                SELECT 1 FROM benchmark_results 
-                WHERE part_id = :part_id 
-                AND test_name = 'Blender' 
-                AND test_version = '4.5.0'
-                AND scenario = 'Median'
-            )
-        """)
-        exists_result = conn.execute(check_sql, {"part_id": part_id})
-        if exists_result.scalar() == 1:
-            print(f"        -> (건너뜀) Blender Median Score 데이터가 이미 존재합니다.")
+        # 신선도 체크: TTL 이내이거나 이번 실행의 갱신 한도를 넘으면 수집하지 않음
+        freshness = benchmark_freshness.collect_status(conn, 'blender_cpu', part_id)
+        if freshness not in benchmark_freshness.COLLECT_STATUSES:
+            print(f"        -> (건너뜀) Blender Median Score {benchmark_freshness.STATUS_LABELS[freshness]}")
             return
         # Blender Open Data API 호출 (DataTables 형식)
         url = "https://opendata.blender.org/benchmarks/query/"
@@ -1990,66 +1073,16 @@ def scrape_blender_median(page, cpu_name, conn, part_id):
         
         print(f"      -> Blender Median Score 검색: {url}")
         
-        # DataTables API 호출
-        response = requests.get(url, params=params, timeout=15)
-        if response.status_code != 200:
-            print(f"        -> (경고) API 응답 오류: {response.status_code}")
-            return
-        
-        try:
-            data = response.json()
-        except:
-            print(f"        -> (경고) JSON 파싱 실패")
-            return
-        
-        # DataTables 응답 구조: {columns: [...], rows: [[...], [...]]}
-        if not isinstance(data, dict) or 'rows' not in data:
-            print(f"        -> (경고) 잘못된 응답 구조")
-            return
-        
-        # columns에서 'Median Score' 컬럼 인덱스 찾기
-        columns = data.get('columns', [])
-        median_score_idx = None
-        device_name_idx = None
-        
-        for i, col in enumerate(columns):
-            display_name = col.get('display_name', '') if isinstance(col, dict) else str(col)
-            if 'Median Score' in display_name or 'median' in display_name.lower():
-                median_score_idx = i
-            if 'Device Name' in display_name or 'device_name' in display_name.lower():
-                device_name_idx = i
-        
-        if median_score_idx is None:
-            print(f"        -> (경고) Median Score 컬럼을 찾지 못했습니다.")
+        # 순위표는 크롤링 중 한 번만 받아 색인하고 모든 CPU가 재사용
+        device_index = get_source_index(
+            ('blender_opendata', 'CPU', params['blender_version']), 'CPU',
+            lambda: _load_blender_median_rows(url, params, timeout=15))
+        if device_index is None:
             return
         
-        # rows에서 CPU 이름 매칭하여 점수 찾기
-        rows = data.get('rows', [])
-        median_score = None
-        
-        for row in rows:
-            if not isinstance(row, list) or len(row) <= max(median_score_idx, device_name_idx if device_name_idx else 0):
-                continue
-            
-            device_name = ''
-            if device_name_idx is not None and device_name_idx < len(row):
-                device_name = str(row[device_name_idx])
-                # HTML 태그 제거
-                if '<a' in device_name:
-                    device_name = re.sub(r'<[^>]+>', '', device_name)
-                device_name = device_name.strip()
-            
-            # 검색어 매칭
-            if (search_term.lower() in device_name.lower() or 
-                any(word in device_name.lower() for word in cpu_name.split() if len(word) > 3)):
-                if median_score_idx < len(row):
-                    score_val = row[median_score_idx]
-                    if score_val and score_val != 0:
-                        try:
-                            median_score = float(score_val)
-                            break
-                        except:
-                            pass
+        # CPU 이름 매칭하여 점수 찾기
+        match = device_index.match(cpu_identity)
+        median_score = match.payload if match else None
         
         if median_score:
             sql_bench = text("""
@@ -2080,6 +1113,8 @@ def scrape_blender_median(page, cpu_name, conn, part_id):
             print(f"        -> Blender Median Score: {median_score}")
         else:
             print(f"        -> (정보) Blender Median Score를 찾지 못했습니다.")
+    except CircuitOpenError:
+        raise
     except Exception as e:
         print(f"        -> (경고) Blender Median Score 수집 중 오류: {type(e).__name__} - {str(e)[:100]}")
 
@@ -2093,23 +1128,12 @@ def scrape_blender_gpu(page, gpu_name, conn, part_id):
         if not gpu_name:
             return
         # 공통 라벨/토큰 추출
-        common_label, search_token = _normalize_gpu_model(gpu_name)
-
-        # 중복 체크: 이미 데이터가 있으면 수집하지 않음
-        check_sql = text("""
-            SELECT EXISTS (
-                SELECT 1 FROM benchmark_results 
-                WHERE part_type = 'GPU'
-                AND cpu_model = :model 
-                AND source = 'blender_opendata'
-                AND test_name = 'Blender' 
-                AND test_version = '4.5.0'
-                AND scenario = 'Median GPU'
-            )
-        """)
-        exists_result = conn.execute(check_sql, {"model": common_label})
-        if exists_result.scalar() == 1:
-            print(f"        -> (건너뜀) Blender GPU Median 데이터가 이미 존재합니다.")
+        common_label, search_token = normalize_gpu_model(gpu_name)
+
+        # 신선도 체크: TTL 이내이거나 이번 실행의 갱신 한도를 넘으면 수집하지 않음
+        freshness = benchmark_freshness.collect_status(conn, 'blender_gpu', common_label)
+        if freshness not in benchmark_freshness.COLLECT_STATUSES:
+            print(f"        -> (건너뜀) Blender GPU Median {benchmark_freshness.STATUS_LABELS[freshness]}")
             return
 
         # 사용자 제공 URL 형식 사용
@@ -2121,105 +1145,19 @@ def scrape_blender_gpu(page, gpu_name, conn, part_id):
         }
         print(f"      -> Blender GPU Median 검색: {url}")
 
-        response = requests.get(url, params=params, timeout=20)
-        if response.status_code != 200:
-            print(f"        -> (경고) GPU API 응답 오류: {response.status_code}")
-            return
-
-        try:
-            data = response.json()
-        except:
-            print(f"        -> (경고) GPU JSON 파싱 실패")
-            return
-
-        if not isinstance(data, dict) or 'rows' not in data:
-            print(f"        -> (경고) GPU 잘못된 응답 구조")
+        # 순위표는 크롤링 중 한 번만 받아 색인하고 모든 GPU가 재사용
+        device_index = get_source_index(
+            ('blender_opendata', 'GPU', params['blender_version']), 'GPU',
+            lambda: _load_blender_median_rows(url, params, timeout=20, label='GPU '))
+        if device_index is None:
             return
 
-        columns = data.get('columns', [])
-        median_idx = None
-        device_idx = None
-        for i, col in enumerate(columns):
-            display_name = col.get('display_name', '') if isinstance(col, dict) else str(col)
-            if 'Median Score' in display_name or 'median' in display_name.lower():
-                median_idx = i
-            if 'Device Name' in display_name or 'device_name' in display_name.lower():
-                device_idx = i
-
-        if median_idx is None:
-            print(f"        -> (경고) GPU Median Score 컬럼을 찾지 못했습니다.")
-            return
-
-        rows = data.get('rows', [])
-        found = None
-        found_device = ''
-        
-        # 정확한 모델명 매칭을 위한 패턴 생성
-        # 예: "RTX 5060" -> "5060"이 포함되지만 "5060 Ti"는 제외
-        # 예: "RTX 5060 Ti" -> "5060 Ti"가 포함되어야 함
-        
-        # 매칭 패턴: common_label의 정확한 형태로 매칭
-        # "RTX 5060"을 찾을 때는 "5060"이 포함되지만 "5060 Ti"는 제외
-        # "RTX 5060 Ti"를 찾을 때는 "5060 Ti"가 포함되어야 함
-        def matches_gpu_model(device_name: str, label: str, token: str) -> bool:
-            """GPU 모델명이 정확히 매칭되는지 확인 (5060과 5060 Ti 구분)"""
-            if not token:
-                return False
-                
-            dev_upper = device_name.upper()
-            label_upper = label.upper()
-            
-            # common_label이 "RTX 5060 Ti"인 경우
-            if 'TI' in label_upper or 'SUPER' in label_upper:
-                # 정확히 "5060 Ti" 또는 "5060TI" 형태가 포함되어야 함
-                if (f"{token} TI" in dev_upper) or (f"{token}TI" in dev_upper):
-                    return True
-                # 또는 common_label 전체가 포함되어야 함
-                if label_upper.replace(' ', '') in dev_upper.replace(' ', ''):
-                    return True
-                return False
-            else:
-                # common_label이 "RTX 5060"인 경우 (Ti 없음)
-                # "5060"이 포함되어야 하지만 "5060 Ti"는 제외
-                if token in dev_upper:
-                    # "5060 Ti"가 포함되어 있으면 제외
-                    if (f"{token} TI" in dev_upper) or (f"{token}TI" in dev_upper):
-                        return False
-                    # "5060"만 포함되어 있으면 매칭
-                    return True
-                # 또는 common_label 전체가 포함되어야 함
-                if label_upper.replace(' ', '') in dev_upper.replace(' ', ''):
-                    # "5060 Ti"가 포함되어 있으면 제외
-                    if 'TI' in dev_upper and token in dev_upper:
-                        # "5060" 다음에 "TI"가 오는지 확인
-                        pattern = re.compile(rf"{re.escape(token)}\s*TI", re.IGNORECASE)
-                        if pattern.search(dev_upper):
-                            return False
-                    return True
-                return False
-        
-        for row in rows:
-            if not isinstance(row, list):
-                continue
-            dev = ''
-            if device_idx is not None and device_idx < len(row):
-                dev = str(row[device_idx])
-                if '<a' in dev:
-                    dev = re.sub(r'<[^>]+>', '', dev)
-                dev = dev.strip()
-
-            # 정확한 모델명 매칭
-            if matches_gpu_model(dev, common_label, search_token):
-                if median_idx < len(row):
-                    try:
-                        val = float(row[median_idx])
-                        if val > 0:
-                            found = val
-                            found_device = dev
-                            print(f"        -> (디버그) 매칭된 디바이스: {dev}")
-                            break
-                    except:
-                        pass
+        # 정확한 모델명 매칭 (접미사 규칙: "RTX 5060"은 "5060 Ti" 행과 매칭되지 않음)
+        match = device_index.match(common_label)
+        found = match.payload if match else None
+        found_device = match.name if match else ''
+        if match:
+            print(f"        -> (디버그) 매칭된 디바이스: {found_device}")
 
         if not found:
             print(f"        -> (정보) Blender GPU Median 점수를 찾지 못했습니다. (검색어: {common_label})")
@@ -2252,6 +1190,8 @@ def scrape_blender_gpu(page, gpu_name, conn, part_id):
             "review_url": f"{url}?{'&'.join([f'{k}={v}' for k, v in params.items()])}"
         })
         print(f"        -> Blender GPU Median: {found} ({found_device})")
+    except CircuitOpenError:
+        raise
     except Exception as e:
         print(f"        -> (경고) Blender GPU Median 수집 중 오류: {type(e).__name__} - {str(e)[:100]}")
 
@@ -2268,127 +1208,6 @@ def _trimmed_median(scores: list[float], trim_ratio: float = 0.1) -> float:
     except:
         return float(trimmed[len(trimmed)//2]) if trimmed else 0.0
 
-def _parse_scores_for_gpu(html: str, gpu_name: str) -> list[float]:
-    """3DMark 페이지 HTML에서 GPU 이름이 포함된 행/블록의 Graphics Score만 추출."""
-    soup = BeautifulSoup(html, 'lxml')
-    # GPU 식별: 이름의 숫자 토큰 기반
-    token_match = re.search(r"(\d{3,5})", gpu_name)
-    token = token_match.group(1) if token_match else None
-    if not token:
-        return []
-    
-    scores = []
-    token_upper = token.upper()
-    
-    # 방법 1: 테이블 구조에서 Graphics Score 컬럼 찾기
-    # 더 넓은 범위의 선택자 사용
-    rows = soup.select('table tbody tr, table tr, .result-row, .benchmark-row, [class*="result"], [class*="benchmark"], [class*="score"], tr[class*="row"], div[class*="row"]')
-    
-    for row in rows:
-        row_text = row.get_text(" ", strip=True)
-        
-        # GPU 모델 토큰이 포함되어 있는지 확인 (대소문자 무시)
-        if token_upper not in row_text.upper():
-            continue
-        
-        # 방법 1-1: "Graphics Score" 또는 "GPU Score" 텍스트와 함께 있는 숫자 찾기
-        graphics_score_patterns = [
-            r"Graphics\s+Score[:\s]*[=]?\s*(\d{4,6})",
-            r"GPU\s+Score[:\s]*[=]?\s*(\d{4,6})",
-            r"Graphics[:\s]*[=]?\s*(\d{4,6})",
-            r"Graphics\s*:\s*(\d{4,6})",
-            r"GPU\s*:\s*(\d{4,6})",
-        ]
-        
-        for pattern in graphics_score_patterns:
-            match = re.search(pattern, row_text, re.IGNORECASE)
-            if match:
-                try:
-                    val = int(match.group(1))
-                    if 1000 <= val <= 200000:  # 유효한 점수 범위
-                        scores.append(float(val))
-                        break  # 하나 찾으면 다음 행으로
-                except:
-                    pass
-        
-        # 방법 1-2: 테이블 셀에서 숫자 찾기 (Graphics 관련 헤더가 있는 컬럼)
-        cells = row.select('td, th, [class*="cell"], [class*="column"]')
-        if len(cells) >= 2:  # 최소 2개 컬럼이 있어야 함
-            # 첫 번째 셀에 GPU 모델명이 있고, 다른 셀에 점수가 있을 수 있음
-            for i, cell in enumerate(cells):
-                cell_text = cell.get_text(" ", strip=True)
-                # GPU 모델명이 포함된 셀 다음의 셀들에서 점수 찾기
-                if token_upper in cell_text.upper() and i < len(cells) - 1:
-                    # 다음 셀들에서 점수 찾기
-                    for j in range(i + 1, min(i + 5, len(cells))):  # 최대 4개 셀 확인
-                        score_cell = cells[j].get_text(" ", strip=True)
-                        # 4-6자리 숫자만 추출
-                        num_match = re.search(r'\b(\d{4,6})\b', score_cell)
-                        if num_match:
-                            try:
-                                val = int(num_match.group(1))
-                                if 1000 <= val <= 200000:
-                                    scores.append(float(val))
-                                    break
-                            except:
-                                pass
-    
-    # 방법 2: 전체 텍스트에서 "Graphics Score" 레이블 근처의 숫자 찾기
-    if len(scores) < 3:
-        text = soup.get_text(" ")
-        # "Graphics Score" 또는 "GPU Score" 다음에 오는 숫자 찾기
-        graphics_patterns = [
-            r"Graphics\s+Score[:\s]*[=]?\s*(\d{4,6})",
-            r"GPU\s+Score[:\s]*[=]?\s*(\d{4,6})",
-            r"Graphics[:\s]*[=]?\s*(\d{4,6})",
-        ]
-        
-        for pattern in graphics_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # 매칭된 위치 근처(앞뒤 300자)에 GPU 토큰이 있는지 확인
-                start = max(0, match.start() - 300)
-                end = min(len(text), match.end() + 300)
-                context = text[start:end]
-                if token_upper in context.upper():
-                    try:
-                        val = int(match.group(1))
-                        if 1000 <= val <= 200000:
-                            scores.append(float(val))
-                    except:
-                        pass
-    
-    # 방법 3: GPU 모델명 근처의 모든 4-6자리 숫자를 후보로 추출 (더 관대한 방법)
-    if len(scores) < 3:
-        text = soup.get_text(" ")
-        # GPU 토큰 주변(앞뒤 500자)에서 모든 4-6자리 숫자 찾기
-        token_positions = []
-        for match in re.finditer(re.escape(token), text, re.IGNORECASE):
-            token_positions.append(match.start())
-        
-        for pos in token_positions:
-            start = max(0, pos - 500)
-            end = min(len(text), pos + 500)
-            context = text[start:end]
-            # 컨텍스트에서 4-6자리 숫자 찾기
-            nums = re.findall(r'\b(\d{4,6})\b', context)
-            for num_str in nums:
-                try:
-                    val = int(num_str)
-                    if 1000 <= val <= 200000:
-                        scores.append(float(val))
-                except:
-                    pass
-    
-    # 중복 제거 및 정렬
-    scores = sorted(list(set(scores)))
-    
-    # 너무 많은 값이면 상위 100개만 사용
-    if len(scores) > 100:
-        scores = scores[:100]
-    
-    return scores
-
 def _insert_bench(conn, part_id, part_type, model_name, source, test_name, scenario, value, unit, url, metric_name="Score"):
     sql_bench = text("""
         INSERT INTO benchmark_results (
@@ -2416,35 +1235,23 @@ def _insert_bench(conn, part_id, part_type, model_name, source, test_name, scena
         "review_url": url
     })
 
-def _normalize_gpu_model(raw_name: str) -> tuple[str, str]:
-    """브랜드/유통사 제거하고 공통 GPU 모델로 정규화. 반환: (common_label, numeric_token)
-    예) "GALAX GeForce RTX 5060 DUAL" -> ("RTX 5060", "5060")
-    예) "AMD Radeon RX 7800 XT" -> ("RX 7800 XT", "7800")
-    """
-    name = (raw_name or '').upper()
-    # NVIDIA
-    m = re.search(r"(RTX|GTX)\s*(\d{3,4,5})\s*(TI|SUPER|XT)?", name)
-    if m:
-        series, num, suffix = m.group(1), m.group(2), m.group(3) or ''
-        series_label = f"{series} {num}{(' ' + suffix) if suffix else ''}".strip()
-        return series_label.title(), num
-    # AMD
-    m = re.search(r"(RX)\s*(\d{3,4,5})\s*(XT|XTX)?", name)
-    if m:
-        series, num, suffix = m.group(1), m.group(2), m.group(3) or ''
-        series_label = f"{series} {num}{(' ' + suffix) if suffix else ''}".strip()
-        return series_label, num
-    # Fallback: 숫자 토큰만
-    token = re.search(r"(\d{3,5})", name)
-    t = token.group(1) if token else name.split()[0:2]
-    common = f"GPU {t}" if isinstance(t, str) else ' '.join(t)
-    return common, (t if isinstance(t, str) else '')
+def _load_3dmark_gpu_names(search_url):
+    """3DMark GPU 이름 검색 결과 -> [(GPU 이름, GPU ID)] (조회 실패 시 None)"""
+    with polite_sync(search_url):
+        response = requests.get(search_url, timeout=10)
+        raise_for_blocking_status(response.status_code, search_url)
+    if response.status_code != 200:
+        return None
+    gpu_data = response.json()
+    if not isinstance(gpu_data, list):
+        return None
+    return [(gpu.get('label', ''), gpu.get('id')) for gpu in gpu_data if isinstance(gpu, dict) and gpu.get('id')]
 
 async def scrape_3dmark_generic(browser, gpu_name, conn, part_id, test_name: str, url: str):
     """3DMark 필터를 사용하여 GPU Graphics Score의 Average Score를 수집."""
     new_page = None # 새 페이지 객체 초기화
     try:
-        common_label, token = _normalize_gpu_model(gpu_name)
+        common_label, token = normalize_gpu_model(gpu_name)
         if not token:
             print(f"        -> (정보) 3DMark {test_name} GPU 모델명을 추출할 수 없습니다.")
             return
@@ -2461,24 +1268,24 @@ async def scrape_3dmark_generic(browser, gpu_name, conn, part_id, test_name: str
         if not test_code:
             print(f"        -> (정보) 3DMark {test_name} 테스트 코드를 찾을 수 없습니다.")
             return
+
+        freshness = benchmark_freshness.collect_status(conn, '3dmark_' + test_name.lower().replace(' ', '_'), part_id)
+        if freshness not in benchmark_freshness.COLLECT_STATUSES:
+            print(f"        -> (건너뜀) 3DMark {test_name} {benchmark_freshness.STATUS_LABELS[freshness]}")
+            return
         
         # 먼저 GPU ID를 찾기 위해 API 호출
         gpu_id = None
         try:
             # GPU 이름으로 검색하여 GPU ID 찾기
             search_url = f"https://www.3dmark.com/proxycon/ajax/search/gpuname?term={token}"
-            response = requests.get(search_url, timeout=10)
-            if response.status_code == 200:
-                gpu_data = response.json()
-                if isinstance(gpu_data, list) and len(gpu_data) > 0:
-                    # common_label이 포함된 GPU 찾기
-                    for gpu in gpu_data[:10]:  # 최대 10개 확인
-                        gpu_label = gpu.get('label', '')
-                        if token.upper() in gpu_label.upper():
-                            gpu_id = gpu.get('id')
-                            if gpu_id:
-                                print(f"        -> (디버그) GPU ID 발견: {gpu_id} ({gpu_label[:50]})")
-                                break
+            # 같은 숫자 토큰(5060 / 5060 Ti)의 검색 결과는 한 번만 받아 색인
+            gpu_index = await asyncio.to_thread(get_source_index, ('3dmark_gpuname', token), 'GPU',
+                                                lambda: _load_3dmark_gpu_names(search_url))
+            match = gpu_index.match(common_label) if gpu_index else None
+            if match:
+                gpu_id = match.payload
+                print(f"        -> (디버그) GPU ID 발견: {gpu_id} ({match.name[:50]})")
         except Exception as e:
             print(f"        -> (정보) GPU ID 검색 실패: {type(e).__name__}")
         
@@ -2517,12 +1324,12 @@ async def scrape_3dmark_generic(browser, gpu_name, conn, part_id, test_name: str
             )
             
             # URL로 직접 이동
-            await new_page.goto(search_url_with_params, wait_until='load', timeout=90000) # page. -> new_page.
+            await goto_checked(new_page, search_url_with_params, 'goto', 90000, wait_until='load') # page. -> new_page.
             await new_page.wait_for_timeout(10000)  # AJAX 로딩 대기 # page. -> new_page.
         else:
             # GPU ID를 찾지 못한 경우 기존 방식 사용
             main_url = "https://www.3dmark.com/search"
-            await new_page.goto(main_url, wait_until='load', timeout=45000) # page. -> new_page.
+            await goto_checked(new_page, main_url, 'goto', 45000, wait_until='load') # page. -> new_page.
             await new_page.wait_for_timeout(8000) # page. -> new_page.
             
             # [수정] 이하 모든 page. 로직을 new_page. 로 변경
@@ -2534,7 +1341,7 @@ async def scrape_3dmark_generic(browser, gpu_name, conn, part_id, test_name: str
             
             try:
                 result_type_select = new_page.locator('#resultTypeId')
-                await result_type_select.wait_for(state='visible', timeout=10000)
+                await timed('3dmark.com', 'wait', 10000, lambda t: result_type_select.wait_for(state='visible', timeout=t))
                 await result_type_select.select_option(value=test_code)
                 await new_page.wait_for_timeout(2000)
                 print(f"        -> (디버그) Benchmark 필터 설정: {test_code}")
@@ -2545,7 +1352,7 @@ async def scrape_3dmark_generic(browser, gpu_name, conn, part_id, test_name: str
             try:
                 await new_page.wait_for_timeout(2000)  # scoreType이 동적으로 채워지므로 대기
                 score_type_select = new_page.locator('#scoreType')
-                await score_type_select.wait_for(state='visible', timeout=10000)
+                await timed('3dmark.com', 'wait', 10000, lambda t: score_type_select.wait_for(state='visible', timeout=t))
                 await score_type_select.select_option(value='graphicsScore')
                 await new_page.wait_for_timeout(2000)
                 print(f"        -> (디버그) Score 필터 설정: graphicsScore")
@@ -2555,7 +1362,7 @@ async def scrape_3dmark_generic(browser, gpu_name, conn, part_id, test_name: str
             # GPU 필터에서 GPU 모델 검색 및 선택 (#gpuName)
             try:
                 gpu_name_input = new_page.locator('#gpuName')
-                await gpu_name_input.wait_for(state='visible', timeout=10000)
+                await timed('3dmark.com', 'wait', 10000, lambda t: gpu_name_input.wait_for(state='visible', timeout=t))
                 await gpu_name_input.fill(token)
                 await new_page.wait_for_timeout(3000)  # 자동완성 대기
                 
@@ -2581,7 +1388,7 @@ async def scrape_3dmark_generic(browser, gpu_name, conn, part_id, test_name: str
         for attempt in range(3):  # 최대 3번 시도
             try:
                 median_score_element = new_page.locator('#medianScore') # page. -> new_page.
-                await median_score_element.wait_for(state='visible', timeout=10000)
+                await timed('3dmark.com', 'wait', 10000, lambda t: median_score_element.wait_for(state='visible', timeout=t))
                 
                 median_text = (await median_score_element.text_content()).strip()
                 if median_text and median_text != 'N/A' and median_text != '':
@@ -2641,6 +1448,8 @@ async def scrape_3dmark_generic(browser, gpu_name, conn, part_id, test_name: str
                     pass
         
         print(f"        -> (정보) 3DMark {test_name} Average Score를 찾지 못했습니다.")
+    except CircuitOpenError:
+        raise
     except Exception as e:
         print(f"        -> (경고) 3DMark {test_name} 수집 중 오류: {type(e).__name__} - {str(e)[:100]}")
     finally:
@@ -2654,16 +1463,17 @@ def scrape_3dmark_timespy(page, cpu_name, conn, part_id):
     """
     try:
         # CPU 모델명 정규화
-        model_match = re.search(r'(\d{4,5}\w*(?:F|K|X|G|3D)*|\d{3}[K])', cpu_name, re.I)
-        if not model_match:
+        cpu_identity = resolve_cpu(cpu_name)
+        if not cpu_identity:
             return
         
-        search_term = model_match.group(1)
+        search_term = cpu_identity.model
         url = f"https://www.topcpu.net/ko/gpu-r/3dmark-time-spy"
         
         print(f"      -> 3DMark Time Spy 검색: {url}")
         
-        page.goto(url, wait_until='networkidle', timeout=15000)
+        with polite_sync(url):
+            timed_sync(url, 'goto_idle', 15000, lambda t: page.goto(url, wait_until='networkidle', timeout=t))
         page.wait_for_timeout(1000)
         
         # 검색어 입력 및 검색 버튼 클릭 시도
@@ -2729,387 +1539,415 @@ def scrape_3dmark_timespy(page, cpu_name, conn, part_id):
 
 # (crawler.py 파일의 1238행부터 시작)
 
-async def scrape_category(browser, page, engine, category_name, query, collect_reviews, collect_benchmarks, sql_parts, sql_specs, sql_review, sql_check_review):
+# 3DMark GPU 테스트 (테스트 이름, 검색 URL)
+THREEDMARK_TESTS = (
+    ('Fire Strike', 'https://www.3dmark.com/search#advanced/fs'),
+    ('Time Spy', 'https://www.3dmark.com/search#advanced/spy'),
+    ('Port Royal', 'https://www.3dmark.com/search#advanced/pr'),
+)
+
+
+async def _call_work(work, conn):
+    if asyncio.iscoroutinefunction(work):
+        await work(conn=conn)
+    else:
+        # 동기 스크래퍼(requests + polite_sync)는 토큰 대기/응답 대기가 이벤트 루프를 막지 않도록 스레드에서 실행
+        await asyncio.to_thread(work, conn=conn)
+
+
+async def _run_with_circuit(source, label, conn, work):
     """
-    카테고리별 크롤링 함수
-    
-    Args:
-        browser: Playwright 브라우저 객체
-        page: Playwright 페이지 객체
-        engine: SQLAlchemy 엔진 객체
-        category_name: 카테고리 이름 (예: 'CPU')
-        query: 검색 쿼리
-        collect_reviews: 퀘이사존 리뷰 수집 여부
-        collect_benchmarks: 벤치마크 정보 수집 여부
-        sql_parts: parts 테이블 INSERT SQL
-        sql_specs: part_spec 테이블 INSERT SQL
-        sql_review: community_reviews 테이블 INSERT SQL
-        sql_check_review: 리뷰 존재 여부 확인 SQL
+    사이트 차단기를 거쳐 벤치마크/리뷰 작업 하나를 실행 (work: conn 키워드 인수를 받는 스크래퍼)
+    차단기가 열려 있거나 작업 도중 열리면(CircuitOpenError) 재시도 대기열에 넣습니다. (실행했으면 True, 미뤘으면 False)
     """
+    if not CIRCUITS.allow(source):
+        CIRCUITS.defer(source, label, work)
+        print(f"        -> (건너뜀) {label}: {source} 차단기 열림 - 카테고리 끝에서 재시도")
+        return False
+    try:
+        await _call_work(work, conn)
+    except CircuitOpenError:
+        CIRCUITS.defer(source, label, work)
+        print(f"        -> (중단) {label}: 작업 도중 {source} 차단기 열림 - 카테고리 끝에서 재시도")
+        return False
+    finally:
+        CIRCUITS.release(source)
+    return True
 
-    # --- [신규 함수: 아이템 처리 로직을 분리 및 비동기화] ---
-    async def process_item_async(browser, page, engine, category_name, item_loc, collect_benchmarks, collect_reviews, sql_parts, sql_specs, sql_review, sql_check_review):
-        """개별 상품의 정보 추출, DB 저장, 벤치마크/리뷰 수집을 비동기적으로 처리합니다."""
-        # DB 트랜잭션은 아이템별로 독립적으로 관리됩니다.
-        # 각 아이템은 독립적인 DB 연결을 사용합니다.
 
-        # 4. Locator를 사용하여 각 요소를 추출 (이 과정에서 Playwright가 자동으로 대기함)
-        try:
-            name_tag_loc = item_loc.locator('p.prod_name > a')
-            img_tag_loc = item_loc.locator('div.thumb_image img.lazyload, div.thumb_image img:not([alt*="옵션마크"])').first
-            
-            name = await name_tag_loc.inner_text(timeout=5000)
-            link = await name_tag_loc.get_attribute('href', timeout=5000)
-            
-            # ✅ 용량별 가격 수집 (RAM, SSD, HDD의 경우)
-            price_options = []
-            if category_name in ['RAM', 'SSD', 'HDD']:
-                # 가격 섹션에서 모든 가격 옵션 가져오기
-                price_sect_loc = item_loc.locator('p.price_sect')
-                price_link_count = await price_sect_loc.locator('a').count()
+async def _retry_deferred_work(engine):
+    """재시도 대기열 처리 (쿨다운이 CIRCUIT_REQUEUE_MAX_WAIT보다 많이 남았거나 다시 열리면 다음 실행으로 넘김)"""
+    for source, remaining, items in CIRCUITS.take_deferred():
+        if crawl_checkpoint.stop_requested():
+            # 중단 요청 중에는 기다리지 않음 (해당 단계는 완료로 기록되지 않아 재개 시 다시 수집)
+            print(f"--- (차단기) 중단 요청: {source} 대기 작업 {len(items)}건은 재개 시 수집 ---")
+            continue
+        if remaining > CIRCUIT_REQUEUE_MAX_WAIT:
+            print(f"--- (차단기) {source} 쿨다운 {remaining:.0f}초 남음: 대기 작업 {len(items)}건은 다음 실행에서 수집 ---")
+            continue
+        if remaining:
+            print(f"--- (차단기) {source} 쿨다운 종료까지 {remaining:.0f}초 대기 ---")
+            await asyncio.sleep(remaining)
+        print(f"--- (차단기) {source} 대기 작업 {len(items)}건 재시도 ---")
+        for index, (label, work) in enumerate(items):
+            if not CIRCUITS.allow(source):
+                print(f"--- (차단기) {source} 다시 열림: 남은 {len(items) - index}건은 다음 실행에서 수집 ---")
+                break
+            try:
+                with engine.connect() as conn:
+                    with conn.begin():
+                        await _call_work(work, conn)
+            except CircuitOpenError:
+                print(f"--- (차단기) {source} 다시 열림: 남은 {len(items) - index}건은 다음 실행에서 수집 ---")
+                break
+            except Exception as e:
+                print(f"        -> (오류) {label} 재시도 실패: {e}")
+            finally:
+                CIRCUITS.release(source)
+
+
+async def extract_price_options(item_loc, category_name):
+    """
+    목록 상품 하나의 가격 옵션 -> [{'capacity', 'price', 'option_text', ...}]
+
+    RAM/SSD/HDD는 용량별 가격 링크마다 옵션 하나 (용량을 찾은 옵션이 있으면 용량 없는 옵션은 제외),
+    다른 카테고리는 첫 번째 가격 하나. 가격이 없거나 가격비교예정/단종이면 빈 목록.
+    """
+    # ✅ 용량별 가격 수집 (RAM, SSD, HDD의 경우)
+    price_options = []
+    if category_name in ['RAM', 'SSD', 'HDD']:
+        # 가격 섹션에서 모든 가격 옵션 가져오기
+        price_sect_loc = item_loc.locator('p.price_sect')
+        price_link_count = await price_sect_loc.locator('a').count()
+        
+        for i in range(price_link_count):
+            try:
+                price_link = price_sect_loc.locator('a').nth(i)
+                
+                # 각 가격 링크의 부모 p.price_sect 요소 찾기 (strict mode violation 방지)
+                # JavaScript를 사용하여 부모 요소 찾기
+                try:
+                    parent_price_sect = await price_link.evaluate('''(element) => {
+                        let parent = element.parentElement;
+                        while (parent && (parent.tagName !== 'P' || !parent.classList.contains('price_sect'))) {
+                            parent = parent.parentElement;
+                            if (!parent) break;
+                        }
+                        return parent;
+                    }''')
+                except:
+                    parent_price_sect = None
                 
-                for i in range(price_link_count):
+                # 가격 텍스트 추출 (strong 태그 우선)
+                price_text = None
+                try:
+                    price_strong = price_link.locator('strong').first
+                    price_text = await timed('danawa.com', 'read', 2000, lambda t: price_strong.inner_text(timeout=t))
+                except:
+                    pass
+                
+                if not price_text:
+                    # strong 태그가 없으면 전체 텍스트에서 가격 추출
+                    option_text = await timed('danawa.com', 'read', 2000, lambda t: price_link.inner_text(timeout=t))
+                    price_match = re.search(r'([\d,]+)\s*원', option_text)
+                    if price_match:
+                        price_text = price_match.group(1)
+                
+                if not price_text:
+                    continue
+                
+                # 가격 파싱
+                try:
+                    price = int(price_text.strip().replace(',', ''))
+                except ValueError:
+                    continue
+                
+                # 가격 링크의 href에서 pcode 추출
+                price_link_href = await timed('danawa.com', 'read', 1000, lambda t: price_link.get_attribute('href', timeout=t)) or ''
+                pcode_match = re.search(r'pcode=(\d+)', price_link_href)
+                current_pcode = pcode_match.group(1) if pcode_match else None
+                
+                # 용량 정보 추출 - 여러 방법 시도
+                capacity = None
+                debug_info = []  # 디버깅용 정보 수집
+                
+                # 방법 0: hidden input 필드에서 용량 정보 추출 (최우선)
+                if current_pcode:
                     try:
-                        price_link = price_sect_loc.locator('a').nth(i)
+                        # 상품 아이템 내의 hidden input 필드 찾기 (wishListBundleVal_로 시작하는 id)
+                        hidden_input_loc = item_loc.locator('input[id^="wishListBundleVal_"]').first
+                        hidden_value = await timed('danawa.com', 'read', 1000, lambda t: hidden_input_loc.get_attribute('value', timeout=t))
+                        debug_info.append(f"hidden_input_value: '{hidden_value}'")
                         
-                        # 각 가격 링크의 부모 p.price_sect 요소 찾기 (strict mode violation 방지)
-                        # JavaScript를 사용하여 부모 요소 찾기
-                        try:
-                            parent_price_sect = await price_link.evaluate('''(element) => {
+                        if hidden_value:
+                            # 형식: "4TB^69869606**2TB^69869573**1TB^69869543//삼성전자 990 EVO Plus M.2 NVMe//69869543"
+                            # 또는: "32GB(16Gx2)^12345**16GB x2^67890//..."
+                            # 각 용량^pcode 쌍을 파싱
+                            # 먼저 "//"로 분리하여 용량 매핑 부분만 추출
+                            parts = hidden_value.split('//')
+                            if parts:
+                                capacity_mapping = parts[0]  # "4TB^69869606**2TB^69869573**1TB^69869543"
+                                # "**"로 분리하여 각 용량^pcode 쌍 확인
+                                capacity_pairs = capacity_mapping.split('**')
+                                for pair in capacity_pairs:
+                                    if '^' in pair:
+                                        cap, pcode = pair.split('^', 1)
+                                        if pcode == current_pcode:
+                                            # 용량 추출 (예: "4TB", "32GB(16Gx2)")
+                                            cap_raw = cap.strip()
+                                            # extract_capacity_from_option으로 정규화 (RAM의 경우 패키지 정보 포함)
+                                            capacity_normalized = extract_capacity_from_option(cap_raw, category_name)
+                                            capacity = capacity_normalized if capacity_normalized else cap_raw
+                                            debug_info.append(f"hidden_input에서 용량 발견: {cap_raw} -> {capacity} (pcode: {pcode})")
+                                            break
+                    except Exception as e:
+                        debug_info.append(f"방법0(hidden_input)실패: {e}")
+                
+                # capacity가 설정되었으면 다른 방법들은 건너뛰기
+                if not capacity:
+                    # 방법 1: 링크의 전체 텍스트에서 추출 (strong 제외한 텍스트)
+                    try:
+                        # 링크 내부의 모든 텍스트 노드 확인 (strong 제외)
+                        all_text = await price_link.evaluate('''(element) => {
+                            let text = '';
+                            for (let node of element.childNodes) {
+                                if (node.nodeType === 3) { // Text node
+                                    text += node.textContent.trim() + ' ';
+                                } else if (node.tagName && node.tagName !== 'STRONG') {
+                                    const nodeText = node.textContent ? node.textContent.trim() : '';
+                                    if (nodeText) text += nodeText + ' ';
+                                }
+                            }
+                            return text.trim();
+                        }''')
+                        debug_info.append(f"링크내부텍스트(strong제외): '{all_text}'")
+                        if all_text:
+                            capacity = extract_capacity_from_option(all_text, category_name)
+                    except Exception as e:
+                        debug_info.append(f"방법1실패: {e}")
+                
+                # 방법 2: 링크의 전체 inner_text에서 추출
+                if not capacity:
+                    try:
+                        option_text = await timed('danawa.com', 'read', 1000, lambda t: price_link.inner_text(timeout=t))
+                        debug_info.append(f"전체inner_text: '{option_text}'")
+                        # 가격 부분 제거하고 용량만 추출
+                        option_without_price = re.sub(r'[\d,]+원', '', option_text).strip()
+                        if option_without_price:
+                            capacity = extract_capacity_from_option(option_without_price, category_name)
+                    except Exception as e:
+                        debug_info.append(f"방법2실패: {e}")
+                
+                # 방법 3: 링크의 title 속성 확인
+                if not capacity:
+                    try:
+                        link_title = await timed('danawa.com', 'read', 1000, lambda t: price_link.get_attribute('title', timeout=t))
+                        debug_info.append(f"title속성: '{link_title}'")
+                        if link_title:
+                            capacity = extract_capacity_from_option(link_title, category_name)
+                    except Exception as e:
+                        debug_info.append(f"방법3실패: {e}")
+                
+                # 방법 4: 링크 앞의 텍스트 노드 확인 (형제 요소)
+                if not capacity:
+                    try:
+                        # 부모 요소에서 링크 앞의 텍스트 확인
+                        parent_text = await price_link.evaluate('''(element) => {
+                            const parent = element.parentElement;
+                            if (!parent) return '';
+                            let text = '';
+                            for (let node of parent.childNodes) {
+                                if (node === element) break;
+                                if (node.nodeType === 3) {
+                                    text += node.textContent.trim() + ' ';
+                                } else if (node.textContent) {
+                                    text += node.textContent.trim() + ' ';
+                                }
+                            }
+                            return text.trim();
+                        }''')
+                        debug_info.append(f"부모요소앞텍스트: '{parent_text}'")
+                        if parent_text:
+                            capacity = extract_capacity_from_option(parent_text, category_name)
+                    except Exception as e:
+                        debug_info.append(f"방법4실패: {e}")
+                
+                # 방법 4-2: 부모 요소의 전체 텍스트 확인 (가격 섹션 전체)
+                if not capacity:
+                    try:
+                        # 각 가격 링크의 부모 p.price_sect 요소에서 텍스트 추출
+                        if parent_price_sect:
+                            parent_full_text = await price_link.evaluate('''(element) => {
                                 let parent = element.parentElement;
                                 while (parent && (parent.tagName !== 'P' || !parent.classList.contains('price_sect'))) {
                                     parent = parent.parentElement;
                                     if (!parent) break;
                                 }
-                                return parent;
+                                return parent ? (parent.textContent || parent.innerText || '') : '';
                             }''')
-                        except:
-                            parent_price_sect = None
-                        
-                        # 가격 텍스트 추출 (strong 태그 우선)
-                        price_text = None
-                        try:
-                            price_strong = price_link.locator('strong').first
-                            price_text = await price_strong.inner_text(timeout=2000)
-                        except:
-                            pass
-                        
-                        if not price_text:
-                            # strong 태그가 없으면 전체 텍스트에서 가격 추출
-                            option_text = await price_link.inner_text(timeout=2000)
-                            price_match = re.search(r'([\d,]+)\s*원', option_text)
-                            if price_match:
-                                price_text = price_match.group(1)
-                        
-                        if not price_text:
-                            continue
-                        
-                        # 가격 파싱
-                        try:
-                            price = int(price_text.strip().replace(',', ''))
-                        except ValueError:
-                            continue
-                        
-                        # 가격 링크의 href에서 pcode 추출
-                        price_link_href = await price_link.get_attribute('href', timeout=1000) or ''
-                        pcode_match = re.search(r'pcode=(\d+)', price_link_href)
-                        current_pcode = pcode_match.group(1) if pcode_match else None
-                        
-                        # 용량 정보 추출 - 여러 방법 시도
-                        capacity = None
-                        debug_info = []  # 디버깅용 정보 수집
-                        
-                        # 방법 0: hidden input 필드에서 용량 정보 추출 (최우선)
-                        if current_pcode:
-                            try:
-                                # 상품 아이템 내의 hidden input 필드 찾기 (wishListBundleVal_로 시작하는 id)
-                                hidden_input_loc = item_loc.locator('input[id^="wishListBundleVal_"]').first
-                                hidden_value = await hidden_input_loc.get_attribute('value', timeout=1000)
-                                debug_info.append(f"hidden_input_value: '{hidden_value}'")
-                                
-                                if hidden_value:
-                                    # 형식: "4TB^69869606**2TB^69869573**1TB^69869543//삼성전자 990 EVO Plus M.2 NVMe//69869543"
-                                    # 또는: "32GB(16Gx2)^12345**16GB x2^67890//..."
-                                    # 각 용량^pcode 쌍을 파싱
-                                    # 먼저 "//"로 분리하여 용량 매핑 부분만 추출
-                                    parts = hidden_value.split('//')
-                                    if parts:
-                                        capacity_mapping = parts[0]  # "4TB^69869606**2TB^69869573**1TB^69869543"
-                                        # "**"로 분리하여 각 용량^pcode 쌍 확인
-                                        capacity_pairs = capacity_mapping.split('**')
-                                        for pair in capacity_pairs:
-                                            if '^' in pair:
-                                                cap, pcode = pair.split('^', 1)
-                                                if pcode == current_pcode:
-                                                    # 용량 추출 (예: "4TB", "32GB(16Gx2)")
-                                                    cap_raw = cap.strip()
-                                                    # extract_capacity_from_option으로 정규화 (RAM의 경우 패키지 정보 포함)
-                                                    capacity_normalized = extract_capacity_from_option(cap_raw, category_name)
-                                                    capacity = capacity_normalized if capacity_normalized else cap_raw
-                                                    debug_info.append(f"hidden_input에서 용량 발견: {cap_raw} -> {capacity} (pcode: {pcode})")
-                                                    break
-                            except Exception as e:
-                                debug_info.append(f"방법0(hidden_input)실패: {e}")
-                        
-                        # capacity가 설정되었으면 다른 방법들은 건너뛰기
-                        if not capacity:
-                            # 방법 1: 링크의 전체 텍스트에서 추출 (strong 제외한 텍스트)
-                            try:
-                                # 링크 내부의 모든 텍스트 노드 확인 (strong 제외)
-                                all_text = await price_link.evaluate('''(element) => {
-                                    let text = '';
-                                    for (let node of element.childNodes) {
-                                        if (node.nodeType === 3) { // Text node
-                                            text += node.textContent.trim() + ' ';
-                                        } else if (node.tagName && node.tagName !== 'STRONG') {
-                                            const nodeText = node.textContent ? node.textContent.trim() : '';
-                                            if (nodeText) text += nodeText + ' ';
-                                        }
-                                    }
-                                    return text.trim();
-                                }''')
-                                debug_info.append(f"링크내부텍스트(strong제외): '{all_text}'")
-                                if all_text:
-                                    capacity = extract_capacity_from_option(all_text, category_name)
-                            except Exception as e:
-                                debug_info.append(f"방법1실패: {e}")
-                        
-                        # 방법 2: 링크의 전체 inner_text에서 추출
-                        if not capacity:
-                            try:
-                                option_text = await price_link.inner_text(timeout=1000)
-                                debug_info.append(f"전체inner_text: '{option_text}'")
-                                # 가격 부분 제거하고 용량만 추출
-                                option_without_price = re.sub(r'[\d,]+원', '', option_text).strip()
-                                if option_without_price:
-                                    capacity = extract_capacity_from_option(option_without_price, category_name)
-                            except Exception as e:
-                                debug_info.append(f"방법2실패: {e}")
-                        
-                        # 방법 3: 링크의 title 속성 확인
-                        if not capacity:
-                            try:
-                                link_title = await price_link.get_attribute('title', timeout=1000)
-                                debug_info.append(f"title속성: '{link_title}'")
-                                if link_title:
-                                    capacity = extract_capacity_from_option(link_title, category_name)
-                            except Exception as e:
-                                debug_info.append(f"방법3실패: {e}")
-                        
-                        # 방법 4: 링크 앞의 텍스트 노드 확인 (형제 요소)
-                        if not capacity:
-                            try:
-                                # 부모 요소에서 링크 앞의 텍스트 확인
-                                parent_text = await price_link.evaluate('''(element) => {
-                                    const parent = element.parentElement;
-                                    if (!parent) return '';
-                                    let text = '';
-                                    for (let node of parent.childNodes) {
-                                        if (node === element) break;
-                                        if (node.nodeType === 3) {
-                                            text += node.textContent.trim() + ' ';
-                                        } else if (node.textContent) {
-                                            text += node.textContent.trim() + ' ';
-                                        }
-                                    }
-                                    return text.trim();
-                                }''')
-                                debug_info.append(f"부모요소앞텍스트: '{parent_text}'")
-                                if parent_text:
-                                    capacity = extract_capacity_from_option(parent_text, category_name)
-                            except Exception as e:
-                                debug_info.append(f"방법4실패: {e}")
-                        
-                        # 방법 4-2: 부모 요소의 전체 텍스트 확인 (가격 섹션 전체)
-                        if not capacity:
-                            try:
-                                # 각 가격 링크의 부모 p.price_sect 요소에서 텍스트 추출
-                                if parent_price_sect:
-                                    parent_full_text = await price_link.evaluate('''(element) => {
-                                        let parent = element.parentElement;
-                                        while (parent && (parent.tagName !== 'P' || !parent.classList.contains('price_sect'))) {
-                                            parent = parent.parentElement;
-                                            if (!parent) break;
-                                        }
-                                        return parent ? (parent.textContent || parent.innerText || '') : '';
-                                    }''')
-                                else:
-                                    parent_full_text = ''
-                                debug_info.append(f"가격섹션전체텍스트: '{parent_full_text[:200]}'")
-                                
-                                # 가격 텍스트 정규화 (쉼표 제거)
-                                price_normalized = price_text.replace(',', '')
-                                
-                                # 방법 4-2-1: 가격 앞의 텍스트에서 용량 추출
-                                if price_text in parent_full_text:
-                                    price_index = parent_full_text.find(price_text)
-                                    if price_index > 0:
-                                        before_price = parent_full_text[:price_index].strip()
-                                        capacity = extract_capacity_from_option(before_price, category_name)
-                                
-                                # 방법 4-2-2: 정규화된 가격으로 검색 (쉼표 없는 버전)
-                                if not capacity and price_normalized in parent_full_text:
-                                    price_index = parent_full_text.find(price_normalized)
-                                    if price_index > 0:
-                                        before_price = parent_full_text[:price_index].strip()
-                                        capacity = extract_capacity_from_option(before_price, category_name)
-                                
-                                # 방법 4-2-3: "/" 또는 줄바꿈으로 분리된 각 세그먼트에서 해당 가격 찾기
-                                if not capacity:
-                                    # 세그먼트 분리 (/, \n, 공백 여러 개 등)
-                                    segments = re.split(r'[/\n]+|\s{2,}', parent_full_text)
-                                    for segment in segments:
-                                        segment = segment.strip()
-                                        # 세그먼트에 현재 가격이 포함되어 있는지 확인
-                                        if price_text in segment or price_normalized in segment:
-                                            # 세그먼트에서 용량 추출
-                                            capacity = extract_capacity_from_option(segment, category_name)
-                                            if capacity:
-                                                break
-                                
-                                # 방법 4-2-4: 가격 섹션 전체에서 용량 패턴 직접 검색 (예: "8TB 135원/1GB 1,079,080원")
-                                if not capacity:
-                                    capacity = extract_capacity_from_option(parent_full_text, category_name)
-                            except Exception as e:
-                                debug_info.append(f"방법4-2실패: {e}")
+                        else:
+                            parent_full_text = ''
+                        debug_info.append(f"가격섹션전체텍스트: '{parent_full_text[:200]}'")
                         
-                        # 방법 4-3: 링크의 이전 형제 요소 확인
-                        if not capacity:
-                            try:
-                                prev_sibling_text = await price_link.evaluate('''(element) => {
-                                    let prev = element.previousElementSibling;
-                                    while (prev) {
-                                        if (prev.textContent && prev.textContent.trim()) {
-                                            return prev.textContent.trim();
-                                        }
-                                        prev = prev.previousElementSibling;
-                                    }
-                                    return '';
-                                }''')
-                                debug_info.append(f"이전형제요소: '{prev_sibling_text}'")
-                                if prev_sibling_text:
-                                    capacity = extract_capacity_from_option(prev_sibling_text, category_name)
-                            except Exception as e:
-                                debug_info.append(f"방법4-3실패: {e}")
+                        # 가격 텍스트 정규화 (쉼표 제거)
+                        price_normalized = price_text.replace(',', '')
                         
-                        # 방법 5: 링크의 data 속성 확인
-                        if not capacity:
-                            try:
-                                data_capacity = await price_link.get_attribute('data-capacity', timeout=500)
-                                if not data_capacity:
-                                    data_capacity = await price_link.get_attribute('data-option', timeout=500)
-                                debug_info.append(f"data속성: '{data_capacity}'")
-                                if data_capacity:
-                                    capacity = extract_capacity_from_option(data_capacity, category_name)
-                            except:
-                                pass
+                        # 방법 4-2-1: 가격 앞의 텍스트에서 용량 추출
+                        if price_text in parent_full_text:
+                            price_index = parent_full_text.find(price_text)
+                            if price_index > 0:
+                                before_price = parent_full_text[:price_index].strip()
+                                capacity = extract_capacity_from_option(before_price, category_name)
                         
-                        # 방법 6: 링크의 전체 HTML 구조 확인 (span, em 등 모든 요소)
-                        if not capacity:
-                            try:
-                                full_html = await price_link.evaluate('''(element) => {
-                                    return element.outerHTML;
-                                }''')
-                                debug_info.append(f"전체HTML: '{full_html[:300]}'")
-                                # HTML에서 용량 패턴 찾기
-                                if full_html:
-                                    capacity = extract_capacity_from_option(full_html, category_name)
-                            except Exception as e:
-                                debug_info.append(f"방법6실패: {e}")
+                        # 방법 4-2-2: 정규화된 가격으로 검색 (쉼표 없는 버전)
+                        if not capacity and price_normalized in parent_full_text:
+                            price_index = parent_full_text.find(price_normalized)
+                            if price_index > 0:
+                                before_price = parent_full_text[:price_index].strip()
+                                capacity = extract_capacity_from_option(before_price, category_name)
                         
-                        # 방법 7: 가격 섹션의 전체 HTML 구조 확인 (모든 형제 요소 포함)
+                        # 방법 4-2-3: "/" 또는 줄바꿈으로 분리된 각 세그먼트에서 해당 가격 찾기
                         if not capacity:
-                            try:
-                                price_sect_html = await price_link.evaluate('''(element) => {
-                                    let parent = element.parentElement;
-                                    while (parent && (parent.tagName !== 'P' || !parent.classList.contains('price_sect'))) {
-                                        parent = parent.parentElement;
-                                        if (!parent) break;
-                                    }
-                                    return parent ? (parent.innerHTML || parent.outerHTML || '') : '';
-                                }''')
-                                debug_info.append(f"가격섹션HTML: '{price_sect_html[:300]}'")
-                                # HTML에서 용량 패턴 찾기
-                                if price_sect_html:
-                                    capacity = extract_capacity_from_option(price_sect_html, category_name)
-                            except Exception as e:
-                                debug_info.append(f"방법7실패: {e}")
+                            # 세그먼트 분리 (/, \n, 공백 여러 개 등)
+                            segments = re.split(r'[/\n]+|\s{2,}', parent_full_text)
+                            for segment in segments:
+                                segment = segment.strip()
+                                # 세그먼트에 현재 가격이 포함되어 있는지 확인
+                                if price_text in segment or price_normalized in segment:
+                                    # 세그먼트에서 용량 추출
+                                    capacity = extract_capacity_from_option(segment, category_name)
+                                    if capacity:
+                                        break
                         
-                        # 방법 8: 가격 링크의 다음 형제 요소 확인
+                        # 방법 4-2-4: 가격 섹션 전체에서 용량 패턴 직접 검색 (예: "8TB 135원/1GB 1,079,080원")
                         if not capacity:
-                            try:
-                                next_sibling_text = await price_link.evaluate('''(element) => {
-                                    let next = element.nextElementSibling;
-                                    while (next) {
-                                        if (next.textContent && next.textContent.trim()) {
-                                            return next.textContent.trim();
-                                        }
-                                        next = next.nextElementSibling;
-                                    }
-                                    return '';
-                                }''')
-                                debug_info.append(f"다음형제요소: '{next_sibling_text}'")
-                                if next_sibling_text:
-                                    capacity = extract_capacity_from_option(next_sibling_text, category_name)
-                            except Exception as e:
-                                debug_info.append(f"방법8실패: {e}")
-                        
-                        if capacity:
-                            price_options.append({
-                                'capacity': capacity,
-                                'price': price,
-                                'option_text': f"{capacity} {price_text}원"
-                            })
-                            print(f"         -> 옵션 발견: {capacity} - {price:,}원")
-                        else:
-                            # 디버깅 정보 출력 (처음 몇 개만)
-                            if len(price_options) < 5:  # 처음 5개만 상세 로그
-                                print(f"         -> (디버그) 용량 추출 실패 - 가격: {price_text}원")
-                                for info in debug_info:  # 모든 디버그 정보 출력
-                                    print(f"            {info}")
-                            else:
-                                print(f"         -> (경고) 용량 정보 추출 실패: {price_text}원")
+                            capacity = extract_capacity_from_option(parent_full_text, category_name)
                     except Exception as e:
-                        print(f"         -> (경고) 옵션 처리 실패: {e}")
-                        continue
+                        debug_info.append(f"방법4-2실패: {e}")
                 
-                # 용량별 가격이 없으면 첫 번째 가격만 사용
-                # 단, 용량별 가격 옵션이 하나라도 있으면 용량 없는 기본 상품은 저장하지 않음
-                if not price_options:
-                    price_tag_loc = item_loc.locator('p.price_sect > a').first.locator('strong').first
-                    price_text = await price_tag_loc.inner_text(timeout=5000)
-                    if '가격비교예정' not in price_text and '단종' not in price_text and price_text:
-                        try:
-                            price = int(price_text.strip().replace(',', ''))
-                            price_options.append({
-                                'capacity': None,
-                                'price': price,
-                                'option_text': price_text
-                            })
-                        except ValueError:
-                            pass
+                # 방법 4-3: 링크의 이전 형제 요소 확인
+                if not capacity:
+                    try:
+                        prev_sibling_text = await price_link.evaluate('''(element) => {
+                            let prev = element.previousElementSibling;
+                            while (prev) {
+                                if (prev.textContent && prev.textContent.trim()) {
+                                    return prev.textContent.trim();
+                                }
+                                prev = prev.previousElementSibling;
+                            }
+                            return '';
+                        }''')
+                        debug_info.append(f"이전형제요소: '{prev_sibling_text}'")
+                        if prev_sibling_text:
+                            capacity = extract_capacity_from_option(prev_sibling_text, category_name)
+                    except Exception as e:
+                        debug_info.append(f"방법4-3실패: {e}")
+                
+                # 방법 5: 링크의 data 속성 확인
+                if not capacity:
+                    try:
+                        data_capacity = await timed('danawa.com', 'read', 500, lambda t: price_link.get_attribute('data-capacity', timeout=t))
+                        if not data_capacity:
+                            data_capacity = await timed('danawa.com', 'read', 500, lambda t: price_link.get_attribute('data-option', timeout=t))
+                        debug_info.append(f"data속성: '{data_capacity}'")
+                        if data_capacity:
+                            capacity = extract_capacity_from_option(data_capacity, category_name)
+                    except:
+                        pass
+                
+                # 방법 6: 링크의 전체 HTML 구조 확인 (span, em 등 모든 요소)
+                if not capacity:
+                    try:
+                        full_html = await price_link.evaluate('''(element) => {
+                            return element.outerHTML;
+                        }''')
+                        debug_info.append(f"전체HTML: '{full_html[:300]}'")
+                        # HTML에서 용량 패턴 찾기
+                        if full_html:
+                            capacity = extract_capacity_from_option(full_html, category_name)
+                    except Exception as e:
+                        debug_info.append(f"방법6실패: {e}")
+                
+                # 방법 7: 가격 섹션의 전체 HTML 구조 확인 (모든 형제 요소 포함)
+                if not capacity:
+                    try:
+                        price_sect_html = await price_link.evaluate('''(element) => {
+                            let parent = element.parentElement;
+                            while (parent && (parent.tagName !== 'P' || !parent.classList.contains('price_sect'))) {
+                                parent = parent.parentElement;
+                                if (!parent) break;
+                            }
+                            return parent ? (parent.innerHTML || parent.outerHTML || '') : '';
+                        }''')
+                        debug_info.append(f"가격섹션HTML: '{price_sect_html[:300]}'")
+                        # HTML에서 용량 패턴 찾기
+                        if price_sect_html:
+                            capacity = extract_capacity_from_option(price_sect_html, category_name)
+                    except Exception as e:
+                        debug_info.append(f"방법7실패: {e}")
+                
+                # 방법 8: 가격 링크의 다음 형제 요소 확인
+                if not capacity:
+                    try:
+                        next_sibling_text = await price_link.evaluate('''(element) => {
+                            let next = element.nextElementSibling;
+                            while (next) {
+                                if (next.textContent && next.textContent.trim()) {
+                                    return next.textContent.trim();
+                                }
+                                next = next.nextElementSibling;
+                            }
+                            return '';
+                        }''')
+                        debug_info.append(f"다음형제요소: '{next_sibling_text}'")
+                        if next_sibling_text:
+                            capacity = extract_capacity_from_option(next_sibling_text, category_name)
+                    except Exception as e:
+                        debug_info.append(f"방법8실패: {e}")
+                
+                if capacity:
+                    price_options.append({
+                        'capacity': capacity,
+                        'price': price,
+                        'option_text': f"{capacity} {price_text}원"
+                    })
+                    print(f"         -> 옵션 발견: {capacity} - {price:,}원")
                 else:
-                    # 용량별 가격 옵션이 있는 경우, 용량이 없는 옵션은 제거
-                    # (용량별 상품이 있는데 기본 상품도 저장하면 중복됨)
-                    price_options = [opt for opt in price_options if opt['capacity'] is not None]
-                    if not price_options:
-                        # 모든 옵션에서 용량을 찾지 못한 경우에만 기본 상품 저장
-                        price_tag_loc = item_loc.locator('p.price_sect > a').first.locator('strong').first
-                        price_text = await price_tag_loc.inner_text(timeout=5000)
-                        if '가격비교예정' not in price_text and '단종' not in price_text and price_text:
-                            try:
-                                price = int(price_text.strip().replace(',', ''))
-                                price_options.append({
-                                    'capacity': None,
-                                    'price': price,
-                                    'option_text': price_text
-                                })
-                            except ValueError:
-                                pass
-            else:
-                # 다른 카테고리는 첫 번째 가격만 사용
+                    # 디버깅 정보 출력 (처음 몇 개만)
+                    if len(price_options) < 5:  # 처음 5개만 상세 로그
+                        print(f"         -> (디버그) 용량 추출 실패 - 가격: {price_text}원")
+                        for info in debug_info:  # 모든 디버그 정보 출력
+                            print(f"            {info}")
+                    else:
+                        print(f"         -> (경고) 용량 정보 추출 실패: {price_text}원")
+            except Exception as e:
+                print(f"         -> (경고) 옵션 처리 실패: {e}")
+                continue
+        
+        # 용량별 가격이 없으면 첫 번째 가격만 사용
+        # 단, 용량별 가격 옵션이 하나라도 있으면 용량 없는 기본 상품은 저장하지 않음
+        if not price_options:
+            price_tag_loc = item_loc.locator('p.price_sect > a').first.locator('strong').first
+            price_text = await timed('danawa.com', 'read', 5000, lambda t: price_tag_loc.inner_text(timeout=t))
+            if '가격비교예정' not in price_text and '단종' not in price_text and price_text:
+                try:
+                    price = int(price_text.strip().replace(',', ''))
+                    price_options.append({
+                        'capacity': None,
+                        'price': price,
+                        'option_text': price_text
+                    })
+                except ValueError:
+                    pass
+        else:
+            # 용량별 가격 옵션이 있는 경우, 용량이 없는 옵션은 제거
+            # (용량별 상품이 있는데 기본 상품도 저장하면 중복됨)
+            price_options = [opt for opt in price_options if opt['capacity'] is not None]
+            if not price_options:
+                # 모든 옵션에서 용량을 찾지 못한 경우에만 기본 상품 저장
                 price_tag_loc = item_loc.locator('p.price_sect > a').first.locator('strong').first
-                price_text = await price_tag_loc.inner_text(timeout=5000)
+                price_text = await timed('danawa.com', 'read', 5000, lambda t: price_tag_loc.inner_text(timeout=t))
                 if '가격비교예정' not in price_text and '단종' not in price_text and price_text:
                     try:
                         price = int(price_text.strip().replace(',', ''))
@@ -3120,14 +1958,149 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                         })
                     except ValueError:
                         pass
+    else:
+        # 다른 카테고리는 첫 번째 가격만 사용
+        price_tag_loc = item_loc.locator('p.price_sect > a').first.locator('strong').first
+        price_text = await timed('danawa.com', 'read', 5000, lambda t: price_tag_loc.inner_text(timeout=t))
+        if '가격비교예정' not in price_text and '단종' not in price_text and price_text:
+            try:
+                price = int(price_text.strip().replace(',', ''))
+                price_options.append({
+                    'capacity': None,
+                    'price': price,
+                    'option_text': price_text
+                })
+            except ValueError:
+                pass
+    return price_options
+
+
+def product_link_for(link, capacity):
+    """용량별 상품의 parts.link (용량이 있으면 URL 인코딩한 용량을 붙여 unique하게)"""
+    if not capacity:
+        return link
+    return f"{link}#capacity={url_quote(capacity, safe='')}"
+
+
+def load_known_prices(engine, category_name):
+    """카테고리의 저장된 가격 -> {link: [part_id, price]} (--prices-only 비교용, 카테고리 시작 시 1회)"""
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT link, id, price FROM parts WHERE category = :category"),
+                            {"category": category_name}).fetchall()
+    return {link: [part_id, price] for link, part_id, price in rows}
+
+
+async def refresh_page_prices(engine, category_name, product_items_loc, item_count, known_prices, limiter, page_num):
+    """
+    --prices-only: 목록 페이지 하나에서 링크/가격 옵션/용량만 읽어 알려진 가격과 비교하고,
+    바뀐 가격을 UPDATE 한 번으로 저장 (이미지/스펙/파싱/벤치마크/리뷰는 건너뜀)
+    """
+    async def read_item(item_loc):
+        async with limiter.slot():
+            item_started = time.monotonic()
+            name_tag_loc = item_loc.locator('p.prod_name > a')
+            link = await timed('danawa.com', 'read', 5000, lambda t: name_tag_loc.get_attribute('href', timeout=t))
+            price_options = await extract_price_options(item_loc, category_name)
+            # 마감 예산(--deadline)이 전체 상품 처리 추정값 대신 가격만 읽는 속도로 남은 페이지를 추정하도록
+            crawl_deadline.record_item(time.monotonic() - item_started)
+            return link, price_options
+
+    results = await asyncio.gather(*(read_item(product_items_loc.nth(i)) for i in range(item_count)), return_exceptions=True)
+    checks, changes, unknown = [], {}, 0
+    for result in results:
+        if isinstance(result, Exception):
+            limiter.report_error(result)
+            continue
+        link, price_options = result
+        if not link:
+            continue
+        for option in price_options:
+            product_link = product_link_for(link, option['capacity'])
+            known = known_prices.get(product_link)
+            if known is None:
+                # 신규 상품은 이미지/스펙이 필요하므로 전체 크롤링에서 저장
+                unknown += 1
+                continue
+            part_id, old_price = known
+            checks.append((part_id, option['price'] != old_price))
+            if option['price'] != old_price:
+                changes[product_link] = (part_id, option['price'])
+
+    if checks:
+        with engine.begin() as conn:
+            if changes:
+                params, cases = {}, []
+                for index, (part_id, price) in enumerate(changes.values()):
+                    cases.append(f"WHEN :id{index} THEN :price{index}")
+                    params[f"id{index}"], params[f"price{index}"] = part_id, price
+                conn.execute(text(f"""
+                    UPDATE parts SET price = CASE id {' '.join(cases)} END
+                    WHERE id IN ({', '.join(f':id{index}' for index in range(len(changes)))})
+                """), params)
+            refresh_tiers.record_price_checks(conn, category_name, page_num, checks)
+        for product_link, (part_id, price) in changes.items():
+            known_prices[product_link] = [part_id, price]
+    print(f"     -> (가격만) 확인 {len(checks)}개, 가격 변경 {len(changes)}개 저장, 미등록 {unknown}개 (전체 크롤링에서 저장)")
+
+
+async def scrape_category(browser, page, engine, category_name, query, collect_reviews, collect_benchmarks, sql_parts, sql_specs, sql_review, sql_check_review, review_pipeline=None, pages=None, prices_only=False):
+    """
+    카테고리별 크롤링 함수
+    
+    Args:
+        browser: Playwright 브라우저 객체
+        page: Playwright 페이지 객체
+        engine: SQLAlchemy 엔진 객체
+        category_name: 카테고리 이름 (예: 'CPU')
+        query: 검색 쿼리
+        collect_reviews: 퀘이사존 리뷰 수집 여부
+        collect_benchmarks: 벤치마크 정보 수집 여부
+        sql_parts: parts 테이블 INSERT SQL
+        sql_specs: part_spec 테이블 INSERT SQL
+        sql_review: community_reviews 테이블 INSERT SQL
+        sql_check_review: 리뷰 존재 여부 확인 SQL
+        review_pipeline: 리뷰 즉시 요약 파이프라인 (--summarize, 없으면 None)
+        pages: 처리할 목록 페이지 번호 (없으면 1~CRAWL_PAGES, 분산 작업자는 작업 단위의 페이지 하나, --tiered는 등급 계획의 페이지)
+        prices_only: 가격만 갱신 (--prices-only, 알려진 상품의 가격만 페이지당 UPDATE 한 번)
+    Returns:
+        목록 페이지 자체를 처리하지 못한 페이지 번호 목록
+    """
+
+    # --- [신규 함수: 아이템 처리 로직을 분리 및 비동기화] ---
+    async def process_item_async(browser, page, engine, category_name, item_loc, collect_benchmarks, collect_reviews, sql_parts, sql_specs, sql_review, sql_check_review, page_num=None):
+        """
+        개별 상품의 정보 추출, DB 저장, 벤치마크/리뷰 수집을 비동기적으로 처리합니다.
+        Returns: 상품을 끝냈는지 (False면 목록 페이지를 완료로 기록하지 않아 --resume에서 다시 처리)
+        """
+        # DB 트랜잭션은 아이템별로 독립적으로 관리됩니다.
+        # 각 아이템은 독립적인 DB 연결을 사용합니다.
+
+        item_started = time.monotonic()
+        enrichment_seconds = 0.0  # 부가 수집 시간 (마감 예산의 core 시간에서 제외)
+
+        # 4. Locator를 사용하여 각 요소를 추출 (이 과정에서 Playwright가 자동으로 대기함)
+        try:
+            name_tag_loc = item_loc.locator('p.prod_name > a')
+            img_tag_loc = item_loc.locator('div.thumb_image img.lazyload, div.thumb_image img:not([alt*="옵션마크"])').first
+            
+            name = await timed('danawa.com', 'read', 5000, lambda t: name_tag_loc.inner_text(timeout=t))
+            link = await timed('danawa.com', 'read', 5000, lambda t: name_tag_loc.get_attribute('href', timeout=t))
+
+            # 재개 실행(--resume): 모든 용량/단계를 이미 마친 상품은 건너뜀
+            if crawl_checkpoint.is_done('item', link):
+                print(f"     (재개) 이미 처리한 상품 건너뜀: {name}")
+                return True
+            
+            # ✅ 용량별 가격 수집 (RAM, SSD, HDD의 경우)
+            price_options = await extract_price_options(item_loc, category_name)
             
             # 가격 정보가 없으면 건너뛰기
             if not price_options:
-                return
+                return True
             
-            img_src = await img_tag_loc.get_attribute('data-src', timeout=2000) or \
-                        await img_tag_loc.get_attribute('data-original-src', timeout=2000) or \
-                        await img_tag_loc.get_attribute('src', timeout=2000)
+            img_src = await timed('danawa.com', 'read', 2000, lambda t: img_tag_loc.get_attribute('data-src', timeout=t)) or \
+                        await timed('danawa.com', 'read', 2000, lambda t: img_tag_loc.get_attribute('data-original-src', timeout=t)) or \
+                        await timed('danawa.com', 'read', 2000, lambda t: img_tag_loc.get_attribute('src', timeout=t))
 
             if img_src and not img_src.startswith('https:'):
                 img_src = 'https:' + img_src
@@ -3135,10 +2108,11 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
             # noimg가 저장되는 것을 방지
             if 'noImg' in (img_src or ''):
                 print(f"  - (경고) {name} (이미지 로드 실패, noImg 건너뜀)")
-                return
+                return True
         except Exception as e:
             print(f"  - (오류) 아이템 정보 추출 실패: {e}")
-            return
+            limiter.report_error(e)
+            return False
 
         # 2. 리뷰/별점 추출
         review_count = 0
@@ -3148,21 +2122,21 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
         for j in range(meta_count):
             meta_text = ""
             try:
-                meta_text = await meta_items_loc.nth(j).inner_text(timeout=1000)
+                meta_text = await timed('danawa.com', 'read', 1000, lambda t: meta_items_loc.nth(j).inner_text(timeout=t))
             except Exception:
                 continue
                 
             if '상품의견' in meta_text:
                 count_tag_loc = meta_items_loc.nth(j).locator('.dd strong')
                 if await count_tag_loc.count() > 0:
-                    count_text = await count_tag_loc.inner_text(timeout=1000)
+                    count_text = await timed('danawa.com', 'read', 1000, lambda t: count_tag_loc.inner_text(timeout=t))
                     if (match := re.search(r'[\d,]+', count_text)):
                         review_count = int(match.group().replace(',', ''))
             
             elif '상품리뷰' in meta_text:
                 score_tag_loc = meta_items_loc.nth(j).locator('.text__score')
                 if await score_tag_loc.count() > 0:
-                    try: star_rating = float((await score_tag_loc.inner_text(timeout=1000)).strip())
+                    try: star_rating = float((await timed('danawa.com', 'read', 1000, lambda t: score_tag_loc.inner_text(timeout=t))).strip())
                     except (ValueError, TypeError): star_rating = 0.0
 
         # 3. 스펙 추출
@@ -3170,12 +2144,12 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
         try:
             # '전체 스펙'을 우선 시도
             spec_tag_loc = item_loc.locator('div.spec-box--full .spec_list')
-            spec_string = await spec_tag_loc.inner_text(timeout=2000)
+            spec_string = await timed('danawa.com', 'read', 2000, lambda t: spec_tag_loc.inner_text(timeout=t))
         except Exception:
             try:
                 # '전체 스펙'이 없으면 '요약 스펙'이라도 가져옴
                 spec_tag_loc_fallback = item_loc.locator('div.spec_list').first
-                spec_string = await spec_tag_loc_fallback.inner_text(timeout=1000)
+                spec_string = await timed('danawa.com', 'read', 1000, lambda t: spec_tag_loc_fallback.inner_text(timeout=t))
             except Exception:
                 print(f"  - (경고) {name} (스펙 정보 없음)")
         
@@ -3198,6 +2172,7 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
         
         # --- 4. 용량별로 상품 저장 (RAM, SSD, HDD의 경우) ---
         # 각 용량별 가격 옵션을 별도 상품으로 저장
+        item_complete = True  # 모든 용량의 저장/수집 단계를 마쳤는지 (체크포인트 기록용)
         for price_option in price_options:
             capacity = price_option['capacity']
             price = price_option['price']
@@ -3212,26 +2187,10 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                 if capacity not in product_name:
                     product_name = f"{name} ({capacity})"
                 # link에 용량 정보 추가하여 unique하게 만들기 (URL 인코딩)
-                encoded_capacity = url_quote(capacity, safe='')
-                product_link = f"{link}#capacity={encoded_capacity}"
+                product_link = product_link_for(link, capacity)
             
             # 용량 정보를 스펙에 추가
-            detailed_specs_with_capacity = detailed_specs.copy()
-            if capacity:
-                if category_name == 'RAM':
-                    # RAM의 경우 capacity에 패키지 정보 포함 (예: "32GB (16GB x2)")
-                    detailed_specs_with_capacity['capacity'] = capacity
-                    # 패키지 개수 추출
-                    package_match = re.search(r'x(\d+)', capacity)
-                    if package_match:
-                        detailed_specs_with_capacity['ram_count'] = f"{package_match.group(1)}개"
-                    # 총 용량 추출
-                    total_capacity_match = re.search(r'^(\d+GB)', capacity)
-                    if total_capacity_match:
-                        detailed_specs_with_capacity['total_capacity'] = total_capacity_match.group(1)
-                elif category_name in ['SSD', 'HDD']:
-                    # SSD/HDD의 경우 storage_capacity에 용량 정보 저장 (예: "1TB", "2TB", "4TB")
-                    detailed_specs_with_capacity['storage_capacity'] = capacity
+            detailed_specs_with_capacity = add_capacity_specs(detailed_specs, category_name, capacity)
             
             # --- 4. (신규) 1단계: `parts` 테이블에 공통 정보 저장 ---
             parts_params = {
@@ -3260,6 +2219,7 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                             
                             part_id = None
                             needs_update = False
+                            price_changed = False
                             
                             if existing:
                                 # 기존 상품이 존재
@@ -3270,6 +2230,7 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                                     # 가격 변동이 있는 경우만 업데이트
                                     print(f"     -> [{capacity or '기본'}] 가격 변동 감지: {old_price}원 -> {price}원 (업데이트)")
                                     needs_update = True
+                                    price_changed = True
                                 else:
                                     # 가격 변동 없음 - 벤치마크/리뷰만 확인
                                     print(f"     -> [{capacity or '기본'}] 가격 변동 없음 (건너뜀)")
@@ -3290,6 +2251,10 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                                         part_id_result = conn.execute(find_id_sql, {"link": product_link})
                                         part_id = part_id_result.scalar_one_or_none()
 
+                            # 가격 확인/변동 횟수 누적 (갱신 등급의 변동성, refresh_tiers.py)
+                            if part_id:
+                                refresh_tiers.record_price_check(conn, part_id, category_name, page_num, price_changed)
+
                             # part_id가 확보된 경우에만 스펙 저장 (트랜잭션 블록 안에서 실행)
                             if part_id:
                                 # 스펙 저장 (항상 업데이트 - 스펙이 변경될 수 있으므로)
@@ -3321,6 +2286,19 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                                     if spec_id:
                                         print(f"         -> [{capacity or '기본'}] 스펙 저장 완료 (part_id: {part_id} -> spec_id: {spec_id})")
                                 
+                                # 파서 수정 후 재크롤링 없이 재파싱할 수 있도록 원본 입력 보관 (--reparse)
+                                archive_spec_sql = text("""
+                                    INSERT INTO part_spec_raw (part_id, category, name, spec_string, capacity)
+                                    VALUES (:part_id, :category, :name, :spec_string, :capacity)
+                                    ON DUPLICATE KEY UPDATE
+                                        category = VALUES(category), name = VALUES(name),
+                                        spec_string = VALUES(spec_string), capacity = VALUES(capacity)
+                                """)
+                                conn.execute(archive_spec_sql, {
+                                    "part_id": part_id, "category": category_name, "name": name,
+                                    "spec_string": spec_string, "capacity": capacity
+                                })
+
                                 # part_spec.id를 parts.part_spec_id에 연결 (항상 업데이트)
                                 if spec_id:
                                     update_parts_sql = text("""
@@ -3336,48 +2314,109 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                     print(f"     [처리 완료] {product_name} (용량: {capacity or '기본'}, 가격: {price:,}원)")
                     
                     # === 벤치마크/리뷰 수집은 별도 트랜잭션으로 처리 (DB 락 방지) ===
-                    if part_id:
+                    if part_id and crawl_checkpoint.stop_requested():
+                        # 중단 요청 중에는 저장만 마치고 부가 수집은 재개 실행으로 넘김
+                        print(f"         -> [{capacity or '기본'}] (중단 요청) 벤치마크/리뷰 수집 건너뜀 - 재개 시 수집")
+                        item_complete = False
+                    elif part_id:
+                        # 재개 실행 또는 재시도에서 이미 커밋된 단계는 다시 수집하지 않음
+                        benchmark_stage = f"{product_link}|benchmarks"
+                        review_stage = f"{product_link}|reviews"
+                        benchmarks_pending = collect_benchmarks and not crawl_checkpoint.is_done('stage', benchmark_stage)
+                        reviews_pending = collect_reviews and not crawl_checkpoint.is_done('stage', review_stage)
+                        if (collect_benchmarks and not benchmarks_pending) or (collect_reviews and not reviews_pending):
+                            print(f"         -> [{capacity or '기본'}] (재개) 이미 수집한 단계 건너뜀")
+
+                        # 마감(--deadline)이 가까우면 우선순위가 낮은 부가 수집부터 건너뜀 (재개 시 수집)
+                        if benchmarks_pending and category_name in ('CPU', '그래픽카드') and not crawl_deadline.allow('benchmarks', limiter.current):
+                            print(f"         -> [{capacity or '기본'}] (마감) 벤치마크 수집 건너뜀")
+                            benchmarks_pending = False
+                            item_complete = False
+                        if reviews_pending and not crawl_deadline.allow('reviews', limiter.current):
+                            print(f"             -> [{capacity or '기본'}] (마감) 퀘이사존 리뷰 수집 건너뜀")
+                            reviews_pending = False
+                            item_complete = False
+
                         # 벤치마크 수집 (CPU) - --benchmarks 플래그 선택 시에만 수집
-                        if collect_benchmarks and category_name == 'CPU':
+                        if benchmarks_pending and category_name == 'CPU':
                             print(f"         -> [{capacity or '기본'}] CPU 벤치마크 수집 중... (--benchmarks 플래그 활성화)")
+                            stage_started = time.monotonic()
                             # 별도 커넥션 사용
                             with engine.connect() as bench_conn:
                                 with bench_conn.begin():
-                                    await scrape_cinebench_r23(browser, product_name, bench_conn, part_id, category_name)
-                                    await asyncio.sleep(0.5)
-                                    await scrape_geekbench_v6(browser, product_name, bench_conn, part_id)
-                                    await asyncio.sleep(0.5)
-                                    scrape_blender_median(None, product_name, bench_conn, part_id)
-                                    await asyncio.sleep(0.5)
-                        elif category_name == 'CPU':
+                                    ran = [
+                                        await _run_with_circuit('render4you.com', f"Cinebench R23 {product_name}", bench_conn,
+                                                                partial(scrape_cinebench_r23, browser, product_name, part_id=part_id, category_name=category_name)),
+                                        await _run_with_circuit('geekbench.com', f"Geekbench 6 {product_name}", bench_conn,
+                                                                partial(scrape_geekbench_v6, browser, product_name, part_id=part_id)),
+                                        await _run_with_circuit('opendata.blender.org', f"Blender {product_name}", bench_conn,
+                                                                partial(scrape_blender_median, None, product_name, part_id=part_id)),
+                                    ]
+                            stage_seconds = time.monotonic() - stage_started
+                            crawl_deadline.record_stage('benchmarks', stage_seconds)
+                            enrichment_seconds += stage_seconds
+                            # 차단기로 미뤄진 작업이 있으면 단계 완료로 기록하지 않음 (재개 시 다시 수집)
+                            if all(ran):
+                                crawl_checkpoint.mark('stage', benchmark_stage)
+                            else:
+                                item_complete = False
+                        elif category_name == 'CPU' and not collect_benchmarks:
                             print(f"         -> [{capacity or '기본'}] CPU 벤치마크 수집 건너뜀 (--benchmarks 플래그 미설정)")
 
                         # GPU 벤치마크 수집 - --benchmarks 플래그 선택 시에만 수집
-                        if collect_benchmarks and category_name == '그래픽카드':
-                            common_label, token = _normalize_gpu_model(product_name)
+                        if benchmarks_pending and category_name == '그래픽카드':
+                            common_label, token = normalize_gpu_model(product_name)
                             print(f"         -> [{capacity or '기본'}] GPU 벤치마크 수집 중... ({common_label}, --benchmarks 플래그 활성화)")
+                            stage_started = time.monotonic()
+                            extra_seconds = 0.0
                             # 별도 커넥션 사용
                             with engine.connect() as bench_conn:
                                 with bench_conn.begin():
-                                    scrape_blender_gpu(page, common_label, bench_conn, part_id)
-                                    await asyncio.sleep(2)
-                                    await scrape_3dmark_generic(browser, common_label, bench_conn, part_id, 'Fire Strike', 'https://www.3dmark.com/search#advanced/fs')
-                                    await asyncio.sleep(2)
-                                    await scrape_3dmark_generic(browser, common_label, bench_conn, part_id, 'Time Spy', 'https://www.3dmark.com/search#advanced/spy')
-                                    await asyncio.sleep(2)
-                                    await scrape_3dmark_generic(browser, common_label, bench_conn, part_id, 'Port Royal', 'https://www.3dmark.com/search#advanced/pr')
-                                    await asyncio.sleep(2)
-                        elif category_name == '그래픽카드':
+                                    ran = [await _run_with_circuit('opendata.blender.org', f"Blender GPU {common_label}", bench_conn,
+                                                                   partial(scrape_blender_gpu, page, common_label, part_id=part_id))]
+                                    for test_name, test_url in THREEDMARK_TESTS:
+                                        # 기본 테스트 외 3DMark 테스트는 마감이 가까우면 먼저 건너뜀
+                                        stage = 'benchmarks' if test_name == crawl_deadline.DEADLINE_PRIMARY_3DMARK else '3dmark_extra'
+                                        if stage == '3dmark_extra' and not crawl_deadline.allow(stage, limiter.current):
+                                            print(f"         -> [{capacity or '기본'}] (마감) 3DMark {test_name} 건너뜀")
+                                            ran.append(False)
+                                            item_complete = False
+                                            continue
+                                        test_started = time.monotonic()
+                                        ran.append(await _run_with_circuit('3dmark.com', f"3DMark {test_name} {common_label}", bench_conn,
+                                                                           partial(scrape_3dmark_generic, browser, common_label, part_id=part_id, test_name=test_name, url=test_url)))
+                                        if stage == '3dmark_extra':
+                                            test_seconds = time.monotonic() - test_started
+                                            crawl_deadline.record_stage(stage, test_seconds)
+                                            extra_seconds += test_seconds
+                            stage_seconds = time.monotonic() - stage_started
+                            crawl_deadline.record_stage('benchmarks', stage_seconds - extra_seconds)
+                            enrichment_seconds += stage_seconds
+                            if all(ran):
+                                crawl_checkpoint.mark('stage', benchmark_stage)
+                            else:
+                                item_complete = False
+                        elif category_name == '그래픽카드' and not collect_benchmarks:
                             print(f"         -> [{capacity or '기본'}] GPU 벤치마크 수집 건너뜀 (--benchmarks 플래그 미설정)")
 
                         # 퀘이사존 리뷰 수집 - --reviews 플래그 선택 시에만 수집
-                        if collect_reviews:
+                        if reviews_pending:
                             print(f"             -> [{capacity or '기본'}] 퀘이사존 리뷰 수집 중... (--reviews 플래그 활성화)")
+                            stage_started = time.monotonic()
                             # 별도 커넥션 사용
                             with engine.connect() as review_conn:
                                 with review_conn.begin():
-                                    await scrape_quasarzone_reviews(browser, review_conn, sql_review, part_id, product_name, category_name, detailed_specs_with_capacity)
-                        else:
+                                    ran = await _run_with_circuit('quasarzone.com', f"퀘이사존 리뷰 {product_name}", review_conn,
+                                                                  partial(scrape_quasarzone_reviews, browser, sql_review=sql_review, part_id=part_id, part_name=product_name,
+                                                                          category_name=category_name, detailed_specs=detailed_specs_with_capacity, review_pipeline=review_pipeline))
+                            stage_seconds = time.monotonic() - stage_started
+                            crawl_deadline.record_stage('reviews', stage_seconds)
+                            enrichment_seconds += stage_seconds
+                            if ran:
+                                crawl_checkpoint.mark('stage', review_stage)
+                            else:
+                                item_complete = False
+                        elif not collect_reviews:
                             print(f"             -> [{capacity or '기본'}] 퀘이사존 리뷰 수집 건너뜀 (--reviews 플래그 미설정)")
                     
                     break  # 성공 시 재시도 루프 탈출
@@ -3401,6 +2440,7 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                     is_retryable = any(pattern in error_msg for pattern in retryable_errors)
                     
                     if is_retryable:
+                        limiter.report_error(e)
                         retry_count += 1
                         if retry_count < max_retries:
                             # 지수 백오프: 2초, 4초, 8초, 16초, 32초 (최대 30초)
@@ -3424,16 +2464,42 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                             print(f"     [처리 오류] {product_name} 저장 중 오류 발생 (최대 재시도 횟수 {max_retries}회 초과)")
                             print(f"         상세: {e}")
                             print(f"     [권장 조치]")
-                            print(f"       1. 동시 처리 개수 줄이기: MAX_CONCURRENT_ITEMS=3")
+                            print(f"       1. 동시 처리 상한 줄이기: AIMD_MAX_CONCURRENCY=3")
                             print(f"       2. MySQL wait_timeout 증가: SET GLOBAL wait_timeout=28800")
                             print(f"       3. MySQL max_connections 증가: SET GLOBAL max_connections=500")
+                            item_complete = False
                             break
                     else:
                         # 재시도 불가능한 오류는 즉시 중단
                         print(f"     [처리 오류] {product_name} 저장 중 오류 발생 (재시도 불가): {e}")
+                        limiter.report_error(e)
+                        item_complete = False
                         break
 
-    for page_num in range(1, CRAWL_PAGES + 1): # CRAWL_PAGES 변수 사용하도록 수정
+        crawl_deadline.record_item(time.monotonic() - item_started - enrichment_seconds)
+
+        # 모든 용량을 저장하고 요청된 단계를 마친 상품만 완료로 기록 (재개 시 목록에서 바로 건너뜀)
+        if item_complete and not crawl_checkpoint.stop_requested():
+            crawl_checkpoint.mark('item', link)
+        return item_complete
+
+    # 동시 처리 한도는 카테고리 안의 모든 페이지에서 이어서 학습 (MAX_CONCURRENT_ITEMS는 시작 값)
+    limiter = AdaptiveLimiter(MAX_CONCURRENT_ITEMS, name=category_name)
+    failed_pages = []  # 목록을 열지 못한 페이지 (분산 작업자는 단위를 다시 대기열로 돌림)
+    # --prices-only: 저장된 가격을 한 번 읽어 두고 페이지마다 비교
+    known_prices = load_known_prices(engine, category_name) if prices_only else None
+
+    for page_num in (pages if pages is not None else range(1, CRAWL_PAGES + 1)): # CRAWL_PAGES 변수 사용하도록 수정
+        if crawl_checkpoint.stop_requested():
+            break
+        page_key = f"{category_name}:{page_num}"
+        if crawl_checkpoint.is_done('page', page_key):
+            print(f"--- (재개) '{category_name}' {page_num}페이지는 이미 처리되어 건너뜀 ---")
+            continue
+        # 마감(--deadline) 안에 이 페이지의 목록 저장을 마칠 수 없으면 중단 (--resume으로 이어서)
+        if not crawl_deadline.allow_page(limiter.current):
+            break
+        page_started = time.monotonic()
         if 'query=' in query: # 쿨러처럼 복잡한 쿼리 문자열인 경우
             url = f'https://search.danawa.com/dsearch.php?{query}&page={page_num}'
         else: # CPU처럼 단순 키워드인 경우
@@ -3442,20 +2508,22 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
         print(f"--- '{category_name}' 카테고리, {page_num}페이지 목록 수집 ---")
         
         try:
-            await page.goto(url, wait_until='load', timeout=20000)
-            await page.wait_for_selector('ul.product_list', timeout=10000)
-
-            # [수정] 스크롤 로직 강화 (횟수 5, 대기 1초)
-            print("     -> 스크롤 다운 (5회)...")
-            for _ in range(5):
-                await page.mouse.wheel(0, 1500)
-                await page.wait_for_timeout(1000) # 👈 스크롤 후 대기 시간 증가
-            
-            # [수정] networkidle 대기 시간 증가
-            try:
-                await page.wait_for_load_state('networkidle', timeout=10000)
-            except Exception as e:
-                print(f"     -> (경고) networkidle 대기 시간 초과 (무시하고 진행): {type(e).__name__}")
+            await goto_checked(page, url, 'goto', 20000, wait_until='load')
+            await timed('danawa.com', 'wait', 10000, lambda t: page.wait_for_selector('ul.product_list', timeout=t))
+
+            # 스크롤/networkidle 대기는 지연 로딩 이미지용 (--prices-only는 이미지를 읽지 않으므로 건너뜀)
+            if not prices_only:
+                # [수정] 스크롤 로직 강화 (횟수 5, 대기 1초)
+                print("     -> 스크롤 다운 (5회)...")
+                for _ in range(5):
+                    await page.mouse.wheel(0, 1500)
+                    await page.wait_for_timeout(1000) # 👈 스크롤 후 대기 시간 증가
+                
+                # [수정] networkidle 대기 시간 증가
+                try:
+                    await timed('danawa.com', 'wait_idle', 10000, lambda t: page.wait_for_load_state('networkidle', timeout=t))
+                except Exception as e:
+                    print(f"     -> (경고) networkidle 대기 시간 초과 (무시하고 진행): {type(e).__name__}")
 
             # --- [핵심 수정] ---
             # BeautifulSoup(page.content()) 대신 Playwright Locator 사용
@@ -3465,9 +2533,15 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
             
             # 2. 최소 1개의 아이템이 로드될 때까지 기다립니다.
             try:
-                await product_items_loc.first.wait_for(timeout=10000)
+                await timed('danawa.com', 'wait', 10000, lambda t: product_items_loc.first.wait_for(timeout=t))
             except Exception:
                 print("     -> (경고) 상품 아이템(li.prod_item)을 기다렸지만 로드되지 않았습니다.")
+                try:
+                    if looks_like_bot_wall(await timed('danawa.com', 'read', 2000, lambda t: page.inner_text('body', timeout=t))):
+                        print("     -> (경고) 봇 차단/캡차 화면으로 보입니다.")
+                        limiter.backoff('bot_wall')
+                except Exception:
+                    pass
                 
             item_count = await product_items_loc.count()
             if item_count == 0:
@@ -3475,14 +2549,22 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                 break
             
             print(f"     -> {item_count}개 상품 아이템(locator) 감지. 파싱 시작...")
+            crawl_deadline.record_page(time.monotonic() - page_started, item_count)
+
+            if prices_only:
+                await refresh_page_prices(engine, category_name, product_items_loc, item_count, known_prices, limiter, page_num)
+                if not crawl_checkpoint.stop_requested():
+                    crawl_checkpoint.mark('page', page_key)
+                continue
 
             # 3. BeautifulSoup 루프 대신 locator 루프 사용 - 제한된 병렬 처리
-            # ✅ Semaphore를 사용해 동시 실행 개수 제한 (DB 락 타임아웃 방지)
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT_ITEMS)
-            
+            # ✅ AIMD 제한기로 동시 실행 개수 조절 (건강하면 늘리고, 락 타임아웃/타임아웃/봇 차단 시 절반으로)
             async def limited_process(item_loc):
-                async with semaphore:
-                    return await process_item_async(browser, page, engine, category_name, item_loc, collect_benchmarks, collect_reviews, sql_parts, sql_specs, sql_review, sql_check_review)
+                async with limiter.slot():
+                    # 중단 요청 후에는 대기 중이던 상품을 시작하지 않음 (진행 중인 상품만 마무리)
+                    if crawl_checkpoint.stop_requested():
+                        return False
+                    return await process_item_async(browser, page, engine, category_name, item_loc, collect_benchmarks, collect_reviews, sql_parts, sql_specs, sql_review, sql_check_review, page_num=page_num)
             
             tasks = []
             for i in range(item_count):
@@ -3490,12 +2572,30 @@ async def scrape_category(browser, page, engine, category_name, query, collect_r
                 tasks.append(limited_process(item_loc))
             
             # 제한된 병렬로 모든 아이템 처리
-            await asyncio.gather(*tasks, return_exceptions=True) 
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # 모든 상품을 끝낸 페이지만 완료로 기록 (예외/실패/건너뛴 부가 수집이 있으면 --resume에서 다시 열어 남은 상품만 처리)
+            unfinished = sum(1 for result in results if result is not True)
+            if unfinished:
+                print(f"     -> {page_num}페이지: 끝내지 못한 상품 {unfinished}개 (페이지를 완료로 기록하지 않음)")
+                crawl_checkpoint.mark_incomplete('page', page_key)
+                crawl_checkpoint.mark_incomplete('category', category_name)
+            elif not crawl_checkpoint.stop_requested():
+                crawl_checkpoint.mark('page', page_key)
 
         except Exception as e:
             print(f"--- {page_num}페이지 처리 중 오류 발생: {e}. 다음 페이지로 넘어갑니다. ---")
+            limiter.report_error(e)
+            failed_pages.append(page_num)
+            crawl_checkpoint.mark_incomplete('page', page_key)
+            crawl_checkpoint.mark_incomplete('category', category_name)
             continue
 
+    # 차단기가 열려 건너뛴 벤치마크/리뷰 작업을 (쿨다운이 곧 끝나면) 브라우저가 살아 있는 동안 다시 시도
+    await _retry_deferred_work(engine)
+
+    print(f"--- '{category_name}' {limiter.summary()} ---")
+    return failed_pages
+
 
 
 # --- (신규) 퀘이사존 검색을 위한 핵심 키워드 추출 함수 ---
@@ -3522,9 +2622,9 @@ def get_search_keyword(part_name, category_name, detailed_specs):
     if category_name == 'CPU':
         # 예: 7500F, 14400F, 7800X3D, 265K (신형 모델)
         # (7800X3D, 14900KF, 7500F, 5600, 265K, 245K, 9600X 등)
-        match = re.search(r'(\d{4,5}\w*(?:F|K|X|G|3D)*|\d{3}[K])', part_name, re.I)
-        if match:
-            return match.group(1)
+        cpu_identity = resolve_model(part_name, category_name, detailed_specs)
+        if cpu_identity:
+            return cpu_identity.model
 
     # 3. 파워 (시리즈명 추출 강화)
     if category_name == '파워':
@@ -3609,8 +2709,125 @@ def get_search_keyword(part_name, category_name, detailed_specs):
         
     return search_query.strip()
 
+# --- 리뷰 즉시 요약 (--summarize) ---
+# 대기열 크기: 가득 차면 리뷰 수집이 요약을 기다립니다. (메모리 상한 겸 역압)
+SUMMARY_QUEUE_SIZE = int(os.environ.get("SUMMARY_QUEUE_SIZE", "20"))
+# 동시에 요약을 요청하는 작업자 수
+SUMMARY_WORKERS = int(os.environ.get("SUMMARY_WORKERS", "2"))
+# 분당 최대 요약 API 호출 수 (캐시 적중은 포함하지 않음)
+SUMMARY_REQUESTS_PER_MINUTE = float(os.environ.get("SUMMARY_REQUESTS_PER_MINUTE", "10"))
+
+
+class ReviewSummaryPipeline:
+    """
+    수집한 리뷰 본문을 크롤링 도중 바로 요약해 리뷰와 함께 저장합니다.
+
+    scrape_quasarzone_reviews가 리뷰를 대기열에 넣으면, 작업자들이 분당 호출 수 제한 안에서
+    요약한 뒤 리뷰 INSERT와 요약/캐시 저장을 한 트랜잭션으로 커밋합니다.
+    요약에 실패한 리뷰는 summary_status='pending'으로 저장되어 summarize_reviews.py가 나중에 처리합니다.
+    """
+
+    def __init__(self, engine, sql_review_summarized, workers=SUMMARY_WORKERS,
+                 queue_size=SUMMARY_QUEUE_SIZE, requests_per_minute=SUMMARY_REQUESTS_PER_MINUTE):
+        self.engine = engine
+        self.sql_review_summarized = sql_review_summarized
+        self.Session = sessionmaker(bind=engine)
+        self.workers = workers
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.min_interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self.next_slot = 0.0
+        self.slot_lock = asyncio.Lock()
+        self.tasks = []
+        self.stats = {"summarized": 0, "cache_hits": 0, "failed": 0, "skipped": 0}
+
+    def start(self):
+        summarize_reviews.ensure_summary_cache_table(self.engine)
+        self.tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def submit(self, review_params):
+        """리뷰를 대기열에 넣습니다. 대기열이 가득 차면 자리가 날 때까지 기다립니다."""
+        await self.queue.put(review_params)
+
+    async def close(self):
+        """남은 리뷰를 모두 처리한 뒤 작업자를 종료합니다."""
+        await self.queue.join()
+        for _ in self.tasks:
+            await self.queue.put(None)
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        print(f"--- 리뷰 즉시 요약 완료: 요약 {self.stats['summarized']}건 "
+              f"(캐시 적중 {self.stats['cache_hits']}건), 실패 {self.stats['failed']}건, 중복 건너뜀 {self.stats['skipped']}건 ---")
+
+    async def _wait_for_slot(self):
+        """작업자 전체에서 API 호출 간격을 min_interval 이상으로 유지합니다."""
+        loop = asyncio.get_running_loop()
+        async with self.slot_lock:
+            now = loop.time()
+            wait = max(0.0, self.next_slot - now)
+            self.next_slot = max(now, self.next_slot) + self.min_interval
+        if wait:
+            await asyncio.sleep(wait)
+
+    async def _worker(self):
+        while True:
+            review_params = await self.queue.get()
+            try:
+                if review_params is None:
+                    return
+                await self._process(review_params)
+            except Exception as e:
+                print(f"      -> (경고) 리뷰 즉시 요약 중 오류 (무시함): {type(e).__name__} - {str(e)[:100]}")
+            finally:
+                self.queue.task_done()
+
+    async def _process(self, review_params):
+        session = self.Session()
+        try:
+            # 이미 저장된 리뷰(같은 URL)는 API를 호출하지 않음
+            exists = session.execute(
+                text("SELECT 1 FROM community_reviews WHERE review_url = :review_url"),
+                {"review_url": review_params["review_url"]}
+            ).scalar()
+            if exists:
+                self.stats["skipped"] += 1
+                return
+
+            prepared_text = summarize_reviews.prepare_review_text(review_params["raw_text"])
+            cache_key = summarize_reviews.summary_cache_key(prepared_text)
+            ai_summary = summarize_reviews.get_cached_summary(session, cache_key)
+            from_cache = bool(ai_summary)
+            session.commit()  # API 호출 동안 트랜잭션을 열어두지 않음
+
+            if not from_cache:
+                await self._wait_for_slot()
+                ai_summary = await asyncio.to_thread(summarize_reviews.summarize_text, prepared_text)
+
+            # 리뷰 INSERT와 요약/캐시 저장을 한 트랜잭션으로
+            session.execute(self.sql_review_summarized, {
+                **review_params,
+                "ai_summary": ai_summary,
+                "summary_status": summarize_reviews.SUMMARY_STATUS_DONE if ai_summary else summarize_reviews.SUMMARY_STATUS_PENDING,
+            })
+            if ai_summary and not from_cache:
+                summarize_reviews.put_cached_summary(session, cache_key, ai_summary)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        if not ai_summary:
+            self.stats["failed"] += 1
+            print(f"      -> (경고) 리뷰 요약 실패, 요약 없이 저장 (나중에 summarize_reviews.py로 처리): {review_params['review_url']}")
+        else:
+            self.stats["summarized"] += 1
+            if from_cache:
+                self.stats["cache_hits"] += 1
+            print(f"      -> 퀘이사존 리뷰 1건 요약/저장 완료.{' (캐시 적중)' if from_cache else ''}")
+
+
 # --- (수정) 퀘이사존 리뷰 크롤링 함수 (봇 우회 강화) ---
-async def scrape_quasarzone_reviews(browser, conn, sql_review, part_id, part_name, category_name, detailed_specs):
+async def scrape_quasarzone_reviews(browser, conn, sql_review, part_id, part_name, category_name, detailed_specs, review_pipeline=None):
     """
     (봇 우회 강화) ... (중략)
     """
@@ -3636,10 +2853,14 @@ async def scrape_quasarzone_reviews(browser, conn, sql_review, part_id, part_nam
             
             # Cloud Run 환경 대응: 여러 wait_until 전략 시도
             try:
-                await new_page.goto(q_url, wait_until='networkidle', timeout=30000)
+                await goto_checked(new_page, q_url, 'goto_idle', 30000, wait_until='networkidle')
+            except (BlockedResponseError, CircuitOpenError):
+                raise
             except Exception as e:
                 print(f"         -> (경고) networkidle 실패, load로 재시도: {type(e).__name__}")
-                await new_page.goto(q_url, wait_until='load', timeout=30000)
+                await goto_checked(new_page, q_url, 'goto', 30000, wait_until='load')
+        except CircuitOpenError:
+            raise
         except Exception as e:
             print(f"         -> (오류) 검색 페이지 로딩 실패: {e}") # 6칸 -> 8칸
             return
@@ -3741,10 +2962,12 @@ async def scrape_quasarzone_reviews(browser, conn, sql_review, part_id, part_nam
         
         # [수정] Cloud Run 환경을 위한 페이지 로딩 개선
         try:
-            await new_page.goto(review_url, wait_until='networkidle', timeout=45000)
+            await goto_checked(new_page, review_url, 'goto_idle', 45000, wait_until='networkidle')
+        except (BlockedResponseError, CircuitOpenError):
+            raise
         except Exception as e:
             print(f"         -> (경고) networkidle 대기 실패, load로 재시도: {type(e).__name__}")
-            await new_page.goto(review_url, wait_until='load', timeout=30000)
+            await goto_checked(new_page, review_url, 'goto', 30000, wait_until='load')
         
         # 추가 대기: JavaScript 렌더링 시간 확보
         await new_page.wait_for_timeout(3000)
@@ -3825,9 +3048,9 @@ async def scrape_quasarzone_reviews(browser, conn, sql_review, part_id, part_nam
         # CPU 모델명 추출 (7500F, 7800X3D 등)
         cpu_model = None
         if category_name == 'CPU':
-            model_match = re.search(r'(\d{3,5}\w*(?:F|K|X|G|3D)*|\d{3}[K])', part_name, re.I)
-            if model_match:
-                cpu_model = model_match.group(1)
+            cpu_identity = resolve_model(part_name, category_name, detailed_specs)
+            if cpu_identity:
+                cpu_model = cpu_identity.model
         
         # DB에 저장 (1건)
         review_params = {
@@ -3838,9 +3061,16 @@ async def scrape_quasarzone_reviews(browser, conn, sql_review, part_id, part_nam
                 "review_url": review_url,
                 "raw_text": raw_text
             }
+        if review_pipeline:
+            # 즉시 요약 모드: 요약 작업자가 리뷰와 요약을 한 트랜잭션으로 저장
+            await review_pipeline.submit(review_params)
+            print("      -> 퀘이사존 리뷰 1건 요약 대기열에 추가.")
+            return
         conn.execute(sql_review, review_params)
         print("      -> 퀘이사존 리뷰 1건 저장 완료.")
         
+    except CircuitOpenError:
+        raise
     except Exception as e:
         if "Target page, context or browser has been closed" in str(e):
             print("      -> (치명적 오류) 크롤러 페이지가 닫혔습니다. 중단합니다.")
@@ -3857,21 +3087,8 @@ async def scrape_quasarzone_reviews(browser, conn, sql_review, part_id, part_nam
 # 기존 run_crawler 함수를 찾아서 scrape_category 호출 부분을 수정합니다.
 
 
-async def run_crawler(collect_reviews=False, collect_benchmarks=False):
-    """
-    크롤러 실행 함수
-    
-    Args:
-        collect_reviews: 퀘이사존 리뷰 수집 여부
-        collect_benchmarks: 벤치마크 정보 수집 여부
-    """
-    # CATEGORIES 딕셔너리를 리스트로 변환
-    category_list = list(CATEGORIES.items())
-
-    # 브라우저를 몇 개 카테고리마다 재시작할지 설정합니다. (9개 카테고리 중 3개마다 재시작)
-    RESTART_INTERVAL = 3
-
-    # --- SQL 쿼리 정의 ---
+def build_crawl_sql():
+    """크롤링 저장 SQL -> (parts, part_spec, 리뷰, 리뷰 존재 확인, 요약 포함 리뷰)"""
     sql_parts = text("""
         INSERT INTO parts (
             name, category, price, link, img_src, manufacturer, 
@@ -3896,9 +3113,9 @@ async def run_crawler(collect_reviews=False, collect_benchmarks=False):
 
     sql_review = text("""
         INSERT INTO community_reviews (
-            part_id, part_type, cpu_model, source, review_url, raw_text
+            part_id, part_type, cpu_model, source, review_url, raw_text, summary_status
         ) VALUES (
-            :part_id, :part_type, :cpu_model, :source, :review_url, :raw_text
+            :part_id, :part_type, :cpu_model, :source, :review_url, :raw_text, 'pending'
         )
         ON DUPLICATE KEY UPDATE
             part_id = part_id 
@@ -3906,75 +3123,487 @@ async def run_crawler(collect_reviews=False, collect_benchmarks=False):
     
     sql_check_review = text("SELECT EXISTS (SELECT 1 FROM community_reviews WHERE part_id = :part_id)")
 
-    async with async_playwright() as p: # ✅ [수정] async_playwright 사용
-        
-        # 퀘이사존 세션 획득 로직은 그대로 둡니다.
-
-        for i in range(0, len(category_list), RESTART_INTERVAL):
-            # 1. 브라우저 시작 (Cloud Run 환경 최적화)
-            browser = await p.chromium.launch(
-                headless=HEADLESS_MODE, 
-                slow_mo=SLOW_MOTION,
-                args=[
-                    '--no-sandbox',                    # Cloud Run 필수
-                    '--disable-setuid-sandbox',        # Cloud Run 필수
-                    '--disable-dev-shm-usage',         # 메모리 부족 방지
-                    '--disable-gpu',                   # GPU 비활성화
-                    '--disable-software-rasterizer',
-                    '--disable-extensions',
-                    '--disable-background-networking',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--no-first-run',
-                    '--no-default-browser-check',
-                    '--window-size=1920,1080'          # 화면 크기 명시
-                ]
-            )
-            # 메인 페이지 생성 및 봇 우회 (page는 다나와 목록 유지용)
-            page = await browser.new_page() # await 추가
-            
-            # NOTE: stealth_sync는 동기 함수이므로, 여기서는 User-Agent 설정만 유지합니다.
-            await page.set_extra_http_headers({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"})
+    # 즉시 요약 모드에서 리뷰와 요약을 함께 저장
+    sql_review_summarized = text("""
+        INSERT INTO community_reviews (
+            part_id, part_type, cpu_model, source, review_url, raw_text, ai_summary, summary_status
+        ) VALUES (
+            :part_id, :part_type, :cpu_model, :source, :review_url, :raw_text, :ai_summary, :summary_status
+        )
+        ON DUPLICATE KEY UPDATE
+            part_id = part_id 
+    """)
 
-            print(f"\n--- [재시작] 브라우저 세션 시작 (카테고리 {i+1}부터)")
+    return sql_parts, sql_specs, sql_review, sql_check_review, sql_review_summarized
 
-            # 2. 퀘이사존 세션 획득 (매번 다시 로그인 페이지 방문)
-            if collect_reviews:
-                try:
-                    print("--- (봇 우회) 퀘이사존 메인 리뷰 페이지 1회 방문 (세션 획득) ---")
-                    await page.goto("https://quasarzone.com/bbs/qc_qsz", wait_until='load', timeout=30000) # await 추가
-                    await page.wait_for_timeout(1000) # await 추가
-                    print("--- 퀘이사존 세션 획득 완료 ---")
-                except Exception as e:
-                    print(f"--- (경고) 퀘이사존 메인 페이지 방문 실패 (무시하고 계속): {e}")
 
-            # 3. 카테고리 묶음 처리 (순차 실행으로 변경)
-            batch = category_list[i : i + RESTART_INTERVAL]
-            
-            for idx_in_batch, (category_name, query) in enumerate(batch, 1):
-                global_idx = i + idx_in_batch
-                print(f"\n--- [카테고리 {global_idx}/{len(category_list)}] '{category_name}' 처리 시작 ---")
-                # 순차 실행
-                await scrape_category(browser, page, engine, category_name, query, collect_reviews, collect_benchmarks, sql_parts, sql_specs, sql_review, sql_check_review)
+def start_review_pipeline(collect_reviews, summarize_inline, sql_review_summarized):
+    """리뷰 즉시 요약 파이프라인 시작 (--summarize, 사용할 수 없으면 None)"""
+    review_pipeline = None
+    if collect_reviews and summarize_inline:
+        try:
+            summarize_reviews.get_backend()  # API 키 등 설정 확인
+            review_pipeline = ReviewSummaryPipeline(engine, sql_review_summarized)
+            review_pipeline.start()
+            print(f"--- 리뷰 즉시 요약 활성화 (작업자 {SUMMARY_WORKERS}개, 분당 최대 {SUMMARY_REQUESTS_PER_MINUTE:g}회) ---")
+        except (SystemExit, Exception) as e:
+            print(f"--- (경고) 리뷰 즉시 요약을 시작할 수 없어 리뷰만 저장합니다: {e}")
+            review_pipeline = None
+    return review_pipeline
+
+
+def load_benchmark_plan(collect_benchmarks):
+    """벤치마크 갱신 계획: 정책별 created_at 집계로 오래된 값만 이번 실행에서 다시 수집"""
+    if collect_benchmarks:
+        try:
+            benchmark_freshness.load_plan(engine)
+        except Exception as e:
+            print(f"--- (경고) 벤치마크 갱신 계획 수립 실패 (부품별 TTL 조회로 진행): {e}")
+
+
+async def new_list_page(browser):
+    """다나와 목록용 페이지 (User-Agent 설정)"""
+    page = await browser.new_page() # await 추가
+
+    # NOTE: stealth_sync는 동기 함수이므로, 여기서는 User-Agent 설정만 유지합니다.
+    await page.set_extra_http_headers({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"})
+    return page
+
+
+async def launch_browser(p, collect_reviews, label=''):
+    """Chromium 시작 + 다나와 목록용 페이지 생성 (+ 리뷰 수집 시 퀘이사존 세션 획득) -> (browser, page)"""
+    # 1. 브라우저 시작 (Cloud Run 환경 최적화)
+    browser = await p.chromium.launch(
+        headless=HEADLESS_MODE, 
+        args=[
+            '--no-sandbox',                    # Cloud Run 필수
+            '--disable-setuid-sandbox',        # Cloud Run 필수
+            '--disable-dev-shm-usage',         # 메모리 부족 방지
+            '--disable-gpu',                   # GPU 비활성화
+            '--disable-software-rasterizer',
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--disable-background-timer-throttling',
+            '--disable-backgrounding-occluded-windows',
+            '--disable-renderer-backgrounding',
+            '--no-first-run',
+            '--no-default-browser-check',
+            '--window-size=1920,1080'          # 화면 크기 명시
+        ]
+    )
+    # 메인 페이지 생성 및 봇 우회 (page는 다나와 목록 유지용)
+    page = await new_list_page(browser)
+
+    print(f"\n--- [재시작] 브라우저 세션 시작 ({label})")
+
+    # 2. 퀘이사존 세션 획득 (매번 다시 로그인 페이지 방문)
+    if collect_reviews:
+        try:
+            print("--- (봇 우회) 퀘이사존 메인 리뷰 페이지 1회 방문 (세션 획득) ---")
+            await goto_checked(page, "https://quasarzone.com/bbs/qc_qsz", 'goto', 30000, wait_until='load') # await 추가
+            await page.wait_for_timeout(1000) # await 추가
+            print("--- 퀘이사존 세션 획득 완료 ---")
+        except Exception as e:
+            print(f"--- (경고) 퀘이사존 메인 페이지 방문 실패 (무시하고 계속): {e}")
+
+    return browser, page
+
+
+async def run_crawler(collect_reviews=False, collect_benchmarks=False, summarize_inline=False, resume=False, tiered=False, deadline=None, prices_only=False):
+    """
+    크롤러 실행 함수
+    
+    Args:
+        collect_reviews: 퀘이사존 리뷰 수집 여부
+        collect_benchmarks: 벤치마크 정보 수집 여부
+        summarize_inline: 수집한 리뷰를 크롤링 중에 바로 AI 요약할지 여부 (--summarize)
+        resume: 마지막 미완료 실행의 체크포인트부터 이어서 실행 (--resume)
+        tiered: 인기도/가격 변동성 등급으로 열 목록 페이지를 고름 (--tiered, 예산은 카테고리 수 x CRAWL_PAGES)
+        deadline: 이 시간(초) 안에 끝내도록 부가 수집을 줄이고, 목록 저장을 마칠 수 없으면 재개 가능하게 중단 (--deadline)
+        prices_only: 알려진 상품의 가격만 갱신 (--prices-only, 리뷰/벤치마크 수집은 하지 않음)
+    """
+    if prices_only:
+        collect_reviews = collect_benchmarks = summarize_inline = False
+    # 진행 상황 체크포인트 (중단되면 --resume으로 이어서 실행) + SIGTERM 시 진행 중인 저장만 마치고 종료
+    crawl_checkpoint.begin_run(engine, {"collect_reviews": collect_reviews, "collect_benchmarks": collect_benchmarks,
+                                        "summarize_inline": summarize_inline, "tiered": tiered,
+                                        "prices_only": prices_only}, resume=resume)
+    crawl_checkpoint.install_stop_handlers()
+    if tiered:
+        refresh_tiers.load_plan(engine, list(CATEGORIES), REFRESH_PAGE_BUDGET)
+
+    # CATEGORIES 딕셔너리를 리스트로 변환 (재개 실행이면 끝난 카테고리 제외 - 브라우저 재시작 묶음도 남은 것 기준)
+    category_list = [(name, query) for name, query in CATEGORIES.items() if not crawl_checkpoint.is_done('category', name)]
+    if len(category_list) < len(CATEGORIES):
+        print(f"--- (재개) 완료된 카테고리 {len(CATEGORIES) - len(category_list)}개 건너뜀 ---")
+
+    # 마감 예산: 남은 목록 페이지 수 기준으로 단계별 속도를 측정해 남은 시간을 추정 (crawl_deadline.py)
+    if deadline:
+        total_pages = sum(1 for name, _ in category_list
+                          for page_num in (refresh_tiers.pages_for(name) if tiered else range(1, CRAWL_PAGES + 1))
+                          if not crawl_checkpoint.is_done('page', f"{name}:{page_num}"))
+        crawl_deadline.begin(deadline, total_pages, prices_only=prices_only)
+
+    # 브라우저를 몇 개 카테고리마다 재시작할지 설정합니다. (9개 카테고리 중 3개마다 재시작)
+    RESTART_INTERVAL = 3
+
+    sql_parts, sql_specs, sql_review, sql_check_review, sql_review_summarized = build_crawl_sql()
 
-            # 4. 브라우저 종료 (메모리 해제)
-            await browser.close() # await 추가
-            print("--- 브라우저 세션 종료 (메모리 해제) ---")
+    review_pipeline = start_review_pipeline(collect_reviews, summarize_inline, sql_review_summarized)
+    load_benchmark_plan(collect_benchmarks)
 
+    try:
+        async with async_playwright() as p: # ✅ [수정] async_playwright 사용
+        
+            # 퀘이사존 세션 획득 로직은 그대로 둡니다.
+
+            for i in range(0, len(category_list), RESTART_INTERVAL):
+                if crawl_checkpoint.stop_requested():
+                    break
+                # 1~2. 브라우저 시작 + 퀘이사존 세션 획득
+                browser, page = await launch_browser(p, collect_reviews, label=f"카테고리 {i+1}부터")
+
+                # 3. 카테고리 묶음 처리 (순차 실행으로 변경)
+                batch = category_list[i : i + RESTART_INTERVAL]
+            
+                for idx_in_batch, (category_name, query) in enumerate(batch, 1):
+                    if crawl_checkpoint.stop_requested():
+                        break
+                    global_idx = i + idx_in_batch
+                    print(f"\n--- [카테고리 {global_idx}/{len(category_list)}] '{category_name}' 처리 시작 ---")
+                    # 순차 실행
+                    await scrape_category(browser, page, engine, category_name, query, collect_reviews, collect_benchmarks, sql_parts, sql_specs, sql_review, sql_check_review, review_pipeline,
+                                          pages=refresh_tiers.pages_for(category_name) if tiered else None, prices_only=prices_only)
+                    if not crawl_checkpoint.stop_requested():
+                        crawl_checkpoint.mark('category', category_name)
+
+                # 4. 브라우저 종료 (메모리 해제)
+                await browser.close() # await 추가
+                print("--- 브라우저 세션 종료 (메모리 해제) ---")
+    finally:
+        # 대기열에 남은 리뷰까지 요약/저장한 뒤 종료 (중단되어도 수집한 리뷰는 저장)
+        if review_pipeline:
+            await review_pipeline.close()
+
+    print_host_summary()
+    print_circuit_summary()
+    print_timeout_summary()
+    crawl_deadline.print_deadline_summary()
+    if crawl_deadline.shed_any():
+        # 건너뛴 부가 수집은 --resume에서 수집하도록 실행을 완료로 기록하지 않음
+        crawl_checkpoint.mark_incomplete('run', 'deadline')
+    stopped = crawl_checkpoint.stop_requested()
+    incomplete = crawl_checkpoint.has_incomplete()
+    crawl_checkpoint.finish_run()
+    if stopped:
+        print("\n중단 요청으로 크롤링을 멈췄습니다. (진행 중이던 저장은 완료)")
+        return
+    if incomplete:
+        print("\n크롤링을 마쳤지만 끝내지 못한 페이지가 있습니다. (--resume으로 이어서 수집)")
+        return
     print("\n모든 카테고리 데이터 수집을 완료했습니다.")
 
 
+async def _run_daemon_job(browser, page, category_name, kinds, sql, review_pipeline):
+    """상주 모드 작업 하나: 카테고리 목록을 한 번 돌며 밀린 작업 종류를 같이 처리"""
+    sql_parts, sql_specs, sql_review, sql_check_review = sql
+    collect_reviews = 'reviews' in kinds
+    collect_benchmarks = 'benchmarks' in kinds
+    if collect_benchmarks:
+        # 이전 작업에서 갱신된 값을 반영해 TTL이 지난 값만 다시 수집
+        load_benchmark_plan(True)
+    pages = None
+    prices_only = kinds == ['prices'] and crawl_daemon.DAEMON_PRICES_ONLY
+    if kinds == ['prices']:
+        # 가격만 갱신하는 작업은 등급 주기가 지난 부품이 있는 페이지만 (카테고리당 CRAWL_PAGES 예산)
+        pages = refresh_tiers.load_plan(engine, [category_name], CRAWL_PAGES)[category_name]
+    failed_pages = await scrape_category(browser, page, engine, category_name, CATEGORIES[category_name],
+                                         collect_reviews, collect_benchmarks, sql_parts, sql_specs, sql_review,
+                                         sql_check_review, review_pipeline if collect_reviews else None, pages=pages,
+                                         prices_only=prices_only)
+    if failed_pages:
+        raise RuntimeError(f"목록 페이지 처리 실패: {failed_pages}")
+
+
+async def run_daemon(job_spec=crawl_daemon.DAEMON_JOBS, status_port=crawl_daemon.DAEMON_STATUS_PORT, summarize_inline=False):
+    """
+    상주 크롤러 (--daemon): 브라우저/DB 풀을 유지한 채 카테고리별 갱신 작업을 주기마다 실행
+
+    Args:
+        job_spec: 작업 주기 (DAEMON_JOBS 형식, crawl_daemon.py 참고)
+        status_port: 상태 엔드포인트 포트
+        summarize_inline: 리뷰 작업에서 수집한 리뷰를 바로 AI 요약할지 여부
+    """
+    schedule = crawl_daemon.JobSchedule(crawl_daemon.load_job_intervals(CATEGORIES, job_spec))
+    if not schedule.intervals:
+        print("--- 실행할 작업이 없습니다. (DAEMON_JOBS 확인) ---")
+        return
+    status = crawl_daemon.DaemonStatus(schedule)
+    server = crawl_daemon.start_status_server(status, port=status_port)
+    crawl_checkpoint.install_stop_handlers()
+
+    # 퀘이사존 세션은 리뷰 작업이 있을 때만 브라우저 시작 시 획득
+    needs_reviews = any(kind == 'reviews' for _, kind in schedule.intervals)
+    sql_parts, sql_specs, sql_review, sql_check_review, sql_review_summarized = build_crawl_sql()
+    sql = (sql_parts, sql_specs, sql_review, sql_check_review)
+    review_pipeline = start_review_pipeline(needs_reviews, summarize_inline, sql_review_summarized)
+    print(f"--- 상주 크롤러 시작: 작업 {len(schedule.intervals)}개, 동시 작업 {crawl_daemon.DAEMON_PAGES}개 ---")
+
+    running = {}  # asyncio.Task -> (카테고리, 종류 목록, 시작 시각, 목록 페이지)
+    try:
+        async with async_playwright() as p:
+            browser, idle_pages, jobs_since_launch = None, [], 0
+            while not crawl_checkpoint.stop_requested():
+                # 브라우저 재시작은 진행 중인 작업이 모두 끝난 뒤에만 (죽은 브라우저도 여기서 다시 띄움)
+                needs_launch = browser is None or not browser.is_connected() or jobs_since_launch >= crawl_daemon.DAEMON_RECYCLE_JOBS
+                if needs_launch and not running:
+                    if browser is not None:
+                        try:
+                            await browser.close()
+                        except Exception:
+                            pass
+                    status.update(state='launching')
+                    try:
+                        browser, first_page = await launch_browser(p, needs_reviews, label="상주 모드")
+                        idle_pages = [first_page] + [await new_list_page(browser) for _ in range(crawl_daemon.DAEMON_PAGES - 1)]
+                    except Exception as e:
+                        print(f"--- (오류) 브라우저 시작 실패: {e}. 30초 뒤 다시 시도 ---")
+                        browser = None
+                        await asyncio.sleep(30)
+                        continue
+                    jobs_since_launch = 0
+                    status.update(browser_launches=status.browser_launches + 1)
+
+                if not needs_launch:
+                    busy = {category for category, _, _, _ in running.values()}
+                    for category_name, kinds in schedule.due(time.monotonic(), busy=busy)[:len(idle_pages)]:
+                        job_page = idle_pages.pop()
+                        print(f"\n--- [상주] '{category_name}' 작업 시작: {', '.join(kinds)} ---")
+                        task = asyncio.create_task(_run_daemon_job(browser, job_page, category_name, kinds, sql, review_pipeline))
+                        running[task] = (category_name, kinds, time.monotonic(), job_page)
+                        status.job_started(category_name, kinds)
+                        jobs_since_launch += 1
+                status.update(state='running' if running else 'idle')
+
+                # 작업이 하나 끝나거나, 다음 작업 시각이 되거나, 중단 요청을 확인할 때까지 (최대 1초씩) 대기
+                wait_seconds = min(max(schedule.seconds_until_next(time.monotonic()), 0.1), 1.0)
+                if running:
+                    done, _ = await asyncio.wait(running, timeout=wait_seconds, return_when=asyncio.FIRST_COMPLETED)
+                else:
+                    done = ()
+                    await asyncio.sleep(wait_seconds)
+                for task in done:
+                    category_name, kinds, started, job_page = running.pop(task)
+                    error = task.exception()
+                    if error:
+                        print(f"--- [상주] '{category_name}' 작업 실패: {error} ---")
+                    schedule.record(category_name, kinds, started, time.monotonic(), error=error)
+                    status.job_finished(category_name)
+                    idle_pages.append(job_page)
+
+            # 중단 요청: 진행 중인 작업의 저장까지 마치고 종료
+            status.update(state='stopping')
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            if browser is not None:
+                await browser.close()
+    finally:
+        if review_pipeline:
+            await review_pipeline.close()
+        server.shutdown()
+
+    print_host_summary()
+    print_circuit_summary()
+    print_timeout_summary()
+    print(f"\n--- 상주 크롤러 종료: 작업 {status.jobs_run}개 실행, 브라우저 {status.browser_launches}회 시작 ---")
+
+# 분산 작업자가 브라우저를 재시작하는 간격 (처리한 작업 단위 수)
+WORKER_RESTART_UNITS = int(os.getenv('WORKER_RESTART_UNITS', '6'))
+
+
+async def _keep_lease(unit, owner):
+    """작업 단위를 처리하는 동안 임대를 연장 (임대를 잃으면 경고만 - 저장은 멱등)"""
+    while True:
+        await asyncio.sleep(work_queue.WORK_HEARTBEAT_SECONDS)
+        try:
+            if not work_queue.heartbeat(engine, unit, owner):
+                print(f"--- (경고) 단위 #{unit.id} 임대를 잃었습니다 (다른 작업자가 다시 처리할 수 있음) ---")
+                return
+        except Exception as e:
+            print(f"--- (경고) 단위 #{unit.id} 하트비트 실패: {e}")
+
+
+async def run_worker(batch_id=None, max_units=None):
+    """
+    분산 작업자 (--worker): 작업 묶음에서 (카테고리, 페이지) 단위를 하나씩 임대해 크롤링하고 커밋
+
+    Args:
+        batch_id: 처리할 묶음 (None이면 마지막 묶음)
+        max_units: 이 작업자가 처리할 최대 단위 수 (None이면 남은 단위가 없을 때까지)
+    """
+    if batch_id is None:
+        latest = work_queue.latest_batch(engine)
+        if latest is None:
+            print("--- 작업 묶음이 없습니다. 먼저 python crawler.py --coordinator 를 실행하세요. ---")
+            return
+        batch_id, options = latest
+    else:
+        options = work_queue.batch_options(engine, batch_id)
+        if options is None:
+            print(f"--- 작업 묶음 #{batch_id}이 없습니다. ---")
+            return
+    collect_reviews = options.get("collect_reviews", False)
+    collect_benchmarks = options.get("collect_benchmarks", False)
+    owner = work_queue.worker_id()
+    print(f"--- 작업자 {owner}: 묶음 #{batch_id} 처리 시작 (리뷰 {collect_reviews}, 벤치마크 {collect_benchmarks}) ---")
+
+    # SIGTERM 시 진행 중인 단위만 마치고(또는 돌려놓고) 종료
+    crawl_checkpoint.install_stop_handlers()
+    sql_parts, sql_specs, sql_review, sql_check_review, sql_review_summarized = build_crawl_sql()
+    review_pipeline = start_review_pipeline(collect_reviews, options.get("summarize_inline", False), sql_review_summarized)
+    load_benchmark_plan(collect_benchmarks)
+
+    processed = 0
+    try:
+        async with async_playwright() as p:
+            browser = page = None
+            units_in_session = 0
+            while not crawl_checkpoint.stop_requested() and (max_units is None or processed < max_units):
+                unit = work_queue.claim_unit(engine, batch_id, owner)
+                if unit is None:
+                    # 다른 작업자가 임대 중인 단위가 남았으면 (그 작업자가 죽어 임대가 만료될 수 있으니) 기다렸다 다시 확인
+                    if not work_queue.has_unfinished(engine, batch_id):
+                        break
+                    await asyncio.sleep(work_queue.WORK_POLL_SECONDS)
+                    continue
+
+                if browser is None or units_in_session >= WORKER_RESTART_UNITS:
+                    if browser is not None:
+                        await browser.close()
+                    browser, page = await launch_browser(p, collect_reviews, label=f"작업자 {owner}")
+                    units_in_session = 0
+
+                print(f"\n--- [작업자 {owner}] 단위 #{unit.id}: '{unit.category}' {unit.page_num}페이지 (시도 {unit.attempts}) ---")
+                lease_task = asyncio.create_task(_keep_lease(unit, owner))
+                try:
+                    failed_pages = await scrape_category(browser, page, engine, unit.category, unit.query, collect_reviews, collect_benchmarks,
+                                                         sql_parts, sql_specs, sql_review, sql_check_review, review_pipeline,
+                                                         pages=[unit.page_num])
+                    if crawl_checkpoint.stop_requested():
+                        work_queue.release_unit(engine, unit, owner)
+                    elif failed_pages:
+                        work_queue.release_unit(engine, unit, owner, error="목록 페이지 처리 실패")
+                    else:
+                        work_queue.complete_unit(engine, unit, owner)
+                except Exception as e:
+                    print(f"--- (오류) 단위 #{unit.id} 처리 실패: {e}")
+                    work_queue.release_unit(engine, unit, owner, error=e)
+                finally:
+                    lease_task.cancel()
+                processed += 1
+                units_in_session += 1
+
+            if browser is not None:
+                await browser.close()
+    finally:
+        if review_pipeline:
+            await review_pipeline.close()
+
+    print_host_summary()
+    print_circuit_summary()
+    print_timeout_summary()
+    print(f"\n--- 작업자 {owner}: 단위 {processed}개 처리 ---")
+    work_queue.print_batch_status(engine, batch_id)
+
+
 if __name__ == "__main__":
     # 1. 명령줄 인수(sys.argv)에서 선택지를 읽어옵니다.
     args = sys.argv
-    
+
+    # 보관된 스펙 원본으로 part_spec만 재파싱하고 종료 (브라우저 사용 안 함)
+    if "--reparse" in args:
+        import reparse_specs
+        reparse_args = reparse_specs.parse_reparse_args(args[1:])
+        reparse_specs.run_reparse(engine, categories=reparse_args.category, dry_run=reparse_args.dry_run,
+                                  workers=reparse_args.workers, chunk_size=reparse_args.chunk_size)
+        sys.exit(0)
+
+    # 저장된 리뷰 본문에서 벤치마크 점수만 일괄 추출하고 종료 (네트워크 요청 없음)
+    if "--review-benchmarks" in args:
+        import review_benchmarks
+        backfill_args = review_benchmarks.parse_backfill_args(args[1:])
+        review_benchmarks.run_backfill(engine, dry_run=backfill_args.dry_run, workers=backfill_args.workers,
+                                       chunk_size=backfill_args.chunk_size, min_id=backfill_args.min_id)
+        sys.exit(0)
+
+    # 분산 크롤링: 작업 묶음 생성 / 작업자 실행 / 진행 상황 (work_queue.py)
+    if "--coordinator" in args or "--worker" in args or "--queue-status" in args:
+        queue_args = work_queue.parse_worker_args(args[1:])
+        if queue_args.coordinator:
+            options = {"collect_reviews": queue_args.reviews, "collect_benchmarks": queue_args.benchmarks,
+                       "summarize_inline": queue_args.summarize}
+            batch_id = work_queue.create_batch(engine, CATEGORIES, range(1, CRAWL_PAGES + 1), options)
+            print(f"--- 작업 묶음 #{batch_id} 생성: 카테고리 {len(CATEGORIES)}개 x {CRAWL_PAGES}페이지 ---")
+            work_queue.print_batch_status(engine, batch_id)
+        elif queue_args.queue_status:
+            latest = work_queue.latest_batch(engine)
+            batch_id = queue_args.batch or (latest[0] if latest else None)
+            if batch_id is None:
+                print("--- 작업 묶음이 없습니다. ---")
+            else:
+                work_queue.print_batch_status(engine, batch_id)
+        elif queue_args.processes > 1:
+            work_queue.spawn_local_workers(__file__, queue_args.processes, batch_id=queue_args.batch, max_units=queue_args.max_units)
+        else:
+            asyncio.run(run_worker(batch_id=queue_args.batch, max_units=queue_args.max_units))
+        sys.exit(0)
+
+    # 상주 모드: 시작 비용을 한 번만 치르고 카테고리별 갱신 작업을 주기마다 실행 (crawl_daemon.py)
+    if "--daemon" in args:
+        daemon_args = crawl_daemon.parse_daemon_args(args[1:])
+        try:
+            initialize_compatibility_rules(engine)
+            initialize_usage_weights(engine)
+        except Exception as e:
+            print(f"초기화 중 오류 발생: {e}")
+        asyncio.run(run_daemon(job_spec=daemon_args.jobs, status_port=daemon_args.port, summarize_inline=daemon_args.summarize))
+        sys.exit(0)
+
     # 2. 플래그 확인 (--reviews, --benchmarks)
     has_reviews_flag = "--reviews" in args
     has_benchmarks_flag = "--benchmarks" in args
+    # 리뷰를 크롤링 중에 바로 AI 요약 (--reviews와 함께 사용)
+    summarize_inline = "--summarize" in args
+    # 알려진 상품의 가격만 빠르게 갱신 (이미지/스펙/파싱/리뷰/벤치마크 건너뜀)
+    prices_only = "--prices-only" in args
+    # 인기도/가격 변동성 등급으로 열 목록 페이지를 고름 (refresh_tiers.py)
+    tiered = "--tiered" in args
+    # 마감 시간 (예: --deadline 40m) - Cloud Run 작업 제한 시간보다 조금 짧게 (crawl_deadline.py)
+    deadline = None
+    if "--deadline" in args:
+        try:
+            deadline = crawl_deadline.parse_duration(args[args.index("--deadline") + 1])
+        except (IndexError, ValueError):
+            print("--deadline 값이 올바르지 않습니다. (예: --deadline 40m, --deadline 2400)")
+            sys.exit(1)
+    # 마지막 미완료 실행을 저장된 옵션 그대로 이어서 실행 (메뉴/플래그 무시)
+    resume = "--resume" in args
+    resumable = crawl_checkpoint.find_resumable(engine) if resume else None
     
     # 3. 플래그가 하나도 없으면 항상 대화형 메뉴 표시 (강제)
-    if not has_reviews_flag and not has_benchmarks_flag:
+    if resumable:
+        saved_options = resumable[1]
+        collect_reviews = saved_options.get("collect_reviews", False)
+        collect_benchmarks = saved_options.get("collect_benchmarks", False)
+        summarize_inline = saved_options.get("summarize_inline", False)
+        tiered = saved_options.get("tiered", False)
+        prices_only = saved_options.get("prices_only", False)
+        print(f"\n💡 --resume: 실행 #{resumable[0]}의 옵션으로 이어서 실행 (대화형 메뉴 건너뜀)")
+    elif prices_only:
+        collect_reviews = False
+        collect_benchmarks = False
+        print("\n💡 --prices-only: 가격만 갱신 (대화형 메뉴 건너뜀)")
+    elif not has_reviews_flag and not has_benchmarks_flag:
         print("\n" + "="*60)
         print("🕷️  다나와 PC 부품 크롤러")
         print("="*60)
@@ -4036,9 +3665,15 @@ if __name__ == "__main__":
 
     print("\n" + "="*60)
     print("크롤러 실행 옵션:")
-    print(f" - 다나와 제품 정보: ✅ 항상 수집")
+    print(f" - 다나와 제품 정보: {'💲 가격만 갱신 (신규 상품/스펙/이미지 건너뜀)' if prices_only else '✅ 항상 수집'}")
     print(f" - 퀘이사존 리뷰 수집: {'✅ 수집함' if collect_reviews else '❌ 건너뜀'}")
     print(f" - 벤치마크 정보 수집: {'✅ 수집함' if collect_benchmarks else '❌ 건너뜀'}")
+    if deadline:
+        print(f" - 마감 시간: ⏱️ {deadline / 60:.0f}분 (가까워지면 리뷰/추가 3DMark부터 건너뜀)")
+    if tiered:
+        print(f" - 목록 페이지 선택: ✅ 갱신 등급 계획 (예산 {REFRESH_PAGE_BUDGET}페이지)")
+    if collect_reviews:
+        print(f" - 리뷰 즉시 AI 요약: {'✅ 크롤링 중 요약' if summarize_inline else '❌ summarize_reviews.py로 나중에 요약'}")
     print("="*60 + "\n")
 
     # 4. AI 견적 추천 시스템 데이터 초기화
@@ -4053,4 +3688,4 @@ if __name__ == "__main__":
         traceback.print_exc()
 
     # 5. 읽어온 옵션을 run_crawler 함수로 전달합니다.
-    asyncio.run(run_crawler(collect_reviews=collect_reviews, collect_benchmarks=collect_benchmarks)) # ✅ [수정] asyncio.run으로 비동기 시작
\ No newline at end of file
+    asyncio.run(run_crawler(collect_reviews=collect_reviews, collect_benchmarks=collect_benchmarks, summarize_inline=summarize_inline, resume=resume, tiered=tiered, deadline=deadline, prices_only=prices_only)) # ✅ [수정] asyncio.run으로 비동기 시작
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""
+호스트별 요청 속도/동시 요청 제한 스케줄러 (모든 스크래퍼가 공유)
+
+다나와, 퀘이사존, Geekbench, 3DMark, render4you, Blender Open Data로 가는 요청(Playwright 탐색, requests 호출)은
+모두 이 스케줄러를 거칩니다. 호스트마다 토큰 버킷(초당 요청 수 + 순간 허용량)과 동시 요청 수 제한을 따로 두므로
+한 사이트를 천천히 다루느라 다른 사이트까지 기다리는 고정 sleep 없이, 각 호스트가 안전한 최대 속도로 진행됩니다.
+
+    async with polite(url):            # Playwright (비동기)
+        await page.goto(url, ...)
+
+    with polite_sync(url):             # requests (동기, 이벤트 루프 밖: asyncio.to_thread로 실행)
+        response = requests.get(url, ...)
+
+요청 결과(예외 여부)는 사이트별 차단기(circuit_breaker.py)에 기록되고, 차단기가 열린 사이트로의 요청은
+기다리지 않고 바로 CircuitOpenError로 끝납니다.
+"""
+import os
+import time
+import asyncio
+import threading
+from collections import namedtuple
+from contextlib import asynccontextmanager, contextmanager
+from urllib.parse import urlsplit
+
+from circuit_breaker import CIRCUITS
+
+# rate: 초당 요청 수, burst: 쉬다가 몰아서 보낼 수 있는 요청 수, concurrency: 동시에 진행 중인 요청 수
+HostPolicy = namedtuple('HostPolicy', ['rate', 'burst', 'concurrency'])
+
+# 도메인(하위 도메인 포함) -> 정책
+HOST_POLICIES = {
+    'danawa.com': HostPolicy(2.0, 4, 4),
+    'quasarzone.com': HostPolicy(0.5, 2, 1),
+    'geekbench.com': HostPolicy(1.0, 2, 2),
+    '3dmark.com': HostPolicy(0.5, 2, 2),
+    'render4you.com': HostPolicy(0.5, 2, 1),
+    'opendata.blender.org': HostPolicy(1.0, 2, 2),
+}
+DEFAULT_HOST_POLICY = HostPolicy(1.0, 2, 2)
+# 모든 호스트의 속도에 곱하는 값 (차단이 의심되면 0.5 등으로 낮춤)
+HOST_RATE_SCALE = float(os.environ.get("HOST_RATE_SCALE", "1"))
+
+
+def host_key(url):
+    """URL -> 정책 키 (search.danawa.com -> danawa.com, 정책이 없으면 호스트 이름 그대로)"""
+    host = (urlsplit(url).hostname or url or '').lower()
+    for domain in HOST_POLICIES:
+        if host == domain or host.endswith('.' + domain):
+            return domain
+    return host
+
+
+class _HostState:
+    """호스트 하나의 토큰 버킷 + 동시 요청 제한 + 통계"""
+
+    def __init__(self, policy):
+        self.rate = max(policy.rate * HOST_RATE_SCALE, 0.01)
+        self.burst = max(policy.burst, 1)
+        self.concurrency = max(policy.concurrency, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        self.semaphore = None   # 이벤트 루프 안에서 처음 쓸 때 생성
+        self.requests = 0
+        self.waited = 0.0
+
+    def reserve(self):
+        """토큰 하나를 예약하고 기다려야 할 시간(초)을 돌려줌 (대기 중인 요청끼리도 순서대로 간격 유지)"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.requests += 1
+            self.waited += wait
+            return wait
+
+
+class HostScheduler:
+    def __init__(self, policies=None, default_policy=DEFAULT_HOST_POLICY):
+        self.policies = policies if policies is not None else HOST_POLICIES
+        self.default_policy = default_policy
+        self.hosts = {}
+
+    def _state(self, url):
+        key = host_key(url)
+        state = self.hosts.get(key)
+        if state is None:
+            state = self.hosts[key] = _HostState(self.policies.get(key, self.default_policy))
+        return state
+
+    @asynccontextmanager
+    async def fetch(self, url):
+        """비동기 요청 하나: 동시 요청 슬롯을 얻고 토큰을 기다린 뒤 실행"""
+        key = host_key(url)
+        CIRCUITS.check(key)
+        state = self._state(url)
+        if state.semaphore is None:
+            state.semaphore = asyncio.Semaphore(state.concurrency)
+        async with state.semaphore:
+            wait = state.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+            try:
+                yield
+            except Exception as e:
+                CIRCUITS.record_failure(key, e)
+                raise
+            CIRCUITS.record_success(key)
+
+    @contextmanager
+    def fetch_sync(self, url):
+        """
+        동기 요청 하나 (requests 등): 토큰만 기다린 뒤 실행
+        time.sleep으로 기다리므로 이벤트 루프 스레드에서 부르면 모든 비동기 작업이 멈춤 (asyncio.to_thread로 실행)
+        """
+        key = host_key(url)
+        CIRCUITS.check(key)
+        wait = self._state(url).reserve()
+        if wait:
+            time.sleep(wait)
+        try:
+            yield
+        except Exception as e:
+            CIRCUITS.record_failure(key, e)
+            raise
+        CIRCUITS.record_success(key)
+
+    def summary(self):
+        """호스트별 (요청 수, 총 대기 초)"""
+        return {key: (state.requests, state.waited) for key, state in self.hosts.items()}
+
+
+HOST_SCHEDULER = HostScheduler()
+
+
+def polite(url):
+    return HOST_SCHEDULER.fetch(url)
+
+
+def polite_sync(url):
+    return HOST_SCHEDULER.fetch_sync(url)
+
+
+def print_host_summary():
+    stats = HOST_SCHEDULER.summary()
+    if not stats:
+        return
+    print("--- 호스트별 요청 (요청 수 / 속도 제한 대기) ---")
+    for key, (requests, waited) in sorted(stats.items()):
+        print(f"   {key:<24} {requests}회 / {waited:.1f}s")
@@ -0,0 +1,174 @@
+"""
+요약기(summarize_reviews.py) 오프라인 테스트용 LLM 스텁 서버
+
+실제 Gemini API 대신 응답 지연 분포, 429(요청 한도 초과), 형식이 깨진 응답을 흉내 냅니다.
+API 키나 할당량 없이 요약기의 처리량을 측정/회귀 확인할 때 사용합니다.
+
+사용법:
+    python llm_stub_server.py --port 8765 --latency-ms 800 --rate-limit 0.05 --malformed 0.05
+    SUMMARIZER_BACKEND=stub STUB_LLM_URL=http://localhost:8765 python summarize_reviews.py
+
+API:
+    POST /generate  {"prompt": "..."}  ->  {"text": "..."}   (429 응답 가능)
+"""
+import os
+import re
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# --- 기본 설정 (환경 변수 또는 명령줄 인수로 변경) ---
+STUB_PORT = int(os.environ.get("STUB_PORT", "8765"))
+# 응답 지연 중앙값(ms)과 로그정규분포 표준편차 (클수록 꼬리가 긺)
+STUB_LATENCY_MS = float(os.environ.get("STUB_LATENCY_MS", "800"))
+STUB_LATENCY_SIGMA = float(os.environ.get("STUB_LATENCY_SIGMA", "0.5"))
+# 입력 1,000토큰(대략 한글 1,000자)당 추가 지연(ms)
+STUB_MS_PER_1K_TOKENS = float(os.environ.get("STUB_MS_PER_1K_TOKENS", "150"))
+# 429 응답 비율, 형식이 깨진 응답 비율 (0~1)
+STUB_RATE_LIMIT_RATE = float(os.environ.get("STUB_RATE_LIMIT_RATE", "0.02"))
+STUB_MALFORMED_RATE = float(os.environ.get("STUB_MALFORMED_RATE", "0.02"))
+
+BATCH_ID_PATTERN = re.compile(r'리뷰 id=(\d+)')
+
+
+class StubConfig:
+    """서버 동작 설정 (핸들러 스레드들이 공유)"""
+
+    def __init__(self, latency_ms=STUB_LATENCY_MS, latency_sigma=STUB_LATENCY_SIGMA,
+                 ms_per_1k_tokens=STUB_MS_PER_1K_TOKENS, rate_limit_rate=STUB_RATE_LIMIT_RATE,
+                 malformed_rate=STUB_MALFORMED_RATE, seed=None):
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.ms_per_1k_tokens = ms_per_1k_tokens
+        self.rate_limit_rate = rate_limit_rate
+        self.malformed_rate = malformed_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counters = {"requests": 0, "rate_limited": 0, "malformed": 0}
+
+    def roll(self):
+        with self.lock:
+            return self.random.random()
+
+    def sample_latency(self, prompt):
+        with self.lock:
+            base = self.latency_ms * self.random.lognormvariate(0, self.latency_sigma)
+        hangul = sum(1 for ch in prompt if '가' <= ch <= '힣')
+        tokens = hangul + (len(prompt) - hangul) // 4
+        return (base + tokens / 1000 * self.ms_per_1k_tokens) / 1000
+
+    def count(self, key):
+        with self.lock:
+            self.counters[key] += 1
+
+
+def _fake_summary(prompt, seed_text=''):
+    """프롬프트 내용에서 몇 단어를 뽑아 그럴듯한 3줄 요약을 만듭니다."""
+    words = re.findall(r'[가-힣A-Za-z0-9]{2,}', seed_text or prompt)[:12]
+    head = ' '.join(words[:4]) or '제품'
+    return (f"{head} 리뷰 요약입니다.\n"
+            f"장점: {' '.join(words[4:8]) or '성능'}.\n"
+            f"단점: {' '.join(words[8:12]) or '가격'}.")
+
+
+def build_response(prompt, config):
+    """(HTTP 상태 코드, 응답 텍스트 또는 None)"""
+    config.count("requests")
+    if config.roll() < config.rate_limit_rate:
+        config.count("rate_limited")
+        return 429, None
+
+    malformed = config.roll() < config.malformed_rate
+    if malformed:
+        config.count("malformed")
+
+    ids = BATCH_ID_PATTERN.findall(prompt)
+    if ids:
+        # 묶음 요약 요청: id별 JSON
+        chunks = re.split(r'--- 리뷰 id=\d+ ---', prompt)[1:]
+        summaries = [{"id": int(review_id), "summary": _fake_summary(prompt, chunk)}
+                     for review_id, chunk in zip(ids, chunks)]
+        if malformed:
+            # 일부 id 누락 + JSON 잘림 중 하나
+            if config.roll() < 0.5 and len(summaries) > 1:
+                return 200, json.dumps({"summaries": summaries[:-1]}, ensure_ascii=False)
+            return 200, json.dumps({"summaries": summaries}, ensure_ascii=False)[:-7]
+        return 200, json.dumps({"summaries": summaries}, ensure_ascii=False)
+
+    if malformed:
+        return 200, ""
+    return 200, _fake_summary(prompt.split('--- 리뷰 원본 ---')[-1])
+
+
+def make_handler(config):
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            if self.path != '/generate':
+                self.send_error(404)
+                return
+            length = int(self.headers.get('Content-Length', '0'))
+            try:
+                prompt = json.loads(self.rfile.read(length).decode('utf-8')).get('prompt', '')
+            except ValueError:
+                self.send_error(400)
+                return
+
+            time.sleep(config.sample_latency(prompt))
+            status, body = build_response(prompt, config)
+            if status != 200:
+                self.send_error(status)
+                return
+            payload = json.dumps({"text": body}, ensure_ascii=False).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            # GET /stats : 누적 요청/429/깨진 응답 수
+            payload = json.dumps(config.counters).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass  # 요청마다 로그를 찍지 않음
+
+    return StubHandler
+
+
+def start_stub_server(port=0, config=None):
+    """백그라운드 스레드로 스텁 서버를 띄웁니다. (port=0이면 빈 포트 자동 선택) 반환: (server, base_url)"""
+    config = config or StubConfig()
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(config))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요약기 오프라인 테스트용 LLM 스텁 서버")
+    parser.add_argument('--port', type=int, default=STUB_PORT)
+    parser.add_argument('--latency-ms', type=float, default=STUB_LATENCY_MS, help='응답 지연 중앙값(ms)')
+    parser.add_argument('--latency-sigma', type=float, default=STUB_LATENCY_SIGMA, help='로그정규분포 표준편차')
+    parser.add_argument('--rate-limit', type=float, default=STUB_RATE_LIMIT_RATE, help='429 응답 비율 (0~1)')
+    parser.add_argument('--malformed', type=float, default=STUB_MALFORMED_RATE, help='깨진 응답 비율 (0~1)')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    stub_config = StubConfig(latency_ms=args.latency_ms, latency_sigma=args.latency_sigma,
+                             rate_limit_rate=args.rate_limit, malformed_rate=args.malformed, seed=args.seed)
+    httpd = ThreadingHTTPServer(('0.0.0.0', args.port), make_handler(stub_config))
+    print(f"LLM 스텁 서버 시작: http://0.0.0.0:{args.port}/generate "
+          f"(지연 {args.latency_ms}ms, 429 {args.rate_limit:.0%}, 깨진 응답 {args.malformed:.0%})")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n종료. 누적: {stub_config.counters}")
@@ -0,0 +1,199 @@
+"""
+부품 모델 식별자 해석기 (CPU/GPU 상품명 -> 정규화된 모델 키)
+
+다나와 상품명, 벤치마크 사이트의 행 이름, 리뷰 제목처럼 표기가 제각각인 이름을
+(vendor, family, number, suffix) 하나로 정규화합니다. 벤치마크/리뷰 수집, 중복 체크,
+캐시 키가 모두 같은 키를 쓰도록 모델명 추출은 이 모듈에서만 합니다.
+
+    AMD 라이젠7-6세대 9800X3D (그래니트 릿지)   -> ('amd', 'ryzen7', '9800', 'X3D')
+    인텔 코어 울트라7 시리즈2 265K              -> ('intel', 'core-ultra7', '265', 'K')
+    MSI 지포스 RTX 5070 Ti 게이밍 트리오 OC     -> ('nvidia', 'RTX', '5070', 'Ti')
+    SAPPHIRE 라데온 RX 7900 XTX NITRO+          -> ('amd', 'RX', '7900', 'XTX')
+
+같은 상품명이 카테고리/벤치마크 단계마다 반복해서 들어오므로 결과는 LRU 캐시로 기억하고,
+자주 나오는 CPU는 미리 만든 SKU 표에서 바로 찾습니다.
+DB/브라우저 의존성이 없으므로 크롤러 밖에서도 그대로 불러올 수 있습니다.
+"""
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+# 캐시할 상품명 수 (카테고리 전체 상품 수보다 넉넉하게)
+MODEL_IDENTITY_CACHE_SIZE = 4096
+
+
+class ModelIdentity(namedtuple('ModelIdentity', ['vendor', 'family', 'number', 'suffix'])):
+    """정규화된 모델 식별자 (해시 가능, 캐시/딕셔너리 키로 사용)"""
+    __slots__ = ()
+
+    @property
+    def model(self):
+        """모델 번호 + 접미사 (예: '9800X3D', '14400F', '265K') - CPU 벤치마크 검색어, cpu_model 컬럼 값"""
+        return f"{self.number}{self.suffix.replace(' ', '')}"
+
+    @property
+    def token(self):
+        """숫자만 남긴 모델 번호 (예: '9800', '5060', 'B580' -> '580') - 사이트 검색 필터용"""
+        return _DIGITS_PATTERN.search(self.number).group(0)
+
+    @property
+    def label(self):
+        """사람이 읽는 공통 라벨 (예: 'RTX 5060 Ti', 'RX 7900 XTX', 'Arc B580')"""
+        return f"{self.family} {self.number}{(' ' + self.suffix) if self.suffix else ''}".strip()
+
+    @property
+    def key(self):
+        """소스 간 조인/중복 제거용 문자열 키 (예: 'amd:ryzen7:9800:X3D')"""
+        return ':'.join(self)
+
+
+_DIGITS_PATTERN = re.compile(r'\d+')
+
+# --- CPU ---
+# 모델 번호: 앞뒤가 숫자가 아닌 3~5자리 숫자 + 영문/숫자 접미사 (예: 7500F, 7800X3D, 14900KF, 265K)
+_CPU_MODEL_PATTERN = re.compile(r'(?<!\d)(\d{3,5})([A-Za-z][A-Za-z0-9]*)?(?!\d)')
+
+_CPU_FAMILY_PATTERNS = [
+    (re.compile(r'(?:코어\s*울트라|core\s*ultra)\s*(\d)', re.I), 'intel', 'core-ultra{}'),
+    (re.compile(r'(?:코어\s*i|core\s*i)(\d)', re.I), 'intel', 'core-i{}'),
+    (re.compile(r'(?:라이젠|ryzen)\s*(\d)', re.I), 'amd', 'ryzen{}'),
+    (re.compile(r'스레드리퍼|threadripper', re.I), 'amd', 'threadripper'),
+    (re.compile(r'펜티엄|pentium', re.I), 'intel', 'pentium'),
+    (re.compile(r'셀러론|celeron', re.I), 'intel', 'celeron'),
+    (re.compile(r'애슬론|athlon', re.I), 'amd', 'athlon'),
+]
+_CPU_VENDOR_KEYWORDS = [
+    (('인텔', 'intel', '코어'), 'intel'),
+    (('amd', '라이젠', 'ryzen'), 'amd'),
+]
+
+# 자주 나오는 SKU: 모델 -> (vendor, family). 상품명에 제조사/제품군 표기가 없어도 같은 키가 나오도록 합니다.
+KNOWN_CPU_SKUS = {
+    ('amd', 'ryzen9'): ['9950X3D', '9950X', '9900X3D', '9900X', '7950X3D', '7950X', '7900X3D', '7900X', '7900',
+                        '5950X', '5900XT', '5900X'],
+    ('amd', 'ryzen7'): ['9800X3D', '9700X', '7800X3D', '7700X', '7700', '8700G', '8700F', '5800X3D', '5800XT',
+                        '5800X', '5700X3D', '5700X', '5700G', '5700'],
+    ('amd', 'ryzen5'): ['9600X', '9600', '7600X', '7600', '7500F', '8600G', '8500G', '8400F', '5600X', '5600GT',
+                        '5600G', '5600', '5500', '4500'],
+    ('intel', 'core-ultra9'): ['285K', '285'],
+    ('intel', 'core-ultra7'): ['265K', '265KF', '265F', '265'],
+    ('intel', 'core-ultra5'): ['245K', '245KF', '235', '225F', '225'],
+    ('intel', 'core-i9'): ['14900K', '14900KF', '14900F', '14900', '13900K', '13900KF', '13900F', '12900K', '12900KF'],
+    ('intel', 'core-i7'): ['14700K', '14700KF', '14700F', '14700', '13700K', '13700KF', '13700F', '12700K',
+                           '12700KF', '12700F'],
+    ('intel', 'core-i5'): ['14600K', '14600KF', '14400F', '14400', '13600K', '13600KF', '13400F', '13400',
+                           '12600K', '12400F', '12400'],
+    ('intel', 'core-i3'): ['14100F', '14100', '13100F', '12100F', '12100'],
+}
+
+
+def _split_cpu_model(model):
+    match = _CPU_MODEL_PATTERN.fullmatch(model)
+    return match.group(1), (match.group(2) or '').upper()
+
+
+_CPU_SKU_TABLE = {
+    model: ModelIdentity(vendor, family, *_split_cpu_model(model))
+    for (vendor, family), models in KNOWN_CPU_SKUS.items()
+    for model in models
+}
+
+
+def _cpu_family(text):
+    for pattern, vendor, family in _CPU_FAMILY_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return vendor, family.format(*match.groups())
+    return None
+
+
+def _cpu_vendor(text):
+    lowered = text.lower()
+    for keywords, vendor in _CPU_VENDOR_KEYWORDS:
+        if any(keyword in lowered for keyword in keywords):
+            return vendor
+    return ''
+
+
+@lru_cache(maxsize=MODEL_IDENTITY_CACHE_SIZE)
+def resolve_cpu(name, manufacturer=None, cpu_class=None):
+    """
+    CPU 이름 -> ModelIdentity (모델 번호가 없으면 None)
+
+    Args:
+        name: 상품명 또는 벤치마크 사이트의 CPU 이름
+        manufacturer, cpu_class: 파싱된 스펙 값 (상품명만으로 제조사/제품군을 알 수 없을 때 사용)
+    """
+    if not name:
+        return None
+    match = _CPU_MODEL_PATTERN.search(name)
+    if not match:
+        return None
+    number, suffix = match.group(1), (match.group(2) or '').upper()
+
+    known = _CPU_SKU_TABLE.get(number + suffix)
+    if known:
+        return known
+
+    vendor_family = _cpu_family(name) or (_cpu_family(cpu_class) if cpu_class else None)
+    if vendor_family:
+        return ModelIdentity(vendor_family[0], vendor_family[1], number, suffix)
+    vendor = _cpu_vendor(name) or (_cpu_vendor(manufacturer) if manufacturer else '')
+    return ModelIdentity(vendor, '', number, suffix)
+
+
+# --- GPU ---
+# 한글이 붙은 표기("지포스RTX 5060", "5060TI블랙")도 찾도록 \b 대신 영문/숫자 경계만 검사
+_GPU_PATTERNS = [
+    (re.compile(r'(?<![A-Z])(RTX|GTX|GT)\s*(\d{3,5})(?:\s*(TI\s*SUPER|TI|SUPER)(?![A-Z0-9]))?'), 'nvidia'),
+    (re.compile(r'(?<![A-Z])(RX)\s*(\d{3,5})(?:\s*(XTX|XT|GRE)(?![A-Z0-9]))?'), 'amd'),
+    (re.compile(r'(?<![A-Z])(ARC)\s*([AB]\d{3})(?![A-Z0-9])'), 'intel'),
+]
+_GPU_SUFFIX_LABELS = {'TI': 'Ti', 'SUPER': 'SUPER', 'TISUPER': 'Ti SUPER', 'XT': 'XT', 'XTX': 'XTX', 'GRE': 'GRE'}
+
+
+@lru_cache(maxsize=MODEL_IDENTITY_CACHE_SIZE)
+def resolve_gpu(name):
+    """GPU 이름 -> ModelIdentity (RTX/GTX/GT, RX, Arc 모델을 찾지 못하면 None)"""
+    upper = (name or '').upper()
+    for pattern, vendor in _GPU_PATTERNS:
+        match = pattern.search(upper)
+        if match:
+            family = 'Arc' if match.group(1) == 'ARC' else match.group(1)
+            suffix = match.group(3) if match.lastindex >= 3 else None
+            suffix = _GPU_SUFFIX_LABELS[suffix.replace(' ', '')] if suffix else ''
+            return ModelIdentity(vendor, family, match.group(2), suffix)
+    return None
+
+
+@lru_cache(maxsize=MODEL_IDENTITY_CACHE_SIZE)
+def normalize_gpu_model(raw_name):
+    """
+    브랜드/유통사를 제거한 공통 GPU 모델. 반환: (common_label, numeric_token)
+    예) "GALAX GeForce RTX 5060 DUAL" -> ("RTX 5060", "5060")
+    예) "AMD Radeon RX 7800 XT" -> ("RX 7800 XT", "7800")
+    """
+    identity = resolve_gpu(raw_name)
+    if identity:
+        return identity.label, identity.token
+    # Fallback: 숫자 토큰만
+    name = (raw_name or '').upper()
+    token = re.search(r"(\d{3,5})", name)
+    if token:
+        return f"GPU {token.group(1)}", token.group(1)
+    return ' '.join(name.split()[0:2]), ''
+
+
+def resolve_model(name, category_name, specs=None):
+    """
+    카테고리에 맞는 ModelIdentity (CPU/그래픽카드 외에는 None)
+
+    specs(파싱된 상세 스펙)가 있으면 상품명보다 정확한 칩셋/제품군 값을 함께 사용합니다.
+    """
+    specs = specs or {}
+    if category_name == 'CPU':
+        return resolve_cpu(name, specs.get('manufacturer'), specs.get('cpu_class'))
+    if category_name == '그래픽카드':
+        chipset = specs.get('nvidia_chipset') or specs.get('amd_chipset') or specs.get('intel_chipset')
+        return (resolve_gpu(chipset) if chipset else None) or resolve_gpu(name)
+    return None
@@ -0,0 +1,202 @@
+"""
+인기도/가격 변동성 기반 갱신 등급과 실행당 크롤링 예산 계획 (--tiered)
+
+모든 실행이 카테고리마다 1~CRAWL_PAGES 목록 페이지를 똑같이 다시 여는 대신, 이미 아는 부품마다
+    인기도   - 다나와 상품의견 수(review_count)와 별점(star_rating)
+    변동성   - 가격을 확인한 횟수 대비 가격이 바뀐 횟수 (part_refresh_stats에 누적)
+를 카테고리 안에서 순위(백분위)로 합쳐 갱신 등급을 매기고, 등급별 주기가 지난 부품이 있는 목록 페이지만 엽니다.
+    hot  - 상위 REFRESH_HOT_SHARE   (기본 20%)  1시간마다
+    warm - 다음 REFRESH_WARM_SHARE  (기본 30%)  6시간마다
+    cold - 나머지 (롱테일)                       48시간마다
+페이지 가치 = 갱신할 부품의 등급 가중치 합. 실행 전체의 페이지 예산(기본: 카테고리 수 x CRAWL_PAGES)을
+가치가 큰 페이지부터 채우므로, 인기/변동 부품은 자주, 롱테일은 드물게 갱신됩니다.
+REFRESH_MAX_PAGES(기본 5)까지의 페이지 중 아직 본 적 없는 페이지는 가장 낮은 가치로 예산에 들어가 새 부품을 찾습니다.
+
+    python crawler.py --tiered                  # 등급 계획으로 목록 페이지 선택
+
+    load_plan(engine, CATEGORIES, page_budget)  # 크롤링 시작 시 1회
+    pages = pages_for('CPU')                    # 열 페이지 번호 (계획이 없으면 None)
+    record_price_check(conn, part_id, 'CPU', page_num, changed)
+    record_price_checks(conn, 'CPU', page_num, [(part_id, changed), ...])   # 페이지 단위 (--prices-only)
+"""
+import os
+import math
+from collections import namedtuple, Counter
+
+from sqlalchemy import text
+
+# interval_hours: 이 시간이 지나면 다시 확인, weight: 페이지 가치 가중치
+TierPolicy = namedtuple('TierPolicy', ['name', 'interval_hours', 'weight'])
+REFRESH_TIERS = (
+    TierPolicy('hot', 1, 8),
+    TierPolicy('warm', 6, 3),
+    TierPolicy('cold', 48, 1),
+)
+REFRESH_HOT_SHARE = float(os.environ.get("REFRESH_HOT_SHARE", "0.2"))
+REFRESH_WARM_SHARE = float(os.environ.get("REFRESH_WARM_SHARE", "0.3"))
+# 등급 점수에서 가격 변동성의 비중 (나머지는 인기도)
+REFRESH_VOLATILITY_WEIGHT = float(os.environ.get("REFRESH_VOLATILITY_WEIGHT", "0.5"))
+# 모든 등급 주기에 곱하는 값 (0이면 모든 부품이 갱신 대상)
+REFRESH_INTERVAL_SCALE = float(os.environ.get("REFRESH_INTERVAL_SCALE", "1"))
+# 계획에 넣을 수 있는 가장 깊은 목록 페이지 (본 적 없는 페이지 탐색 포함)
+REFRESH_MAX_PAGES = int(os.environ.get("REFRESH_MAX_PAGES", "5"))
+# 아직 본 적 없는 페이지의 가치 (cold 부품 하나와 같음)
+UNSEEN_PAGE_VALUE = 1
+
+
+def ensure_tables(engine):
+    """가격 확인 이력 테이블이 없으면 생성합니다."""
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS part_refresh_stats (
+                part_id BIGINT NOT NULL PRIMARY KEY,
+                category VARCHAR(32) NOT NULL,
+                list_page INT NULL COMMENT '마지막으로 발견된 목록 페이지',
+                price_checks INT NOT NULL DEFAULT 0,
+                price_changes INT NOT NULL DEFAULT 0,
+                last_checked_at TIMESTAMP NULL,
+                last_changed_at TIMESTAMP NULL,
+                KEY idx_refresh_category (category)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """))
+
+
+def record_price_check(conn, part_id, category, page_num, changed):
+    """목록에서 가격을 확인할 때마다 기록 (부품 저장과 같은 트랜잭션에서 호출)"""
+    record_price_checks(conn, category, page_num, [(part_id, changed)])
+
+
+def record_price_checks(conn, category, page_num, checks):
+    """목록 페이지 하나의 가격 확인을 INSERT 한 번으로 기록 (checks: [(part_id, 가격 변경 여부)])"""
+    if not checks:
+        return
+    values, params = [], {"category": category, "page_num": page_num}
+    for index, (part_id, changed) in enumerate(checks):
+        values.append(f"(:part_id{index}, :category, :page_num, 1, :changed{index}, CURRENT_TIMESTAMP, "
+                      f"IF(:changed{index}, CURRENT_TIMESTAMP, NULL))")
+        params[f"part_id{index}"] = part_id
+        params[f"changed{index}"] = int(bool(changed))
+    conn.execute(text(f"""
+        INSERT INTO part_refresh_stats
+            (part_id, category, list_page, price_checks, price_changes, last_checked_at, last_changed_at)
+        VALUES {', '.join(values)}
+        ON DUPLICATE KEY UPDATE
+            category = VALUES(category),
+            list_page = COALESCE(VALUES(list_page), list_page),
+            price_checks = price_checks + 1,
+            price_changes = price_changes + VALUES(price_changes),
+            last_checked_at = VALUES(last_checked_at),
+            last_changed_at = COALESCE(VALUES(last_changed_at), last_changed_at)
+    """), params)
+
+
+def _percentiles(values):
+    """값 목록 -> 같은 순서의 백분위 (0~1, 같은 값은 같은 백분위)"""
+    if len(values) < 2:
+        return [1.0] * len(values)
+    ordered = sorted(values)
+    rank = {}
+    for index, value in enumerate(ordered):
+        rank.setdefault(value, index)
+    return [rank[value] / (len(values) - 1) for value in values]
+
+
+def assign_tiers(parts):
+    """
+    카테고리 하나의 부품 등급
+
+    Args:
+        parts: [(part_id, review_count, star_rating, price_checks, price_changes)]
+    Returns:
+        {part_id: TierPolicy}
+    """
+    if not parts:
+        return {}
+    popularity = [math.log1p(review_count or 0) * (0.5 + (star_rating or 0) / 10) for _, review_count, star_rating, _, _ in parts]
+    # 확인 횟수가 적은 부품이 우연히 극단값이 되지 않도록 (변동 1회 / 확인 2회)를 미리 더함
+    volatility = [(changes + 1) / (checks + 2) for _, _, _, checks, changes in parts]
+    scores = [(1 - REFRESH_VOLATILITY_WEIGHT) * pop + REFRESH_VOLATILITY_WEIGHT * vol
+              for pop, vol in zip(_percentiles(popularity), _percentiles(volatility))]
+    ranked = sorted(range(len(parts)), key=lambda index: -scores[index])
+    hot_count = round(len(parts) * REFRESH_HOT_SHARE)
+    warm_count = round(len(parts) * REFRESH_WARM_SHARE)
+    tiers = {}
+    for position, index in enumerate(ranked):
+        tier = REFRESH_TIERS[0] if position < hot_count else REFRESH_TIERS[1] if position < hot_count + warm_count else REFRESH_TIERS[2]
+        tiers[parts[index][0]] = tier
+    return tiers
+
+
+def plan_pages(category_rows, page_budget, max_pages=REFRESH_MAX_PAGES):
+    """
+    실행 하나의 목록 페이지 계획
+
+    Args:
+        category_rows: 카테고리 -> [(part_id, 목록 페이지, review_count, star_rating, 확인 수, 변동 수, 마지막 확인 후 경과 초)]
+        page_budget: 실행 전체에서 열 목록 페이지 수
+    Returns:
+        (카테고리 -> 정렬된 페이지 번호 목록, 카테고리 -> 등급별 (전체, 갱신 대상) Counter 쌍)
+    """
+    candidates = []   # (가치, 카테고리, 페이지)
+    tier_counts = {}
+    for category, rows in category_rows.items():
+        tiers = assign_tiers([(row[0], row[2], row[3], row[4], row[5]) for row in rows])
+        page_values = {page: 0 for page in range(1, max_pages + 1)}
+        seen_pages = set()
+        totals, due = Counter(), Counter()
+        for part_id, page, _, _, _, _, age_seconds in rows:
+            tier = tiers[part_id]
+            totals[tier.name] += 1
+            if page is None or page > max_pages:
+                continue
+            seen_pages.add(page)
+            if age_seconds is None or age_seconds >= tier.interval_hours * 3600 * REFRESH_INTERVAL_SCALE:
+                due[tier.name] += 1
+                page_values[page] += tier.weight
+        for page, value in page_values.items():
+            if page not in seen_pages:
+                value = UNSEEN_PAGE_VALUE
+            if value > 0:
+                candidates.append((value, category, page))
+        tier_counts[category] = (totals, due)
+    # 가치가 큰 페이지부터, 같으면 앞 페이지부터
+    candidates.sort(key=lambda item: (-item[0], item[2]))
+    pages = {category: [] for category in category_rows}
+    for _, category, page in candidates[:max(page_budget, 0)]:
+        pages[category].append(page)
+    return {category: sorted(selected) for category, selected in pages.items()}, tier_counts
+
+
+_PLAN = None
+
+
+def load_plan(engine, categories, page_budget):
+    """크롤링 시작 시 1회: 부품 등급을 매기고 카테고리별로 열 목록 페이지를 정합니다."""
+    global _PLAN
+    ensure_tables(engine)
+    category_rows = {category: [] for category in categories}
+    with engine.connect() as conn:
+        rows = conn.execute(text("""
+            SELECT s.category, s.part_id, s.list_page, p.review_count, p.star_rating,
+                   s.price_checks, s.price_changes,
+                   TIMESTAMPDIFF(SECOND, s.last_checked_at, CURRENT_TIMESTAMP)
+            FROM part_refresh_stats s
+            JOIN parts p ON p.id = s.part_id
+        """)).fetchall()
+    for category, *row in rows:
+        if category in category_rows:
+            category_rows[category].append(tuple(row))
+    _PLAN, tier_counts = plan_pages(category_rows, page_budget)
+    print(f"--- 갱신 등급 계획 (페이지 예산 {page_budget}개, 등급별 갱신 대상/전체 hot·warm·cold) ---")
+    for category in categories:
+        totals, due = tier_counts[category]
+        tiers = ' '.join(f"{due[tier.name]}/{totals[tier.name]}" for tier in REFRESH_TIERS)
+        print(f"   {category:<8} 페이지 {_PLAN[category] or '없음'}  ({tiers})")
+    return _PLAN
+
+
+def pages_for(category):
+    """계획에서 이 카테고리에 배정된 목록 페이지 (계획이 없으면 None = 기본 범위)"""
+    if _PLAN is None:
+        return None
+    return _PLAN.get(category, [])
@@ -0,0 +1,178 @@
+"""
+보관된 스펙 원본(part_spec_raw)으로 part_spec을 다시 만드는 재파싱 도구
+
+파서(spec_parsers.py)를 고친 뒤 다나와를 다시 크롤링하지 않고 저장된 스펙만 갱신합니다.
+원본은 크롤러가 스펙을 저장할 때 part_spec_raw에 함께 보관합니다.
+
+사용법:
+    python reparse_specs.py                   # 전체 재파싱 (바뀐 행만 UPDATE)
+    python reparse_specs.py --dry-run         # DB는 그대로 두고 바뀔 키만 보고
+    python reparse_specs.py --category RAM --category 케이스
+    python crawler.py --reparse [--dry-run]   # 크롤러에서 같은 작업 실행
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from collections import Counter
+from multiprocessing import Pool
+
+from sqlalchemy import text
+
+from spec_parsers import build_part_specs
+from batch_jobs import create_batch_engine, ordered_chunk_results
+
+# --- 설정 ---
+# 한 번에 읽어 작업자에게 넘기는 행 수 (= 한 트랜잭션에서 UPDATE하는 최대 행 수)
+REPARSE_CHUNK_SIZE = int(os.environ.get("REPARSE_CHUNK_SIZE", "500"))
+# 작업 프로세스 수 (기본: CPU 코어 수)
+REPARSE_WORKERS = int(os.environ.get("REPARSE_WORKERS", str(os.cpu_count() or 2)))
+# 보고서에 보여줄 변경 예시 수
+REPARSE_SAMPLE_LIMIT = 10
+
+
+def diff_specs(old_specs, new_specs):
+    """(추가된 키, 삭제된 키, 값이 바뀐 키)"""
+    added = [key for key in new_specs if key not in old_specs]
+    removed = [key for key in old_specs if key not in new_specs]
+    changed = [key for key in new_specs if key in old_specs and old_specs[key] != new_specs[key]]
+    return added, removed, changed
+
+
+def reparse_chunk(rows):
+    """
+    작업 프로세스에서 실행: 원본을 다시 파싱해 바뀐 행만 반환합니다.
+
+    Args:
+        rows: [(part_id, category, name, spec_string, capacity, 기존 specs JSON 문자열)]
+    Returns:
+        [(part_id, category, 새 specs JSON, 추가 키, 삭제 키, 변경 키)]
+    """
+    results = []
+    for part_id, category, name, spec_string, capacity, old_json in rows:
+        new_specs = build_part_specs(category, name, spec_string, capacity)
+        try:
+            old_specs = json.loads(old_json) if old_json else {}
+        except (TypeError, ValueError):
+            old_specs = {}
+        # MySQL JSON 컬럼은 키 순서를 보존하지 않으므로 딕셔너리로 비교
+        if old_specs == new_specs:
+            continue
+        added, removed, changed = diff_specs(old_specs, new_specs)
+        results.append((part_id, category, json.dumps(new_specs, ensure_ascii=False), added, removed, changed))
+    return results
+
+
+def iter_raw_chunks(engine, categories=None, chunk_size=REPARSE_CHUNK_SIZE):
+    """part_spec_raw를 part_id 순서의 keyset 페이지로 읽어옵니다. (기존 스펙과 함께)"""
+    category_filter = ""
+    params = {"limit": chunk_size}
+    if categories:
+        placeholders = ", ".join(f":category{i}" for i in range(len(categories)))
+        category_filter = f"AND r.category IN ({placeholders})"
+        params.update({f"category{i}": category for i, category in enumerate(categories)})
+
+    last_id = 0
+    while True:
+        with engine.connect() as conn:
+            rows = conn.execute(text(f"""
+                SELECT r.part_id, r.category, r.name, r.spec_string, r.capacity, s.specs
+                FROM part_spec_raw r
+                JOIN part_spec s ON s.part_id = r.part_id
+                WHERE r.part_id > :last_id {category_filter}
+                ORDER BY r.part_id
+                LIMIT :limit
+            """), {**params, "last_id": last_id}).fetchall()
+        if not rows:
+            return
+        yield [tuple(row) for row in rows]
+        last_id = rows[-1][0]
+
+
+def apply_updates(engine, updates):
+    """바뀐 스펙을 한 트랜잭션에서 executemany로 갱신합니다."""
+    with engine.begin() as conn:
+        conn.execute(
+            text("UPDATE part_spec SET specs = :specs, updated_at = CURRENT_TIMESTAMP WHERE part_id = :part_id"),
+            [{"part_id": part_id, "specs": specs_json} for part_id, _, specs_json, *_ in updates]
+        )
+
+
+def print_report(scanned, changed_rows, key_counts, samples, elapsed, dry_run):
+    print("\n" + "=" * 60)
+    print(f"재파싱 결과{' (dry-run: DB 변경 없음)' if dry_run else ''}")
+    print("=" * 60)
+    print(f" - 검사한 부품: {scanned}개 ({scanned / elapsed if elapsed else 0:,.0f}개/s, {elapsed:.1f}s)")
+    print(f" - 스펙이 바뀐 부품: {changed_rows}개")
+    if key_counts:
+        print(" - 바뀐 키 (카테고리 / 키 / 추가·삭제·변경 건수):")
+        for (category, key), counts in sorted(key_counts.items(), key=lambda item: -sum(item[1].values())):
+            print(f"     {category:<6} {key:<28} +{counts['added']} -{counts['removed']} ~{counts['changed']}")
+    for part_id, category, added, removed, changed in samples:
+        print(f"   예) part_id={part_id} [{category}] 추가 {added} / 삭제 {removed} / 변경 {changed}")
+    print("=" * 60)
+
+
+def run_reparse(engine, categories=None, dry_run=False, workers=REPARSE_WORKERS, chunk_size=REPARSE_CHUNK_SIZE):
+    """
+    part_spec_raw 전체를 프로세스 풀로 재파싱하고, 바뀐 행만 청크 단위로 일괄 UPDATE합니다.
+
+    Returns:
+        바뀐 부품 수
+    """
+    started = time.perf_counter()
+    scanned = 0
+    changed_rows = 0
+    key_counts = {}
+    samples = []
+
+    print(f"--- 스펙 재파싱 시작 (작업자 {workers}개, 청크 {chunk_size}행"
+          f"{', 카테고리 ' + ', '.join(categories) if categories else ''}) ---")
+
+    chunks = iter_raw_chunks(engine, categories, chunk_size)
+    with Pool(processes=workers) as pool:
+        # 작업자가 파싱하는 동안 메인 프로세스는 다음 청크를 읽고, 끝난 청크를 DB에 반영
+        for chunk_rows, updates in zip_with_results(pool, chunks):
+            scanned += chunk_rows
+            if not updates:
+                continue
+            changed_rows += len(updates)
+            for part_id, category, _, added, removed, changed in updates:
+                for kind, keys in (('added', added), ('removed', removed), ('changed', changed)):
+                    for key in keys:
+                        key_counts.setdefault((category, key), Counter())[kind] += 1
+                if len(samples) < REPARSE_SAMPLE_LIMIT:
+                    samples.append((part_id, category, added, removed, changed))
+            if not dry_run:
+                apply_updates(engine, updates)
+            print(f"   -> {scanned}개 검사, {changed_rows}개 변경")
+
+    print_report(scanned, changed_rows, key_counts, samples, time.perf_counter() - started, dry_run)
+    return changed_rows
+
+
+def zip_with_results(pool, chunks):
+    """청크를 풀에 순서대로 넘기고 (청크 행 수, 결과)를 순서대로 돌려줍니다."""
+    return ordered_chunk_results(pool, reparse_chunk, chunks)
+
+
+def create_reparse_engine():
+    return create_batch_engine()
+
+
+def parse_reparse_args(argv):
+    parser = argparse.ArgumentParser(description="보관된 스펙 원본으로 part_spec 재파싱")
+    parser.add_argument('--reparse', action='store_true', help=argparse.SUPPRESS)  # crawler.py --reparse 호환
+    parser.add_argument('--dry-run', action='store_true', help='DB를 바꾸지 않고 변경 내용만 보고')
+    parser.add_argument('--category', action='append', help='특정 카테고리만 (여러 번 지정 가능)')
+    parser.add_argument('--workers', type=int, default=REPARSE_WORKERS)
+    parser.add_argument('--chunk-size', type=int, default=REPARSE_CHUNK_SIZE)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_reparse_args(sys.argv[1:])
+    engine = create_reparse_engine()
+    run_reparse(engine, categories=args.category, dry_run=args.dry_run,
+                workers=args.workers, chunk_size=args.chunk_size)
@@ -0,0 +1,301 @@
+"""
+저장된 리뷰 본문(community_reviews.raw_text)에서 벤치마크 점수를 일괄 추출하는 백필 도구
+
+네트워크 요청 없이 이미 수집한 리뷰에서 Cinebench R23/R24, CPU Profile, 3DMark, 게임 FPS 표를 찾아
+benchmark_results에 source='review'로 저장합니다. 리뷰는 id 순서의 keyset 페이지로 읽고,
+패턴 매칭은 프로세스 풀에서 실행하며, 결과는 청크마다 executemany 한 번으로 upsert합니다.
+
+사용법:
+    python review_benchmarks.py                    # 전체 리뷰 백필
+    python review_benchmarks.py --dry-run          # DB는 그대로 두고 추출 건수만 보고
+    python review_benchmarks.py --min-id 12000     # 해당 id 이후 리뷰만
+    python crawler.py --review-benchmarks          # 크롤러에서 같은 작업 실행
+"""
+import os
+import re
+import sys
+import time
+import argparse
+from collections import Counter
+from multiprocessing import Pool
+
+from sqlalchemy import text
+
+from model_identity import resolve_model
+from batch_jobs import create_batch_engine, ordered_chunk_results
+
+# --- 설정 ---
+# 한 번에 읽어 작업자에게 넘기는 리뷰 수 (본문이 길어 재파싱보다 작게)
+REVIEW_BENCH_CHUNK_SIZE = int(os.environ.get("REVIEW_BENCH_CHUNK_SIZE", "200"))
+# 작업 프로세스 수 (기본: CPU 코어 수)
+REVIEW_BENCH_WORKERS = int(os.environ.get("REVIEW_BENCH_WORKERS", str(os.cpu_count() or 2)))
+# 리뷰 한 건에서 저장할 최대 결과 수 (비교 표가 긴 리뷰 대비)
+REVIEW_BENCH_MAX_PER_REVIEW = 30
+REVIEW_BENCH_SOURCE = 'review'
+
+# 리뷰의 part_type(카테고리 이름) -> benchmark_results.part_type
+_PART_TYPES = {'CPU': 'CPU', '그래픽카드': 'GPU'}
+
+# --- 패턴 (모듈 로드 시 한 번만 컴파일) ---
+# 점수: 1,234 / 12,345 / 1234 형태 (쉼표 포함)
+_NUMBER = r'(\d{1,3}(?:,\d{3})+|\d{3,6})'
+
+_CINEBENCH_PATTERN = re.compile(
+    r'Cinebench\s*(?:R(2[34])|(2024))'
+    r'\s*(Multi(?:[\s-]*core)?|멀티(?:\s*코어)?|nT|MT|Single(?:[\s-]*core)?|싱글(?:\s*코어)?|1T|ST)?'
+    r'[^\d\n\r]{0,30}?' + _NUMBER, re.I)
+_CPU_PROFILE_PATTERN = re.compile(r'\b(Max(?:\s*threads)?|16\s*T|8\s*T|4\s*T|2\s*T|1\s*T)\b[^\d\n\r]{0,15}?' + _NUMBER, re.I)
+_3DMARK_PATTERN = re.compile(
+    r'(Time\s*Spy(?:\s*Extreme)?|Fire\s*Strike(?:\s*(?:Extreme|Ultra))?|Port\s*Royal|Steel\s*Nomad|Speed\s*Way)'
+    r'\s*(?:(Graphics|그래픽|GPU|CPU|Physics)\s*(?:Score|점수)?)?[^\d\n\r]{0,20}?' + _NUMBER, re.I)
+_FPS_PATTERN = re.compile(r'(?<![\d.%])(\d{1,3}(?:\.\d{1,2})?)\s*(?:fps|프레임)', re.I)
+_FPS_LOW_PATTERN = re.compile(r'1\s*%|\blows?\b|최저|최소', re.I)
+_RESOLUTION_PATTERN = re.compile(r'\b(720p|1080p|1440p|2160p|FHD|QHD|UHD|4K)\b', re.I)
+_FPS_FIELD_SPLIT = re.compile(r'\s*[|:\t/]\s*|\s{2,}')
+_FPS_LABEL_PATTERN = re.compile(r'^(?:평균|avg\.?|average)\s*|\s*(?:평균|avg\.?|average)$', re.I)
+
+# 다른 모델을 명시한 줄(비교 표의 경쟁 제품 행)은 건너뜀
+_GPU_MENTION_PATTERN = re.compile(r'\b(?:RTX|GTX|RX|ARC)\s*([AB]?\d{3,5})', re.I)
+_CPU_MENTION_PATTERN = re.compile(r'(?:\bi[3579]|울트라\s*\d|ultra\s*\d|라이젠\s*\d|ryzen\s*\d)[\s-]*(\d{3,5})', re.I)
+
+# 시나리오 표기의 첫 글자 -> 저장 값 (Multi-core/멀티/nT/MT, Single-core/싱글/1T/ST)
+_CINEBENCH_SCENARIOS = {'m': 'Multi', 'n': 'Multi', '멀': 'Multi', 's': 'Single', '1': 'Single', '싱': 'Single'}
+_3DMARK_SCENARIOS = {
+    'graphics': ('GPU', 'Graphics Score'), '그래픽': ('GPU', 'Graphics Score'), 'gpu': ('GPU', 'Graphics Score'),
+    'cpu': ('CPU', 'CPU Score'), 'physics': ('CPU', 'Physics Score'),
+}
+
+SCORE_MIN, SCORE_MAX = 100, 300000
+FPS_MIN, FPS_MAX = 1.0, 999.0
+
+
+def _to_int(num_str):
+    try:
+        return int(num_str.replace(',', ''))
+    except ValueError:
+        return None
+
+
+def _canonical_test(name):
+    """'time spy  extreme' -> 'Time Spy Extreme' (크롤러의 3DMark test_name과 같은 표기)"""
+    return ' '.join(word.capitalize() for word in re.findall(r'[A-Za-z]+', name))
+
+
+def _mentions_other_model(line, token):
+    """줄에 모델명이 적혀 있는데 리뷰 대상 모델 번호가 아니면 True"""
+    if not token:
+        return False
+    mentions = _GPU_MENTION_PATTERN.findall(line) + _CPU_MENTION_PATTERN.findall(line)
+    return bool(mentions) and not any(token in mention for mention in mentions)
+
+
+def _fps_game(line, fps_start):
+    """FPS 숫자 앞부분에서 게임 이름과 해상도 -> (게임, 해상도) 또는 None"""
+    head = line[:fps_start]
+    resolution = _RESOLUTION_PATTERN.search(line)
+    for field in _FPS_FIELD_SPLIT.split(head):
+        field = _FPS_LABEL_PATTERN.sub('', _RESOLUTION_PATTERN.sub('', field)).strip(' -=,()[]')
+        if not 2 <= len(field) <= 40 or not re.search(r'[A-Za-z가-힣]', field):
+            continue
+        # 비교 표의 제품명 칸은 게임 이름이 아님
+        if not (_GPU_MENTION_PATTERN.search(field) or _CPU_MENTION_PATTERN.search(field)):
+            label = resolution.group(1) if resolution else ''
+            return field, (label.lower() if label[-1:] in ('p', 'P') else label.upper())
+    return None
+
+
+def extract_benchmark_scores(raw_text, model_token=None):
+    """
+    리뷰 본문 텍스트에서 대표적인 벤치마크 점수를 추출합니다.
+    - Cinebench R23/R24(2024): Multi/Single
+    - CPU Profile: Max/1T/2T/4T/8T/16T
+    - 3DMark Time Spy/Fire Strike/Port Royal/Steel Nomad/Speed Way: Graphics/CPU/종합 점수
+    - 게임 FPS 표: "게임 | 해상도 | 평균 123 FPS" 형태의 줄
+
+    Args:
+        model_token: 리뷰 대상 모델 번호 (예: '9800', '5070'). 다른 모델이 적힌 줄은 제외
+    Returns:
+        [{test_name, test_version, scenario, metric_name, value, unit}] (같은 항목은 처음 값만, 최대 REVIEW_BENCH_MAX_PER_REVIEW개)
+    """
+    results = {}
+
+    def add(test_name, test_version, scenario, metric_name, value, unit):
+        key = (test_name, test_version, scenario, metric_name)
+        if key not in results and len(results) < REVIEW_BENCH_MAX_PER_REVIEW:
+            results[key] = {
+                "test_name": test_name, "test_version": test_version, "scenario": scenario,
+                "metric_name": metric_name, "value": value, "unit": unit,
+            }
+
+    for line in (raw_text or '').splitlines():
+        lowered = line.lower()
+        # 키워드가 없는 줄은 정규식을 돌리지 않음 (대부분의 본문 줄)
+        has_cinebench = 'cinebench' in lowered
+        has_profile = 'cpu profile' in lowered or 'cpuprofile' in lowered
+        has_3dmark = any(word in lowered for word in ('spy', 'strike', 'royal', 'nomad', 'speed way', 'speedway'))
+        has_fps = 'fps' in lowered or '프레임' in lowered
+        if not (has_cinebench or has_profile or has_3dmark or has_fps):
+            continue
+        if _mentions_other_model(line, model_token):
+            continue
+
+        if has_cinebench:
+            for match in _CINEBENCH_PATTERN.finditer(line):
+                value = _to_int(match.group(4))
+                if value and SCORE_MIN <= value <= SCORE_MAX:
+                    scenario = _CINEBENCH_SCENARIOS.get((match.group(3) or '')[:1].lower(), '')
+                    add("Cinebench", f"R{match.group(1) or '24'}", scenario, "Score", value, "pts")
+
+        if has_profile:
+            for match in _CPU_PROFILE_PATTERN.finditer(line):
+                value = _to_int(match.group(2))
+                if value and SCORE_MIN <= value <= SCORE_MAX:
+                    label = re.sub(r'\s+', '', match.group(1)).upper()
+                    add("CPU Profile", "", "Max" if label.startswith('MAX') else label, "Score", value, "pts")
+
+        if has_3dmark:
+            for match in _3DMARK_PATTERN.finditer(line):
+                value = _to_int(match.group(3))
+                if value and 1000 <= value <= SCORE_MAX:
+                    scenario, metric_name = _3DMARK_SCENARIOS.get((match.group(2) or '').lower(), ('Overall', 'Score'))
+                    add(_canonical_test(match.group(1)), "", scenario, metric_name, value, "pts")
+
+        if has_fps and not _FPS_LOW_PATTERN.search(line):
+            match = _FPS_PATTERN.search(line)
+            if match:
+                value = float(match.group(1))
+                game = _fps_game(line, match.start())
+                if game and FPS_MIN <= value <= FPS_MAX:
+                    scenario = f"{game[0]} {game[1]}".strip()
+                    add("Game FPS", "", scenario, "Average FPS", value, "fps")
+
+    return list(results.values())
+
+
+def _belongs_to(part_type, result):
+    """CPU 리뷰의 그래픽 점수, GPU 리뷰의 CPU 점수는 테스트 시스템의 다른 부품 값이므로 제외"""
+    if result["test_name"] == "Game FPS":
+        return True
+    cpu_result = result["test_name"] in ("Cinebench", "CPU Profile") or result["scenario"] == 'CPU'
+    return cpu_result == (part_type == 'CPU')
+
+
+def extract_chunk(rows):
+    """
+    작업 프로세스에서 실행: 리뷰 묶음 -> benchmark_results upsert 파라미터 목록
+
+    Args:
+        rows: [(review_id, part_id, part_type, cpu_model, review_url, raw_text, 부품 이름)]
+    """
+    params = []
+    for _, part_id, part_type, cpu_model, review_url, raw_text, part_name in rows:
+        identity = resolve_model(part_name or '', part_type)
+        # 크롤러와 같은 표기: CPU는 모델명(7800X3D), GPU는 공통 라벨(RTX 5070)
+        model_name = cpu_model
+        if not model_name and identity:
+            model_name = identity.model if part_type == 'CPU' else identity.label
+        for result in extract_benchmark_scores(raw_text, identity.token if identity else None):
+            if not _belongs_to(part_type, result):
+                continue
+            params.append({
+                "part_id": part_id,
+                "part_type": _PART_TYPES.get(part_type, part_type),
+                "cpu_model": model_name,
+                "source": REVIEW_BENCH_SOURCE,
+                "review_url": review_url,
+                **result,
+            })
+    return params
+
+
+def iter_review_chunks(engine, chunk_size=REVIEW_BENCH_CHUNK_SIZE, min_id=0):
+    """CPU/그래픽카드 리뷰를 id 순서의 keyset 페이지로 읽어옵니다. (부품 이름과 함께)"""
+    last_id = min_id
+    while True:
+        with engine.connect() as conn:
+            rows = conn.execute(text("""
+                SELECT r.id, r.part_id, r.part_type, r.cpu_model, r.review_url, r.raw_text, p.name
+                FROM community_reviews r
+                LEFT JOIN parts p ON p.id = r.part_id
+                WHERE r.id > :last_id AND r.part_type IN ('CPU', '그래픽카드')
+                ORDER BY r.id
+                LIMIT :limit
+            """), {"last_id": last_id, "limit": chunk_size}).fetchall()
+        if not rows:
+            return
+        yield [tuple(row) for row in rows]
+        last_id = rows[-1][0]
+
+
+def upsert_results(engine, params):
+    """추출 결과를 한 트랜잭션에서 executemany로 upsert합니다. (리뷰 URL이 키에 포함되어 리뷰별로 한 행)"""
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO benchmark_results (
+                part_id, part_type, cpu_model, source, test_name, test_version, scenario,
+                metric_name, value, unit, review_url
+            ) VALUES (
+                :part_id, :part_type, :cpu_model, :source, :test_name, :test_version, :scenario,
+                :metric_name, :value, :unit, :review_url
+            )
+            ON DUPLICATE KEY UPDATE
+                value = VALUES(value),
+                created_at = CURRENT_TIMESTAMP
+        """), params)
+
+
+def run_backfill(engine, dry_run=False, workers=REVIEW_BENCH_WORKERS, chunk_size=REVIEW_BENCH_CHUNK_SIZE, min_id=0):
+    """
+    저장된 리뷰 전체를 프로세스 풀로 훑어 벤치마크 점수를 benchmark_results에 일괄 저장합니다.
+
+    Returns:
+        저장한(dry-run이면 추출한) 결과 수
+    """
+    started = time.perf_counter()
+    scanned = 0
+    saved = 0
+    test_counts = Counter()
+    parts = set()
+
+    print(f"--- 리뷰 벤치마크 백필 시작 (작업자 {workers}개, 청크 {chunk_size}건, id > {min_id}) ---")
+
+    chunks = iter_review_chunks(engine, chunk_size, min_id)
+    with Pool(processes=workers) as pool:
+        for chunk_rows, params in ordered_chunk_results(pool, extract_chunk, chunks):
+            scanned += chunk_rows
+            if not params:
+                continue
+            saved += len(params)
+            for row in params:
+                test_counts[(row["part_type"], row["test_name"])] += 1
+                parts.add(row["part_id"])
+            if not dry_run:
+                upsert_results(engine, params)
+            print(f"   -> 리뷰 {scanned}건 검사, 결과 {saved}건")
+
+    elapsed = time.perf_counter() - started
+    print("\n" + "=" * 60)
+    print(f"리뷰 벤치마크 백필 결과{' (dry-run: DB 변경 없음)' if dry_run else ''}")
+    print("=" * 60)
+    print(f" - 검사한 리뷰: {scanned}건 ({scanned / elapsed if elapsed else 0:,.0f}건/s, {elapsed:.1f}s)")
+    print(f" - 추출한 결과: {saved}건 (부품 {len(parts)}개)")
+    for (part_type, test_name), count in test_counts.most_common():
+        print(f"     {part_type:<4} {test_name:<20} {count}건")
+    print("=" * 60)
+    return saved
+
+
+def parse_backfill_args(argv):
+    parser = argparse.ArgumentParser(description="저장된 리뷰 본문에서 벤치마크 점수 일괄 추출")
+    parser.add_argument('--review-benchmarks', action='store_true', help=argparse.SUPPRESS)  # crawler.py 호환
+    parser.add_argument('--dry-run', action='store_true', help='DB를 바꾸지 않고 추출 건수만 보고')
+    parser.add_argument('--min-id', type=int, default=0, help='이 id 이후의 리뷰만 처리')
+    parser.add_argument('--workers', type=int, default=REVIEW_BENCH_WORKERS)
+    parser.add_argument('--chunk-size', type=int, default=REVIEW_BENCH_CHUNK_SIZE)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_backfill_args(sys.argv[1:])
+    run_backfill(create_batch_engine(), dry_run=args.dry_run, workers=args.workers,
+                 chunk_size=args.chunk_size, min_id=args.min_id)
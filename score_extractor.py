@@ -0,0 +1,295 @@
+"""
+3DMark 결과 페이지 HTML에서 GPU Graphics Score 후보를 한 번의 순회로 추출
+
+기존 BeautifulSoup 구현(넓은 CSS 합집합 선택자 + 매칭 요소마다 get_text + 전체 텍스트 두 번 생성 +
+토큰 주변 구간마다 정규식)과 같은 결과를 내면서,
+    - lxml 트리를 한 번만 순회해 텍스트 조각과 요소별 텍스트 범위를 기록하고
+    - 요소 텍스트는 전체 텍스트의 구간(search(text, start, end))으로 다루며
+    - 토큰 위치/숫자 위치를 미리 색인해 구간 검사를 이진 탐색으로 처리합니다.
+script/style/template 내부 문자열은 BeautifulSoup처럼 해당 요소 자체의 텍스트에만 포함합니다.
+(template 안에 template/script가 다시 들어간 비정상 마크업은 결과가 다를 수 있음)
+
+    from score_extractor import parse_scores_for_gpu
+    scores = parse_scores_for_gpu(html, "RTX 5060")   # 정렬된 고유 점수 목록 (최대 100개)
+"""
+import re
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+from lxml import etree
+
+# 점수로 인정하는 범위
+SCORE_MIN = 1000
+SCORE_MAX = 200000
+# 행/블록에서 찾은 점수가 이보다 적으면 전체 텍스트에서 추가로 찾음
+MIN_ROW_SCORES = 3
+LABEL_CONTEXT_CHARS = 300   # "Graphics Score" 레이블 주변에서 GPU 토큰을 찾는 범위
+TOKEN_CONTEXT_CHARS = 500   # GPU 토큰 주변에서 점수 후보를 찾는 범위
+MAX_SCORES = 100
+
+_GPU_TOKEN_PATTERN = re.compile(r"(\d{3,5})")
+_ROW_SCORE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"Graphics\s+Score[:\s]*[=]?\s*(\d{4,6})",
+    r"GPU\s+Score[:\s]*[=]?\s*(\d{4,6})",
+    r"Graphics[:\s]*[=]?\s*(\d{4,6})",
+    r"Graphics\s*:\s*(\d{4,6})",
+    r"GPU\s*:\s*(\d{4,6})",
+)]
+_PAGE_SCORE_PATTERNS = _ROW_SCORE_PATTERNS[:3]
+_CELL_NUMBER_PATTERN = re.compile(r'\b(\d{4,6})\b')
+_WORD_RUN_PATTERN = re.compile(r'\w+')
+
+# BeautifulSoup get_text()가 텍스트로 보지 않는 태그 (내용 제외, 뒤따르는 텍스트는 포함)
+_NON_TEXT_TAGS = {'script', 'style', 'template'}
+
+
+def _is_row(tag, classes, in_table):
+    """'table tbody tr, table tr, .result-row, .benchmark-row, [class*=result|benchmark|score], tr/div[class*=row]'"""
+    if tag == 'tr' and in_table:
+        return True
+    if 'result' in classes or 'benchmark' in classes or 'score' in classes:
+        return True
+    return tag in ('tr', 'div') and 'row' in classes
+
+
+def _is_cell(tag, classes):
+    """'td, th, [class*=cell], [class*=column]'"""
+    return tag in ('td', 'th') or 'cell' in classes or 'column' in classes
+
+
+def _walk(root):
+    """('start'|'end', 노드) 순회. etree.iterwalk와 달리 주석/처리 명령도 돌려줌 (tail 텍스트 때문)"""
+    stack = [(root, False)]
+    while stack:
+        node, closing = stack.pop()
+        if closing:
+            yield 'end', node
+            continue
+        yield 'start', node
+        stack.append((node, True))
+        stack.extend((child, False) for child in reversed(node))
+
+
+def _in_range(value):
+    return SCORE_MIN <= value <= SCORE_MAX
+
+
+class _PageText:
+    """
+    한 번의 순회 결과
+
+    raw_parts: 일반 텍스트 조각 (soup.get_text(" ")와 같은 전체 텍스트용)
+    stripped: 공백을 제거한 비어 있지 않은 조각을 " "로 이은 텍스트 (get_text(" ", strip=True)용)
+    rows/cells: (전위 순서, 하위 끝 전위 순서, 자체 텍스트, 시작 조각, 끝 조각)
+        script/style/template 요소만 자체 텍스트(내부 문자열)를 가지고, 나머지는 stripped의 조각 범위를 씀
+    """
+
+    def __init__(self, root):
+        self.raw_parts = []
+        parts = []
+        self.rows = []
+        self.cells = []
+
+        offset = 0
+        starts = []
+        special_texts = []  # 열려 있는 script/style/template 요소별 내부 문자열
+
+        def add_text(value):
+            nonlocal offset
+            stripped = value.strip()
+            if special_texts:
+                # BeautifulSoup은 이 문자열을 해당 요소의 get_text()에만 포함
+                if stripped:
+                    for collected in special_texts:
+                        collected.append(stripped)
+                return
+            self.raw_parts.append(value)
+            if stripped:
+                starts.append(offset)
+                parts.append(stripped)
+                offset += len(stripped) + 1
+
+        order = 0
+        open_elements = []  # (전위 순서, 시작 조각, 행 여부, 셀 여부)
+        table_depth = 0
+        for event, element in _walk(root):
+            tag = element.tag.lower() if isinstance(element.tag, str) else None
+            if event == 'start':
+                if tag is None:
+                    continue
+                classes = element.get('class') or ''
+                open_elements.append((order, len(parts), _is_row(tag, classes, table_depth > 0), _is_cell(tag, classes)))
+                order += 1
+                if tag == 'table':
+                    table_depth += 1
+                if tag in _NON_TEXT_TAGS:
+                    special_texts.append([])
+                if element.text:
+                    add_text(element.text)
+                continue
+
+            if tag is not None:
+                element_order, first_part, is_row, is_cell = open_elements.pop()
+                own_text = ' '.join(special_texts.pop()) if tag in _NON_TEXT_TAGS else None
+                span = (element_order, order, own_text, first_part, len(parts))
+                if is_row:
+                    self.rows.append(span)
+                if is_cell:
+                    self.cells.append(span)
+                if tag == 'table':
+                    table_depth -= 1
+            # 주석/처리 명령도 뒤따르는 텍스트(tail)는 일반 텍스트
+            if element.tail:
+                add_text(element.tail)
+
+        self.stripped = ' '.join(parts)
+        self._starts = starts
+        self._ends = [start + len(part) for start, part in zip(starts, parts)]
+        # 행은 문서 순서대로, 셀은 전위 순서로 이진 탐색
+        self.rows.sort(key=itemgetter(0))
+        self.cells.sort(key=itemgetter(0))
+        self._cell_orders = [cell[0] for cell in self.cells]
+        self._raw_text = None
+
+    def text_of(self, span):
+        """요소 텍스트 -> (텍스트, 시작, 끝). 대부분은 stripped의 구간이라 복사하지 않음"""
+        own_text = span[2]
+        if own_text is not None:
+            return own_text, 0, len(own_text)
+        first_part, last_part = span[3], span[4]
+        if first_part >= last_part:
+            return self.stripped, 0, 0
+        return self.stripped, self._starts[first_part], self._ends[last_part - 1]
+
+    def cells_under(self, row):
+        """행 요소의 하위 셀들 (문서 순서)"""
+        element_order, end_order = row[0], row[1]
+        return self.cells[bisect_right(self._cell_orders, element_order):bisect_left(self._cell_orders, end_order)]
+
+    @property
+    def raw_text(self):
+        if self._raw_text is None:
+            self._raw_text = ' '.join(self.raw_parts)
+        return self._raw_text
+
+
+def _occurrences(text, token, overlapping):
+    positions = []
+    step = 1 if overlapping else len(token)
+    position = text.find(token)
+    while position != -1:
+        positions.append(position)
+        position = text.find(token, position + step)
+    return positions
+
+
+def _has_occurrence(positions, token_length, start, end):
+    """[start, end) 구간 안에 토큰 전체가 들어가는 위치가 있는지"""
+    index = bisect_left(positions, start)
+    return index < len(positions) and positions[index] + token_length <= end
+
+
+def _numbers_in_window(text, runs, run_starts, start, end):
+    """text[start:end]에서 \\b\\d{4,6}\\b에 걸리는 숫자들 (구간 경계에서 잘린 단어 포함)"""
+    index = max(bisect_right(run_starts, start) - 1, 0)
+    values = []
+    while index < len(runs):
+        run_start, run_end = runs[index]
+        if run_start >= end:
+            break
+        index += 1
+        clipped_start, clipped_end = max(run_start, start), min(run_end, end)
+        if 4 <= clipped_end - clipped_start <= 6:
+            digits = text[clipped_start:clipped_end]
+            if digits.isdecimal():
+                values.append(int(digits))
+    return values
+
+
+def parse_scores_for_gpu(html, gpu_name):
+    """3DMark 페이지 HTML에서 GPU 이름이 포함된 행/블록의 Graphics Score만 추출 (정렬된 고유 값, 최대 100개)"""
+    token_match = _GPU_TOKEN_PATTERN.search(gpu_name)
+    if not token_match:
+        return []
+    token = token_match.group(1)
+    if not html or not html.strip():
+        return []
+    try:
+        root = etree.fromstring(html, etree.HTMLParser(recover=True))
+    except ValueError:
+        # 인코딩 선언이 있는 문자열은 바이트로 다시 파싱
+        root = etree.fromstring(html.encode('utf-8'), etree.HTMLParser(recover=True, encoding='utf-8'))
+    except etree.ParserError:
+        return []
+    if root is None:
+        return []
+
+    page = _PageText(root)
+    # GPU 토큰은 숫자라 공백을 넘지 않으므로 stripped 텍스트에서 위치를 한 번만 색인
+    token_in_text = _occurrences(page.stripped, token, overlapping=True)
+    token_length = len(token)
+
+    def contains_token(text, start, end):
+        if text is page.stripped:
+            return _has_occurrence(token_in_text, token_length, start, end)
+        return token in text
+
+    scores = []
+    cell_cache = {}
+
+    def cell_info(cell):
+        cached = cell_cache.get(cell[0])
+        if cached is None:
+            text, start, end = page.text_of(cell)
+            number = _CELL_NUMBER_PATTERN.search(text, start, end)
+            cached = (contains_token(text, start, end), int(number.group(1)) if number else None)
+            cell_cache[cell[0]] = cached
+        return cached
+
+    # 방법 1: 행/블록 요소 (중첩된 요소도 각각 처리 - 기존 선택자와 같은 횟수)
+    for row in page.rows:
+        text, start, end = page.text_of(row)
+        if not contains_token(text, start, end):
+            continue
+
+        # 1-1: "Graphics Score" / "GPU Score" 레이블 뒤의 숫자
+        for pattern in _ROW_SCORE_PATTERNS:
+            match = pattern.search(text, start, end)
+            if match and _in_range(int(match.group(1))):
+                scores.append(float(int(match.group(1))))
+                break
+
+        # 1-2: 토큰이 들어 있는 셀 다음 셀들(최대 4개)의 첫 4-6자리 숫자
+        cells = page.cells_under(row)
+        if len(cells) >= 2:
+            for i in range(len(cells) - 1):
+                if not cell_info(cells[i])[0]:
+                    continue
+                for j in range(i + 1, min(i + 5, len(cells))):
+                    value = cell_info(cells[j])[1]
+                    if value is not None and _in_range(value):
+                        scores.append(float(value))
+                        break
+
+    # 방법 2/3은 전체 텍스트(공백 포함)에서 위치 색인으로 처리
+    if len(scores) < MIN_ROW_SCORES:
+        raw = page.raw_text
+        raw_token_positions = _occurrences(raw, token, overlapping=True)
+        for pattern in _PAGE_SCORE_PATTERNS:
+            for match in pattern.finditer(raw):
+                start = max(0, match.start() - LABEL_CONTEXT_CHARS)
+                end = min(len(raw), match.end() + LABEL_CONTEXT_CHARS)
+                if _has_occurrence(raw_token_positions, token_length, start, end) and _in_range(int(match.group(1))):
+                    scores.append(float(int(match.group(1))))
+
+    if len(scores) < MIN_ROW_SCORES:
+        raw = page.raw_text
+        runs = [match.span() for match in _WORD_RUN_PATTERN.finditer(raw)]
+        run_starts = [run[0] for run in runs]
+        for position in _occurrences(raw, token, overlapping=False):
+            start = max(0, position - TOKEN_CONTEXT_CHARS)
+            end = min(len(raw), position + TOKEN_CONTEXT_CHARS)
+            scores.extend(float(value) for value in _numbers_in_window(raw, runs, run_starts, start, end)
+                          if _in_range(value))
+
+    return sorted(set(scores))[:MAX_SCORES]
@@ -0,0 +1,1016 @@
+"""
+다나와 상세 스펙 문자열 파서 (규칙 테이블 기반)
+
+카테고리별 파싱 규칙을 선언형 테이블로 정의하고, 모듈을 불러올 때 한 번만
+파이썬 함수로 컴파일합니다. 컴파일된 함수는 스펙 문자열을 '/'로 한 번 나눈 뒤
+(토큰화) 각 조각에 대해 규칙 순서대로 if/elif 분기를 평가하며, 정규식은 모두
+미리 컴파일되고 문자열 포함 검사로 먼저 걸러집니다.
+
+기존 crawler.py의 parse_*_specs 함수와 결과(키 순서 포함)가 같도록 규칙의 순서와
+조건을 그대로 옮겼습니다. 규칙을 고칠 때는 테이블만 수정하면 됩니다.
+
+    from spec_parsers import PARSER_MAP
+    specs = PARSER_MAP['CPU'](name, spec_string)
+
+DB/브라우저 의존성이 없으므로 크롤러 밖(재파싱, 벤치마크)에서도 그대로 불러올 수 있습니다.
+"""
+import re
+
+# --- 1. 규칙 DSL ---
+# 조건/값/동작 객체는 컴파일 시 파이썬 코드 조각으로 변환됩니다.
+# 대상(target)은 생성된 함수 안의 변수명입니다. (part, full_text, name, spec_parts, spec_string 등)
+PART = 'part'
+FULL_TEXT = 'full_text'
+
+_REGEX_META = set('.^$*+?{}[]\\|()')
+
+
+def _literal_prefix(pattern):
+    """정규식이 매치되려면 반드시 포함되어야 하는 앞부분 리터럴 (사전 필터용)"""
+    if '|' in pattern:
+        return ''
+    prefix = []
+    for ch in pattern:
+        if ch in _REGEX_META:
+            if ch in '*?{' and prefix:
+                prefix.pop()  # 직전 글자가 생략 가능
+            break
+        prefix.append(ch)
+    return ''.join(prefix)
+
+
+class Has:
+    """target에 literal이 포함됨"""
+
+    def __init__(self, literal, target=PART):
+        self.literal = literal
+        self.target = target
+
+    def render(self, compiler):
+        return f"{self.literal!r} in {self.target}"
+
+
+class Lacks(Has):
+    """target에 literal이 없음"""
+
+    def render(self, compiler):
+        return f"{self.literal!r} not in {self.target}"
+
+
+class Missing:
+    """specs에 key가 아직 없음"""
+
+    def __init__(self, key):
+        self.key = key
+
+    def render(self, compiler):
+        return f"{self.key!r} not in specs"
+
+
+class Present(Missing):
+    """specs에 key가 있음"""
+
+    def render(self, compiler):
+        return f"{self.key!r} in specs"
+
+
+class Empty(Missing):
+    """specs에 key가 없거나 값이 비어 있음"""
+
+    def render(self, compiler):
+        return f"({self.key!r} not in specs or not specs[{self.key!r}])"
+
+
+class Equals:
+    """specs.get(key) == value"""
+
+    def __init__(self, key, value, negate=False):
+        self.key = key
+        self.value = value
+        self.negate = negate
+
+    def render(self, compiler):
+        op = '!=' if self.negate else '=='
+        return f"specs.get({self.key!r}) {op} {self.value!r}"
+
+
+class Search:
+    """
+    정규식 검색. 매치 객체는 m에 바인딩되어 Group()에서 사용합니다.
+    패턴의 앞부분 리터럴(또는 requires)을 먼저 `in`으로 확인해 대부분의 정규식 호출을 생략합니다.
+    """
+
+    def __init__(self, pattern, target=PART, flags=0, anchored=False, requires=None):
+        self.pattern = pattern
+        self.target = target
+        self.flags = flags
+        self.anchored = anchored
+        self.requires = requires
+
+    def render(self, compiler):
+        regex = compiler.regex(self.pattern, self.flags)
+        method = 'match' if self.anchored else 'search'
+        expr = f"(m := {regex}.{method}({self.target}))"
+        prefix = self.requires
+        if prefix is None and not self.flags & re.IGNORECASE:
+            prefix = _literal_prefix(self.pattern)
+        if prefix and len(prefix) >= 2:
+            return f"({prefix!r} in {self.target} and {expr})"
+        return expr
+
+
+class Expr:
+    """규칙 DSL로 표현하기 어려운 조건/값 (파이썬 식 그대로)"""
+
+    def __init__(self, source):
+        self.source = source
+
+    def render(self, compiler):
+        return self.source
+
+
+class All:
+    def __init__(self, *conditions):
+        self.conditions = conditions
+
+    def render(self, compiler):
+        return "(" + " and ".join(c.render(compiler) for c in self.conditions) + ")"
+
+
+class AnyOf(All):
+    def render(self, compiler):
+        return "(" + " or ".join(c.render(compiler) for c in self.conditions) + ")"
+
+
+def has_any(literals, target=PART):
+    """target에 literals 중 하나라도 포함됨 (any(s in target for s in literals)와 동일)"""
+    return AnyOf(*(Has(literal, target) for literal in literals))
+
+
+# --- 값 ---
+VALUE = Expr("part.split(':', 1)[-1].strip()")   # "스펙명: 값"의 값 (첫 ':' 기준)
+LAST = Expr("part.split(':')[-1].strip()")       # 마지막 ':' 뒤의 값
+WHOLE = Expr("part")                             # 조각 전체
+
+
+class Const:
+    def __init__(self, value):
+        self.value = value
+
+    def render(self, compiler):
+        return repr(self.value)
+
+
+Y = Const('Y')
+
+
+class Group:
+    """직전 Search 매치의 그룹 값 (+ 후처리)"""
+
+    def __init__(self, index=1, suffix='', strip=False, rstrip=None, nospace=False):
+        self.index = index
+        self.suffix = suffix
+        self.strip = strip
+        self.rstrip = rstrip
+        self.nospace = nospace
+
+    def render(self, compiler):
+        expr = f"m.group({self.index})"
+        if self.nospace:
+            expr += ".replace(' ', '')"
+        if self.strip:
+            expr += ".strip()"
+        if self.rstrip is not None:
+            expr += f".rstrip({self.rstrip!r})"
+        if self.suffix:
+            expr += f" + {self.suffix!r}"
+        return expr
+
+
+class FromKey:
+    def __init__(self, key):
+        self.key = key
+
+    def render(self, compiler):
+        return f"specs[{self.key!r}]"
+
+
+# --- 동작 ---
+class Set:
+    """specs[key] = 값 (key가 튜플이면 같은 값을 순서대로 여러 키에 저장)"""
+
+    def __init__(self, keys, value):
+        self.keys = keys if isinstance(keys, tuple) else (keys,)
+        self.value = value
+
+    def emit(self, compiler, depth):
+        for key in self.keys:
+            compiler.emit(depth, f"specs[{key!r}] = {self.value.render(compiler)}")
+
+
+class Let:
+    """지역 변수에 값 저장 (이후 조건의 target으로 사용)"""
+
+    def __init__(self, variable, value):
+        self.variable = variable
+        self.value = value
+
+    def emit(self, compiler, depth):
+        compiler.emit(depth, f"{self.variable} = {self.value.render(compiler)}")
+
+
+class Delete:
+    def __init__(self, key):
+        self.key = key
+
+    def emit(self, compiler, depth):
+        compiler.emit(depth, f"del specs[{self.key!r}]")
+
+
+class Call:
+    """규칙으로 표현하기 어려운 추론 로직: hook(specs)"""
+
+    def __init__(self, hook):
+        self.hook = hook
+
+    def emit(self, compiler, depth):
+        compiler.emit(depth, f"{compiler.constant(self.hook, 'HOOK')}(specs)")
+
+
+class Rule:
+    """조건(when)이 참이면 동작들을 실행. when=None이면 Chain의 else 분기"""
+
+    def __init__(self, when, *then):
+        self.when = when
+        self.then = then
+
+
+class Chain:
+    """규칙들을 if/elif/else로 평가 (처음 참인 규칙 하나만 실행)"""
+
+    def __init__(self, *rules):
+        self.rules = rules
+
+    def emit(self, compiler, depth):
+        for index, rule in enumerate(self.rules):
+            if rule.when is None:
+                compiler.emit(depth, "else:")
+            else:
+                keyword = "if" if index == 0 else "elif"
+                compiler.emit(depth, f"{keyword} {rule.when.render(compiler)}:")
+            compiler.emit_block(rule.then, depth + 1)
+
+
+def when(condition, *then):
+    """단일 if 블록 (Chain(Rule(...)) 축약)"""
+    return Chain(Rule(condition, *then))
+
+
+class FirstPart:
+    """spec_parts 중 조건에 맞는 첫 조각에만 동작을 실행"""
+
+    def __init__(self, condition, *then):
+        self.condition = condition
+        self.then = then
+
+    def emit(self, compiler, depth):
+        compiler.emit(depth, "for part in spec_parts:")
+        compiler.emit(depth + 1, f"if {self.condition.render(compiler)}:")
+        compiler.emit_block(self.then, depth + 2)
+        compiler.emit(depth + 2, "break")
+
+
+# --- 2. 컴파일러 ---
+FULL_TEXT_WITH_NAME = 'name + " / " + spec_string'
+FULL_TEXT_JOINED = '" / ".join(spec_parts)'
+
+
+class SpecParser:
+    """카테고리 하나의 규칙 테이블"""
+
+    def __init__(self, function_name, doc, full_text, prelude=(), per_part=(), postlude=()):
+        self.function_name = function_name
+        self.doc = doc
+        self.full_text = full_text
+        self.prelude = prelude
+        self.per_part = per_part
+        self.postlude = postlude
+
+
+class _Compiler:
+    def __init__(self):
+        self.lines = []
+        self.namespace = {}
+        self._regex_names = {}
+
+    def emit(self, depth, line):
+        self.lines.append("    " * depth + line)
+
+    def emit_block(self, statements, depth):
+        if not statements:
+            self.emit(depth, "pass")
+        for statement in statements:
+            statement.emit(self, depth)
+
+    def constant(self, value, prefix):
+        name = f"_{prefix}{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def regex(self, pattern, flags):
+        key = (pattern, flags)
+        if key not in self._regex_names:
+            self._regex_names[key] = self.constant(re.compile(pattern, flags), 'RE')
+        return self._regex_names[key]
+
+
+def compile_spec_parser(parser):
+    """규칙 테이블을 파이썬 함수로 컴파일합니다. (생성된 코드는 함수의 source 속성에 보관)"""
+    compiler = _Compiler()
+    compiler.emit(0, f"def {parser.function_name}(name, spec_string):")
+    compiler.emit(1, "specs = {}")
+    compiler.emit(1, "spec_parts = [part.strip() for part in spec_string.split('/')]")
+    compiler.emit(1, f"full_text = {parser.full_text}")
+    for statement in parser.prelude:
+        statement.emit(compiler, 1)
+    compiler.emit(1, "for part in spec_parts:")
+    compiler.emit_block(parser.per_part, 2)
+    for statement in parser.postlude:
+        statement.emit(compiler, 1)
+    compiler.emit(1, "return specs")
+
+    source = "\n".join(compiler.lines) + "\n"
+    exec(compile(source, f"<spec_parser {parser.function_name}>", "exec"), compiler.namespace)
+    function = compiler.namespace[parser.function_name]
+    function.__doc__ = parser.doc
+    function.__module__ = __name__
+    function.source = source
+    return function
+
+
+# --- 3. 카테고리별 규칙 테이블 ---
+FT = FULL_TEXT
+
+
+def _manufacturer_from_name():
+    return when(Expr("name"), Set('manufacturer', Expr("name.split()[0]")))
+
+
+CPU_RULES = SpecParser(
+    'parse_cpu_specs',
+    "[수정] P+E코어, 클럭, 캐시, 벤치마크 등 상세 스펙을 지원하는 CPU 파서",
+    full_text=FULL_TEXT_WITH_NAME,
+    prelude=[
+        # 제조사 확정
+        Chain(
+            Rule(has_any(['인텔', '코어i', '울트라'], FT), Set('manufacturer', Const('인텔'))),
+            Rule(has_any(['AMD', '라이젠'], FT), Set('manufacturer', Const('AMD'))),
+        ),
+    ],
+    per_part=[
+        # "Key: Value" 및 단순 키워드 스펙
+        Chain(
+            Rule(Has('메모리 규격:'), Set('memory_spec', VALUE)),
+            Rule(Has('기본 클럭:'), Set('base_clock', VALUE)),
+            Rule(Has('최대 클럭:'), Set('max_clock', VALUE)),
+            Rule(Has('L2 캐시:'), Set('l2_cache', VALUE)),
+            Rule(Has('L3 캐시:'), Set('l3_cache', VALUE)),
+            Rule(Has('PBP-MTP:'), Set('power_consumption', VALUE)),  # 인텔 전력
+            Rule(Has('TDP:'), Set('power_consumption', VALUE)),  # AMD 전력
+            Rule(Has('기술 지원:'), Set('tech_support', VALUE)),
+            Rule(Has('쿨러:'), Set('cooler_included', VALUE)),
+            Rule(Has('시네벤치R23(싱글):'), Set('cinebench_r23_single', VALUE)),
+            Rule(Has('시네벤치R23(멀티):'), Set('cinebench_r23_multi', VALUE)),
+            Rule(Has('출시가:'), Set('launch_price', VALUE)),
+            Rule(All(Has('nm'), Missing('process_node')), Set('process_node', WHOLE)),  # 예: TSMC 3nm
+            Rule(All(Has('PCIe'), Missing('pcie_version')), Set('pcie_version', WHOLE)),
+            Rule(All(Has('MHz'), Missing('memory_clock_default')), Set('memory_clock_default', WHOLE)),
+            Rule(All(Has('그래픽'), Lacks('내장그래픽'), Missing('graphics_model')), Set('graphics_model', WHOLE)),
+        ),
+    ],
+    postlude=[
+        when(All(Missing('cores'), Search(r'([PE\d\+]+코어)', FT)), Set('cores', Group(1))),
+        when(All(Missing('threads'), Search(r'([\d\+]+)\s*스레드', FT)),
+             Set('threads', Group(1, nospace=True, suffix='스레드'))),
+        # 괄호 안의 소켓도 인식. 예: 인텔(소켓1851), AMD(소켓AM5), 소켓1700
+        when(All(Missing('socket'), Search(r'(소켓[\w\d\+]+)', FT)), Set('socket', Group(1))),
+        when(All(Missing('codename'),
+                 Search(r'\(([^)]*(?:레이크|릿지|리프레시|라파엘|버미어|피카소|세잔|시마다 픽|피닉스|Zen\d+)[^)]*)\)', FT)),
+             Set('codename', Group(1))),
+        # '세대' 또는 '(Zen5)' 같은 코드네임도 시리즈로 간주, 없으면 코드네임 사용
+        when(Missing('cpu_series'), Chain(
+            Rule(Search(r'(\d+세대|\(Zen\d+\))', FT), Set('cpu_series', Group(1))),
+            Rule(Present('codename'), Set('cpu_series', FromKey('codename'))),
+        )),
+        when(All(Missing('cpu_class'), Search(r'(코어\s?(?:울트라|i)\d+|라이젠\s?\d)', 'name', re.I)),
+             Set('cpu_class', Group(1, nospace=True))),
+        when(Missing('integrated_graphics'), Chain(
+            Rule(Has('내장그래픽', FT), Chain(
+                Rule(Has('미탑재', FT), Set('integrated_graphics', Const('미탑재'))),
+                Rule(Has('탑재', FT), Set('integrated_graphics', Const('탑재'))),
+            )),
+            Rule(Present('graphics_model'), Set('integrated_graphics', Const('탑재'))),
+        )),
+    ],
+)
+
+
+COOLER_RULES = SpecParser(
+    'parse_cooler_specs',
+    "쿨러 파싱 로직 개선 (CPU 쿨러 / 시스템 쿨러 / 상세스펙 최종본)",
+    full_text=FULL_TEXT_WITH_NAME,
+    prelude=[
+        _manufacturer_from_name(),
+        # product_type: 명시적 항목 → 이름/전체 텍스트 → 스펙 내용으로 추론
+        Chain(
+            Rule(Has('CPU 쿨러', 'spec_parts'), Set('product_type', Const('CPU 쿨러'))),
+            Rule(has_any(['시스템 쿨러', '시스템 팬'], 'spec_parts'), Set('product_type', Const('시스템 쿨러'))),
+            Rule(None, Chain(
+                Rule(Has('CPU 쿨러', FT), Set('product_type', Const('CPU 쿨러'))),
+                Rule(AnyOf(Has('시스템 쿨러', FT), Has('시스템 팬', FT)),
+                     when(Lacks('시스템 팬 커넥터', FT), Set('product_type', Const('시스템 쿨러')))),
+                Rule(None, Chain(
+                    Rule(has_any(['공랭', '수랭', '타워형', '쿨러 높이', '라디에이터'], 'spec_string'),
+                         Set('product_type', Const('CPU 쿨러'))),
+                    Rule(AnyOf(Has(' fan', 'name.lower()'), Has(' 팬', 'name')), Set('product_type', Const('시스템 쿨러'))),
+                    Rule(None, Set('product_type', Const('기타 쿨러'))),  # M.2 쿨러 등
+                )),
+            )),
+        ),
+    ],
+    per_part=[
+        # [A] 공통 스펙 (CPU 쿨러 & 시스템 쿨러)
+        Chain(
+            Rule(Has('팬 크기:'), when(Search(r'(\d+mm)'), Set('fan_size', Group(1)))),
+            Rule(AnyOf(Has('팬 커넥터'),
+                       All(Has('핀'), Expr("not part.split(':', 1)[-1].strip().startswith('12V')"), Lacks('16핀'))),
+                 Set('fan_connector', VALUE)),
+            Rule(Has('RPM'), Set('max_fan_speed', VALUE)),
+            Rule(Has('CFM'), Set('max_airflow', VALUE)),
+            Rule(Has('mmH2O'), Set('static_pressure', VALUE)),
+            Rule(Has('dBA'), Set('max_fan_noise', VALUE)),
+            Rule(AnyOf(Has('A/S기간'), Has('A/S 기간')), Set('warranty_period', VALUE)),
+            Rule(Has('무게:'), Set('weight', VALUE)),
+            Rule(Search(r'^\d+T$'), Set('fan_thickness', WHOLE)),  # "25T"
+            Rule(Has('베어링:'), Set('fan_bearing', VALUE)),
+            Rule(Has('PWM 지원'), Set('pwm_support', Y)),
+            Rule(Has('LED'), Set('led_type', VALUE)),
+        ),
+        # [B] 시스템 쿨러 전용 스펙
+        when(Equals('product_type', '시스템 쿨러'), Chain(
+            Rule(Has('작동전압:'), Set('operating_voltage', VALUE)),
+            Rule(Has('데이지체인'), Set('daisy_chain', Y)),
+            Rule(AnyOf(Has('제로팬'), Has('0-dB')), Set('zero_fan', Y)),
+            Rule(Search(r'^\d+개$'), Set('fan_count', WHOLE)),
+        )),
+        # [C] CPU 쿨러 전용 스펙
+        when(Equals('product_type', 'CPU 쿨러'), Chain(
+            Rule(Has('공랭'), Set('cooling_method', Const('공랭'))),
+            Rule(Has('수랭'), Set('cooling_method', Const('수랭'))),
+            Rule(Has('듀얼타워형'), Set('air_cooling_form', Const('듀얼타워형'))),
+            Rule(Has('싱글타워형'), Set('air_cooling_form', Const('싱글타워형'))),
+            Rule(Has('슬림형'), Set('air_cooling_form', Const('슬림형'))),
+            Rule(Has('일반형'), Set('air_cooling_form', Const('일반형'))),
+            Rule(Has('서버용'), Set('air_cooling_form', Const('서버용'))),
+            Rule(AnyOf(Has('라디에이터'), Has('열')),
+                 when(Search(r'(1열|2열|3열|4열)'), Set('radiator_length', Group(1)))),
+            Rule(All(Has('TDP'), AnyOf(Has('W'), Has('w'))), Set('tdp', VALUE)),
+            Rule(Has('인텔 소켓:'), Set('intel_socket', VALUE)),
+            Rule(Has('AMD 소켓:'), Set('amd_socket', VALUE)),
+            Rule(Has('가로:'), Set('width', VALUE)),
+            Rule(Has('세로:'), Set('depth', VALUE)),
+            Rule(All(Has('높이:'), Lacks('쿨러 높이')), Set('height', VALUE)),
+            Rule(Has('쿨러 높이:'), Set('cooler_height', VALUE)),
+            Rule(Search(r'팬 개수: \d+개'), Set('fan_count', VALUE)),
+        )),
+    ],
+    postlude=[
+        when(All(Equals('product_type', '시스템 쿨러'), Missing('fan_count'),
+                 Search(r'(\d)(?:IN1|PACK)', 'name', re.I)),
+             Set('fan_count', Group(1, suffix='개'))),
+        when(All(Equals('cooling_method', '수랭', negate=True), Present('radiator_length')),
+             Delete('radiator_length')),
+    ],
+)
+
+
+def _infer_memory_type_from_clock(specs):
+    """Z790/B760/H770처럼 DDR4/DDR5 혼용 칩셋은 메모리 클럭으로 추론"""
+    memory_clock_str = str(specs.get('memory_clock', ''))
+    if memory_clock_str:
+        clock_num = int(''.join(filter(str.isdigit, memory_clock_str))) if any(c.isdigit() for c in memory_clock_str) else 0
+        # DDR5는 일반적으로 4800MHz 이상, DDR4는 2133~3200MHz
+        if clock_num >= 4800:
+            specs['memory_type'] = 'DDR5'
+        elif 2000 <= clock_num < 4800:
+            specs['memory_type'] = 'DDR4'
+
+
+# (칩셋 목록, 값) - 위에서부터 처음 맞는 항목 사용
+CHIPSET_SOCKETS = [
+    (['B850', 'X870', 'A620', 'B650', 'X670'], 'AM5'),
+    (['B550', 'X570', 'A520'], 'AM4'),
+    (['Z890', 'B860', 'H810'], 'LGA1851'),
+    (['Z790', 'B760', 'H770', 'B660'], 'LGA1700'),
+    (['Z690', 'H670'], 'LGA1700'),
+]
+NAME_SOCKETS = [
+    (['B850', 'X870', 'B650', 'X670', 'A620'], 'AM5'),
+    (['B550', 'X570', 'A520'], 'AM4'),
+    (['Z890', 'B860', 'H810'], 'LGA1851'),
+    (['Z790', 'B760', 'H770'], 'LGA1700'),
+    (['Z690', 'B660', 'H670'], 'LGA1700'),
+]
+CHIPSET_MEMORY_TYPES = [
+    (['B850', 'X870', 'B650', 'X670', 'A620'], 'DDR5'),  # AM5는 DDR5 전용
+    (['B550', 'X570', 'A520', 'B450', 'X470'], 'DDR4'),  # AM4는 DDR4 전용
+    (['Z890', 'B860', 'H810'], 'DDR5'),
+]
+NAME_MEMORY_TYPES = [
+    (['B850', 'X870', 'B650', 'X670', 'A620'], 'DDR5'),
+    (['B550', 'X570', 'A520', 'B450'], 'DDR4'),
+    (['Z890', 'B860', 'H810'], 'DDR5'),
+]
+
+
+def _lookup_rules(table, target, keys):
+    return [Rule(has_any(chips, target), Set(keys, Const(value))) for chips, value in table]
+
+
+MOTHERBOARD_RULES = SpecParser(
+    'parse_motherboard_specs',
+    "메인보드 파싱 로직 개선 (사용자 요청 스펙 모두 반영)",
+    full_text=FULL_TEXT_JOINED,
+    prelude=[_manufacturer_from_name()],
+    per_part=[
+        Chain(
+            Rule(All(Has('소켓'), Has('CPU 소켓')),
+                 Set(('socket', 'cpu_socket'), Expr("part.replace('CPU 소켓:','').strip()"))),
+            Rule(Search(r'^[A-Z]\d{3}[A-Z]*$'), Set('chipset', WHOLE)),
+            Rule(AnyOf(Has('ATX'), Has('ITX')), Set(('form_factor', 'board_form_factor'), WHOLE)),
+            Rule(Has('DDR'), Set('memory_spec', WHOLE), Chain(
+                Rule(Has('DDR5'), Set('memory_type', Const('DDR5'))),
+                Rule(Has('DDR4'), Set('memory_type', Const('DDR4'))),
+                Rule(Has('DDR3'), Set('memory_type', Const('DDR3'))),
+            )),
+            Rule(AnyOf(Has('VGA 연결'), All(Has('PCIe'), Missing('vga_connection'))),
+                 Set('vga_connection', WHOLE),
+                 when(Has('VGA 연결'), Set('vga_interface', WHOLE))),
+            Rule(Has('메모리 슬롯'), Set('memory_slots', WHOLE)),
+            Rule(Has('M.2:'), Set('m2_slots', LAST)),
+            Rule(Has('SATA3:'), Set('sata3_ports', LAST)),
+            Rule(AnyOf(Has('ch('), Has('.1ch')), Set('audio_channels', WHOLE)),
+            Rule(AnyOf(Has('무선랜'), Has('Wi-Fi')), Set('wireless_lan', Y)),
+            Rule(Has('블루투스'), Set('bluetooth', Y)),
+            Rule(All(Has('MHz'), Missing('memory_clock')), Set('memory_clock', WHOLE)),
+        ),
+    ],
+    postlude=[
+        # 전원부
+        when(Search(r'전원부:\s*([\d\+\s]+페이즈)', FT), Set(('power_phases', 'power_phase'), Group(1))),
+        # 메모리
+        when(Search(r'(\d+)MHz\s*\((PC\d-[\d]+)\)', FT), Set('memory_clock', Group(1, suffix='MHz'))),
+        when(Search(r'메모리 용량:\s*(최대 [\d,]+GB)', FT),
+             Set(('memory_capacity_max', 'max_memory_capacity'), Group(1))),
+        when(Has('XMP', FT), Set(('memory_profile_xmp', 'xmp'), Y)),
+        when(Has('EXPO', FT), Set(('memory_profile_expo', 'expo'), Y)),
+        # 확장슬롯
+        when(Search(r'PCIe버전:\s*([\w\d\.,\s]+)', FT), Set('pcie_versions', Group(1, strip=True, rstrip=','))),
+        when(Search(r'PCIex16:\s*(\d+개)', FT), Set('pciex16_slots', Group(1))),
+        when(Search(r'PCIex1:\s*([\d+]+개)', FT), Set('pciex1_slots', Group(1))),
+        # 저장장치
+        when(Search(r'M.2 연결:\s*([\w\d\.,\s]+)', FT, requires=' 연결:'),
+             Set('m2_interface', Group(1, strip=True, rstrip=','))),
+        # 후면단자 (항목별 존재 여부)
+        when(Search(r'후면단자:\s*([^\/]+(?:\s*\/[^\/]+)*)', FT),
+             Let('rear_io_text', Group(1)),
+             *[when(Has(literal, 'rear_io_text'), Set(key, Y)) for literal, key in [
+                 ('HDMI', 'rear_io_hdmi'), ('DP', 'rear_io_dp'), ('USB 3', 'rear_io_usb3'),
+                 ('USB 2.0', 'rear_io_usb2'), ('RJ-45', 'rear_io_rj45'), ('오디오잭', 'rear_io_audio'),
+                 ('PS/2', 'rear_io_ps2'), ('BIOS플래시백', 'rear_io_bios_flashback'),
+             ]]),
+        when(Search(r'USB A타입:\s*(\d+개)', FT), Set('rear_io_usb_a', Group(1))),
+        when(Search(r'USB C타입:\s*(\d+개)', FT), Set('rear_io_usb_c', Group(1))),
+        # 랜/오디오
+        when(Search(r'유선랜 칩셋:\s*([\w\s]+)', FT), Set('lan_chipset', Group(1, strip=True))),
+        when(Search(r'([\d\.]+)Gbps', FT, requires='Gbps'), Set('lan_speed', Group(1, suffix='Gbps'))),
+        when(Search(r'RJ-45:\s*(\d+개)', FT), Set('rj45_ports', Group(1))),
+        when(Search(r'오디오 칩셋:\s*([\w\s]+)', FT), Set('audio_chipset', Group(1, strip=True))),
+        # 내부 I/O
+        when(Has('USB3.0 헤더', FT), Set('internal_io_usb3', Y)),
+        when(Has('USB2.0 헤더', FT), Set('internal_io_usb2', Y)),
+        when(Has('USB3.0 Type C 헤더', FT), Set('internal_io_usb_c', Y)),
+        when(Has('RGB 12V 4핀 헤더', FT), Set('internal_io_rgb_12v', Y)),
+        when(Has('ARGB 5V 3핀 헤더', FT), Set('internal_io_argb_5v', Y)),
+        when(Search(r'시스템팬 4핀:\s*(\d+개)', FT), Set('internal_io_sys_fan', Group(1))),
+        when(Has('TPM 헤더', FT), Set('internal_io_tpm', Y)),
+        when(Has('프론트오디오AAFP 헤더', FT), Set('internal_io_audio', Y)),
+        # 특징
+        when(Has('전원부 방열판', FT), Set('feature_vr_heatsink', Y)),
+        when(Has('M.2 히트싱크', FT), Set('feature_m2_heatsink', Y)),
+        when(Has('UEFI', FT), Set('feature_uefi', Y)),
+        when(Search(r'(\d{2}년 \d{1,2}월부로.*)', FT, requires='월부로'), Set('product_note', Group(1))),
+        # 소켓/메모리 타입 추론 (정보가 없으면 칩셋 → 제품명 순서로)
+        Let('chipset', Expr("specs.get('chipset', '')")),
+        Let('product_name_upper', Expr("name.upper() if name else ''")),
+        when(Empty('socket'),
+             when(Expr('chipset'), Chain(*_lookup_rules(CHIPSET_SOCKETS, 'chipset', ('socket', 'cpu_socket')))),
+             when(All(Empty('socket'), Expr('product_name_upper')),
+                  Chain(*_lookup_rules(NAME_SOCKETS, 'product_name_upper', ('socket', 'cpu_socket'))))),
+        when(Empty('memory_type'),
+             when(Expr('chipset'), Chain(
+                 *_lookup_rules(CHIPSET_MEMORY_TYPES, 'chipset', 'memory_type'),
+                 Rule(has_any(['Z790', 'B760', 'H770'], 'chipset'), Call(_infer_memory_type_from_clock)),
+             )),
+             when(All(Empty('memory_type'), Expr('product_name_upper')),
+                  Chain(*_lookup_rules(NAME_MEMORY_TYPES, 'product_name_upper', 'memory_type')))),
+    ],
+)
+
+
+RAM_RULES = SpecParser(
+    'parse_ram_specs',
+    "RAM 파싱 로직 개선 (사용자 요청 스펙 모두 반영)",
+    full_text=FULL_TEXT_JOINED,
+    prelude=[_manufacturer_from_name()],
+    per_part=[
+        Chain(
+            Rule(AnyOf(Has('데스크탑용'), Has('노트북용')), Set('device_type', WHOLE)),
+            Rule(Search(r'^DDR\d+$', anchored=True), Set('product_class', WHOLE)),
+            Rule(All(Search(r'^\d+GB$|^\d+TB$'), Missing('capacity')), Set('capacity', WHOLE)),
+            # 클럭
+            Rule(Search(r'(\d+MHz)\s*\((PC\d-[\d]+)\)', requires='MHz'),
+                 Set('clock_speed', Group(1)), Set('pc_clock_speed', Group(2))),
+            Rule(All(Has('MHz'), Missing('clock_speed')), Set('clock_speed', WHOLE)),
+            Rule(Has('램타이밍:'), Set('ram_timing', LAST)),
+            # 전압
+            Rule(Search(r'([\d\.]+)V$', requires='V'), Set('voltage', Group(1, suffix='V'))),
+            Rule(Has('램개수:'), Set('ram_count', LAST)),
+            # LED
+            Rule(Has('LED 라이트'), Set('led_light', Y)),
+            Rule(Has('LED색상:'), Set('led_color', LAST)),
+            # 프로파일
+            Rule(Has('XMP'), Set('memory_profile_xmp', Y)),
+            Rule(Has('EXPO'), Set('memory_profile_expo', Y)),
+            Rule(Has('온다이ECC'), Set('on_die_ecc', Y)),
+            # 방열판
+            Rule(Has('히트싱크:'), Set('heatsink_presence', LAST)),
+            Rule(Has('방열판 색상:'), Set('heatsink_color', LAST)),
+            Rule(All(Has('방열판'), Missing('heatsink_presence')), Set('heatsink_presence', Y)),
+            Rule(Has('높이:'), Set('height', LAST)),
+            Rule(Has('모듈제조사:'), Set('module_manufacturer', LAST)),
+        ),
+    ],
+    postlude=[
+        when(Search(r'LED 시스템:\s*([^\/]+)', FT), Set('led_system', Group(1, strip=True))),
+    ],
+)
+
+
+VGA_RULES = SpecParser(
+    'parse_vga_specs',
+    "그래픽카드 파싱 로직 개선 (사용자 요청 스펙 모두 반영)",
+    full_text=FULL_TEXT_JOINED,
+    prelude=[_manufacturer_from_name()],
+    per_part=[
+        Chain(
+            Rule(AnyOf(Has('RTX'), Has('GTX')), Set('nvidia_chipset', WHOLE)),
+            Rule(Has('RX'), Set('amd_chipset', WHOLE)),
+            Rule(Has('Arc'), Set('intel_chipset', WHOLE)),
+            Rule(All(Has('PCIe'), Missing('gpu_interface')), Set('gpu_interface', WHOLE)),
+            Rule(All(Has('GDDR'), Missing('gpu_memory_type')), Set('gpu_memory_type', WHOLE)),
+            Rule(All(Has('GB'), Lacks('TB'), Missing('gpu_memory_capacity')), Set('gpu_memory_capacity', WHOLE)),
+            Rule(AnyOf(Has('팬 개수'), All(Has('팬'), Expr("len(part) < 4"))), Set('fan_count', WHOLE)),
+        ),
+    ],
+    postlude=[
+        # 전력 및 크기
+        when(Search(r'정격파워\s*([\w\d\s]+이상)', FT), Set('recommended_psu', Group(1))),
+        when(Search(r'전원 포트:\s*([^\/]+)', FT), Set('power_connector', Group(1, strip=True))),
+        when(Search(r'가로\(길이\):\s*([\d\.]+mm)', FT), Set('gpu_length', Group(1))),
+        when(Search(r'두께:\s*([\d\.]+mm)', FT), Set('gpu_thickness', Group(1))),
+        when(Search(r'사용전력:\s*([\w\d\s]+)', FT), Set('power_consumption', Group(1, strip=True))),
+        # 클럭 및 프로세서
+        when(Search(r'베이스클럭:\s*(\d+MHz)', FT), Set('base_clock', Group(1))),
+        when(Search(r'부스트클럭:\s*(\d+MHz)', FT), Set('boost_clock', Group(1))),
+        when(Search(r'OC클럭:\s*(\d+MHz)', FT), Set('oc_clock', Group(1))),
+        when(Search(r'스트림 프로세서:\s*([\d,]+)개', FT), Set('stream_processors', Group(1, suffix='개'))),
+        # 출력 및 지원
+        when(Search(r'출력단자:\s*([^\/]+)', FT), Set('output_ports', Group(1, strip=True))),
+        when(Has('8K', FT), Set('support_8k', Y)),
+        when(Has('HDR', FT), Set('support_hdr', Y)),
+        when(Has('HDCP 2.3', FT), Set('support_hdcp', Const('2.3'))),
+        when(Search(r'A/S\s*([\d년]+)', FT), Set('warranty_period', Group(1))),
+        # 특징
+        when(AnyOf(Has('제로팬', FT), Has('0-dB', FT)), Set('zero_fan', Y)),
+        when(Has('백플레이트', FT), Set('has_backplate', Y)),
+        when(Has('DrMOS', FT), Set('feature_drmos', Y)),
+        when(Has('LED 라이트', FT), Set('led_light', Y)),
+        when(Search(r'MYSTIC LIGHT', FT), Set('led_system', Group(0))),
+        when(Search(r'구성품:\s*([^\/]+)', FT), Set('accessories', Group(1, strip=True))),
+    ],
+)
+
+
+SSD_RULES = SpecParser(
+    'parse_ssd_specs',
+    "SSD 파싱 로직 개선 (사용자 요청 스펙 모두 반영)",
+    full_text=FULL_TEXT_JOINED,
+    prelude=[_manufacturer_from_name()],
+    per_part=[
+        Chain(
+            Rule(AnyOf(Has('M.2'), Has('2.5인치'), All(Has('SATA'), Missing('form_factor'))), Set('form_factor', WHOLE)),
+            Rule(AnyOf(Has('PCIe'), All(Has('SATA'), Missing('ssd_interface'))), Set('ssd_interface', WHOLE)),
+            Rule(All(AnyOf(Has('TLC'), Has('QLC'), Has('MLC')), Missing('memory_type')), Set('memory_type', WHOLE)),
+            Rule(AnyOf(Has('DRAM 탑재'), Has('DRAM 미탑재')), Set('ram_mounted', WHOLE)),
+            Rule(All(Has('DDR'), Has('GB')), Set('ram_spec', WHOLE)),
+            Rule(Has('컨트롤러:'), Set('controller', LAST)),
+            # 성능
+            Rule(Has('순차읽기:'), Set('sequential_read', LAST)),
+            Rule(Has('순차쓰기:'), Set('sequential_write', LAST)),
+            Rule(Has('읽기IOPS:'), Set('read_iops', LAST)),
+            Rule(Has('쓰기IOPS:'), Set('write_iops', LAST)),
+            # 지원기능
+            Rule(Has('TRIM'), Set('support_trim', Y)),
+            Rule(Has('GC'), Set('support_gc', Y)),
+            Rule(Has('SLC캐싱'), Set('support_slc_caching', Y)),
+            Rule(Has('S.M.A.R.T'), Set('support_smart', Y)),
+            Rule(Has('DEVSLP'), Set('support_devslp', Y)),
+            Rule(Has('AES 암호화'), Set('support_aes', Y)),
+            Rule(Has('전용 S/W'), Set('support_sw', Y)),
+            # 환경특성
+            Rule(Has('MTBF:'), Set('mtbf', LAST)),
+            Rule(Has('TBW:'), Set('tbw', LAST)),
+            Rule(Has('PS5 호환'), Set('ps5_compatible', Y)),
+            Rule(Has('A/S기간:'), Set('warranty_period', LAST)),
+            Rule(All(Has('방열판'), Missing('heatsink_presence')), Set('heatsink_presence', WHOLE)),
+            Rule(Has('두께:'), Set('ssd_thickness', LAST)),
+            Rule(Search(r'(\d+g)$', requires='g'), Set('ssd_weight', Group(1))),
+        ),
+    ],
+    postlude=[
+        when(All(Missing('warranty_period'), Search(r'A/S\s*([\w\d년\s,]+)', FT)),
+             Set('warranty_period', Group(1, strip=True))),
+        # 'TB'/'GB'가 TBW와 겹칠 수 있으므로 마지막에 체크
+        when(Missing('capacity'), FirstPart(
+            All(AnyOf(Has('TB'), Has('GB')), Lacks('TBW'), Lacks('DDR'), Missing('capacity')),
+            Set('capacity', WHOLE),
+        )),
+    ],
+)
+
+
+HDD_RULES = SpecParser(
+    'parse_hdd_specs',
+    "HDD 파싱 로직 개선 (사용자 요청 스펙 모두 반영)",
+    full_text=FULL_TEXT_JOINED,
+    prelude=[_manufacturer_from_name()],
+    per_part=[
+        Chain(
+            Rule(Has('HDD ('), Set('product_class', WHOLE)),
+            Rule(AnyOf(Has('cm'), Has('인치')), Set('form_factor', WHOLE)),
+            Rule(All(AnyOf(Has('TB'), Has('GB')), Missing('disk_capacity')), Set('disk_capacity', WHOLE)),
+            Rule(Has('SATA'), Set('hdd_interface', WHOLE)),
+            Rule(Has('RPM'), Set('rotation_speed', WHOLE)),
+            Rule(AnyOf(Has('메모리'), Has('버퍼')), Set('buffer_capacity', WHOLE)),
+            Rule(Has('MB/s'), Set('transfer_rate', WHOLE)),
+            Rule(Has('기록방식:'), Set('recording_method', LAST)),
+            Rule(Has('두께:'), Set('hdd_thickness', LAST)),
+            Rule(Has('헬륨충전'), Set('helium_filled', Y)),
+            Rule(Has('RV센서'), Set('rv_sensor', Y)),
+            Rule(Has('사용보증:'), Set('mtbf', LAST)),
+            Rule(All(Has('소음'), Has('dB')), Set('noise_level', LAST)),
+            Rule(Has('A/S 정보:'), Set('hdd_warranty', LAST)),
+        ),
+    ],
+    postlude=[
+        when(All(Missing('hdd_warranty'), Search(r'A/S 정보:\s*([^\/]+)', FT)),
+             Set('hdd_warranty', Group(1, strip=True))),
+    ],
+)
+
+
+CASE_RULES = SpecParser(
+    'parse_case_specs',
+    "케이스 파싱 로직 개선 (사용자 요청 스펙 모두 반영)",
+    full_text=FULL_TEXT_JOINED,
+    prelude=[_manufacturer_from_name()],
+    per_part=[
+        Chain(
+            Rule(All(Has('케이스'), Lacks('('), Missing('product_class')), Set('product_class', WHOLE)),
+            Rule(Has('지원보드규격:'), Set('supported_board', LAST)),
+            Rule(All(Has('VGA'), AnyOf(Has('mm'), Has('길이')), Missing('vga_length')), Set('vga_length', LAST)),
+            Rule(All(Has('CPU'), AnyOf(Has('mm'), Has('높이')), Missing('cpu_cooler_height_limit')),
+                 Set('cpu_cooler_height_limit', LAST)),
+            Rule(Has('타워'), Set('case_size', WHOLE)),
+            Rule(AnyOf(Has('파워미포함'), Has('파워포함')), Set('psu_included', WHOLE)),
+            Rule(Has('측면:'), Set('panel_side', LAST)),
+            Rule(Has('파워 장착 길이:'), Set('psu_length', LAST)),
+            Rule(Has('파워 위치:'), Set('psu_location', LAST)),
+            Rule(Has('LED 색상:'), Set('led_color', LAST)),
+        ),
+    ],
+    postlude=[
+        # 패널
+        when(Search(r'전면 패널 타입:\s*([^\/]+)', FT), Set('panel_front', Group(1, strip=True))),
+        when(Search(r'측면 패널 타입:\s*([^\/]+)', FT), Set('panel_side', Group(1, strip=True))),
+        # 쿨러/튜닝
+        when(Search(r'쿨링팬:\s*(총[\d]+개)', FT), Set('cooling_fan_total', Group(1))),
+        when(Search(r'LED팬:\s*([\d]+개)', FT), Set('cooling_fan_led', Group(1))),
+        when(Search(r'후면:\s*([^\/]+)', FT), Set('cooling_fan_rear', Group(1, strip=True))),
+        # 크기
+        when(Search(r'너비\(W\):\s*([\d\.]+mm)', FT), Set('case_width', Group(1))),
+        when(Search(r'깊이\(D\):\s*([\d\.]+mm)', FT), Set('case_depth', Group(1))),
+        when(Search(r'높이\(H\):\s*([\d\.]+mm)', FT), Set('case_height', Group(1))),
+    ],
+)
+
+
+POWER_RULES = SpecParser(
+    'parse_power_specs',
+    "파워 파싱 로직 개선 (사용자 요청 스펙 모두 반영)",
+    full_text=FULL_TEXT_JOINED,
+    prelude=[_manufacturer_from_name()],
+    per_part=[
+        Chain(
+            Rule(All(Has('파워'), Has('ATX'), Missing('product_class')), Set('product_class', WHOLE)),
+            Rule(All(Has('W'), Missing('rated_output')), Set('rated_output', WHOLE)),
+            Rule(Has('80 PLUS'), Set('eighty_plus_cert', WHOLE)),
+            Rule(Has('케이블연결:'), Set('cable_connection', LAST)),
+            Rule(Has('ETA인증:'), Set('eta_cert', LAST)),
+            Rule(Has('LAMBDA인증:'), Set('lambda_cert', LAST)),
+            Rule(All(Has('+12V'), Has('레일')), Set('plus_12v_rail', WHOLE)),
+            Rule(Has('+12V 가용률:'), Set('plus_12v_availability', LAST)),
+            Rule(Has('PFC'), Set('pfc_circuit', WHOLE)),
+            Rule(Has('PF(역률):'), Set('pf_rate', LAST)),
+            Rule(Has('mm 팬'), Set('fan_size', WHOLE)),
+            Rule(Has('깊이:'), Set('psu_depth', LAST)),
+            Rule(AnyOf(Has('무상'), All(Has('A/S'), Missing('warranty_period'))), Set('warranty_period', WHOLE)),
+            # 커넥터
+            Rule(Has('메인전원:'), Set('main_connector', LAST)),
+            Rule(Has('보조전원:'), Set('aux_connector', LAST)),
+            Rule(Has('PCIe 16핀'), Set('pcie_16pin', LAST)),
+            Rule(Has('PCIe 8핀'), Set('pcie_8pin', LAST)),
+            Rule(Has('SATA:'), Set('sata_connectors', LAST)),
+            Rule(Has('IDE 4핀:'), Set('ide_4pin_connectors', LAST)),
+            # 부가기능
+            Rule(Has('대기전력 1W 미만'), Set('feature_standby_power', Y)),
+            Rule(Has('플랫케이블'), Set('feature_flat_cable', Y)),
+        ),
+    ],
+    postlude=[
+        when(Search(r'(\d{2}년 \d{1,2}월.*)', FT, requires='년 '), Set('product_note', Group(1))),
+    ],
+)
+
+
+# --- 4. 컴파일 (모듈 로드 시 1회) ---
+parse_cpu_specs = compile_spec_parser(CPU_RULES)
+parse_cooler_specs = compile_spec_parser(COOLER_RULES)
+parse_motherboard_specs = compile_spec_parser(MOTHERBOARD_RULES)
+parse_ram_specs = compile_spec_parser(RAM_RULES)
+parse_vga_specs = compile_spec_parser(VGA_RULES)
+parse_ssd_specs = compile_spec_parser(SSD_RULES)
+parse_hdd_specs = compile_spec_parser(HDD_RULES)
+parse_case_specs = compile_spec_parser(CASE_RULES)
+parse_power_specs = compile_spec_parser(POWER_RULES)
+
+PARSER_MAP = {
+    'CPU': parse_cpu_specs,
+    '쿨러': parse_cooler_specs,
+    '메인보드': parse_motherboard_specs,
+    'RAM': parse_ram_specs,
+    '그래픽카드': parse_vga_specs,
+    'SSD': parse_ssd_specs,
+    'HDD': parse_hdd_specs,
+    '케이스': parse_case_specs,
+    '파워': parse_power_specs,
+}
+
+
+_PACKAGE_COUNT_PATTERN = re.compile(r'x(\d+)')
+_TOTAL_CAPACITY_PATTERN = re.compile(r'^(\d+GB)')
+
+
+def add_capacity_specs(detailed_specs, category_name, capacity):
+    """
+    가격 옵션의 용량 정보를 스펙에 추가한 사본을 반환합니다. (RAM, SSD, HDD)
+
+    크롤링 저장과 재파싱(reparse_specs.py)이 같은 결과를 내도록 두 곳 모두 이 함수를 사용합니다.
+    """
+    specs = detailed_specs.copy()
+    if capacity:
+        if category_name == 'RAM':
+            # RAM의 경우 capacity에 패키지 정보 포함 (예: "32GB (16GB x2)")
+            specs['capacity'] = capacity
+            # 패키지 개수 추출
+            package_match = _PACKAGE_COUNT_PATTERN.search(capacity)
+            if package_match:
+                specs['ram_count'] = f"{package_match.group(1)}개"
+            # 총 용량 추출
+            total_capacity_match = _TOTAL_CAPACITY_PATTERN.search(capacity)
+            if total_capacity_match:
+                specs['total_capacity'] = total_capacity_match.group(1)
+        elif category_name in ['SSD', 'HDD']:
+            # SSD/HDD의 경우 storage_capacity에 용량 정보 저장 (예: "1TB", "2TB", "4TB")
+            specs['storage_capacity'] = capacity
+    return specs
+
+
+def build_part_specs(category_name, name, spec_string, capacity=None):
+    """원본 입력(카테고리, 상품명, 스펙 문자열, 용량)으로 part_spec.specs에 저장할 딕셔너리를 만듭니다."""
+    parser_func = PARSER_MAP.get(category_name)
+    detailed_specs = parser_func(name, spec_string) if parser_func else {}
+    return add_capacity_specs(detailed_specs, category_name, capacity)
+
+
+def extract_capacity_from_option(option_text, category_name):
+    """
+    가격 옵션 텍스트에서 용량 정보 추출
+    
+    Args:
+        option_text: 가격 옵션 텍스트 (예: "4TB 629,940원", "32GB(16Gx2) 807,970원", "1위 2TB 329,390원")
+        category_name: 카테고리 이름 ('RAM', 'SSD', 'HDD')
+    
+    Returns:
+        용량 문자열 (예: "4TB", "32GB (16GB x2)", "2TB") 또는 None
+    """
+    if not option_text:
+        return None
+    
+    # RAM의 경우: "32GB(16Gx2)", "48GB(24Gx2)", "16GB x2", "32GB (16GB x2)", "J 패키지" 등
+    if category_name == 'RAM':
+        # 패턴 1: "32GB(16Gx2)" 또는 "48GB(24Gx2)" - 괄호 안에 축약형
+        pattern1 = re.search(r'(\d+GB)\((\d+)Gx(\d+)\)', option_text, re.IGNORECASE)
+        if pattern1:
+            total_capacity = pattern1.group(1)  # 예: "32GB"
+            single_capacity_num = int(pattern1.group(2))  # 예: 16
+            count = int(pattern1.group(3))  # 예: 2
+            single_capacity = f"{single_capacity_num}GB"
+            return f"{total_capacity} ({single_capacity} x{count})"
+        
+        # 패턴 2: "32GB(16GBx2)" - 괄호 안에 GB 포함
+        pattern2 = re.search(r'(\d+GB)\((\d+GB)x(\d+)\)', option_text, re.IGNORECASE)
+        if pattern2:
+            total_capacity = pattern2.group(1)  # 예: "32GB"
+            single_capacity = pattern2.group(2)  # 예: "16GB"
+            count = int(pattern2.group(3))  # 예: 2
+            return f"{total_capacity} ({single_capacity} x{count})"
+        
+        # 패턴 3: "16GB x2" 또는 "16GB x 2" - 공백 포함
+        pattern3 = re.search(r'(\d+GB)\s*x\s*(\d+)', option_text, re.IGNORECASE)
+        if pattern3:
+            single_capacity = pattern3.group(1)  # 예: "16GB"
+            count = int(pattern3.group(2))  # 예: 2
+            # 총 용량 계산
+            single_capacity_num = int(single_capacity.replace('GB', ''))
+            total_capacity_num = single_capacity_num * count
+            return f"{total_capacity_num}GB ({single_capacity} x{count})"
+        
+        # 패턴 4: "32GB (16GB x2)" - 괄호와 공백 포함
+        pattern4 = re.search(r'(\d+GB)\s*\((\d+GB)\s*x\s*(\d+)\)', option_text, re.IGNORECASE)
+        if pattern4:
+            total_capacity = pattern4.group(1)  # 예: "32GB"
+            single_capacity = pattern4.group(2)  # 예: "16GB"
+            count = int(pattern4.group(3))  # 예: 2
+            return f"{total_capacity} ({single_capacity} x{count})"
+        
+        # 패턴 5: "J 패키지" 또는 "K 패키지" 등 - 패키지 정보만 있는 경우
+        # 이 경우 용량 정보는 상품명에서 추출해야 하므로, 패키지 정보만 반환
+        package_match = re.search(r'([JK])\s*패키지', option_text, re.IGNORECASE)
+        if package_match:
+            # J 패키지 = 2개, K 패키지 = 4개 (일반적인 규칙)
+            package_type = package_match.group(1).upper()
+            package_count = 2 if package_type == 'J' else 4 if package_type == 'K' else 2
+            # 용량 정보가 함께 있는지 확인
+            capacity_match = re.search(r'(\d+GB)', option_text, re.IGNORECASE)
+            if capacity_match:
+                total_capacity = capacity_match.group(1)
+                # 단일 용량 추정 (총 용량 / 패키지 개수)
+                total_capacity_num = int(total_capacity.replace('GB', ''))
+                single_capacity_num = total_capacity_num // package_count
+                single_capacity = f"{single_capacity_num}GB"
+                return f"{total_capacity} ({single_capacity} x{package_count})"
+            else:
+                # 용량 정보가 없으면 패키지 정보만 반환
+                return f"{package_type} 패키지"
+        
+        # 패턴 6: 단순 용량 패턴 (예: "32GB") - 패키지 정보 없음
+        capacity_match = re.search(r'(\d+GB)', option_text, re.IGNORECASE)
+        if capacity_match:
+            return capacity_match.group(1)
+    
+    # SSD, HDD의 경우: "4TB", "2TB", "1TB", "512GB" 등
+    # 또는 "8TB 135원/1GB 1,079,080원" 같은 형식
+    elif category_name in ['SSD', 'HDD']:
+        # TB 우선 검색 (숫자 + TB 패턴, 앞뒤 공백이나 다른 문자 허용)
+        tb_match = re.search(r'(\d+(?:\.\d+)?)\s*TB', option_text, re.IGNORECASE)
+        if tb_match:
+            return f"{tb_match.group(1)}TB"
+        
+        # GB 검색 (숫자 + GB 패턴)
+        gb_match = re.search(r'(\d+(?:\.\d+)?)\s*GB', option_text, re.IGNORECASE)
+        if gb_match:
+            return f"{gb_match.group(1)}GB"
+    
+    return None
@@ -1,10 +1,13 @@
 import os
-from sqlalchemy import create_engine, text
+import re
+import sys
+import json
+import time
+import hashlib
+import urllib.request
+import urllib.error
+from sqlalchemy import create_engine, text, inspect
 from sqlalchemy.orm import sessionmaker
-import pymysql
-
-# [수정] Google Generative AI (Gemini API) 사용
-import google.generativeai as genai
 
 # --- 1. DB 설정 (로컬 모드) ---
 DB_HOST = os.environ.get("DB_HOST", "localhost")
@@ -13,19 +16,146 @@ DB_USER = os.environ.get("DB_USER", "root")
 DB_PASSWORD = os.environ.get("DB_PASSWORD", "1234")
 DB_NAME = os.environ.get("DB_NAME", "danawa")
 
-# --- 2. Google Gemini API 설정 ---
-GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
+# 전체 DB URL 직접 지정 (예: 벤치마크용 sqlite:///summarizer_bench.db). 비우면 위 MySQL 설정 사용
+SUMMARY_DB_URL = os.environ.get("SUMMARY_DB_URL", "")
 
-if not GOOGLE_API_KEY:
-    print("오류: GOOGLE_API_KEY 환경 변수가 설정되지 않았습니다.")
-    print("     .env 파일에 GOOGLE_API_KEY=your-api-key를 추가하세요.")
-    exit()
+# --- 2. 요약 백엔드 설정 ---
+# gemini: Google Gemini API (기본) / stub: 로컬 스텁 서버 (llm_stub_server.py, API 키 불필요)
+SUMMARIZER_BACKEND = os.environ.get("SUMMARIZER_BACKEND", "gemini")
+STUB_LLM_URL = os.environ.get("STUB_LLM_URL", "http://localhost:8765")
+# 스텁 백엔드가 보고하는 모델명 (캐시 키와 summary_cache.model_name에 쓰이므로 실제 모델명과 겹치지 않게)
+STUB_MODEL_NAME = os.environ.get("STUB_LLM_MODEL", "stub")
 
-# Gemini API 초기화
-genai.configure(api_key=GOOGLE_API_KEY)
+GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
 
 # --- 3. AI 모델 및 프롬프트 설정 ---
-model = genai.GenerativeModel('gemini-2.5-flash')
+MODEL_NAME = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
+
+# 429(요청 한도 초과) 응답 시 재시도 횟수와 첫 대기 시간(초, 재시도마다 2배)
+SUMMARY_MAX_RETRIES = int(os.environ.get("SUMMARY_MAX_RETRIES", "3"))
+SUMMARY_RETRY_BACKOFF = float(os.environ.get("SUMMARY_RETRY_BACKOFF", "2"))
+
+
+class RateLimitError(Exception):
+    """백엔드가 요청 한도 초과(429)를 응답한 경우"""
+
+
+class SummarizerBackend:
+    """요약 백엔드 인터페이스: 프롬프트를 받아 모델 응답 텍스트를 반환합니다."""
+    name = "base"
+    # 캐시 키에 들어가는 모델 식별자: 백엔드마다 다르게 두어 다른 백엔드의 요약을 재사용하지 않게 합니다.
+    model_name = None
+
+    def generate(self, prompt):
+        raise NotImplementedError
+
+
+class GeminiBackend(SummarizerBackend):
+    """Google Gemini API 백엔드"""
+    name = "gemini"
+    model_name = MODEL_NAME
+
+    def __init__(self, model_name=MODEL_NAME):
+        self.model_name = model_name
+        if not GOOGLE_API_KEY:
+            print("오류: GOOGLE_API_KEY 환경 변수가 설정되지 않았습니다.")
+            print("     .env 파일에 GOOGLE_API_KEY=your-api-key를 추가하세요.")
+            print("     (API 키 없이 테스트하려면 SUMMARIZER_BACKEND=stub 사용)")
+            sys.exit(1)
+
+        # [수정] Google Generative AI (Gemini API) 사용 - 스텁 모드에서는 설치되어 있지 않아도 되도록 지연 import
+        import google.generativeai as genai
+        genai.configure(api_key=GOOGLE_API_KEY)
+        self.model = genai.GenerativeModel(model_name)
+
+    def generate(self, prompt):
+        try:
+            response = self.model.generate_content(prompt)
+        except Exception as e:
+            # google.api_core.exceptions.ResourceExhausted (HTTP 429)
+            if type(e).__name__ == 'ResourceExhausted' or '429' in str(e):
+                raise RateLimitError(str(e)) from e
+            raise
+        return response.text
+
+
+class HttpStubBackend(SummarizerBackend):
+    """로컬 스텁 서버(llm_stub_server.py) 백엔드: POST /generate {"prompt"} -> {"text"}"""
+    name = "stub"
+    model_name = STUB_MODEL_NAME
+
+    def __init__(self, base_url=STUB_LLM_URL, timeout=60):
+        self.url = base_url.rstrip('/') + '/generate'
+        self.timeout = timeout
+
+    def generate(self, prompt):
+        body = json.dumps({"prompt": prompt, "model": self.model_name}).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = response.read().decode('utf-8')
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                raise RateLimitError("stub 429") from e
+            raise
+        return json.loads(payload).get('text', '')
+
+
+BACKENDS = {
+    'gemini': GeminiBackend,
+    'stub': HttpStubBackend,
+}
+
+_backend = None
+
+
+def get_backend():
+    """설정된 요약 백엔드를 (처음 호출 시 한 번만) 생성해 반환합니다."""
+    global _backend
+    if _backend is None:
+        backend_cls = BACKENDS.get(SUMMARIZER_BACKEND)
+        if backend_cls is None:
+            raise ValueError(f"알 수 없는 SUMMARIZER_BACKEND: {SUMMARIZER_BACKEND} (gemini/stub)")
+        _backend = backend_cls()
+    return _backend
+
+
+def set_backend(backend):
+    """백엔드를 직접 지정합니다. (벤치마크에서 계측용 래퍼를 끼울 때 사용)"""
+    global _backend
+    _backend = backend
+
+
+def backend_model_name():
+    """캐시 키에 쓸 현재 백엔드의 모델명 (백엔드를 아직 만들지 않았으면 설정된 백엔드 클래스의 값)"""
+    backend = _backend or BACKENDS.get(SUMMARIZER_BACKEND, SummarizerBackend)
+    return backend.model_name or backend.name
+
+
+def generate_with_retry(prompt):
+    """백엔드를 호출하고, 429 응답이면 지수 백오프로 재시도합니다."""
+    for attempt in range(SUMMARY_MAX_RETRIES + 1):
+        try:
+            return get_backend().generate(prompt)
+        except RateLimitError:
+            if attempt >= SUMMARY_MAX_RETRIES:
+                raise
+            wait_time = SUMMARY_RETRY_BACKOFF * (2 ** attempt)
+            print(f"   -> 요청 한도 초과(429), {wait_time:.1f}초 후 재시도 ({attempt + 1}/{SUMMARY_MAX_RETRIES})")
+            time.sleep(wait_time)
+
+
+# 프롬프트 템플릿을 바꾸면 이 값을 올려야 기존 캐시가 재사용되지 않습니다.
+PROMPT_VERSION = "v1"
+
+# 모델에 보내는 리뷰 본문 최대 길이 (문자 수, 압축 후에도 넘지 않도록 하는 안전장치)
+SUMMARY_MAX_INPUT_CHARS = 15000
+
+# 사전 압축(compress_review_text) 후 모델 입력 토큰 예산. 0이면 압축하지 않고 잘라내기만 합니다.
+SUMMARY_INPUT_TOKEN_BUDGET = int(os.environ.get("SUMMARY_INPUT_TOKEN_BUDGET", "3000"))
+
+# 압축 규칙을 바꾸면 이 값을 올려야 기존 캐시가 재사용되지 않습니다.
+PREPROCESS_VERSION = "c2"
 
 SUMMARIZE_PROMPT_TEMPLATE = """
 당신은 PC 부품 전문 리뷰어입니다.
@@ -39,86 +169,725 @@ SUMMARIZE_PROMPT_TEMPLATE = """
 """
 
 def summarize_text(text_to_summarize):
-    """Google Gemini API를 호출하여 텍스트를 요약합니다."""
+    """요약 백엔드(기본: Gemini API)를 호출하여 텍스트를 요약합니다. (입력은 prepare_review_text로 압축된 본문)"""
     try:
-        truncated_text = text_to_summarize[:15000]
+        truncated_text = text_to_summarize[:SUMMARY_MAX_INPUT_CHARS]
         
         prompt = SUMMARIZE_PROMPT_TEMPLATE.format(review_text=truncated_text)
         
-        # Gemini API 호출
-        response = model.generate_content(prompt)
+        # 백엔드 호출 (429는 재시도)
+        response_text = generate_with_retry(prompt)
         
-        return response.text.strip()
+        return (response_text or '').strip() or None
     except Exception as e:
         print(f"   -> AI 요약 실패: {e}")
         return None
 
-def main():
-    try:
-        # 로컬 MySQL 연결
-        print(f"로컬 MySQL DB 연결 중... ({DB_HOST}:{DB_PORT}/{DB_NAME})")
-        
-        db_url = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
-        
-        engine = create_engine(
-            db_url,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            echo=False
+# --- 리뷰 본문 사전 압축 (LLM 입력 토큰 절감) ---
+# 퀘이사존 본문에 반복되는 상투 문구/캡션/저작권 문구
+BOILERPLATE_PATTERNS = re.compile(
+    r'^(?:[▲△▼▽※]|\[?(?:사진|이미지|그림)\s*\d*\]?$|출처\s*[:：]|copyright|ⓒ|©|무단\s*전재|재배포\s*금지|'
+    r'목록$|댓글|추천\s*\d*$|비추천|공유하기|신고|https?://|www\.)',
+    re.IGNORECASE
+)
+# 결론 구간 제목 (이후 문단은 모두 우선 보존)
+CONCLUSION_HEADING = re.compile(r'^(?:\d+\.\s*)?(?:마치며|마무리|결론|총평|정리하며|정리|맺음말|conclusion)\b', re.IGNORECASE)
+# 장단점 문장
+PROS_CONS_PATTERN = re.compile(r'장점|단점|아쉬운|아쉬움|좋은 점|개선|추천|비추천|가성비|만족')
+# 벤치마크/수치 문장 (숫자 + 단위)
+BENCHMARK_PATTERN = re.compile(
+    r'\d[\d,.]*\s*(?:fps|FPS|점|pts|%|W|와트|℃|°C|도|MHz|GHz|MB/s|GB/s|dB|배|초|ms)'
+    r'|시네벤치|Cinebench|3DMark|타임스파이|Time Spy|긱벤치|Geekbench|벤치마크'
+)
+# 표의 셀 구분자 (탭/파이프). 공백 여러 개는 본문 문장에도 흔해서 구분자로 보지 않습니다.
+TABLE_CELL_SEPARATOR = re.compile(r'\s*(?:\t|\|)\s*')
+# 표의 한 행으로 볼 최소 구분자 수 (문장 속 '|' 하나나 탭 하나는 표로 보지 않음)
+TABLE_MIN_SEPARATORS = 2
+# 표에서 남길 최대 행 수 (머리글 포함)
+TABLE_MAX_ROWS = 6
+
+
+def estimate_tokens(text_value):
+    """토큰 수 대략 추정: 한글은 글자당 약 1토큰, 그 외는 4글자당 약 1토큰"""
+    hangul = sum(1 for ch in text_value if '가' <= ch <= '힣')
+    return hangul + (len(text_value) - hangul) // 4 + 1
+
+
+def _is_table_row(line):
+    """셀 구분자(탭/파이프)가 TABLE_MIN_SEPARATORS개 이상인 짧은 줄만 표의 행으로 봅니다."""
+    return len(line) < 200 and len(TABLE_CELL_SEPARATOR.findall(line)) >= TABLE_MIN_SEPARATORS
+
+
+def _collapse_table(rows):
+    """연속된 표 행을 ' | ' 구분 한 줄씩으로 압축하고 TABLE_MAX_ROWS행까지만 남깁니다. (마크다운 구분선 행은 제외)"""
+    cells = [' | '.join(c for c in TABLE_CELL_SEPARATOR.split(row) if c.strip()) for row in rows]
+    cells = [c for c in cells if c.strip('-:| ')]
+    if len(cells) > TABLE_MAX_ROWS:
+        cells = cells[:TABLE_MAX_ROWS] + [f"(표 {len(cells) - TABLE_MAX_ROWS}행 생략)"]
+    return '\n'.join(cells)
+
+
+def compress_review_text(raw_text, token_budget=SUMMARY_INPUT_TOKEN_BUDGET):
+    """
+    리뷰 본문에서 요약에 필요한 문단만 골라 토큰 예산 안으로 줄입니다.
+
+    1. 캡션/저작권/링크 같은 상투 문구와 중복 줄 제거
+    2. 연속된 표 행은 몇 줄로 압축
+    3. 도입부, 결론 구간, 장단점/벤치마크 문장이 있는 문단을 우선 선택
+    4. 선택한 문단을 원래 순서대로 이어 붙임
+    """
+    if not raw_text:
+        return ''
+    if token_budget <= 0:
+        return raw_text[:SUMMARY_MAX_INPUT_CHARS]
+
+    # 1~2. 줄 단위 정리 (빈 줄은 문단 구분자로 유지)
+    lines = []
+    seen = set()
+    table_rows = []
+    for line in raw_text.splitlines():
+        line = line.strip()
+        if line and _is_table_row(line):
+            table_rows.append(line)
+            continue
+        if table_rows:
+            lines.append(_collapse_table(table_rows))
+            table_rows = []
+        if not line:
+            lines.append('')
+            continue
+        if len(line) < 2 or BOILERPLATE_PATTERNS.search(line):
+            continue
+        key = re.sub(r'\s+', ' ', line)
+        if key in seen:
+            continue
+        seen.add(key)
+        lines.append(line)
+    if table_rows:
+        lines.append(_collapse_table(table_rows))
+
+    paragraphs = [p.strip() for p in '\n'.join(lines).split('\n\n') if p.strip()]
+    if not paragraphs:
+        return ''
+
+    # 3. 문단 점수 계산
+    scored = []
+    in_conclusion = False
+    for idx, para in enumerate(paragraphs):
+        if CONCLUSION_HEADING.search(para):
+            in_conclusion = True
+        score = 0.0
+        if idx == 0:
+            score += 3
+        if in_conclusion:
+            score += 5
+        score += 2 * len(PROS_CONS_PATTERN.findall(para))
+        score += len(BENCHMARK_PATTERN.findall(para))
+        # 끝부분 문단은 결론 제목이 없어도 결론일 가능성이 높음
+        if idx >= len(paragraphs) - 2:
+            score += 2
+        scored.append((score, idx, para, estimate_tokens(para)))
+
+    # 4. 점수 높은 순으로 예산 안에서 선택 후 원래 순서대로 출력
+    selected = set()
+    used = 0
+    for score, idx, para, tokens in sorted(scored, key=lambda x: (-x[0], x[1])):
+        if used + tokens > token_budget:
+            continue
+        selected.add(idx)
+        used += tokens
+
+    if not selected:
+        # 첫 문단조차 예산을 넘으면 예산에 맞춰 잘라 사용
+        first = paragraphs[0]
+        return first[:token_budget]
+
+    compressed = '\n\n'.join(para for score, idx, para, tokens in scored if idx in selected)
+    return compressed[:SUMMARY_MAX_INPUT_CHARS]
+
+
+def prepare_review_text(raw_text):
+    """모델에 보낼 입력을 만듭니다. (사전 압축 + 최대 길이 제한)"""
+    return compress_review_text(raw_text)[:SUMMARY_MAX_INPUT_CHARS]
+
+
+# --- DB 방언(MySQL/SQLite) 호환 헬퍼 ---
+# 운영은 MySQL, 오프라인 벤치마크는 SQLite에서도 같은 코드가 돌도록 DDL/UPSERT 구문만 분기합니다.
+def _is_mysql(bind):
+    return bind.dialect.name == 'mysql'
+
+
+def _table_options(bind):
+    return " ENGINE=InnoDB DEFAULT CHARSET=utf8mb4" if _is_mysql(bind) else ""
+
+
+def _upsert_clause(bind, key_column, update_columns):
+    """INSERT 뒤에 붙일 중복 키 처리 구문 (MySQL: ON DUPLICATE KEY / SQLite: ON CONFLICT)"""
+    if _is_mysql(bind):
+        return "ON DUPLICATE KEY UPDATE " + ", ".join(f"{c} = VALUES({c})" for c in update_columns)
+    return f"ON CONFLICT({key_column}) DO UPDATE SET " + ", ".join(f"{c} = excluded.{c}" for c in update_columns)
+
+
+# --- 요약 캐시 (동일 본문 재요약 방지) ---
+def normalize_review_text(prepared_text):
+    """캐시 키 계산용 정규화: 공백을 하나로 합치고 모델 입력 길이로 자릅니다."""
+    normalized = re.sub(r'\s+', ' ', prepared_text or '').strip()
+    return normalized[:SUMMARY_MAX_INPUT_CHARS]
+
+
+def _prompt_id(template):
+    """캐시 키와 summary_cache.prompt_version에 쓰는 프롬프트 식별자 (1건 요약은 기존 값 그대로, 묶음은 'v1/batch')"""
+    return PROMPT_VERSION if template == 'single' else f"{PROMPT_VERSION}/{template}"
+
+
+def summary_cache_key(prepared_text, template='single'):
+    """
+    정규화된 모델 입력 + 프롬프트 템플릿(single/batch)과 버전 + 압축 버전 + 백엔드 모델명의 SHA-256 해시
+    묶음 프롬프트의 요약은 품질이 다르므로 1건 요약과 다른 키로, 스텁 응답은 실제 모델과 다른 키로 캐시합니다.
+    """
+    payload = f"{backend_model_name()}\n{_prompt_id(template)}\n{PREPROCESS_VERSION}\n{normalize_review_text(prepared_text)}"
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def ensure_summary_cache_table(engine):
+    """요약 캐시 테이블이 없으면 생성합니다."""
+    with engine.begin() as conn:
+        conn.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS summary_cache (
+                cache_key CHAR(64) PRIMARY KEY,
+                model_name VARCHAR(64) NOT NULL,
+                prompt_version VARCHAR(16) NOT NULL,
+                summary TEXT NOT NULL,
+                hit_count INT NOT NULL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ){_table_options(engine)}
+        """))
+
+
+def get_cached_summary(session, cache_key):
+    """캐시에 요약이 있으면 반환하고 적중 횟수를 올립니다. (없으면 None)"""
+    summary = session.execute(
+        text("SELECT summary FROM summary_cache WHERE cache_key = :key"),
+        {"key": cache_key}
+    ).scalar()
+    if summary:
+        session.execute(
+            text("UPDATE summary_cache SET hit_count = hit_count + 1 WHERE cache_key = :key"),
+            {"key": cache_key}
         )
-        
-        Session = sessionmaker(bind=engine)
-        session = Session()
-        print("DB 연결 성공. AI 요약 작업을 시작합니다...")
+    return summary
 
-        # 1. 요약이 필요한 리뷰 조회
-        reviews_to_summarize = session.execute(
-            text("SELECT id, raw_text FROM community_reviews WHERE ai_summary IS NULL")
-        ).fetchall()
 
-        if not reviews_to_summarize:
-            print("새롭게 요약할 리뷰가 없습니다. 종료합니다.")
-            session.close()
-            connector.close()
-            return
+def put_cached_summary(session, cache_key, summary, template='single'):
+    """새로 생성한 요약을 캐시에 저장합니다. (template: 키를 만든 프롬프트 템플릿)"""
+    session.execute(
+        text(f"""
+            INSERT INTO summary_cache (cache_key, model_name, prompt_version, summary)
+            VALUES (:key, :model_name, :prompt_version, :summary)
+            {_upsert_clause(session.get_bind(), 'cache_key', ['summary'])}
+        """),
+        {"key": cache_key, "model_name": backend_model_name(), "prompt_version": _prompt_id(template), "summary": summary}
+    )
 
-        print(f"총 {len(reviews_to_summarize)}개의 리뷰를 요약합니다.")
-
-        # 2. 각 리뷰를 순회하며 AI 요약
-        update_count = 0
-        for review in reviews_to_summarize:
-            review_id = review[0]
-            raw_text = review[1]
-            
-            print(f"   -> 리뷰 ID {review_id} 요약 시도...")
-            
-            ai_summary = summarize_text(raw_text)
-            
-            if ai_summary:
-                session.execute(
-                    text("UPDATE community_reviews SET ai_summary = :summary WHERE id = :id"),
-                    {"summary": ai_summary, "id": review_id}
-                )
-                print(f"   -> 리뷰 ID {review_id} 요약 완료.")
-                update_count += 1
-            else:
-                print(f"   -> 리뷰 ID {review_id} 요약 실패, 건너뜁니다.")
-        
-        # 3. 루프가 끝난 후 한 번만 커밋
-        if update_count > 0:
-            print(f"\n총 {update_count}개의 요약본을 DB에 일괄 저장(커밋)합니다...")
-            session.commit()
-            print("커밋 완료.")
+
+def summarize_with_cache(session, raw_text):
+    """
+    캐시를 먼저 확인하고, 없을 때만 API를 호출해 요약합니다.
+
+    Returns:
+        (요약문 또는 None, 캐시 적중 여부)
+    """
+    prepared_text = prepare_review_text(raw_text)
+    cache_key = summary_cache_key(prepared_text)
+    cached = get_cached_summary(session, cache_key)
+    if cached:
+        return cached, True
+
+    ai_summary = summarize_text(prepared_text)
+    if ai_summary:
+        put_cached_summary(session, cache_key, ai_summary)
+    return ai_summary, False
+
+
+def seed_summary_cache(engine, session):
+    """
+    이미 요약된 리뷰로 캐시를 채웁니다. (--seed-cache)
+    캐시 도입 이전에 요약된 본문과 같은 리뷰가 다시 들어와도 API를 호출하지 않게 됩니다.
+    """
+    seeded = 0
+    last_id = 0
+    while True:
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(
+                text("""
+                    SELECT id, raw_text, ai_summary FROM community_reviews
+                    WHERE ai_summary IS NOT NULL AND id > :last_id
+                    ORDER BY id
+                    LIMIT :limit
+                """),
+                {"last_id": last_id, "limit": SUMMARY_FETCH_SIZE}
+            )
+            page = [(row[0], row[1], row[2]) for row in result]
+        if not page:
+            break
+        for review_id, raw_text, ai_summary in page:
+            put_cached_summary(session, summary_cache_key(prepare_review_text(raw_text)), ai_summary)
+            seeded += 1
+        session.commit()
+        last_id = page[-1][0]
+    print(f"요약 캐시에 기존 요약 {seeded}건을 등록했습니다.")
+
+
+# --- 다건 묶음 요약 (--batch) ---
+# 한 요청에 묶을 리뷰들의 입력 토큰 합계 상한
+SUMMARY_BATCH_TOKEN_BUDGET = int(os.environ.get("SUMMARY_BATCH_TOKEN_BUDGET", "8000"))
+# 이 토큰 수 이하인 (짧은) 리뷰만 묶음 대상. 긴 리뷰는 기존처럼 1건씩 요약합니다.
+SUMMARY_BATCH_ITEM_MAX_TOKENS = int(os.environ.get("SUMMARY_BATCH_ITEM_MAX_TOKENS", "1500"))
+# 한 요청에 묶을 최대 리뷰 수
+SUMMARY_BATCH_MAX_ITEMS = int(os.environ.get("SUMMARY_BATCH_MAX_ITEMS", "8"))
+
+BATCH_PROMPT_TEMPLATE = """
+당신은 PC 부품 전문 리뷰어입니다.
+아래에는 퀘이사존의 전문가 리뷰 본문 여러 개가 id와 함께 주어집니다.
+각 리뷰의 핵심 내용(장점, 단점, 주요 성능 포인트, 결론)을 리뷰마다 3~5줄로 요약해 주세요.
+"요약:" 이라는 말은 빼고, 본문 내용만 생성해 주세요.
+
+반드시 아래 형식의 JSON만 출력하세요. 다른 설명이나 코드 블록 표시는 넣지 마세요.
+{{"summaries": [{{"id": <리뷰 id 숫자>, "summary": "<요약>"}}, ...]}}
+
+{reviews_block}
+"""
+
+
+def pack_batches(items):
+    """
+    (review_id, prepared_text, tokens) 목록을 토큰 예산/최대 개수 안에서 순서대로 묶습니다.
+    """
+    batches = []
+    current = []
+    current_tokens = 0
+    for item in items:
+        tokens = item[2]
+        if current and (current_tokens + tokens > SUMMARY_BATCH_TOKEN_BUDGET
+                        or len(current) >= SUMMARY_BATCH_MAX_ITEMS):
+            batches.append(current)
+            current = []
+            current_tokens = 0
+        current.append(item)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def parse_batch_response(response_text, expected_ids):
+    """
+    묶음 요약 응답(JSON)을 검증하고 {review_id: 요약} 으로 나눕니다.
+    형식이 틀리거나 요청하지 않은 id, 빈 요약은 버립니다. (버려진 리뷰는 1건씩 재요약)
+    """
+    if not response_text:
+        return {}
+    body = response_text.strip()
+    # ```json ... ``` 으로 감싸서 답하는 경우 제거
+    fence = re.search(r'```(?:json)?\s*(.*?)```', body, re.S)
+    if fence:
+        body = fence.group(1).strip()
+    try:
+        data = json.loads(body)
+    except (ValueError, TypeError):
+        return {}
+
+    entries = data.get('summaries') if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+
+    expected = set(expected_ids)
+    results = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            review_id = int(entry.get('id'))
+        except (TypeError, ValueError):
+            continue
+        summary = entry.get('summary')
+        if review_id in expected and isinstance(summary, str) and summary.strip():
+            results[review_id] = summary.strip()
+    return results
+
+
+def summarize_batch(batch):
+    """여러 리뷰를 한 번의 API 호출로 요약합니다. 반환: {review_id: 요약} (검증 통과분만)"""
+    reviews_block = "\n\n".join(
+        f"--- 리뷰 id={review_id} ---\n{prepared_text}" for review_id, prepared_text, _ in batch
+    )
+    prompt = BATCH_PROMPT_TEMPLATE.format(reviews_block=reviews_block)
+    try:
+        response_text = generate_with_retry(prompt)
+        return parse_batch_response(response_text, [review_id for review_id, _, _ in batch])
+    except Exception as e:
+        print(f"   -> AI 묶음 요약 실패 ({len(batch)}건, 1건씩 재시도): {e}")
+        return {}
+
+
+def summarize_page(session, page, batch_mode=False):
+    """
+    keyset 페이지 하나를 요약합니다.
+
+    1. 캐시 적중분은 바로 사용하고, 같은 페이지 안의 동일 본문은 한 번만 요약합니다.
+       (1건 요약 캐시를 먼저 보고, batch_mode에서만 묶음 요약 캐시도 사용)
+    2. batch_mode면 짧은 리뷰를 묶어서 요청하고, 검증에 실패한 리뷰는 1건씩 재요약합니다.
+
+    Returns:
+        [(review_id, 요약 또는 None, 'cache'|'batch'|'single'|None), ...] (입력 순서 유지)
+    """
+    results = {}
+    # cache_key -> (prepared_text, [review_id, ...]) : 캐시에 없는 본문만
+    misses = {}
+    for review_id, raw_text in page:
+        prepared_text = prepare_review_text(raw_text)
+        cache_key = summary_cache_key(prepared_text)
+        if cache_key in misses:
+            misses[cache_key][1].append(review_id)
+            continue
+        cached = get_cached_summary(session, cache_key)
+        if not cached and batch_mode:
+            cached = get_cached_summary(session, summary_cache_key(prepared_text, 'batch'))
+        if cached:
+            results[review_id] = (cached, 'cache')
+        else:
+            misses[cache_key] = (prepared_text, [review_id])
+
+    def store(cache_key, summary, source):
+        prepared_text, ids = misses[cache_key]
+        if source == 'batch':
+            put_cached_summary(session, summary_cache_key(prepared_text, 'batch'), summary, 'batch')
         else:
-            print("\n업데이트할 항목이 없어 커밋을 건너뜁니다.")
+            put_cached_summary(session, cache_key, summary)
+        for review_id in ids:
+            results[review_id] = (summary, source)
+
+    singles = []
+    if batch_mode:
+        short_items = []
+        for cache_key, (prepared_text, ids) in misses.items():
+            tokens = estimate_tokens(prepared_text)
+            if tokens <= SUMMARY_BATCH_ITEM_MAX_TOKENS:
+                # 묶음 요청 안에서는 대표 id(첫 번째)로 구분
+                short_items.append((ids[0], prepared_text, tokens, cache_key))
+            else:
+                singles.append(cache_key)
+
+        key_by_id = {item[0]: item[3] for item in short_items}
+        for batch in pack_batches([item[:3] for item in short_items]):
+            if len(batch) == 1:
+                singles.append(key_by_id[batch[0][0]])
+                continue
+            print(f"   -> 리뷰 {len(batch)}건 묶음 요약 요청 (id: {', '.join(str(b[0]) for b in batch)})")
+            batch_results = summarize_batch(batch)
+            for review_id, _, _ in batch:
+                if review_id in batch_results:
+                    store(key_by_id[review_id], batch_results[review_id], 'batch')
+                else:
+                    singles.append(key_by_id[review_id])
+    else:
+        singles = list(misses.keys())
+
+    for cache_key in singles:
+        prepared_text, ids = misses[cache_key]
+        ai_summary = summarize_text(prepared_text)
+        if ai_summary:
+            store(cache_key, ai_summary, 'single')
+
+    return [(review_id,) + results.get(review_id, (None, None)) for review_id, _ in page]
+
+
+# --- 4. 배치/체크포인트 설정 ---
+# keyset 페이지 크기: 한 번에 DB에서 읽어오는 리뷰 수 (메모리 사용량 상한)
+SUMMARY_FETCH_SIZE = int(os.environ.get("SUMMARY_FETCH_SIZE", "20"))
+# 몇 건을 요약할 때마다 커밋할지 (작을수록 중단 시 손실이 적음)
+SUMMARY_COMMIT_EVERY = int(os.environ.get("SUMMARY_COMMIT_EVERY", "5"))
+# 체크포인트(재개 지점) 테이블에서 사용하는 작업 이름
+SUMMARY_JOB_NAME = "summarize_reviews"
+
+
+# community_reviews.summary_status 값 (크롤러가 리뷰 저장 시 'pending'으로 기록)
+SUMMARY_STATUS_PENDING = "pending"
+SUMMARY_STATUS_DONE = "done"
+SUMMARY_STATUS_FAILED = "failed"
+
+
+def _is_duplicate_error(error):
+    """이미 있는 컬럼/인덱스를 다시 추가하려 한 오류인지 (MySQL 1060/1061, SQLite duplicate column / already exists)"""
+    message = str(error).lower()
+    return any(pattern in message for pattern in ("1060", "1061", "duplicate column", "duplicate key name", "already exists"))
+
+
+def ensure_review_status_column(engine):
+    """
+    community_reviews에 요약 상태 컬럼과 (summary_status, id) 인덱스를 추가합니다.
+
+    작업 대상은 이 인덱스로만 찾으므로, 테이블이 커져도 TEXT 컬럼 전체를 훑지 않습니다.
+    컬럼과 인덱스는 따로 확인하고 (크롤러가 컬럼만 추가한 경우에도 인덱스를 만듦),
+    컬럼을 새로 추가한 경우에만 기존 요약본을 'done'으로 한 번 채웁니다.
+    """
+    inspector = inspect(engine)
+    columns = {column['name'] for column in inspector.get_columns('community_reviews')}
+    indexes = {index['name'] for index in inspector.get_indexes('community_reviews')}
+
+    column_added = False
+    if 'summary_status' not in columns:
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(
+                    "ALTER TABLE community_reviews "
+                    f"ADD COLUMN summary_status VARCHAR(16) NOT NULL DEFAULT '{SUMMARY_STATUS_PENDING}'"
+                ))
+            column_added = True
+        except Exception as e:
+            if not _is_duplicate_error(e):
+                raise  # 동시에 실행된 크롤러가 먼저 추가한 경우만 무시
+
+    if 'idx_review_summary_status' not in indexes:
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(
+                    "CREATE INDEX idx_review_summary_status ON community_reviews (summary_status, id)"
+                ))
+        except Exception as e:
+            if not _is_duplicate_error(e):
+                raise
+
+    if column_added:
+        print("summary_status 컬럼을 추가했습니다. 기존 요약본 상태를 채웁니다... (최초 1회)")
+        with engine.begin() as conn:
+            conn.execute(
+                text("UPDATE community_reviews SET summary_status = :done WHERE ai_summary IS NOT NULL"),
+                {"done": SUMMARY_STATUS_DONE}
+            )
+
+
+def reset_failed_reviews(session):
+    """요약에 실패했던 리뷰를 다시 대기 상태로 돌립니다. (--retry-failed)"""
+    result = session.execute(
+        text("UPDATE community_reviews SET summary_status = :pending WHERE summary_status = :failed"),
+        {"pending": SUMMARY_STATUS_PENDING, "failed": SUMMARY_STATUS_FAILED}
+    )
+    return result.rowcount
+
+
+def ensure_checkpoint_table(engine):
+    """처리한 리뷰 ID 상한(high-water mark)을 저장하는 테이블이 없으면 생성합니다."""
+    on_update = " ON UPDATE CURRENT_TIMESTAMP" if _is_mysql(engine) else ""
+    with engine.begin() as conn:
+        conn.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS summarizer_checkpoint (
+                job_name VARCHAR(64) PRIMARY KEY,
+                last_id BIGINT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP{on_update}
+            ){_table_options(engine)}
+        """))
 
+
+def load_watermark(session):
+    """마지막으로 커밋된 리뷰 ID를 읽어옵니다. (없으면 0)"""
+    last_id = session.execute(
+        text("SELECT last_id FROM summarizer_checkpoint WHERE job_name = :job"),
+        {"job": SUMMARY_JOB_NAME}
+    ).scalar()
+    return last_id or 0
+
+
+def save_watermark(session, last_id):
+    """재개 지점을 기록합니다. 요약 UPDATE와 같은 트랜잭션에서 호출해야 합니다."""
+    session.execute(
+        text(f"""
+            INSERT INTO summarizer_checkpoint (job_name, last_id)
+            VALUES (:job, :last_id)
+            {_upsert_clause(session.get_bind(), 'job_name', ['last_id'])}
+        """),
+        {"job": SUMMARY_JOB_NAME, "last_id": last_id}
+    )
+
+
+def iter_pending_reviews(engine, start_id=0, page_size=SUMMARY_FETCH_SIZE):
+    """
+    요약 대기(summary_status='pending') 리뷰를 id 순서의 keyset 페이지 단위로 읽어옵니다.
+
+    start_id는 이번 순회 안에서의 keyset 위치일 뿐 재개 지점이 아닙니다. 크롤러가 요약기 실행 중에 저장하는 리뷰는
+    id를 먼저 받고 나중에 커밋될 수 있으므로, 지난 실행의 상한보다 작은 id도 'pending'이면 모두 처리 대상입니다.
+
+    (summary_status, id) 인덱스 범위 조회이므로 비용은 테이블 크기가 아니라
+    새로 들어온 리뷰 수에 비례합니다. fetchall()로 전체를 메모리에 올리지 않고, 서버 사이드 커서(stream_results)로
+    page_size개씩만 읽은 뒤 바로 커넥션을 반납합니다. 긴 LLM 호출 동안
+    읽기 커서를 열어두지 않으므로 MySQL net_write_timeout에도 안전합니다.
+    """
+    last_id = start_id
+    while True:
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(
+                text("""
+                    SELECT id, raw_text FROM community_reviews
+                    WHERE summary_status = :pending AND id > :last_id
+                    ORDER BY id
+                    LIMIT :limit
+                """),
+                {"pending": SUMMARY_STATUS_PENDING, "last_id": last_id, "limit": page_size}
+            )
+            page = [(row[0], row[1]) for row in result]
+
+        if not page:
+            return
+        yield page
+        last_id = page[-1][0]
+
+
+class SummaryStats:
+    """실행 통계 (벤치마크에서 커밋 비용 측정에 사용)"""
+
+    def __init__(self):
+        self.update_count = 0
+        self.fail_count = 0
+        self.cache_hits = 0
+        self.commit_seconds = []
+
+
+def create_summary_engine():
+    """요약 작업용 DB 엔진 생성 (SUMMARY_DB_URL이 있으면 우선 사용)"""
+    if SUMMARY_DB_URL:
+        print(f"DB 연결 중... ({SUMMARY_DB_URL})")
+        return create_engine(SUMMARY_DB_URL, pool_pre_ping=True, echo=False)
+
+    # 로컬 MySQL 연결
+    print(f"로컬 MySQL DB 연결 중... ({DB_HOST}:{DB_PORT}/{DB_NAME})")
+    db_url = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
+    return create_engine(
+        db_url,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        echo=False
+    )
+
+
+def _commit(session, stats):
+    started = time.perf_counter()
+    session.commit()
+    stats.commit_seconds.append(time.perf_counter() - started)
+
+
+def run_summarization(engine, from_start=False, seed_cache=False, batch_mode=False, stats=None, retry_failed=False):
+    """
+    요약 대기 리뷰를 keyset 페이지 단위로 순회하며 요약하고, 작은 배치마다 커밋합니다.
+
+    시작 시에는 체크포인트 한 행과 인덱스 범위만 읽으므로 테이블 크기와 무관하게 바로 시작합니다.
+
+    Returns:
+        SummaryStats
+    """
+    stats = stats or SummaryStats()
+
+    ensure_review_status_column(engine)
+    ensure_checkpoint_table(engine)
+    ensure_summary_cache_table(engine)
+
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    try:
+        print("DB 연결 성공. AI 요약 작업을 시작합니다...")
+
+        if seed_cache:
+            seed_summary_cache(engine, session)
+
+        # 1. 재개 지점(high-water mark) 확인
+        #    대상은 summary_status 인덱스로만 고릅니다. (상한 아래에 늦게 커밋된 'pending' 리뷰도 처리)
+        #    요약한 리뷰는 'done'/'failed'가 되어 인덱스 범위에서 빠지므로 상한은 진행 상황 표시용입니다.
+        if retry_failed:
+            reset_count = reset_failed_reviews(session)
+            print(f"요약 실패 리뷰 {reset_count}건을 다시 대기 상태로 돌립니다.")
+        high_water_mark = 0 if from_start else load_watermark(session)
+        if high_water_mark:
+            print(f"지난 실행은 리뷰 ID {high_water_mark}까지 처리했습니다. 대기 중인 리뷰를 모두 확인합니다.")
+        session.commit()
+
+        # 2. keyset 페이지 단위로 순회하며 AI 요약 (작은 배치마다 커밋)
+        pending_updates = 0
+        last_seen_id = 0
+
+        for page in iter_pending_reviews(engine):
+            print(f"   -> 리뷰 ID {page[0][0]}~{page[-1][0]} ({len(page)}건) 요약 시도...")
+            for review_id, ai_summary, source in summarize_page(session, page, batch_mode):
+                if ai_summary:
+                    session.execute(
+                        text("UPDATE community_reviews SET ai_summary = :summary, summary_status = :done WHERE id = :id"),
+                        {"summary": ai_summary, "done": SUMMARY_STATUS_DONE, "id": review_id}
+                    )
+                    if source == 'cache':
+                        stats.cache_hits += 1
+                        print(f"   -> 리뷰 ID {review_id} 요약 완료. (캐시 적중, API 호출 생략)")
+                    elif source == 'batch':
+                        print(f"   -> 리뷰 ID {review_id} 요약 완료. (묶음 요약)")
+                    else:
+                        print(f"   -> 리뷰 ID {review_id} 요약 완료.")
+                    stats.update_count += 1
+                    pending_updates += 1
+                else:
+                    # 실패한 리뷰는 'failed'로 표시해 매 실행마다 다시 시도하지 않습니다. (--retry-failed로 재시도)
+                    session.execute(
+                        text("UPDATE community_reviews SET summary_status = :failed WHERE id = :id"),
+                        {"failed": SUMMARY_STATUS_FAILED, "id": review_id}
+                    )
+                    print(f"   -> 리뷰 ID {review_id} 요약 실패, 건너뜁니다.")
+                    stats.fail_count += 1
+                last_seen_id = review_id
+
+                # 3. SUMMARY_COMMIT_EVERY건마다 요약과 재개 지점을 함께 커밋
+                if pending_updates >= SUMMARY_COMMIT_EVERY:
+                    save_watermark(session, max(last_seen_id, high_water_mark))
+                    _commit(session, stats)
+                    print(f"   -> 체크포인트 커밋 (누적 {stats.update_count}건, 리뷰 ID {last_seen_id}까지)")
+                    pending_updates = 0
+
+        # 남은 요약본 커밋. 다음 실행은 이번에 처리한 마지막 ID 이후의 새 리뷰만 확인합니다.
+        save_watermark(session, max(last_seen_id, high_water_mark))
+        _commit(session, stats)
+
+        if stats.update_count == 0 and stats.fail_count == 0:
+            print("새롭게 요약할 리뷰가 없습니다. 종료합니다.")
+        else:
+            print(f"\n총 {stats.update_count}개의 요약본을 저장했습니다. (캐시 적중 {stats.cache_hits}건, 실패 {stats.fail_count}건)")
+            if stats.fail_count:
+                print("실패한 리뷰는 --retry-failed 옵션으로 다시 요약할 수 있습니다.")
+        return stats
+    except Exception:
+        # 마지막 체크포인트 이후의 작업만 롤백됩니다. 다시 실행하면 그 지점부터 재개합니다.
+        session.rollback()
+        raise
+    finally:
         session.close()
-        print("모든 AI 요약 작업을 완료했습니다.")
 
+
+def main():
+    # 저장된 처리 ID 상한(진행 상황 표시용)을 0부터 다시 기록하려면 --from-start
+    from_start = "--from-start" in sys.argv
+    # 기존 요약본으로 캐시를 먼저 채우려면 --seed-cache
+    seed_cache = "--seed-cache" in sys.argv
+    # 짧은 리뷰 여러 건을 한 요청으로 묶으려면 --batch
+    batch_mode = "--batch" in sys.argv
+    # 요약에 실패했던 리뷰를 다시 시도하려면 --retry-failed
+    retry_failed = "--retry-failed" in sys.argv
+
+    # 백엔드 설정 오류(API 키 없음 등)는 DB 작업 전에 확인
+    get_backend()
+
+    try:
+        engine = create_summary_engine()
+        run_summarization(engine, from_start=from_start, seed_cache=seed_cache, batch_mode=batch_mode,
+                          retry_failed=retry_failed)
+        print("모든 AI 요약 작업을 완료했습니다.")
     except Exception as e:
         print(f"DB 연결 또는 작업 중 오류 발생: {e}")
     finally:
         print("DB 연결 종료.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,134 @@
+"""
+호스트/동작별로 학습하는 적응형 타임아웃
+
+호출부마다 제각각이던 고정 타임아웃(요소 500~5000ms, 페이지 이동 15~90초) 대신,
+(호스트, 동작)마다 최근 소요 시간의 p95를 기록해 그 TIMEOUT_P95_MULTIPLE배를 타임아웃으로 씁니다.
+    - 표본이 TIMEOUT_MIN_SAMPLES개가 되기 전에는 호출부의 기존 값(initial)을 그대로 사용
+    - 학습된 값은 [동작별 하한, max(initial, 상한)] 안으로 제한
+      (상한: 페이지 이동 goto* = PAGE_LOAD_TIMEOUT, 요소 대기/읽기 wait*, read* = ELEMENT_TIMEOUT)
+    - goto*/wait* 동작이 학습된 타임아웃에 걸리면 그 값을 표본으로 넣어 다음 타임아웃을 늘림
+      (느리지만 정상인 페이지는 계속 성공하고, 멈춘 페이지에서 기다리는 시간은 줄어듦)
+    - read* 동작(없을 수도 있는 요소 읽기)은 타임아웃을 표본으로 넣지 않음
+
+    name = await timed('danawa.com', 'read', 5000, lambda t: loc.inner_text(timeout=t))
+    await timed(url, 'goto', 30000, lambda t: page.goto(url, wait_until='load', timeout=t))
+"""
+import os
+import time
+from collections import deque
+
+from host_scheduler import host_key
+
+# 학습된 타임아웃 = 최근 p95 x 이 값
+TIMEOUT_P95_MULTIPLE = float(os.environ.get("TIMEOUT_P95_MULTIPLE", "3"))
+TIMEOUT_MIN_SAMPLES = int(os.environ.get("TIMEOUT_MIN_SAMPLES", "10"))
+TIMEOUT_WINDOW = 50   # (호스트, 동작)별로 기억하는 최근 표본 수
+# 상한 (ms) - crawler.py와 같은 환경 변수
+PAGE_LOAD_TIMEOUT = int(os.environ.get("PAGE_LOAD_TIMEOUT", "30000"))
+ELEMENT_TIMEOUT = int(os.environ.get("ELEMENT_TIMEOUT", "5000"))
+# 하한 (ms)
+TIMEOUT_MIN_GOTO = int(os.environ.get("TIMEOUT_MIN_GOTO", "5000"))
+TIMEOUT_MIN_ELEMENT = int(os.environ.get("TIMEOUT_MIN_ELEMENT", "300"))
+
+
+def _is_timeout(error):
+    return 'timeout' in type(error).__name__.lower()
+
+
+def _bounds(operation):
+    if operation.startswith('goto'):
+        return TIMEOUT_MIN_GOTO, PAGE_LOAD_TIMEOUT
+    return TIMEOUT_MIN_ELEMENT, ELEMENT_TIMEOUT
+
+
+def percentile(samples, ratio):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+class _Latency:
+    def __init__(self):
+        self.samples = deque(maxlen=TIMEOUT_WINDOW)
+        self.calls = 0
+        self.timeouts = 0
+        self.last_timeout = None
+
+
+class TimeoutPolicy:
+    def __init__(self):
+        self.stats = {}
+
+    def _get(self, target, operation):
+        key = (host_key(target), operation)
+        stat = self.stats.get(key)
+        if stat is None:
+            stat = self.stats[key] = _Latency()
+        return stat
+
+    def timeout_ms(self, target, operation, initial):
+        """이번 호출에 쓸 타임아웃 (ms)"""
+        stat = self.stats.get((host_key(target), operation))
+        if stat is None or len(stat.samples) < TIMEOUT_MIN_SAMPLES:
+            return initial
+        floor, ceiling = _bounds(operation)
+        ceiling = max(initial, ceiling)
+        return int(min(ceiling, max(floor, percentile(stat.samples, 0.95) * TIMEOUT_P95_MULTIPLE)))
+
+    def record(self, target, operation, elapsed_ms=None, timeout_ms=None):
+        """성공이면 elapsed_ms, 타임아웃이면 timeout_ms (쓴 타임아웃)를 기록"""
+        stat = self._get(target, operation)
+        stat.calls += 1
+        if timeout_ms is None:
+            stat.samples.append(elapsed_ms)
+            return
+        stat.timeouts += 1
+        stat.last_timeout = timeout_ms
+        if not operation.startswith('read'):
+            stat.samples.append(timeout_ms)
+
+    def summary(self):
+        """(호스트, 동작) -> (호출 수, 타임아웃 수, 현재 p95 ms 또는 None)"""
+        return {key: (stat.calls, stat.timeouts,
+                      percentile(stat.samples, 0.95) if len(stat.samples) >= TIMEOUT_MIN_SAMPLES else None)
+                for key, stat in self.stats.items()}
+
+
+TIMEOUTS = TimeoutPolicy()
+
+
+async def timed(target, operation, initial, call):
+    """call(timeout_ms)를 학습된 타임아웃으로 실행하고 소요 시간을 기록 (예외는 그대로 전달)"""
+    timeout = TIMEOUTS.timeout_ms(target, operation, initial)
+    started = time.monotonic()
+    try:
+        result = await call(timeout)
+    except Exception as e:
+        if _is_timeout(e):
+            TIMEOUTS.record(target, operation, timeout_ms=timeout)
+        raise
+    TIMEOUTS.record(target, operation, elapsed_ms=(time.monotonic() - started) * 1000)
+    return result
+
+
+def timed_sync(target, operation, initial, call):
+    """동기 Playwright용 timed"""
+    timeout = TIMEOUTS.timeout_ms(target, operation, initial)
+    started = time.monotonic()
+    try:
+        result = call(timeout)
+    except Exception as e:
+        if _is_timeout(e):
+            TIMEOUTS.record(target, operation, timeout_ms=timeout)
+        raise
+    TIMEOUTS.record(target, operation, elapsed_ms=(time.monotonic() - started) * 1000)
+    return result
+
+
+def print_timeout_summary():
+    stats = TIMEOUTS.summary()
+    if not stats:
+        return
+    print("--- 적응형 타임아웃 (호스트 / 동작: 호출 / 타임아웃 / p95) ---")
+    for (host, operation), (calls, timeouts, p95) in sorted(stats.items()):
+        p95_label = f"{p95 / 1000:.2f}s" if p95 is not None else "학습 중"
+        print(f"   {host:<24} {operation:<12} {calls}회 / {timeouts}회 / {p95_label}")
@@ -0,0 +1,218 @@
+"""
+MySQL 임대(lease) 기반 분산 크롤링 작업 대기열
+
+프로세스 하나가 Chromium 하나를 다루는 구조에서는 처리량이 한 프로세스에 묶입니다.
+코디네이터가 CATEGORIES x 페이지를 작업 단위로 펼쳐 crawl_work_units에 넣고,
+작업자(프로세스/컨테이너 몇 개든)가 단위를 하나씩 임대해 크롤링하고 커밋합니다.
+    - 임대: SELECT ... FOR UPDATE SKIP LOCKED로 다른 작업자가 잡은 행을 건너뛰고 하나만 가져옴 (MySQL 8)
+    - 하트비트: 작업 중에는 WORK_HEARTBEAT_SECONDS마다 임대 만료 시각을 연장
+    - 작업자가 죽어 임대가 만료되면 다른 작업자가 다시 가져감 (WORK_MAX_ATTEMPTS번 넘게 실패하면 failed)
+저장은 모두 ON DUPLICATE KEY UPDATE라 같은 단위를 두 번 처리해도 결과는 같습니다.
+
+    python crawler.py --coordinator --reviews --benchmarks   # 작업 묶음 생성 (옵션은 묶음에 저장)
+    python crawler.py --worker                               # 마지막 묶음의 단위를 처리 (여러 개 실행 가능)
+    python crawler.py --worker --processes 4                 # 로컬에서 작업자 프로세스 4개 실행
+    python crawler.py --queue-status                         # 묶음 진행 상황
+
+    batch_id = create_batch(engine, CATEGORIES, pages, options)
+    unit = claim_unit(engine, batch_id, owner)     # WorkUnit 또는 None
+    heartbeat(engine, unit, owner); complete_unit(engine, unit, owner)
+"""
+import os
+import sys
+import json
+import socket
+import argparse
+import subprocess
+from collections import namedtuple
+
+from sqlalchemy import text
+
+# 임대 기간 (초) - 이 시간 안에 하트비트가 없으면 다른 작업자가 가져감
+WORK_LEASE_SECONDS = int(os.environ.get("WORK_LEASE_SECONDS", "600"))
+WORK_HEARTBEAT_SECONDS = int(os.environ.get("WORK_HEARTBEAT_SECONDS", "60"))
+WORK_MAX_ATTEMPTS = int(os.environ.get("WORK_MAX_ATTEMPTS", "3"))
+# 가져갈 단위가 없지만 다른 작업자가 임대 중인 단위가 있을 때 다시 확인하는 간격 (초)
+WORK_POLL_SECONDS = int(os.environ.get("WORK_POLL_SECONDS", "15"))
+
+WorkUnit = namedtuple('WorkUnit', ['id', 'batch_id', 'category', 'query', 'page_num', 'attempts'])
+
+
+def ensure_tables(engine):
+    """작업 대기열 테이블이 없으면 생성합니다."""
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS crawl_batches (
+                batch_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                options TEXT NOT NULL COMMENT '작업자가 사용할 실행 옵션 JSON',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """))
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS crawl_work_units (
+                id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                batch_id BIGINT NOT NULL,
+                category VARCHAR(32) NOT NULL,
+                query VARCHAR(512) NOT NULL,
+                page_num INT NOT NULL,
+                status VARCHAR(16) NOT NULL DEFAULT 'pending' COMMENT 'pending | leased | done | failed',
+                lease_owner VARCHAR(128) NULL,
+                lease_expires_at DATETIME NULL,
+                heartbeat_at DATETIME NULL,
+                attempts INT NOT NULL DEFAULT 0,
+                last_error VARCHAR(512) NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                UNIQUE KEY uq_work_unit (batch_id, category, page_num),
+                KEY idx_work_claim (batch_id, status, lease_expires_at)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+        """))
+
+
+def worker_id():
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def create_batch(engine, categories, pages, options):
+    """카테고리 x 페이지를 작업 단위로 펼쳐 새 묶음을 만들고 batch_id를 돌려줍니다."""
+    ensure_tables(engine)
+    with engine.begin() as conn:
+        batch_id = conn.execute(text("INSERT INTO crawl_batches (options) VALUES (:options)"),
+                                {"options": json.dumps(options, ensure_ascii=False)}).lastrowid
+        # 페이지 번호가 작은 단위부터 (모든 카테고리의 1페이지가 먼저 처리되도록)
+        conn.execute(text("""
+            INSERT INTO crawl_work_units (batch_id, category, query, page_num)
+            VALUES (:batch_id, :category, :query, :page_num)
+        """), [{"batch_id": batch_id, "category": category, "query": query, "page_num": page_num}
+               for page_num in pages for category, query in categories.items()])
+    return batch_id
+
+
+def latest_batch(engine):
+    """마지막 묶음 -> (batch_id, 옵션 dict) 또는 None"""
+    ensure_tables(engine)
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT batch_id, options FROM crawl_batches ORDER BY batch_id DESC LIMIT 1")).fetchone()
+    return (row[0], json.loads(row[1])) if row else None
+
+
+def batch_options(engine, batch_id):
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT options FROM crawl_batches WHERE batch_id = :batch_id"),
+                           {"batch_id": batch_id}).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def claim_unit(engine, batch_id, owner):
+    """대기 중이거나 임대가 만료된 단위 하나를 임대 (없으면 None)"""
+    with engine.begin() as conn:
+        # 재시도 한도를 넘긴 채 임대가 만료된 단위는 실패로 정리
+        conn.execute(text("""
+            UPDATE crawl_work_units SET status = 'failed', lease_owner = NULL
+            WHERE batch_id = :batch_id AND status = 'leased'
+              AND lease_expires_at < CURRENT_TIMESTAMP AND attempts >= :max_attempts
+        """), {"batch_id": batch_id, "max_attempts": WORK_MAX_ATTEMPTS})
+        row = conn.execute(text("""
+            SELECT id, batch_id, category, query, page_num, attempts FROM crawl_work_units
+            WHERE batch_id = :batch_id
+              AND (status = 'pending' OR (status = 'leased' AND lease_expires_at < CURRENT_TIMESTAMP))
+            ORDER BY id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        """), {"batch_id": batch_id}).fetchone()
+        if row is None:
+            return None
+        conn.execute(text("""
+            UPDATE crawl_work_units
+            SET status = 'leased', lease_owner = :owner, attempts = attempts + 1,
+                heartbeat_at = CURRENT_TIMESTAMP,
+                lease_expires_at = CURRENT_TIMESTAMP + INTERVAL :lease SECOND
+            WHERE id = :id
+        """), {"owner": owner, "lease": WORK_LEASE_SECONDS, "id": row[0]})
+    return WorkUnit(row[0], row[1], row[2], row[3], row[4], row[5] + 1)
+
+
+def heartbeat(engine, unit, owner):
+    """임대 연장. 임대를 잃었으면(만료 후 다른 작업자가 가져감) False"""
+    with engine.begin() as conn:
+        result = conn.execute(text("""
+            UPDATE crawl_work_units
+            SET heartbeat_at = CURRENT_TIMESTAMP, lease_expires_at = CURRENT_TIMESTAMP + INTERVAL :lease SECOND
+            WHERE id = :id AND lease_owner = :owner AND status = 'leased'
+        """), {"lease": WORK_LEASE_SECONDS, "id": unit.id, "owner": owner})
+    return result.rowcount > 0
+
+
+def complete_unit(engine, unit, owner):
+    with engine.begin() as conn:
+        conn.execute(text("""
+            UPDATE crawl_work_units SET status = 'done', lease_owner = NULL, lease_expires_at = NULL
+            WHERE id = :id AND lease_owner = :owner
+        """), {"id": unit.id, "owner": owner})
+
+
+def release_unit(engine, unit, owner, error=None):
+    """처리하지 못한 단위를 돌려놓음 (오류로 WORK_MAX_ATTEMPTS번을 채웠으면 failed, 중단 요청이면 시도 횟수 복구)"""
+    if error is None:
+        status_sql, attempts_sql = "'pending'", "attempts - 1"
+    else:
+        status_sql = "IF(attempts >= :max_attempts, 'failed', 'pending')"
+        attempts_sql = "attempts"
+    with engine.begin() as conn:
+        conn.execute(text(f"""
+            UPDATE crawl_work_units
+            SET status = {status_sql}, attempts = {attempts_sql}, lease_owner = NULL, lease_expires_at = NULL,
+                last_error = :error
+            WHERE id = :id AND lease_owner = :owner
+        """), {"max_attempts": WORK_MAX_ATTEMPTS, "error": str(error)[:512] if error else None,
+               "id": unit.id, "owner": owner})
+
+
+def batch_status(engine, batch_id):
+    """상태 -> 단위 수"""
+    with engine.connect() as conn:
+        return dict(conn.execute(text("""
+            SELECT status, COUNT(*) FROM crawl_work_units WHERE batch_id = :batch_id GROUP BY status
+        """), {"batch_id": batch_id}).fetchall())
+
+
+def has_unfinished(engine, batch_id):
+    """아직 대기/임대 중인 단위가 있는지 (다른 작업자가 죽으면 임대 만료 후 가져와야 함)"""
+    counts = batch_status(engine, batch_id)
+    return counts.get('pending', 0) + counts.get('leased', 0) > 0
+
+
+def print_batch_status(engine, batch_id):
+    counts = batch_status(engine, batch_id)
+    total = sum(counts.values())
+    print(f"--- 작업 묶음 #{batch_id}: 전체 {total} / 완료 {counts.get('done', 0)} / 대기 {counts.get('pending', 0)} / "
+          f"임대 중 {counts.get('leased', 0)} / 실패 {counts.get('failed', 0)} ---")
+
+
+def parse_worker_args(argv):
+    parser = argparse.ArgumentParser(description="분산 크롤링 코디네이터/작업자")
+    parser.add_argument('--coordinator', action='store_true', help='CATEGORIES x 페이지로 새 작업 묶음 생성')
+    parser.add_argument('--worker', action='store_true', help='작업 묶음의 단위를 임대해 처리')
+    parser.add_argument('--queue-status', action='store_true', help='묶음 진행 상황 출력')
+    parser.add_argument('--reviews', action='store_true')
+    parser.add_argument('--benchmarks', action='store_true')
+    parser.add_argument('--summarize', action='store_true')
+    parser.add_argument('--batch', type=int, default=None, help='처리할 묶음 (기본: 마지막 묶음)')
+    parser.add_argument('--max-units', type=int, default=None, help='작업자 하나가 처리할 최대 단위 수')
+    parser.add_argument('--processes', type=int, default=1, help='로컬에서 실행할 작업자 프로세스 수')
+    return parser.parse_known_args(argv)[0]
+
+
+def spawn_local_workers(script, processes, batch_id=None, max_units=None):
+    """작업자 프로세스 여러 개를 띄우고 모두 끝날 때까지 기다림 (종료 코드 목록)"""
+    command = [sys.executable, script, '--worker']
+    if batch_id is not None:
+        command += ['--batch', str(batch_id)]
+    if max_units is not None:
+        command += ['--max-units', str(max_units)]
+    children = [subprocess.Popen(command) for _ in range(processes)]
+    print(f"--- 로컬 작업자 {processes}개 실행 (pid: {', '.join(str(child.pid) for child in children)}) ---")
+    try:
+        return [child.wait() for child in children]
+    except KeyboardInterrupt:
+        # 자식도 같은 신호를 받아 진행 중인 단위만 마치고 종료하므로 기다림
+        return [child.wait() for child in children]